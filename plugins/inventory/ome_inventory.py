@@ -23,10 +23,10 @@ options:
     description:
     - OpenManage Enterprise or OpenManage Enterprise Modular IP address or hostname.
     - If the value is not specified in the task, the value of environment variable C(OME_HOSTNAME) will be used instead.
+    - Required when I(appliances) is not provided.
     env:
      - name: OME_HOSTNAME
     type: str
-    required: true
   username:
     description:
     - OpenManage Enterprise or OpenManage Enterprise Modular username.
@@ -76,22 +76,175 @@ options:
     description: To include group variables in the inventory source.
     type: dict
     required: false
+  fanout_workers:
+    description:
+    - Maximum number of groups whose devices and subgroups are fetched concurrently.
+    - Values below C(2) walk the groups one at a time.
+    - If the value is not specified in the task, the value of environment variable C(OMAM_FANOUT_WORKERS) will be used instead.
+    env:
+    - name: OMAM_FANOUT_WORKERS
+    type: int
+    default: 4
+    version_added: "9.10.0"
+  incremental_refresh:
+    description:
+    - If C(true), a snapshot of the group membership and device management addresses is kept on the controller,
+      and the next inventory refresh only asks OpenManage Enterprise for the changes since the snapshot.
+    - Devices are considered changed when their C(LastInventoryTime) or C(LastStatusTime) is later than
+      the latest time recorded in the snapshot. Groups are considered changed when their name, visibility,
+      membership type or C(UpdatedTime) differs from the snapshot.
+    - The device lists of the unchanged groups are reused from the snapshot. Query groups are fetched again
+      when any device changed, and every group is fetched again when a device was added.
+    - A full walk is done when no usable snapshot exists or the appliance rejects the change filter.
+    - If the value is not specified in the task, the value of environment variable C(OMAM_INVENTORY_INCREMENTAL)
+      will be used instead.
+    env:
+    - name: OMAM_INVENTORY_INCREMENTAL
+    type: bool
+    default: false
+    version_added: "9.10.0"
+  snapshot_path:
+    description:
+    - Path of the json file that holds the snapshot used by I(incremental_refresh).
+    - Defaults to a file under C(~/.ansible/tmp) named after the inventory source.
+    type: path
+    version_added: "9.10.0"
+  device_fields:
+    description:
+    - List of device properties of OpenManage Enterprise to be exposed as host variables, such as C(Model),
+      C(DeviceServiceTag), C(Status), C(PowerState), C(ChassisServiceTag) or C(Type).
+    - The properties are fetched with the device lists of the groups, no additional request is sent per host.
+    - Each property is set as a host variable prefixed with C(ome_) in snake case,
+      for example C(DeviceServiceTag) is set as C(ome_device_service_tag).
+    - The host variables can be used by I(compose), I(groups) and I(keyed_groups).
+    type: list
+    elements: str
+    default: []
+    version_added: "9.10.0"
+  appliances:
+    description:
+    - List of OpenManage Enterprise appliances to be fetched in a single inventory source.
+    - Each appliance is fetched concurrently, the groups of the same name are merged.
+    - A device reported by more than one appliance is added once, by its service tag, under the first appliance
+      of the list that reports it.
+    - The source appliance of each host is set in the C(ome_appliance) host variable.
+    - I(hostname) is ignored when I(appliances) is provided.
+    type: list
+    elements: dict
+    version_added: "9.10.0"
+    suboptions:
+      hostname:
+        description: OpenManage Enterprise or OpenManage Enterprise Modular IP address or hostname.
+        type: str
+        required: true
+      username:
+        description: Username of the appliance, defaults to I(username).
+        type: str
+      password:
+        description: Password of the appliance, defaults to I(password).
+        type: str
+      port:
+        description: HTTPS port of the appliance, defaults to I(port).
+        type: int
+      validate_certs:
+        description: Whether the SSL certificates of the appliance are validated, defaults to I(validate_certs).
+        type: bool
+      ca_path:
+        description: CA certificate of the appliance, defaults to I(ca_path).
+        type: path
+      ome_group_name:
+        description: Group name of the appliance, defaults to I(ome_group_name).
+        type: str
+extends_documentation_fragment:
+  - inventory_cache
+  - constructed
 requirements:
   - "python >= 3.9.6"
 author:
   - "Felix Stephen (@felixs88)"
 notes:
   - Run this plugin on a system that has direct access to Dell OpenManage Enterprise.
+  - A single session is created on OpenManage Enterprise for the whole inventory walk.
+  - When I(cache) is enabled, the group and device data read from OpenManage Enterprise is stored in
+    the configured inventory cache plugin for I(cache_timeout) seconds. I(host_vars) and I(group_vars)
+    are applied after the cache is read, so that they can be changed without refreshing the cache.
+"""
+
+EXAMPLES = r"""
+---
+# ome_inventory.yml, the group and device data is cached for one hour.
+plugin: dellemc.openmanage.ome_inventory
+hostname: 192.168.0.1
+username: username
+password: password
+ome_group_name: Servers
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/ome_inventory_cache
+cache_timeout: 3600
+
+# ome_inventory.yml, the hosts are grouped by model and health status.
+plugin: dellemc.openmanage.ome_inventory
+hostname: 192.168.0.1
+username: username
+password: password
+device_fields:
+  - Model
+  - DeviceServiceTag
+  - Status
+  - PowerState
+keyed_groups:
+  - key: ome_model
+    prefix: model
+groups:
+  critical: ome_status == 4000
+compose:
+  service_tag: ome_device_service_tag
+
+# ome_inventory.yml, two appliances sharing the same credentials are fetched concurrently.
+plugin: dellemc.openmanage.ome_inventory
+username: username
+password: password
+appliances:
+  - hostname: ome-dc1.example.com
+  - hostname: ome-dc2.example.com
+    port: 8443
 """
 
-from ansible.plugins.inventory import BaseInventoryPlugin
+import json
+import os
+import tempfile
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.errors import AnsibleParserError
+from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.odata_query import DEVICE_URI, quote_value, \
+    iter_items_with_projection
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import map_concurrently
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination
 
 GROUP_API = "GroupService/Groups"
+DEFAULT_FANOUT_WORKERS = 4
+DEFAULT_SNAPSHOT_PATH = "~/.ansible/tmp/dellemc_openmanage_{0}.json"
+SNAPSHOT_VERSION = 2
+DEVICE_FIELDS = ["Id", "DeviceManagement", "DeviceServiceTag", "LastInventoryTime", "LastStatusTime"]
+APPLIANCE_KEYS = ("hostname", "username", "password", "port", "validate_certs", "ca_path")
+DEVICE_VAR_PREFIX = "ome_"
+DEVICE_TIME_FIELDS = ("LastInventoryTime", "LastStatusTime")
+GROUP_SIGNATURE_FIELDS = ("Name", "Visible", "MembershipTypeId", "ParentId", "UpdatedTime")
+QUERY_GROUP_TYPE = 24
+
+
+def _visible(group_data):
+    return [gdata for gdata in group_data if gdata.get("Visible") not in [False]]
+
+
+def _group_signature(gdata):
+    return [gdata.get(field) for field in GROUP_SIGNATURE_FIELDS]
 
 
-class InventoryModule(BaseInventoryPlugin):
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
     NAME = "dellemc.openmanage.ome_inventory"
 
@@ -99,21 +252,54 @@ class InventoryModule(BaseInventoryPlugin):
         super(InventoryModule, self).__init__()
         self.config = None
 
-    def _get_connection_resp(self):
+    def _get_module_params(self, appliance=None):
         port = self.get_option("port") if "port" in self.config else 443
         validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
         module_params = {"hostname": self.get_option("hostname"), "username": self.get_option("username"),
                          "password": self.get_option("password"), "port": port, "validate_certs": validate_certs}
         if "ca_path" in self.config:
             module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            all_group_data = get_all_data_with_pagination(ome, GROUP_API)
-        return all_group_data
+        module_params.update((key, val) for key, val in dict(appliance or {}).items()
+                             if key in APPLIANCE_KEYS and val is not None)
+        return module_params
+
+    def _get_appliances(self):
+        appliances = self.get_option("appliances")
+        if not appliances:
+            if not self.get_option("hostname"):
+                raise AnsibleParserError("Either hostname or appliances is required.")
+            return [{"hostname": self.get_option("hostname")}]
+        for appliance in appliances:
+            if not isinstance(appliance, dict) or not appliance.get("hostname"):
+                raise AnsibleParserError("hostname is required for each of the appliances.")
+        return appliances
+
+    def _get_group_name(self, appliance):
+        if appliance.get("ome_group_name") is not None:
+            return str(appliance["ome_group_name"])
+        return str(self.get_option("ome_group_name")) if "ome_group_name" in self.config else None
+
+    def _get_fanout_workers(self):
+        workers = self.get_option("fanout_workers")
+        return DEFAULT_FANOUT_WORKERS if workers is None else workers
+
+    def _get_connection_resp(self, ome):
+        return get_all_data_with_pagination(ome, GROUP_API)
+
+    def _get_device_fields(self):
+        return list(self.get_option("device_fields") or [])
+
+    def _get_device_select(self):
+        return DEVICE_FIELDS + [field for field in self._get_device_fields() if field not in DEVICE_FIELDS]
 
-    def _set_host_vars(self, host):
+    def _set_host_vars(self, host, device_vars=None, appliance=None):
         self.inventory.set_variable(host, "idrac_ip", host)
         self.inventory.set_variable(host, "baseuri", host)
         self.inventory.set_variable(host, "hostname", host)
+        if appliance is not None:
+            self.inventory.set_variable(host, DEVICE_VAR_PREFIX + "appliance", appliance)
+        for key, val in camel_dict_to_snake_dict(device_vars or {}).items():
+            self.inventory.set_variable(host, DEVICE_VAR_PREFIX + key, val)
         if "host_vars" in self.config:
             host_vars = self.get_option("host_vars")
             for key, val in dict(host_vars).items():
@@ -136,73 +322,255 @@ class InventoryModule(BaseInventoryPlugin):
             dev_host = mgmt["DeviceManagement"][0]["NetworkAddress"]
         return dev_host
 
-    def _get_all_devices(self, device_uri):
-        device_host = []
+    def _get_all_devices(self, ome, device_uri):
         device_host_uri = device_uri.strip("/api/")
-        port = self.get_option("port") if "port" in self.config else 443
-        validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
-        module_params = {
-            "hostname": self.get_option("hostname"),
-            "username": self.get_option("username"),
-            "password": self.get_option("password"),
-            "port": port,
-            "validate_certs": validate_certs}
-        if "ca_path" in self.config:
-            module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            device_resp = get_all_data_with_pagination(ome, device_host_uri)
-            device_data = device_resp.get("report_list", [])
-            if device_data is not None:
-                for mgmt in device_data:
-                    if (len(mgmt["DeviceManagement"]) != 0):
-                        device_host.append(self._get_device_host(mgmt))
-        return device_host
-
-    def _set_child_group(self, group_data):
-        port = self.get_option("port") if "port" in self.config else 443
-        validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
-        module_params = {"hostname": self.get_option("hostname"), "username": self.get_option("username"),
-                         "password": self.get_option("password"), "port": port, "validate_certs": validate_certs}
-        if "ca_path" in self.config:
-            module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            for gdata in group_data:
-                group_name = gdata["Name"]
-                subgroup_uri = gdata["SubGroups@odata.navigationLink"].strip("/api/")
-                sub_group = get_all_data_with_pagination(ome, subgroup_uri)
-                gdata = sub_group.get("report_list", [])
-                if gdata:
-                    self._add_group_data(gdata)
-                    self._add_child_group_data(group_name, gdata)
-
-    def _add_child_group_data(self, group_name, gdata):
-        for child_name in gdata:
-            self.inventory.add_child(group_name, child_name["Name"])
-
-    def _add_group_data(self, group_data):
-        visible_gdata = list(filter(lambda d: d.get("Visible") in [False], group_data))
-        if visible_gdata:
-            for gp in visible_gdata:
-                group_data.remove(gp)
-        for gdata in group_data:
-            self._set_group_vars(gdata["Name"])
-            device_ip = self._get_all_devices(gdata["AllLeafDevices@odata.navigationLink"])
-            for hst in device_ip:
-                self.inventory.add_host(host=hst, group=gdata["Name"])
-                self._set_host_vars(hst)
-        self._set_child_group(group_data)
-
-    def _populate(self, all_group_data):
-        group_data = all_group_data.get("report_list", [])
-        group_name = str(self.get_option("ome_group_name")) if "ome_group_name" in self.config else None
-        if group_name is not None:
-            group_data = list(filter(lambda d: d.get("Name").lower() in [group_name.lower()], group_data))
-        elif group_name is None:
-            group_data = list(filter(lambda d: d.get("Name") in ["All Devices"], group_data))
-        self._add_group_data(group_data)
+        return list(iter_items_with_projection(ome, device_host_uri, select=self._get_device_select()))
+
+    def _add_devices(self, devices, inventory_data):
+        """Records the management address and the device_fields of each device and moves the sync time forward."""
+        device_fields = self._get_device_fields()
+        for device in devices:
+            host = self._get_device_host(device) if device.get("DeviceManagement") else None
+            inventory_data["devices"][str(device["Id"])] = host
+            inventory_data["service_tags"][str(device["Id"])] = device.get("DeviceServiceTag")
+            if device_fields:
+                inventory_data["device_vars"][str(device["Id"])] = dict(
+                    (field, device.get(field)) for field in device_fields)
+            for field in DEVICE_TIME_FIELDS:
+                if device.get(field) and device[field] > (inventory_data["sync_time"] or ""):
+                    inventory_data["sync_time"] = device[field]
+        return [device["Id"] for device in devices]
+
+    def _get_group_members(self, ome, gdata, devices=True, subgroups=True):
+        """Fetches the devices and the subgroups of a group, called on the worker threads."""
+        device_list = sub_group = None
+        if devices:
+            device_list = self._get_all_devices(ome, gdata["AllLeafDevices@odata.navigationLink"])
+        if subgroups:
+            subgroup_uri = gdata["SubGroups@odata.navigationLink"].strip("/api/")
+            sub_group = get_all_data_with_pagination(ome, subgroup_uri).get("report_list", [])
+        return device_list, sub_group
+
+    def _collect_group_data(self, ome, group_data, inventory_data, plan=None):
+        """
+        Walks the group tree level by level, the groups of a level are fetched concurrently.
+        inventory_data holds the walked groups with their device ids and child group ids in walk order,
+        and the management address of each device. It is plain data, so that it can be stored in the
+        inventory cache and in the incremental refresh snapshot.
+        :param plan: (optional) callable returning the previous group entry, and whether the devices and
+            the subgroups of a group must be fetched again. By default every group is fetched.
+        """
+        level = _visible(group_data)
+        workers = self._get_fanout_workers()
+        while level:
+            plans = [plan(gdata) if plan else (None, True, True) for gdata in level]
+            members = map_concurrently(lambda args: self._get_group_members(ome, args[0], *args[1][1:]),
+                                       list(zip(level, plans)), workers)
+            next_level = []
+            for gdata, (previous, dummy, dummy), (device_list, sub_group) in zip(level, plans, members):
+                device_ids = previous["devices"] if device_list is None else \
+                    self._add_devices(device_list, inventory_data)
+                if sub_group is None:
+                    sub_group = [inventory_data["all_groups"][child_id] for child_id in previous["children"]
+                                 if child_id in inventory_data["all_groups"]]
+                sub_group = _visible(sub_group)
+                inventory_data["groups"].append({"id": gdata["Id"], "name": gdata["Name"], "devices": device_ids,
+                                                 "children": [sub["Id"] for sub in sub_group]})
+                next_level.extend(sub_group)
+            level = next_level
+        inventory_data.pop("all_groups", None)
+        return inventory_data
+
+    def _get_changed_devices(self, ome, previous):
+        """Devices whose inventory or status changed since the snapshot was taken."""
+        since = quote_value(previous["sync_time"])
+        filter_expr = " or ".join("{0} ge {1}".format(field, since) for field in DEVICE_TIME_FIELDS)
+        return list(iter_items_with_projection(ome, DEVICE_URI, select=self._get_device_select(),
+                                               filter_expr=filter_expr))
+
+    def _refresh_inventory_data(self, ome, group_data, all_groups, previous):
+        """
+        Patches the previous snapshot with the devices and groups changed since it was taken.
+        :return: the new inventory data, or None when the snapshot cannot be patched.
+        """
+        if previous.get("version") != SNAPSHOT_VERSION or not previous.get("sync_time") or \
+                not isinstance(previous.get("signatures"), dict) or \
+                previous.get("device_fields", []) != self._get_device_fields() or \
+                [gdata["Id"] for gdata in _visible(group_data)] != previous.get("roots"):
+            return None
+        try:
+            changed = self._get_changed_devices(ome, previous)
+        except HTTPError as err:
+            self.display.vvv("Incremental inventory refresh is not supported, {0}".format(err))
+            return None
+        device_ids = set(str(device["Id"]) for device in iter_items_with_projection(ome, DEVICE_URI, select=["Id"]))
+        inventory_data = {"version": SNAPSHOT_VERSION, "sync_time": previous["sync_time"], "roots": previous["roots"],
+                          "groups": [], "all_groups": all_groups, "device_fields": previous.get("device_fields", []),
+                          "devices": dict((key, val) for key, val in previous["devices"].items() if key in device_ids),
+                          "device_vars": dict((key, val) for key, val in previous.get("device_vars", {}).items()
+                                              if key in device_ids),
+                          "service_tags": dict((key, val) for key, val in previous["service_tags"].items()
+                                               if key in device_ids)}
+        added = device_ids - set(inventory_data["devices"])
+        self._add_devices(changed, inventory_data)
+        previous_groups = dict((gdata["id"], gdata) for gdata in previous["groups"])
+        changed_groups, changed_parents = set(), set()
+        for key, gdata in all_groups.items():
+            signature = previous["signatures"].get(str(key))
+            if signature != _group_signature(gdata):
+                changed_groups.add(key)
+                changed_parents.add(gdata.get("ParentId"))
+                if signature is not None:
+                    changed_parents.add(signature[GROUP_SIGNATURE_FIELDS.index("ParentId")])
+
+        def plan(gdata):
+            entry = previous_groups.get(gdata["Id"])
+            if entry is None or gdata["Id"] in changed_groups:
+                return entry, True, True
+            refetch = bool(added) or (bool(changed) and gdata.get("MembershipTypeId") == QUERY_GROUP_TYPE)
+            return entry, refetch, gdata["Id"] in changed_parents or None in changed_parents
+
+        self._collect_group_data(ome, group_data, inventory_data, plan)
+        for gdata in inventory_data["groups"]:
+            gdata["devices"] = [dev_id for dev_id in gdata["devices"] if str(dev_id) in inventory_data["devices"]]
+        return inventory_data
+
+    def _get_snapshot_path(self, path, hostname=None):
+        """The snapshot of each appliance of a federated source is kept in its own file, suffixed by the hostname."""
+        snapshot_path = self.get_option("snapshot_path")
+        snapshot_path = os.path.expanduser(snapshot_path or DEFAULT_SNAPSHOT_PATH.format(self.get_cache_key(path)))
+        if hostname is None:
+            return snapshot_path
+        root, ext = os.path.splitext(snapshot_path)
+        return "{0}_{1}{2}".format(root, "".join(char if char.isalnum() else "_" for char in hostname), ext)
+
+    def _load_snapshot(self, snapshot_path):
+        try:
+            with open(snapshot_path) as snapshot_file:
+                return dict(json.load(snapshot_file))
+        except (IOError, OSError, ValueError, TypeError):
+            return None
+
+    def _save_snapshot(self, snapshot_path, inventory_data):
+        snapshot_dir = os.path.dirname(snapshot_path)
+        tmp_path = None
+        try:
+            if snapshot_dir and not os.path.isdir(snapshot_dir):
+                os.makedirs(snapshot_dir, 0o700)
+            fd, tmp_path = tempfile.mkstemp(dir=snapshot_dir or None, suffix=".tmp")
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(inventory_data, tmp_file)
+            os.replace(tmp_path, snapshot_path)
+        except (IOError, OSError) as err:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            self.display.warning("Unable to save the inventory snapshot {0}, {1}".format(snapshot_path, err))
+
+    def _get_inventory_data(self, path, appliance, federated=False):
+        incremental = self.get_option("incremental_refresh")
+        snapshot_path = self._get_snapshot_path(path, appliance["hostname"] if federated else None) \
+            if incremental else None
+        with RestOME(self._get_module_params(appliance), req_session=True) as ome:
+            all_group_data = self._get_connection_resp(ome)
+            group_data = all_group_data.get("report_list", [])
+            all_groups = dict((gdata["Id"], gdata) for gdata in group_data)
+            group_name = self._get_group_name(appliance)
+            if group_name is not None:
+                group_data = list(filter(lambda d: d.get("Name").lower() in [group_name.lower()], group_data))
+            elif group_name is None:
+                group_data = list(filter(lambda d: d.get("Name") in ["All Devices"], group_data))
+            inventory_data = None
+            previous = self._load_snapshot(snapshot_path) if incremental else None
+            if previous:
+                inventory_data = self._refresh_inventory_data(ome, group_data, all_groups, previous)
+            if inventory_data is None:
+                inventory_data = {"version": SNAPSHOT_VERSION, "sync_time": None, "groups": [], "devices": {},
+                                  "device_vars": {}, "service_tags": {}, "device_fields": self._get_device_fields(),
+                                  "roots": [gdata["Id"] for gdata in _visible(group_data)]}
+                self._collect_group_data(ome, group_data, inventory_data)
+            inventory_data["signatures"] = dict((str(key), _group_signature(gdata)) for key, gdata in all_groups.items())
+        if incremental:
+            self._save_snapshot(snapshot_path, inventory_data)
+        inventory_data["appliance"] = appliance["hostname"]
+        return inventory_data
+
+    def _get_federated_data(self, path):
+        """Fetches the inventory data of every appliance concurrently, in the order of the appliances."""
+        appliances = self._get_appliances()
+        federated = bool(self.get_option("appliances"))
+        return map_concurrently(lambda appliance: self._get_inventory_data(path, appliance, federated),
+                                appliances, len(appliances))
+
+    def _resolve_hosts(self, federated_data):
+        """
+        Maps the devices of each appliance to a host name. A device reported by more than one appliance
+        is kept once, by service tag, with the address and the host variables of the first appliance.
+        :return: dict of host to (appliance, device_vars) and list of device id to host per appliance.
+        """
+        hosts, owners, device_hosts = {}, {}, []
+        for inventory_data in federated_data:
+            resolved = {}
+            for device_id, hst in inventory_data["devices"].items():
+                if not hst:
+                    continue
+                service_tag = inventory_data.get("service_tags", {}).get(device_id)
+                if service_tag and service_tag in owners:
+                    hst = owners[service_tag]
+                elif service_tag:
+                    owners[service_tag] = hst
+                if hst not in hosts:
+                    hosts[hst] = (inventory_data.get("appliance"), inventory_data.get("device_vars", {}).get(device_id))
+                resolved[device_id] = hst
+            device_hosts.append(resolved)
+        return hosts, device_hosts
+
+    def _set_constructed_vars(self, host):
+        """Applies compose, groups and keyed_groups on the host variables set by the plugin."""
+        strict = self.get_option("strict")
+        host_vars = self.inventory.get_host(host).get_vars()
+        self._set_composite_vars(self.get_option("compose"), host_vars, host, strict=strict)
+        host_vars = self.inventory.get_host(host).get_vars()
+        self._add_host_to_composed_groups(self.get_option("groups"), host_vars, host, strict=strict)
+        self._add_host_to_keyed_groups(self.get_option("keyed_groups"), host_vars, host, strict=strict)
+
+    def _populate(self, federated_data):
+        hosts, device_hosts = self._resolve_hosts(federated_data)
+        for inventory_data, resolved in zip(federated_data, device_hosts):
+            for gdata in inventory_data["groups"]:
+                self._set_group_vars(gdata["name"])
+                for device_id in gdata["devices"]:
+                    hst = resolved.get(str(device_id))
+                    if hst:
+                        self.inventory.add_host(host=hst, group=gdata["name"])
+        for hst, (appliance, host_device_vars) in hosts.items():
+            if hst in self.inventory.hosts:
+                self._set_host_vars(hst, host_device_vars, appliance)
+                self._set_constructed_vars(hst)
+        for inventory_data in federated_data:
+            group_names = dict((gdata["id"], gdata["name"]) for gdata in inventory_data["groups"])
+            for gdata in inventory_data["groups"]:
+                for child_id in gdata["children"]:
+                    self.inventory.add_child(gdata["name"], group_names[child_id])
 
     def parse(self, inventory, loader, path, cache=True):
         super(InventoryModule, self).parse(inventory, loader, path, cache)
         self.config = self._read_config_data(path)
-        all_group_data = self._get_connection_resp()
-        self._populate(all_group_data)
+        cache_key = self.get_cache_key(path)
+        user_cache_setting = self.get_option("cache")
+        attempt_to_read_cache = user_cache_setting and cache
+        cache_needs_update = user_cache_setting and not cache
+        inventory_data = None
+        if attempt_to_read_cache:
+            try:
+                inventory_data = self._cache[cache_key]
+            except KeyError:
+                cache_needs_update = True
+            if inventory_data is not None and (not isinstance(inventory_data, list) or any(
+                    data.get("device_fields", []) != self._get_device_fields() for data in inventory_data)):
+                inventory_data = None
+                cache_needs_update = True
+        if inventory_data is None:
+            inventory_data = self._get_federated_data(path)
+        if cache_needs_update:
+            self._cache[cache_key] = inventory_data
+        self._populate(inventory_data)
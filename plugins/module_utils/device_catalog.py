@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import os
+import sqlite3
+import time
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport_setting
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import normalize_target
+from ansible_collections.dellemc.openmanage.plugins.module_utils.odata_query import DEVICE_URI, \
+    get_report_with_projection, iter_items_with_projection, get_items_by_values, quote_value
+
+DEVICE_CATALOG_ENV = "OMAM_DEVICE_CATALOG"
+DEVICE_CATALOG_PATH_ENV = "OMAM_DEVICE_CATALOG_PATH"
+DEVICE_CATALOG_TTL_ENV = "OMAM_DEVICE_CATALOG_TTL"
+DEVICE_CATALOG_REFRESH_ENV = "OMAM_DEVICE_CATALOG_REFRESH"
+DEFAULT_CATALOG_PATH = "~/.ansible/tmp/dellemc_openmanage_devices.sqlite"
+# Seconds during which a synced catalog is used without asking the appliance for changes.
+DEFAULT_TTL = 300
+SCHEMA_VERSION = 1
+CATALOG_FIELDS = ("Id", "DeviceServiceTag", "DeviceName", "Identifier", "Type", "Model", "DeviceManagement")
+TIME_FIELDS = ("LastInventoryTime", "LastStatusTime")
+# Device properties with an indexed column, NetworkAddress is looked up in the addresses table.
+KEY_COLUMNS = {"Id": "id", "DeviceServiceTag": "service_tag", "DeviceName": "name", "Identifier": "identifier"}
+# Management addresses are nested in DeviceManagement, which $filter cannot reach.
+ADDRESS_KEY = "NetworkAddress"
+# SQLite limits the number of host parameters of a statement.
+MAX_SQL_VARIABLES = 500
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS appliances (appliance TEXT PRIMARY KEY, sync_time TEXT, synced REAL)",
+    "CREATE TABLE IF NOT EXISTS devices (appliance TEXT NOT NULL, id INTEGER NOT NULL, service_tag TEXT, "
+    "name TEXT, identifier TEXT, data TEXT NOT NULL, PRIMARY KEY (appliance, id))",
+    "CREATE INDEX IF NOT EXISTS devices_service_tag ON devices (appliance, service_tag)",
+    "CREATE INDEX IF NOT EXISTS devices_name ON devices (appliance, name)",
+    "CREATE INDEX IF NOT EXISTS devices_identifier ON devices (appliance, identifier)",
+    "CREATE TABLE IF NOT EXISTS addresses (appliance TEXT NOT NULL, address TEXT NOT NULL, id INTEGER NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS addresses_address ON addresses (appliance, address)",
+    "CREATE INDEX IF NOT EXISTS addresses_id ON addresses (appliance, id)",
+)
+
+
+def _chunks(values, size=MAX_SQL_VARIABLES):
+    values = list(values)
+    return [values[idx:idx + size] for idx in range(0, len(values), size)]
+
+
+def get_management_addresses(device):
+    """Management addresses of a device, IPv6 addresses without the enclosing brackets."""
+    addresses = []
+    for mgmt in device.get("DeviceManagement") or []:
+        address = (mgmt or {}).get(ADDRESS_KEY)
+        if address:
+            addresses.append(address[1:-1] if address.startswith("[") else address)
+    return addresses
+
+
+def appliance_key(module_params):
+    """
+    Catalog key of an appliance, the user name is part of it because OME scopes the devices a user
+    can see.
+    """
+    host, port = normalize_target(module_params.get("hostname"), module_params.get("port"))
+    return "{0}:{1}:{2}".format(host, port, module_params.get("username") or "")
+
+
+class DeviceCatalog(object):
+    """
+    SQLite cache of the OME device catalog on the controller, shared by the tasks of a playbook.
+    Each appliance keeps the time of its latest device change, later syncs only fetch the devices
+    whose LastInventoryTime or LastStatusTime is newer, plus the list of device ids to find the
+    added and removed devices. A catalog synced less than ttl seconds ago is used as it is.
+    """
+
+    def __init__(self, path=DEFAULT_CATALOG_PATH, ttl=DEFAULT_TTL):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            cache_dir = os.path.dirname(self.path)
+            if cache_dir and not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir, 0o700)
+            conn = sqlite3.connect(self.path, timeout=30)
+            os.chmod(self.path, 0o600)
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                with conn:
+                    for table in ("appliances", "devices", "addresses"):
+                        conn.execute("DROP TABLE IF EXISTS {0}".format(table))
+                    conn.execute("PRAGMA user_version = {0}".format(SCHEMA_VERSION))
+            with conn:
+                for statement in SCHEMA:
+                    conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _sync_state(self, appliance):
+        return self._connect().execute("SELECT sync_time, synced FROM appliances WHERE appliance = ?",
+                                       (appliance,)).fetchone()
+
+    def _store(self, conn, appliance, devices):
+        for device in devices:
+            conn.execute("DELETE FROM addresses WHERE appliance = ? AND id = ?", (appliance, device["Id"]))
+            conn.execute("INSERT OR REPLACE INTO devices VALUES (?, ?, ?, ?, ?, ?)",
+                         (appliance, device["Id"], device.get("DeviceServiceTag"), device.get("DeviceName"),
+                          device.get("Identifier"),
+                          json.dumps(dict((key, device.get(key)) for key in CATALOG_FIELDS))))
+            conn.executemany("INSERT INTO addresses VALUES (?, ?, ?)",
+                             [(appliance, address, device["Id"]) for address in get_management_addresses(device)])
+
+    def _remove(self, conn, appliance, device_ids):
+        for chunk in _chunks(device_ids):
+            marks = ",".join("?" * len(chunk))
+            for table in ("devices", "addresses"):
+                conn.execute("DELETE FROM {0} WHERE appliance = ? AND id IN ({1})".format(table, marks),
+                             [appliance] + chunk)
+
+    @staticmethod
+    def _latest_change(devices, sync_time):
+        for device in devices:
+            for field in TIME_FIELDS:
+                if device.get(field) and device[field] > (sync_time or ""):
+                    sync_time = device[field]
+        return sync_time
+
+    def _fetch_changes(self, rest_obj, appliance, sync_time):
+        """Devices changed since sync_time, and the ids of the removed devices."""
+        since = quote_value(sync_time)
+        filter_expr = " or ".join("{0} ge {1}".format(field, since) for field in TIME_FIELDS)
+        changed = list(iter_items_with_projection(rest_obj, DEVICE_URI, select=CATALOG_FIELDS + TIME_FIELDS,
+                                                  filter_expr=filter_expr))
+        device_ids = set(item["Id"] for item in iter_items_with_projection(rest_obj, DEVICE_URI, select=["Id"]))
+        known = set(row[0] for row in self._connect().execute("SELECT id FROM devices WHERE appliance = ?",
+                                                              (appliance,)))
+        added = device_ids - known - set(device["Id"] for device in changed)
+        if added:
+            changed.extend(get_items_by_values(rest_obj, "Id", sorted(added), select=CATALOG_FIELDS + TIME_FIELDS))
+        return changed, known - device_ids
+
+    def sync(self, rest_obj, appliance, force=False, ignore_ttl=False):
+        """
+        Brings the catalog of the appliance up to date, with a full read of the device collection on the
+        first sync, when forced, or when the appliance rejects the change filter.
+        :param ignore_ttl: asks the appliance for changes even within the ttl, the sync stays incremental.
+        :return: True when the appliance was asked for changes.
+        """
+        state = self._sync_state(appliance)
+        if not (force or ignore_ttl) and state and state[1] and time.time() - state[1] < self.ttl:
+            return False
+        changed = removed = None
+        if not force and state and state[0]:
+            try:
+                changed, removed = self._fetch_changes(rest_obj, appliance, state[0])
+            except HTTPError:
+                changed = None
+        full = changed is None
+        if full:
+            changed = get_report_with_projection(rest_obj, DEVICE_URI,
+                                                 select=CATALOG_FIELDS + TIME_FIELDS)["report_list"]
+        conn = self._connect()
+        with conn:
+            if full:
+                conn.execute("DELETE FROM devices WHERE appliance = ?", (appliance,))
+                conn.execute("DELETE FROM addresses WHERE appliance = ?", (appliance,))
+            else:
+                self._remove(conn, appliance, sorted(removed))
+            self._store(conn, appliance, changed)
+            conn.execute("INSERT OR REPLACE INTO appliances VALUES (?, ?, ?)",
+                         (appliance, self._latest_change(changed, None if full else state[0]), time.time()))
+        return True
+
+    def put(self, appliance, devices):
+        """Stores devices read from the appliance outside of a sync, the sync time is not moved."""
+        devices = [device for device in devices if all(key in device for key in CATALOG_FIELDS)]
+        if devices:
+            conn = self._connect()
+            with conn:
+                self._store(conn, appliance, devices)
+
+    def _rows(self, query, params):
+        return [json.loads(row[0]) for row in self._connect().execute(query, params)]
+
+    def find(self, appliance, key, values):
+        """
+        Devices of the appliance whose key matches any of the values.
+        :param key: Id, DeviceServiceTag, DeviceName, Identifier or NetworkAddress.
+        :return: list of device dicts with the CATALOG_FIELDS.
+        """
+        devices = []
+        for chunk in _chunks(values):
+            marks = ",".join("?" * len(chunk))
+            if key == ADDRESS_KEY:
+                query = "SELECT DISTINCT devices.data FROM addresses JOIN devices ON devices.appliance = " \
+                        "addresses.appliance AND devices.id = addresses.id WHERE addresses.appliance = ? AND " \
+                        "addresses.address IN ({0})".format(marks)
+            else:
+                query = "SELECT data FROM devices WHERE appliance = ? AND {0} IN ({1})".format(KEY_COLUMNS[key], marks)
+            devices.extend(self._rows(query, [appliance] + list(chunk)))
+        return devices
+
+    def all(self, appliance):
+        return self._rows("SELECT data FROM devices WHERE appliance = ? ORDER BY id", (appliance,))
+
+
+def get_device_catalog():
+    """
+    Returns a :class:`DeviceCatalog` when enabled through the OMAM_DEVICE_CATALOG environment
+    variable, otherwise None.
+    """
+    if not get_transport_setting(DEVICE_CATALOG_ENV, False, boolean):
+        return None
+    path = get_transport_setting(DEVICE_CATALOG_PATH_ENV, DEFAULT_CATALOG_PATH)
+    ttl = get_transport_setting(DEVICE_CATALOG_TTL_ENV, DEFAULT_TTL, int)
+    return DeviceCatalog(path, ttl)
+
+
+def get_catalog_refresh():
+    """Whether the catalog must be read again from the appliance, OMAM_DEVICE_CATALOG_REFRESH."""
+    return get_transport_setting(DEVICE_CATALOG_REFRESH_ENV, False, boolean)
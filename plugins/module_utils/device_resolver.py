@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import sqlite3
+from ansible_collections.dellemc.openmanage.plugins.module_utils.odata_query import DEVICE_URI, \
+    DEVICE_LOOKUP_FIELDS, DEFAULT_FILTER_BATCH, get_items_by_values, get_report_with_projection, project_item
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_catalog import ADDRESS_KEY, \
+    CATALOG_FIELDS, KEY_COLUMNS, appliance_key, get_catalog_refresh, get_device_catalog, get_management_addresses
+
+ID_KEY = "Id"
+SERVICE_TAG_KEY = "DeviceServiceTag"
+NAME_KEY = "DeviceName"
+INVALID_DEVICE_MSG = "Unable to complete the operation because the entered target device {0}(s) '{1}' are invalid."
+
+
+def _unique(values):
+    seen, unique = set(), []
+    for value in values:
+        if value not in seen:
+            seen.add(value)
+            unique.append(value)
+    return unique
+
+
+def _to_id(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def invalid_device_message(kind, missing):
+    return INVALID_DEVICE_MSG.format(kind, ",".join(map(str, missing)))
+
+
+class DeviceResolver(object):
+    """
+    Resolves the OME devices from ids, service tags, names or management addresses.
+    The devices are kept in hash indexes built once per key, the values missing from the indexes are
+    fetched with batched 'or' filters, so that a lookup costs a few requests instead of a read of the
+    whole device collection. Management addresses are resolved from the whole collection, read once.
+    When the controller side device catalog is enabled, see :func:`get_device_catalog`, the lookups
+    are served from the catalog and only the values it does not know are fetched from the appliance.
+    A lookup missing from a catalog used within its ttl asks the appliance for the changes once.
+    """
+
+    def __init__(self, rest_obj, select=DEVICE_LOOKUP_FIELDS, uri=DEVICE_URI, batch_size=DEFAULT_FILTER_BATCH):
+        self.rest_obj = rest_obj
+        self.select = tuple(select)
+        self.uri = uri
+        self.batch_size = batch_size
+        self.devices = {}
+        self.complete = False
+        self._indexes = {}
+        self.catalog = None
+        module_params = getattr(rest_obj, "module_params", None)
+        if isinstance(module_params, dict) and uri == DEVICE_URI and set(self.select) <= set(CATALOG_FIELDS):
+            self.catalog = get_device_catalog()
+        if self.catalog is not None:
+            self._appliance = appliance_key(module_params)
+            self._refresh = get_catalog_refresh()
+            self._synced = False
+            self._fresh = False
+
+    def _index_keys(self, key, device):
+        if key == ADDRESS_KEY:
+            return get_management_addresses(device)
+        value = device.get(key)
+        if key == ID_KEY:
+            value = _to_id(value)
+        return [] if value is None else [value]
+
+    def _index(self, key):
+        if key not in self._indexes:
+            index = {}
+            for device in self.devices.values():
+                for value in self._index_keys(key, device):
+                    index.setdefault(value, device)
+            self._indexes[key] = index
+        return self._indexes[key]
+
+    def add_devices(self, devices):
+        for device in devices:
+            self.devices[device.get(ID_KEY)] = device
+            for key, index in self._indexes.items():
+                for value in self._index_keys(key, device):
+                    index.setdefault(value, device)
+        return self
+
+    def _catalog_call(self, method, *args):
+        """Calls a catalog method after the first sync, the catalog is dropped on any storage error."""
+        if self.catalog is None:
+            return None
+        try:
+            if not self._synced:
+                self._fresh = self.catalog.sync(self.rest_obj, self._appliance, force=self._refresh)
+                self._synced = True
+            return getattr(self.catalog, method)(self._appliance, *args)
+        except (sqlite3.Error, OSError):
+            self.catalog = None
+            return None
+
+    def _add_catalog_devices(self, devices):
+        return self.add_devices(project_item(device, self.select) for device in devices)
+
+    def load_all(self):
+        """Reads the whole device collection once, later lookups are served from the indexes."""
+        if not self.complete:
+            devices = self._catalog_call("all")
+            if devices is not None:
+                self._add_catalog_devices(devices)
+            else:
+                select = self.select if "DeviceManagement" in self.select else self.select + ("DeviceManagement",)
+                self.add_devices(get_report_with_projection(self.rest_obj, self.uri, select=select)["report_list"])
+            self.complete = True
+        return list(self.devices.values())
+
+    def refresh(self):
+        """
+        Asks the appliance for the device changes when the whole collection was read from a catalog
+        synced by an earlier task within its ttl, and reads the collection again.
+        :return: True when the devices were read again.
+        """
+        if not self.complete or self.catalog is None or self._fresh:
+            return False
+        try:
+            self.catalog.sync(self.rest_obj, self._appliance, ignore_ttl=True)
+        except (sqlite3.Error, OSError):
+            self.catalog = None
+        self._fresh = True
+        self.devices, self._indexes, self.complete = {}, {}, False
+        self.load_all()
+        return True
+
+    def lookup(self, key, value):
+        if key == ID_KEY:
+            value = _to_id(value)
+        elif key == ADDRESS_KEY and isinstance(value, str) and value.startswith("["):
+            value = value[1:-1]
+        return None if value is None else self._index(key).get(value)
+
+    def _fetch(self, key, values):
+        if key == ADDRESS_KEY:
+            self.load_all()
+            return
+        if key == ID_KEY:
+            values = [_to_id(value) for value in values]
+        values = _unique(value for value in values if value is not None)
+        if values and key in KEY_COLUMNS:
+            devices = self._catalog_call("find", key, values)
+            if devices is not None:
+                self._add_catalog_devices(devices)
+                values = [value for value in values if self.lookup(key, value) is None]
+                if values:
+                    devices = get_items_by_values(self.rest_obj, key, values, uri=self.uri, select=CATALOG_FIELDS,
+                                                  batch_size=self.batch_size)
+                    self._catalog_call("put", devices)
+                    self._add_catalog_devices(devices)
+                return
+        if values:
+            select = self.select if key in self.select else self.select + (key,)
+            self.add_devices(get_items_by_values(self.rest_obj, key, values, uri=self.uri, select=select,
+                                                 batch_size=self.batch_size))
+
+    def resolve(self, key, values):
+        """
+        Resolves the values of a single key.
+        :param key: Id, DeviceServiceTag, DeviceName, NetworkAddress or any other filterable device property.
+        :param values: list of values.
+        :return: dict of value to device in the order of values, and the list of values not found.
+        """
+        values = _unique(values)
+        pending = [value for value in values if self.lookup(key, value) is None]
+        if pending and not self.complete:
+            self._fetch(key, pending)
+        if self.complete and any(self.lookup(key, value) is None for value in values):
+            self.refresh()
+        found, missing = {}, []
+        for value in values:
+            device = self.lookup(key, value)
+            if device is None:
+                missing.append(value)
+            else:
+                found[value] = device
+        return found, missing
+
+    def resolve_any(self, values, keys=(ID_KEY, SERVICE_TAG_KEY)):
+        """
+        Resolves values which may be of any of the keys, e.g. a list mixing device ids and service tags.
+        Values are tried against the keys in order, numeric values only against Id.
+        :return: dict of value to device in the order of values, and the list of values not found.
+        """
+        values = _unique(values)
+        found = {}
+        for key in keys:
+            pending = [value for value in values if value not in found and
+                       (key != ID_KEY or _to_id(value) is not None)]
+            if pending:
+                found.update(self.resolve(key, pending)[0])
+        return dict((value, found[value]) for value in values if value in found), \
+            [value for value in values if value not in found]
+
+    def get_ids(self, key, values):
+        """Device ids of the values in the order of values, and the list of values not found."""
+        found, missing = self.resolve(key, values)
+        return [device[ID_KEY] for device in found.values()], missing
@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import marshal
+import os
+import re
+import sys
+import tempfile
+from xml.etree import ElementTree as ET
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport_setting
+from ansible_collections.dellemc.openmanage.plugins.module_utils.upload_cache import file_sha256
+
+CATALOG_CACHE_ENV = "OMAM_CATALOG_CACHE"
+CATALOG_CACHE_DIR_ENV = "OMAM_CATALOG_CACHE_DIR"
+DEFAULT_CACHE_DIR = "~/.ansible/tmp/dellemc_openmanage_catalogs"
+# Bumped whenever the layout of the cached index changes, older cache files are parsed again.
+CACHE_FORMAT = 1
+MAX_CACHED_CATALOGS = 8
+CATALOG_PARSE_ERROR = "Unable to parse the catalog file '{0}': {1}"
+VERSION_TOKEN = re.compile(r"\d+|[A-Za-z]+")
+INVENTORY_ID = re.compile(r"^(?P<state>[A-Za-z]+)-(?P<component>\d+)-")
+PACKAGE_FIELDS = ("package_id", "path", "version", "package_type", "hash_md5", "size", "reboot_required", "name",
+                  "component_type", "criticality", "components", "pci", "systems", "models")
+# Index name and the package field holding its keys.
+INDEX_FIELDS = (("component", "components"), ("pci", "pci"), ("system", "systems"), ("model", "models"))
+
+
+def version_key(version):
+    """Sort key of a Dell package version, numeric parts compare as numbers, e.g. 2.10.2 > 2.9.0 and A06 > A05."""
+    return tuple((1, int(token), "") if token.isdigit() else (0, 0, token.upper())
+                 for token in VERSION_TOKEN.findall(version or ""))
+
+
+def _catalog_system_id(system_id):
+    return system_id.strip().upper().zfill(4) if system_id and system_id.strip() else None
+
+
+def normalize_system_id(system_id):
+    """
+    System ids are four hex digits in the catalog, e.g. 0716, Redfish reports the decimal SystemID.
+    Integers and strings of decimal digits are converted, e.g. 1814 and "1814", other strings are taken
+    as hex, e.g. "0x0716" and "07A1".
+    """
+    if system_id is None or system_id == "":
+        return None
+    if isinstance(system_id, int):
+        return "{0:04X}".format(system_id)
+    system_id = str(system_id).strip().upper()
+    if system_id.isdigit():
+        return "{0:04X}".format(int(system_id))
+    if system_id.startswith("0X"):
+        system_id = system_id[2:]
+    return _catalog_system_id(system_id)
+
+
+def pci_key(vendor_id, device_id, sub_vendor_id=None, sub_device_id=None):
+    if not vendor_id or not device_id:
+        return None
+    return ":".join(str(val).upper().zfill(4) if val else "" for val in
+                    (vendor_id, device_id, sub_vendor_id, sub_device_id))
+
+
+def _model_names(model):
+    """Model names as listed in the catalog, Redfish reports the brand too, e.g. PowerEdge R740."""
+    if not model or not model.strip():
+        return []
+    return list(set([model.strip().upper(), model.strip().split()[-1].upper()]))
+
+
+def _value(elem, tag):
+    child = elem.find(tag)
+    return child.get("value") if child is not None else None
+
+
+def _package(elem):
+    attrib = elem.attrib
+    package = {"package_id": attrib.get("packageID"), "path": attrib.get("path"),
+               "version": attrib.get("vendorVersion") or attrib.get("dellVersion"),
+               "package_type": attrib.get("packageType"), "hash_md5": attrib.get("hashMD5"),
+               "size": int(attrib.get("size") or 0),
+               "reboot_required": attrib.get("rebootRequired", "").lower() == "true",
+               "name": (elem.findtext("Name/Display") or "").strip(),
+               "component_type": _value(elem, "ComponentType"), "criticality": _value(elem, "Criticality"),
+               "components": [], "pci": [], "systems": [], "models": []}
+    for device in elem.iterfind("SupportedDevices/Device"):
+        if device.get("componentID"):
+            package["components"].append(device.get("componentID"))
+        for info in device.iterfind("PCIInfo"):
+            key = pci_key(info.get("vendorID"), info.get("deviceID"), info.get("subVendorID"), info.get("subDeviceID"))
+            if key:
+                package["pci"].append(key)
+    for model in elem.iterfind("SupportedSystems/Brand/Model"):
+        if model.get("systemID"):
+            package["systems"].append(_catalog_system_id(model.get("systemID")))
+        if model.findtext("Display"):
+            package["models"].append(model.findtext("Display").strip().upper())
+    return tuple(tuple(package[field]) if isinstance(package[field], list) else package[field]
+                 for field in PACKAGE_FIELDS)
+
+
+def inventory_component(member):
+    """
+    Component id, PCI ids and version of an installed FirmwareInventory member, None for previous or
+    available versions and for components which cannot be updated.
+    """
+    member_id = member.get("Id") or ""
+    match = INVENTORY_ID.match(member_id)
+    state = match.group("state") if match else member_id.split("-", 1)[0]
+    if state != "Installed" or member.get("Updateable") is False or not member.get("Version"):
+        return None
+    dell = ((member.get("Oem") or {}).get("Dell") or {}).get("DellSoftwareInventory") or {}
+    component_id = str(dell.get("ComponentID") or member.get("SoftwareId") or "")
+    if component_id in ("", "0") and match:
+        component_id = match.group("component")
+    return {"id": member_id, "name": member.get("Name"), "version": member.get("Version"),
+            "component_id": component_id if component_id not in ("", "0") else None,
+            "pci": pci_key(dell.get("VendorID"), dell.get("DeviceID"), dell.get("SubVendorID"),
+                           dell.get("SubDeviceID"))}
+
+
+class FirmwareCatalog(object):
+    """
+    Packages of a Dell Catalog.xml with indexes by component id, PCI ids, system id and model, the
+    packages of each index entry are ordered from the newest version to the oldest.
+    The catalog is read with iterparse and every SoftwareComponent is released once indexed, so the
+    memory used does not grow with the size of the file. Packages are kept as tuples of PACKAGE_FIELDS
+    and saved with the indexes through marshal, loading them back takes milliseconds where parsing
+    the catalog of a full release takes seconds. Lookups return the packages as dict.
+    """
+
+    def __init__(self, manifest, rows, index=None, digest=None):
+        self.manifest = manifest
+        self.rows = rows
+        self.index = index if index is not None else self._build_index(rows)
+        self.digest = digest
+
+    @staticmethod
+    def _build_index(rows):
+        version = PACKAGE_FIELDS.index("version")
+        index = dict((name, {}) for name, field in INDEX_FIELDS)
+        for idx, row in enumerate(rows):
+            for name, field in INDEX_FIELDS:
+                for key in set(row[PACKAGE_FIELDS.index(field)]):
+                    index[name].setdefault(key, []).append(idx)
+        for entries in index.values():
+            for idxs in entries.values():
+                idxs.sort(key=lambda idx: version_key(rows[idx][version]), reverse=True)
+        return index
+
+    def package(self, idx):
+        return dict(zip(PACKAGE_FIELDS, self.rows[idx]))
+
+    @property
+    def packages(self):
+        return [self.package(idx) for idx in range(len(self.rows))]
+
+    @classmethod
+    def parse(cls, path):
+        """Parses the catalog file, raises ValueError when it is not a Dell catalog."""
+        packages, depth = [], 0
+        with open(path, "rb") as catalog_file:
+            try:
+                context = ET.iterparse(catalog_file, events=("start", "end"))
+                root = next(context)[1]
+                if root.tag != "Manifest":
+                    raise ValueError(CATALOG_PARSE_ERROR.format(path, "the root element is not Manifest"))
+                manifest = dict(root.attrib)
+                for event, elem in context:
+                    if event == "start":
+                        depth += 1
+                        continue
+                    depth -= 1
+                    if depth == 0:
+                        if elem.tag == "SoftwareComponent":
+                            packages.append(_package(elem))
+                        root.clear()
+            except ET.ParseError as err:
+                raise ValueError(CATALOG_PARSE_ERROR.format(path, err))
+        return cls(manifest, packages)
+
+    @classmethod
+    def from_cache(cls, cache_path):
+        """Catalog saved by :meth:`save`, None when the file is missing or was written by another format."""
+        try:
+            with open(cache_path, "rb") as cache_file:
+                header, digest, manifest, rows, index = marshal.loads(cache_file.read())
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            return None
+        if header != (CACHE_FORMAT, sys.version_info[:2]):
+            return None
+        return cls(manifest, rows, index, digest)
+
+    def save(self, cache_path):
+        cache_dir = os.path.dirname(cache_path)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, 0o700)
+        data = marshal.dumps(((CACHE_FORMAT, sys.version_info[:2]), self.digest, self.manifest,
+                              self.rows, self.index))
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, cache_path)
+        except (IOError, OSError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _iter_find(self, component_id, pci, system_id, model):
+        idxs = []
+        if component_id is not None:
+            idxs = self.index["component"].get(str(component_id), [])
+        if not idxs and pci:
+            idxs = self.index["pci"].get(pci, [])
+        system_id = normalize_system_id(system_id)
+        models = _model_names(model)
+        for idx in idxs:
+            package = self.package(idx)
+            if not package["systems"] or not (system_id or models) or system_id in package["systems"] or \
+                    any(name in package["models"] for name in models):
+                yield package
+
+    def find(self, component_id=None, pci=None, system_id=None, model=None):
+        """
+        Packages of the component, newest first. Packages listing supported systems are only kept
+        when system_id or model is one of them.
+        :param component_id: component id of the catalog, e.g. 159 for the BIOS.
+        :param pci: PCI ids as returned by :func:`pci_key`, used when the component id is not listed.
+        """
+        return list(self._iter_find(component_id, pci, system_id, model))
+
+    def latest(self, component_id=None, pci=None, system_id=None, model=None):
+        return next(self._iter_find(component_id, pci, system_id, model), None)
+
+    def packages_for_system(self, system_id=None, model=None):
+        """Packages which list the system, by system id or by model name."""
+        idxs = set(self.index["system"].get(normalize_system_id(system_id), []))
+        for name in _model_names(model):
+            idxs.update(self.index["model"].get(name, []))
+        return [self.package(idx) for idx in sorted(idxs)]
+
+    def get_updates(self, inventory, system_id=None, model=None):
+        """
+        Compares the FirmwareInventory members with the catalog.
+        :return: list of dict, one for each installed component with a newer version in the catalog, or
+            None when no installed component has a package for the system, the result is then unknown,
+            e.g. the catalog is for other systems or system_id is not reported as the catalog lists it.
+        """
+        updates = []
+        listed = False
+        for member in inventory:
+            component = inventory_component(member)
+            if component is None:
+                continue
+            package = self.latest(component["component_id"], component["pci"], system_id, model)
+            listed = listed or package is not None
+            if package and version_key(package["version"]) > version_key(component["version"]):
+                updates.append({"Id": component["id"], "Name": component["name"],
+                                "InstalledVersion": component["version"], "CatalogVersion": package["version"],
+                                "PackagePath": package["path"], "Criticality": package["criticality"],
+                                "RebootRequired": package["reboot_required"]})
+        return updates if listed else None
+
+
+def _prune_cache(cache_dir, keep=MAX_CACHED_CATALOGS):
+    try:
+        entries = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith(".bin")]
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for stale in entries[keep:]:
+            os.remove(stale)
+    except (IOError, OSError):
+        pass
+
+
+def load_catalog(path, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Returns the :class:`FirmwareCatalog` of the catalog file. The cache entry is keyed by the
+    SHA-256 of the file content, an edited catalog is parsed again. None as cache_dir disables the cache.
+    """
+    if cache_dir is None:
+        return FirmwareCatalog.parse(path)
+    digest = file_sha256(path)
+    cache_dir = os.path.expanduser(cache_dir)
+    cache_path = os.path.join(cache_dir, "catalog-{0}.bin".format(digest))
+    catalog = FirmwareCatalog.from_cache(cache_path)
+    if catalog is None:
+        catalog = FirmwareCatalog.parse(path)
+        catalog.digest = digest
+        catalog.save(cache_path)
+        _prune_cache(cache_dir)
+    return catalog
+
+
+def get_firmware_catalog(path):
+    """
+    Loads the catalog file, through the cache unless the OMAM_CATALOG_CACHE environment variable
+    disables it. The cache is keyed by the file content
+    so it is enabled by default.
+    """
+    cache_dir = None
+    if get_transport_setting(CATALOG_CACHE_ENV, True, boolean):
+        cache_dir = get_transport_setting(CATALOG_CACHE_DIR_ENV, DEFAULT_CACHE_DIR)
+    return load_catalog(path, cache_dir)
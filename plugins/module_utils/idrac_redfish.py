@@ -32,12 +32,19 @@ __metaclass__ = type
 import json
 import re
 import time
-import os
 from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
-from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible.module_utils.common.parameters import env_fallback
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import SessionCacheMixin, \
+    get_session_cache, normalize_target
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry import get_retry_policy
+from ansible_collections.dellemc.openmanage.plugins.module_utils.request_cache import get_get_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_events import get_job_event_waiter
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_core import OpenURLResponse, build_url, \
+    url_common_args, execute_request, get_omam_ca_env
+from ansible_collections.dellemc.openmanage.plugins.module_utils.metrics import ApiMetricsModuleMixin
 from ansible.module_utils.basic import AnsibleModule
 
 idrac_auth_params = {
@@ -61,43 +68,11 @@ IMPORT_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.
 IMPORT_PREVIEW = "/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfigurationPreview"
 
 
-class OpenURLResponse(object):
-    """Handles HTTPResponse"""
-
-    def __init__(self, resp):
-        self.body = None
-        self.resp = resp
-        if self.resp:
-            self.body = self.resp.read()
-
-    @property
-    def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
-    @property
-    def status_code(self):
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        status = self.status_code
-        return status >= 200 & status <= 299
-
-    @property
-    def headers(self):
-        return self.resp.headers
-
-    @property
-    def reason(self):
-        return self.resp.reason
-
-
-class iDRACRedfishAPI(object):
+class iDRACRedfishAPI(SessionCacheMixin):
     """REST api for iDRAC modules."""
 
+    session_resource = SESSION_RESOURCE_COLLECTION
+
     def __init__(self, module_params, req_session=False):
         self.ipaddress = module_params['idrac_ip']
         self.username = module_params['idrac_user']
@@ -113,45 +88,31 @@ class iDRACRedfishAPI(object):
         self.protocol = 'https'
         self._headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
         self.ipaddress = config_ipv6(self.ipaddress)
+        self.transport = get_transport()
+        self.retry_policy = get_retry_policy()
+        self.get_cache = get_get_cache()
+        self.session_cache = get_session_cache()
 
     def _get_url(self, uri):
         return "{0}://{1}:{2}{3}".format(self.protocol, self.ipaddress, self.port, uri)
 
     def _build_url(self, path, query_param=None):
         """builds complete url"""
-        url = path
-        base_uri = self._get_url(url)
-        if path:
-            url = base_uri
-        if query_param:
-            url += "?{0}".format(urlencode(query_param))
-        return url
+        url = self._get_url(path) if path else path
+        return build_url("", url, query_param=query_param)
 
     def _url_common_args_spec(self, method, api_timeout, headers=None):
-        """Creates an argument common spec"""
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
+        """Creates an argument common spec, the headers of the request do not change the client headers"""
+        req_header = dict(self._headers, **headers) if headers else dict(self._headers)
         if api_timeout is None:
             api_timeout = self.timeout
         if self.ca_path is None:
             self.ca_path = self._get_omam_ca_env()
-        url_kwargs = {
-            "method": method,
-            "validate_certs": self.validate_certs,
-            "ca_path": self.ca_path,
-            "use_proxy": self.use_proxy,
-            "headers": req_header,
-            "timeout": api_timeout,
-            "follow_redirects": 'all',
-        }
-        return url_kwargs
+        return url_common_args(method, req_header, api_timeout, validate_certs=self.validate_certs,
+                               ca_path=self.ca_path, use_proxy=self.use_proxy)
 
     def _args_without_session(self, path, method, api_timeout, headers=None):
         """Creates an argument spec in case of basic authentication"""
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
         url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers)
         if not (path == SESSION_RESOURCE_COLLECTION["SESSION"] and method == 'POST'):
             url_kwargs["url_username"] = self.username
@@ -165,6 +126,18 @@ class iDRACRedfishAPI(object):
         url_kwargs["force_basic_auth"] = False
         return url_kwargs
 
+    def open_event_stream(self, uri, api_timeout=None):
+        """
+        Opens a Server-Sent Events stream, the response is returned unread so that the events
+        can be consumed as they arrive.
+        """
+        if 'X-Auth-Token' in self._headers:
+            url_kwargs = self._args_with_session('GET', api_timeout)
+        else:
+            url_kwargs = self._args_without_session(uri, 'GET', api_timeout)
+        url_kwargs["headers"] = dict(url_kwargs["headers"], Accept="text/event-stream")
+        return open_url(self._build_url(uri), **url_kwargs)
+
     def invoke_request(self, uri, method, data=None, query_param=None, headers=None, api_timeout=None, dump=True):
         try:
             if 'X-Auth-Token' in self._headers:
@@ -174,32 +147,48 @@ class iDRACRedfishAPI(object):
             if data and dump:
                 data = json.dumps(data)
             url = self._build_url(uri, query_param=query_param)
-            resp = open_url(url, data=data, **url_kwargs)
-            resp_data = OpenURLResponse(resp)
-        except (HTTPError, URLError, SSLValidationError, ConnectionError) as err:
+            resp_data = execute_request(open_url, self.transport, url, data=data, retry_policy=self.retry_policy,
+                                        response_class=OpenURLResponse, cache=self.get_cache,
+                                        **url_kwargs)
+        except HTTPError as err:
+            if self._renew_session(err, data):
+                return self.invoke_request(uri, method, data=data, query_param=query_param, headers=headers,
+                                           api_timeout=api_timeout, dump=False)
+            raise err
+        except (URLError, SSLValidationError, ConnectionError) as err:
             raise err
         return resp_data
 
+    def _session_target(self):
+        return normalize_target(self.ipaddress, self.port)
+
+    def _session_request(self, method, path):
+        return self.invoke_request(path, method)
+
+    def _create_session(self):
+        """Creates a session and sets its token in the header"""
+        payload = {'UserName': self.username,
+                   'Password': self.password}
+        path = SESSION_RESOURCE_COLLECTION["SESSION"]
+        resp = self.invoke_request(path, 'POST', data=payload)
+        if resp and resp.success:
+            self.session_id = resp.json_data.get("Id")
+            self._headers["X-Auth-Token"] = resp.headers.get('X-Auth-Token')
+        else:
+            msg = "Could not create the session"
+            raise ConnectionError(msg)
+
     def __enter__(self):
         """Creates sessions by passing it to header"""
         if self.req_session and not self.x_auth_token:
-            payload = {'UserName': self.username,
-                       'Password': self.password}
-            path = SESSION_RESOURCE_COLLECTION["SESSION"]
-            resp = self.invoke_request(path, 'POST', data=payload)
-            if resp and resp.success:
-                self.session_id = resp.json_data.get("Id")
-                self._headers["X-Auth-Token"] = resp.headers.get('X-Auth-Token')
-            else:
-                msg = "Could not create the session"
-                raise ConnectionError(msg)
+            self._open_session()
         elif self.x_auth_token is not None:
             self._headers["X-Auth-Token"] = self.x_auth_token
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        """Deletes a session id, which is in use for request"""
-        if self.session_id:
+        """Deletes a session id, which is in use for request, cached sessions are kept for later tasks"""
+        if self._delete_session_on_exit():
             path = SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=self.session_id)
             self.invoke_request(path, 'DELETE')
         return False
@@ -225,16 +214,21 @@ class iDRACRedfishAPI(object):
         :return: object
         """
         response = None
-        while job_wait:
-            try:
-                response = self.invoke_request(task_uri, "GET")
-                if response.json_data.get("TaskState") == "Running":
-                    time.sleep(10)
-                else:
+        waiter = get_job_event_waiter(self, task_uri) if job_wait else None
+        try:
+            while job_wait:
+                try:
+                    response = self.invoke_request(task_uri, "GET")
+                    if response.json_data.get("TaskState") == "Running":
+                        waiter.wait(10)
+                    else:
+                        break
+                except ValueError:
+                    response = response.body
                     break
-            except ValueError:
-                response = response.body
-                break
+        finally:
+            if waiter is not None:
+                waiter.close()
         return response
 
     def wait_for_job_completion(self, job_uri, job_wait=False, reboot=False, apply_update=False):
@@ -246,14 +240,19 @@ class iDRACRedfishAPI(object):
         """
         time.sleep(5)
         response = self.invoke_request(job_uri, "GET")
-        while job_wait:
-            response = self.invoke_request(job_uri, "GET")
-            if response.json_data.get("PercentComplete") == 100 and \
-                    response.json_data.get("JobState") == "Completed":
-                break
-            if response.json_data.get("JobState") == "Starting" and not reboot and apply_update:
-                break
-            time.sleep(30)
+        waiter = get_job_event_waiter(self, job_uri) if job_wait else None
+        try:
+            while job_wait:
+                response = self.invoke_request(job_uri, "GET")
+                if response.json_data.get("PercentComplete") == 100 and \
+                        response.json_data.get("JobState") == "Completed":
+                    break
+                if response.json_data.get("JobState") == "Starting" and not reboot and apply_update:
+                    break
+                waiter.wait(30)
+        finally:
+            if waiter is not None:
+                waiter.close()
         return response
 
     def export_scp(self, export_format=None, export_use=None, target=None,
@@ -436,10 +435,10 @@ class iDRACRedfishAPI(object):
 
     def _get_omam_ca_env(self):
         """Check if the value is set in REQUESTS_CA_BUNDLE or CURL_CA_BUNDLE or OMAM_CA_BUNDLE or returns None"""
-        return os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or os.environ.get("OMAM_CA_BUNDLE")
+        return get_omam_ca_env()
 
 
-class IdracAnsibleModule(AnsibleModule):
+class IdracAnsibleModule(ApiMetricsModuleMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
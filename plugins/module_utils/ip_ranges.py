@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import ipaddress
+from bisect import bisect_right
+
+
+def parse_address(value):
+    """
+    Parses an address as reported by the appliances, IPv6 brackets and zone ids are dropped.
+    :return: tuple of (version, integer value) or None when the value is not an IP address.
+    """
+    if not value:
+        return None
+    value = str(value).strip()
+    if value.startswith("[") and value.endswith("]"):
+        value = value[1:-1]
+    value = value.split("%", 1)[0]
+    try:
+        address = ipaddress.ip_address(value)
+    except ValueError:
+        return None
+    return address.version, int(address)
+
+
+def format_address(version, value):
+    if version == 4:
+        return str(ipaddress.IPv4Address(value))
+    return str(ipaddress.IPv6Address(value))
+
+
+def parse_ip_spec(spec):
+    """
+    Parses a single address, a CIDR network or a 'first-last' range.
+    :return: tuple of (version, first, last) integer interval.
+    :raise ValueError: when the spec is not one of the supported formats.
+    """
+    spec = str(spec).strip()
+    if "/" in spec:
+        if not spec.rsplit("/", 1)[1].isdigit():
+            raise ValueError("Invalid prefix length {0}".format(spec))
+        network = ipaddress.ip_network(spec, strict=False)
+        return network.version, int(network.network_address), int(network.broadcast_address)
+    if spec.count("-") == 1:
+        first, last = [parse_address(part) for part in spec.split("-")]
+        if first is None or last is None or first[0] != last[0] or first[1] > last[1]:
+            raise ValueError("Invalid IP range {0}".format(spec))
+        return first[0], first[1], last[1]
+    address = parse_address(spec)
+    if address is None:
+        raise ValueError("Invalid IP address {0}".format(spec))
+    return address[0], address[1], address[1]
+
+
+class IPRangeSet(object):
+    """
+    Set of IP intervals kept as sorted, merged integer ranges per IP version. Membership of an
+    address is a binary search over the range starts, so matching many addresses against many
+    ranges does not expand the ranges or compare every pair.
+    """
+
+    def __init__(self, intervals=None):
+        self._pending = list(intervals or [])
+        self._starts = {}
+        self._ends = {}
+
+    @classmethod
+    def from_specs(cls, specs):
+        return cls(parse_ip_spec(spec) for spec in specs)
+
+    def add(self, version, first, last):
+        self._pending.append((version, first, last))
+
+    def _build(self):
+        if not self._pending:
+            return
+        merged = dict((version, list(zip(starts, self._ends[version]))) for version, starts in self._starts.items())
+        for version, first, last in self._pending:
+            merged.setdefault(version, []).append((first, last))
+        for version, ranges in merged.items():
+            starts, ends = [], []
+            for first, last in sorted(ranges):
+                if ends and first <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], last)
+                else:
+                    starts.append(first)
+                    ends.append(last)
+            self._starts[version], self._ends[version] = starts, ends
+        self._pending = []
+
+    def contains(self, version, value):
+        self._build()
+        starts = self._starts.get(version)
+        if not starts:
+            return False
+        idx = bisect_right(starts, value) - 1
+        return idx >= 0 and value <= self._ends[version][idx]
+
+    def __contains__(self, address):
+        if not isinstance(address, tuple):
+            address = parse_address(address)
+        return address is not None and self.contains(*address)
+
+
+def collapse_ip_specs(specs):
+    """
+    Drops the specs whose addresses are all covered by another single spec of the list, the first of
+    identical specs is kept. Values which are not IP specs, such as host names, are kept as they are.
+    :return: list of specs in the given order.
+    """
+    intervals = []
+    for idx, spec in enumerate(specs):
+        try:
+            version, first, last = parse_ip_spec(spec)
+        except ValueError:
+            continue
+        intervals.append((version, first, -last, idx))
+    covered, version_seen, max_last = set(), None, None
+    for version, first, neg_last, idx in sorted(intervals):
+        if version != version_seen:
+            version_seen, max_last = version, None
+        if max_last is not None and -neg_last <= max_last:
+            covered.add(idx)
+        else:
+            max_last = -neg_last
+    return [spec for idx, spec in enumerate(specs) if idx not in covered]
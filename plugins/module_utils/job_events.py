@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import math
+import socket
+import threading
+import time
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport_setting
+
+JOB_EVENTS_ENV = "OMAM_JOB_EVENTS"
+JOB_EVENTS_TIMEOUT_ENV = "OMAM_JOB_EVENTS_TIMEOUT"
+SSE_URI = "/redfish/v1/SSE"
+DEFAULT_STREAM_TIMEOUT = 600
+# Bounds the number of early wake-ups so that a chatty event stream cannot keep a tracking loop alive.
+MAX_WAKEUPS = 100
+
+
+def iter_sse_events(stream):
+    """
+    Parses a text/event-stream, yields a dict with event, id and data for each dispatched event.
+    Comment lines, used by the services as keep-alive, are skipped.
+    """
+    event = {"event": "message", "id": None, "data": []}
+    while True:
+        line = stream.readline()
+        if not line:
+            break
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", "replace")
+        line = line.rstrip("\r\n")
+        if not line:
+            if event["data"]:
+                yield {"event": event["event"], "id": event["id"], "data": "\n".join(event["data"])}
+            event = {"event": "message", "id": None, "data": []}
+            continue
+        if line.startswith(":"):
+            continue
+        field, dummy, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if field == "data":
+            event["data"].append(value)
+        elif field in ("event", "id"):
+            event[field] = value
+
+
+def get_job_id(job_uri):
+    """Last segment of the job uri, JID_123456 for /redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_123456."""
+    if not job_uri:
+        return None
+    return str(job_uri).rstrip("/").rsplit("/", 1)[-1] or None
+
+
+class PollingWaiter(object):
+    """Waiter used when events are disabled or the stream is unavailable, sleeps for the whole interval."""
+
+    def wait(self, seconds):
+        time.sleep(seconds)
+        return seconds
+
+    def close(self):
+        pass
+
+
+class JobEventWaiter(object):
+    """
+    Reads the event stream in a background thread and wakes up the job tracking loop as soon as an
+    event mentioning the job is received. The job is always read again by the caller, the event is
+    only a signal. When the stream closes the waiter sleeps like :class:`PollingWaiter`.
+    """
+
+    def __init__(self, stream, job_id=None, max_wakeups=MAX_WAKEUPS):
+        self.stream = stream
+        self.job_id = job_id
+        self.max_wakeups = max_wakeups
+        self.wakeups = 0
+        self.closed = False
+        self._signal = threading.Event()
+        self._thread = threading.Thread(target=self._read_events)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _is_job_event(self, event):
+        return self.job_id is None or self.job_id in event["data"]
+
+    def _read_events(self):
+        try:
+            for event in iter_sse_events(self.stream):
+                if self._is_job_event(event):
+                    self._signal.set()
+        except Exception:
+            pass
+        finally:
+            self.closed = True
+
+    def wait(self, seconds):
+        """
+        Waits up to seconds for an event of the job.
+        :return: seconds waited rounded up, less than seconds when woken up by an event.
+        """
+        if self.closed or self.wakeups >= self.max_wakeups:
+            time.sleep(seconds)
+            return seconds
+        start = time.monotonic()
+        signalled = self._signal.wait(seconds)
+        self._signal.clear()
+        elapsed = min(seconds, int(math.ceil(time.monotonic() - start)))
+        if signalled and elapsed < seconds:
+            self.wakeups += 1
+        return elapsed
+
+    def close(self):
+        """Shuts the socket down first, closing the response directly would wait for the blocked reader."""
+        self.closed = True
+        sock = getattr(getattr(getattr(self.stream, "fp", None), "raw", None), "_sock", None)
+        try:
+            if sock is not None:
+                sock.shutdown(socket.SHUT_RDWR)
+            self._thread.join(1)
+            self.stream.close()
+        except Exception:
+            pass
+
+
+def get_job_event_waiter(rest_obj, job_uri=None):
+    """
+    Returns a JobEventWaiter subscribed to the Redfish SSE stream of rest_obj when OMAM_JOB_EVENTS is
+    enabled and the client can open event streams, otherwise a PollingWaiter.
+    """
+    enabled = get_transport_setting(JOB_EVENTS_ENV, False, boolean)
+    open_stream = getattr(rest_obj, "open_event_stream", None)
+    if not enabled or not callable(open_stream):
+        return PollingWaiter()
+    timeout = get_transport_setting(JOB_EVENTS_TIMEOUT_ENV, DEFAULT_STREAM_TIMEOUT, int)
+    try:
+        stream = open_stream(SSE_URI, api_timeout=timeout)
+    except Exception:
+        return PollingWaiter()
+    return JobEventWaiter(stream, job_id=get_job_id(job_uri))
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import time
+from ansible_collections.dellemc.openmanage.plugins.module_utils.odata_query import batch_or_filters
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_core import make_requests
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry import RetryPolicy
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_events import get_job_event_waiter
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import MANAGER_JOB_URI, MANAGER_JOB_ID_URI
+
+OME_JOB_SERVICE_URI = "JobService/Jobs"
+JOB_STATE_KEY = "JobState"
+
+
+def _get(rest_obj, uri):
+    return rest_obj.invoke_request(**make_requests(rest_obj, [uri])[0])
+
+
+def fetch_ome_jobs(rest_obj, job_ids):
+    """
+    Reads the OME jobs with an 'or' filter on the Id, one request per batch of ids.
+    :return: dict of job id to job
+    """
+    jobs = {}
+    for expr in batch_or_filters("Id", job_ids):
+        resp = rest_obj.invoke_request("GET", OME_JOB_SERVICE_URI, query_param={"$filter": expr})
+        for job in resp.json_data.get("value") or []:
+            jobs[job.get("Id")] = job
+    return jobs
+
+
+def fetch_redfish_jobs(rest_obj, job_ids, collection_uri=MANAGER_JOB_URI, job_uri=MANAGER_JOB_ID_URI):
+    """
+    Reads the Redfish jobs from the expanded job collection. Jobs missing from the collection, or
+    returned as links only when $expand is not supported, are read one by one from job_uri.
+    job_uri is formatted with the job id as first positional and as job_id keyword argument.
+    :return: dict of job id to job
+    """
+    wanted = set(job_ids)
+    members = _get(rest_obj, collection_uri).json_data.get("Members") or []
+    jobs = dict((member["Id"], member) for member in members
+                if isinstance(member, dict) and member.get("Id") in wanted and JOB_STATE_KEY in member)
+    for job_id in job_ids:
+        if job_id not in jobs:
+            jobs[job_id] = _get(rest_obj, job_uri.format(job_id, job_id=job_id)).json_data
+    return jobs
+
+
+class BatchJobTracker(object):
+    """
+    Tracks several jobs with one collection read per poll cycle instead of one request per job.
+    :param rest_obj: RestOME, Redfish or iDRACRedfishAPI object.
+    :param job_ids: ids of the jobs to track.
+    :param fetch_jobs: callable(rest_obj, job_ids) returning a dict of job id to job,
+        :func:`fetch_ome_jobs` or :func:`fetch_redfish_jobs`.
+    :param is_finished: callable(job) returning True once the job does not need to be polled.
+    :param sleep_interval: seconds between two poll cycles.
+    :param wait_timeout: seconds after which the pending jobs are given up.
+    :param max_unresponsive_wait: seconds of failed reads tolerated before the error is raised.
+    """
+
+    def __init__(self, rest_obj, job_ids, fetch_jobs, is_finished, sleep_interval=10, wait_timeout=600,
+                 max_unresponsive_wait=30):
+        self.rest_obj = rest_obj
+        self.job_ids = list(dict.fromkeys(job_ids))
+        self.fetch_jobs = fetch_jobs
+        self.is_finished = is_finished
+        self.sleep_interval = sleep_interval
+        self.wait_timeout = wait_timeout
+        self.max_unresponsive_wait = max_unresponsive_wait
+        self.jobs = {}
+        self.pending = list(self.job_ids)
+        self.polls = 0
+
+    def poll(self):
+        """Reads the pending jobs once, returns the ids of the jobs still pending."""
+        jobs = self.fetch_jobs(self.rest_obj, self.pending)
+        self.polls += 1
+        self.jobs.update(jobs)
+        self.pending = [job_id for job_id in self.pending
+                        if not (job_id in jobs and self.is_finished(jobs[job_id]))]
+        return self.pending
+
+    def wait(self):
+        """
+        Polls until every job is finished or wait_timeout is reached.
+        :return: tuple of the dict of job id to the last job read and the list of ids still pending.
+        """
+        interval = max(1, self.sleep_interval)
+        unresponsive = RetryPolicy.fixed(self.max_unresponsive_wait // interval, interval).new_state()
+        waiter = get_job_event_waiter(self.rest_obj)
+        waited = 0
+        try:
+            while self.pending:
+                try:
+                    if not self.poll():
+                        break
+                except Exception as err:
+                    delay = unresponsive.next_delay(err)
+                    if delay is None:
+                        raise
+                    if waited >= self.wait_timeout:
+                        raise
+                    time.sleep(delay)
+                    waited += delay
+                    continue
+                if waited >= self.wait_timeout:
+                    break
+                waited += waiter.wait(min(interval, self.wait_timeout - waited))
+        finally:
+            waiter.close()
+        return self.jobs, self.pending
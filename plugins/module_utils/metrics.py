@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import os
+import re
+import threading
+import time
+from ansible.module_utils.six.moves.urllib.parse import urlsplit
+from ansible.module_utils.parsing.convert_bool import boolean
+
+API_METRICS_ENV = "OMAM_API_METRICS"
+API_TRACE_ENV = "OMAM_API_TRACE"
+ID_PLACEHOLDER = "{id}"
+URI_ID_PATTERNS = (
+    (re.compile(r"\('[^']*'\)"), "('{id}')"),
+    (re.compile(r"\(\d+\)"), "({id})"),
+    (re.compile(r"(?<=/)(?:JID|RID)_\d+(?=/|$)"), ID_PLACEHOLDER),
+    (re.compile(r"(?<=/)[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?=/|$)"),
+     ID_PLACEHOLDER),
+    (re.compile(r"(?<=/)\d+(?=/|$)"), ID_PLACEHOLDER),
+)
+
+
+def normalize_uri(url):
+    """
+    Returns the uri template of a request url, the host and query are dropped and the resource
+    ids are replaced so that requests to the same endpoint are aggregated.
+    DeviceService/Devices(10)/InventoryDetails becomes DeviceService/Devices({id})/InventoryDetails.
+    """
+    path = urlsplit(url).path if "://" in str(url) else str(url).split("?")[0]
+    for pattern, replacement in URI_ID_PATTERNS:
+        path = pattern.sub(replacement, path)
+    return path
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(-(-pct * len(sorted_values) // 100)))
+    return sorted_values[rank - 1]
+
+
+def _env_enabled(env):
+    try:
+        return boolean(os.environ.get(env) or False)
+    except TypeError:
+        return False
+
+
+class RequestMetrics(object):
+    """Records the requests sent by the REST clients of the running module."""
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def record(self, method, url, status, size, latency):
+        entry = {"method": method, "uri": normalize_uri(url), "status": status,
+                 "bytes": size, "latency": round(latency, 6)}
+        with self._lock:
+            self.records.append(entry)
+        trace_path = os.environ.get(API_TRACE_ENV)
+        if trace_path:
+            self._write_trace(trace_path, entry)
+        return entry
+
+    def _write_trace(self, trace_path, entry):
+        line = json.dumps(dict(entry, time=round(time.time(), 6), pid=os.getpid()))
+        try:
+            with self._lock:
+                with open(os.path.expanduser(trace_path), "a") as trace_file:
+                    trace_file.write(line + "\n")
+        except (IOError, OSError):
+            pass
+
+    def reset(self):
+        with self._lock:
+            self.records = []
+
+    def summary(self):
+        """
+        Aggregates the records per method and uri template.
+        :return: dict with count, total_bytes, total_time and per endpoint count, errors, bytes, p50 and p95.
+        """
+        with self._lock:
+            records = list(self.records)
+        endpoints = {}
+        for entry in records:
+            endpoints.setdefault("{0} {1}".format(entry["method"], entry["uri"]), []).append(entry)
+        result = {}
+        for key, entries in endpoints.items():
+            latencies = sorted(entry["latency"] for entry in entries)
+            result[key] = {"count": len(entries),
+                           "errors": len([entry for entry in entries if not entry["status"] or entry["status"] >= 400]),
+                           "bytes": sum(entry["bytes"] for entry in entries),
+                           "time": round(sum(latencies), 6),
+                           "p50": percentile(latencies, 50),
+                           "p95": percentile(latencies, 95)}
+        return {"count": len(records),
+                "total_bytes": sum(entry["bytes"] for entry in records),
+                "total_time": round(sum(entry["latency"] for entry in records), 6),
+                "endpoints": result}
+
+
+_REQUEST_METRICS = RequestMetrics()
+
+
+def get_request_metrics():
+    return _REQUEST_METRICS
+
+
+def is_instrumented():
+    """Requests are recorded when OMAM_API_METRICS is true or OMAM_API_TRACE names a trace file."""
+    return _env_enabled(API_METRICS_ENV) or bool(os.environ.get(API_TRACE_ENV))
+
+
+def record_request(method, url, status, size, latency):
+    if is_instrumented():
+        _REQUEST_METRICS.record(method, url, status, size, latency)
+
+
+def add_api_metrics(result):
+    """Adds the api_metrics summary to a module result when OMAM_API_METRICS is enabled."""
+    if _env_enabled(API_METRICS_ENV) and "api_metrics" not in result:
+        result["api_metrics"] = _REQUEST_METRICS.summary()
+    return result
+
+
+class ApiMetricsModuleMixin(object):
+    """Adds the api_metrics summary to the results of the module wrappers."""
+
+    def exit_json(self, **kwargs):
+        super().exit_json(**add_api_metrics(kwargs))
+
+    def fail_json(self, msg, **kwargs):
+        super().fail_json(msg=msg, **add_api_metrics(kwargs))
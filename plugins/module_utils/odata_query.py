@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+
+DEVICE_URI = "DeviceService/Devices"
+DEVICE_LOOKUP_FIELDS = ("Id", "DeviceServiceTag", "DeviceName", "DeviceManagement")
+DEFAULT_FILTER_BATCH = 20
+MAX_FILTER_VALUES = 200
+# Status codes returned by appliances which reject a $select they do not support.
+SELECT_UNSUPPORTED_CODES = (400, 404, 501)
+
+
+def quote_value(value):
+    """Formats a python value as an OData literal, strings are quoted and single quotes escaped."""
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (int, float)):
+        return str(value)
+    return "'{0}'".format(str(value).replace("'", "''"))
+
+
+def eq_filter(field, value):
+    return "{0} eq {1}".format(field, quote_value(value))
+
+
+def or_filter(field, values):
+    """Builds an 'or' chain of equality checks, the OData 'in' operator is not supported by every OME version."""
+    exprs = [eq_filter(field, val) for val in values]
+    if len(exprs) == 1:
+        return exprs[0]
+    return "({0})".format(" or ".join(exprs))
+
+
+def and_filter(*exprs):
+    exprs = [expr for expr in exprs if expr]
+    if len(exprs) == 1:
+        return exprs[0]
+    return " and ".join(expr if expr.startswith("(") else "({0})".format(expr) for expr in exprs)
+
+
+def batch_or_filters(field, values, batch_size=DEFAULT_FILTER_BATCH):
+    """Splits the values into 'or' filters of at most batch_size values, keeps the url length bounded."""
+    values = list(values)
+    return [or_filter(field, values[idx:idx + batch_size]) for idx in range(0, len(values), batch_size)]
+
+
+class ODataQuery(object):
+    """Builds the $select, $filter, $top and $skip query parameters of an OData collection request."""
+
+    def __init__(self, select=None, filter_expr=None, top=None, skip=None, orderby=None):
+        self.fields = []
+        self.filters = []
+        self.top = top
+        self.skip = skip
+        self.orderby = orderby
+        if select:
+            self.select(*select)
+        if filter_expr:
+            self.where(filter_expr)
+
+    def select(self, *fields):
+        for field in fields:
+            if field not in self.fields:
+                self.fields.append(field)
+        return self
+
+    def where(self, expr):
+        self.filters.append(expr)
+        return self
+
+    def where_eq(self, field, value):
+        return self.where(eq_filter(field, value))
+
+    def where_any(self, field, values):
+        return self.where(or_filter(field, values))
+
+    def to_params(self):
+        query_param = {}
+        if self.fields:
+            query_param["$select"] = ",".join(self.fields)
+        if self.filters:
+            query_param["$filter"] = and_filter(*self.filters)
+        if self.orderby:
+            query_param["$orderby"] = self.orderby
+        if self.top is not None:
+            query_param["$top"] = self.top
+        if self.skip is not None:
+            query_param["$skip"] = self.skip
+        return query_param
+
+
+def project_item(item, fields):
+    """Keeps only the selected properties, for appliances which ignore $select."""
+    if not fields or not isinstance(item, dict):
+        return item
+    return dict((key, val) for key, val in item.items() if key in fields or key.startswith("@odata."))
+
+
+def _select_unsupported(err, select):
+    return bool(select) and isinstance(err, HTTPError) and err.code in SELECT_UNSUPPORTED_CODES
+
+
+def get_report_with_projection(rest_obj, uri, select=None, filter_expr=None):
+    """
+    Same as RestOME.get_all_report_details, with the properties projected and the collection filtered
+    on the appliance. When $select is rejected the request is sent again without it, the items are
+    projected on the controller so that callers always see the same shape.
+    :param rest_obj: RestOME object.
+    :param uri: collection uri.
+    :param select: (optional) list of property names.
+    :param filter_expr: (optional) $filter expression.
+    :return: dict with resp_obj and report_list.
+    """
+    query = ODataQuery(select=select, filter_expr=filter_expr).to_params()
+    try:
+        report = rest_obj.get_all_report_details(uri, query_param=query or None)
+    except HTTPError as err:
+        if not _select_unsupported(err, select):
+            raise
+        query.pop("$select")
+        report = rest_obj.get_all_report_details(uri, query_param=query or None)
+    if select:
+        report["report_list"] = [project_item(item, select) for item in report.get("report_list") or []]
+    return report
+
+
+def iter_items_with_projection(rest_obj, uri, select=None, filter_expr=None):
+    """
+    Streaming counterpart of :func:`get_report_with_projection` built on RestOME.iter_items.
+    :return: generator of dict
+    """
+    query = ODataQuery(filter_expr=filter_expr).to_params() or None
+    started = False
+    try:
+        for item in rest_obj.iter_items(uri, query_param=query, select=select):
+            started = True
+            yield project_item(item, select)
+        return
+    except HTTPError as err:
+        if started or not _select_unsupported(err, select):
+            raise
+    for item in rest_obj.iter_items(uri, query_param=query):
+        yield project_item(item, select)
+
+
+def get_items_by_values(rest_obj, field, values, uri=DEVICE_URI, select=DEVICE_LOOKUP_FIELDS,
+                        batch_size=DEFAULT_FILTER_BATCH):
+    """
+    Fetches the items whose field matches any of the values, values are sent in batches of
+    'or' filters. Above MAX_FILTER_VALUES values the projected collection is read once instead.
+    :return: list of dict
+    """
+    values = [val for val in values if val is not None]
+    if not values:
+        return []
+    if len(values) > MAX_FILTER_VALUES:
+        return get_report_with_projection(rest_obj, uri, select=select)["report_list"]
+    items, seen = [], set()
+    for expr in batch_or_filters(field, values, batch_size):
+        for item in get_report_with_projection(rest_obj, uri, select=select, filter_expr=expr)["report_list"]:
+            item_id = item.get("Id", id(item))
+            if item_id not in seen:
+                seen.add(item_id)
+                items.append(item)
+    return items
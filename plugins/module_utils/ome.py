@@ -31,14 +31,23 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import json
-import os
 import time
 from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationError
 from ansible.module_utils.common.parameters import env_fallback
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
-from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import iter_pages_with_pagination, \
+    iter_items_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport, get_transport_setting, map_concurrently
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import SessionCacheMixin, \
+    get_session_cache, normalize_target
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry import get_retry_policy
+from ansible_collections.dellemc.openmanage.plugins.module_utils.poll_scheduler import get_poll_scheduler
+from ansible_collections.dellemc.openmanage.plugins.module_utils.request_cache import get_get_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_core import OpenURLResponse as CoreOpenURLResponse, \
+    build_url, url_common_args, execute_request, get_omam_ca_env
+from ansible_collections.dellemc.openmanage.plugins.module_utils.metrics import ApiMetricsModuleMixin
 from ansible.module_utils.basic import AnsibleModule
 
 ome_auth_params = {
@@ -60,40 +69,20 @@ JOB_URI = "JobService/Jobs({job_id})"
 JOB_SERVICE_URI = "JobService/Jobs"
 HOST_UNRESOLVED_MSG = "Unable to resolve hostname or IP {0}."
 JOB_EXEC_HISTORY = "JobService/Jobs({job_id})/ExecutionHistories"
+PAGINATION_WORKERS_ENV = "OMAM_PAGINATION_WORKERS"
 
 
-class OpenURLResponse(object):
-    """Handles HTTPResponse"""
+class OpenURLResponse(CoreOpenURLResponse):
+    """Handles HTTPResponse, OME reports success for the codes it documents only"""
 
-    def __init__(self, resp):
-        self.body = None
-        self.resp = resp
-        if self.resp:
-            self.body = self.resp.read()
+    success_codes = (200, 201, 202, 204)
 
-    @property
-    def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
-    @property
-    def status_code(self):
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        return self.status_code in (200, 201, 202, 204)
-
-    @property
-    def token_header(self):
-        return self.resp.headers.get('X-Auth-Token')
 
-
-class RestOME(object):
+class RestOME(SessionCacheMixin):
     """Handles OME API requests"""
 
+    session_resource = SESSION_RESOURCE_COLLECTION
+
     def __init__(self, module_params=None, req_session=False):
         self.module_params = module_params
         self.hostname = str(self.module_params["hostname"]).strip('][')
@@ -109,6 +98,10 @@ class RestOME(object):
         self.protocol = 'https'
         self._headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
         self.hostname = config_ipv6(self.hostname)
+        self.transport = get_transport()
+        self.retry_policy = get_retry_policy()
+        self.get_cache = get_get_cache()
+        self.session_cache = get_session_cache()
 
     def _get_base_url(self):
         """builds base url"""
@@ -116,41 +109,20 @@ class RestOME(object):
 
     def _build_url(self, path, query_param=None):
         """builds complete url"""
-        url = path
-        base_uri = self._get_base_url()
-        if path:
-            url = '{0}/{1}'.format(base_uri, path)
-        if query_param:
-            """Ome filtering does not work as expected when '+' is passed,
-            urlencode will encode spaces as '+' so replace it to '%20'"""
-            url += "?{0}".format(urlencode(query_param).replace('+', '%20'))
-        return url
+        return build_url(self._get_base_url() + "/", path, query_param=query_param, encode_space=True)
 
     def _url_common_args_spec(self, method, api_timeout, headers=None):
-        """Creates an argument common spec"""
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
+        """Creates an argument common spec, the headers of the request do not change the client headers"""
+        req_header = dict(self._headers, **headers) if headers else dict(self._headers)
         if api_timeout is None:
             api_timeout = self.timeout
         if self.ca_path is None:
             self.ca_path = self._get_omam_ca_env()
-        url_kwargs = {
-            "method": method,
-            "validate_certs": self.validate_certs,
-            "ca_path": self.ca_path,
-            "use_proxy": True,
-            "headers": req_header,
-            "timeout": api_timeout,
-            "follow_redirects": 'all',
-        }
-        return url_kwargs
+        return url_common_args(method, req_header, api_timeout, validate_certs=self.validate_certs,
+                               ca_path=self.ca_path)
 
     def _args_without_session(self, method, api_timeout, headers=None):
         """Creates an argument spec in case of basic authentication"""
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
         url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers)
         url_kwargs["url_username"] = self.username
         url_kwargs["url_password"] = self.password
@@ -187,53 +159,80 @@ class RestOME(object):
             if data and dump:
                 data = json.dumps(data)
             url = self._build_url(path, query_param=query_param)
-            resp = open_url(url, data=data, **url_kwargs)
-            resp_data = OpenURLResponse(resp)
-        except (HTTPError, URLError, SSLValidationError, ConnectionError) as err:
+            resp_data = execute_request(open_url, self.transport, url, data=data, retry_policy=self.retry_policy,
+                                        response_class=OpenURLResponse, cache=self.get_cache,
+                                        **url_kwargs)
+        except HTTPError as err:
+            if self._renew_session(err, data):
+                return self.invoke_request(method, path, data=data, query_param=query_param, headers=headers,
+                                           api_timeout=api_timeout, dump=False)
+            raise err
+        except (URLError, SSLValidationError, ConnectionError) as err:
             raise err
         return resp_data
 
+    def _session_target(self):
+        return normalize_target(self.hostname, self.port)
+
+    def _session_request(self, method, path):
+        return self.invoke_request(method, path)
+
+    def _create_session(self):
+        """Creates a session and sets its token in the header"""
+        payload = {'UserName': self.username,
+                   'Password': self.password,
+                   'SessionType': 'API', }
+        path = SESSION_RESOURCE_COLLECTION["SESSION"]
+        resp = self.invoke_request('POST', path, data=payload)
+        if resp and resp.success:
+            self.session_id = resp.json_data.get("Id")
+            self._headers["X-Auth-Token"] = resp.token_header
+        else:
+            msg = "Could not create the session"
+            raise ConnectionError(msg)
+
     def __enter__(self):
         """Creates sessions by passing it to header"""
         if self.req_session and not self.x_auth_token:
-            payload = {'UserName': self.username,
-                       'Password': self.password,
-                       'SessionType': 'API', }
-            path = SESSION_RESOURCE_COLLECTION["SESSION"]
-            resp = self.invoke_request('POST', path, data=payload)
-            if resp and resp.success:
-                self.session_id = resp.json_data.get("Id")
-                self._headers["X-Auth-Token"] = resp.token_header
-            else:
-                msg = "Could not create the session"
-                raise ConnectionError(msg)
+            self._open_session()
         elif self.x_auth_token is not None:
             self._headers["X-Auth-Token"] = self.x_auth_token
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        """Deletes a session id, which is in use for request"""
-        if self.session_id:
+        """Deletes a session id, which is in use for request, cached sessions are kept for later tasks"""
+        if self._delete_session_on_exit():
             path = SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=self.session_id)
             self.invoke_request('DELETE', path)
         return False
 
-    def get_all_report_details(self, uri):
+    def get_all_report_details(self, uri, max_workers=None, query_param=None):
         """
         This implementation mainly dependent on '@odata.count' value.
-        Currently first request without query string, always returns total number of available
+        Currently first request without paging query string, always returns total number of available
         reports in '@odata.count'.
+        :arg query_param: (optional) $filter and $select query parameters, sent with every page.
+        :arg max_workers: (optional) Maximum number of pages fetched concurrently. When not provided
+            the OMAM_PAGINATION_WORKERS environment variable is used,
+            defaults to 1 which fetches the pages one after another.
         """
         try:
-            resp = self.invoke_request('GET', uri)
+            resp = self.invoke_request('GET', uri, query_param=query_param) if query_param \
+                else self.invoke_request('GET', uri)
             data = resp.json_data
             report_list = data["value"]
             total_count = data['@odata.count']
             remaining_count = total_count - len(report_list)
             first_page_count = len(report_list)
-            while remaining_count > 0:
+            if max_workers is None:
+                max_workers = get_transport_setting(PAGINATION_WORKERS_ENV, 1, int)
+            if max_workers > 1 and first_page_count and remaining_count > 0:
+                resp = self._get_remaining_pages(uri, first_page_count, total_count, report_list, max_workers,
+                                                 query_param)
+            while remaining_count > 0 and max_workers <= 1:
                 resp = self.invoke_request('GET', uri,
-                                           query_param={"$top": first_page_count, "$skip": len(report_list)})
+                                           query_param=dict(query_param or {}, **{"$top": first_page_count,
+                                                                                  "$skip": len(report_list)}))
                 data = resp.json_data
                 value = data["value"]
                 report_list.extend(value)
@@ -242,6 +241,20 @@ class RestOME(object):
         except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
             raise err
 
+    def _get_remaining_pages(self, uri, page_size, total_count, report_list, max_workers, query_param=None):
+        """
+        Fetches every $top/$skip window after the first page on a bounded worker pool
+        and extends report_list in server order.
+        :returns: response of the last window
+        """
+        windows = [dict(query_param or {}, **{"$top": page_size, "$skip": skip})
+                   for skip in range(page_size, total_count, page_size)]
+        responses = map_concurrently(lambda query: self.invoke_request('GET', uri, query_param=query),
+                                     windows, max_workers)
+        for page in responses:
+            report_list.extend(page.json_data["value"])
+        return responses[-1]
+
     def get_job_type_id(self, jobtype_name):
         """This provides an ID of the job type."""
         job_type_id = None
@@ -279,21 +292,36 @@ class RestOME(object):
         :return: dict.
         """
         try:
-            resp = self.invoke_request('GET', uri, query_param=query_param)
-            data = resp.json_data
-            total_items = data.get("value", [])
-            total_count = data.get('@odata.count', 0)
-            next_link = data.get('@odata.nextLink', '')
-            while next_link:
-                resp = self.invoke_request('GET', next_link.split('/api')[-1])
-                data = resp.json_data
-                value = data["value"]
-                next_link = data.get('@odata.nextLink', '')
-                total_items.extend(value)
+            total_items, total_count = [], 0
+            for index, data in enumerate(self.iter_pages(uri, query_param=query_param)):
+                if index == 0:
+                    total_count = data.get('@odata.count', 0)
+                total_items.extend(data.get("value", []))
             return {"total_count": total_count, "value": total_items}
         except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
             raise err
 
+    def iter_pages(self, uri, query_param=None, select=None):
+        """
+        Yields the json data of each page of a pagination supported GET uri as it arrives.
+        :param uri: uri which supports pagination
+        :param query_param: (optional) query parameters carried over to every page
+        :param select: (optional) list of properties to be projected with $select
+        :return: generator of dict
+        """
+        return iter_pages_with_pagination(self, uri, query_param=query_param, select=select)
+
+    def iter_items(self, uri, query_param=None, select=None):
+        """
+        Yields the items of a pagination supported GET uri page by page, so that callers
+        can filter and stop early without downloading and holding the full collection.
+        :param uri: uri which supports pagination
+        :param query_param: (optional) query parameters carried over to every page
+        :param select: (optional) list of properties to be projected with $select
+        :return: generator of dict
+        """
+        return iter_items_with_pagination(self, uri, query_param=query_param, select=select)
+
     def get_device_type(self):
         """
         Returns device type map where as key is type and value is type name
@@ -307,6 +335,11 @@ class RestOME(object):
         return device_map
 
     def get_job_info(self, job_id):
+        exit_poll, job_failed, message, job_dict = self._get_job_info(job_id)
+        return exit_poll, job_failed, message
+
+    def _get_job_info(self, job_id):
+        job_dict = {}
         try:
             job_status_map = {
                 2020: "Scheduled", 2030: "Queued", 2040: "Starting", 2050: "Running", 2060: "Completed",
@@ -322,18 +355,18 @@ class RestOME(object):
                 job_failed = False
                 message = "Job {0} successfully.".format(job_status_map[job_status])
                 exit_poll = True
-                return exit_poll, job_failed, message
+                return exit_poll, job_failed, message, job_dict
             elif job_status in failed_job_status:
                 exit_poll = True
                 job_failed = True
                 message = "Job is in {0} state, and is not completed.".format(job_status_map[job_status])
-                return exit_poll, job_failed, message
-            return False, False, None
+                return exit_poll, job_failed, message, job_dict
+            return False, False, None, job_dict
         except HTTPError:
             job_failed = True
             message = "Unable to track the job status of {0}.".format(job_id)
             exit_poll = True
-            return exit_poll, job_failed, message
+            return exit_poll, job_failed, message, job_dict
 
     def job_tracking(self, job_id, job_wait_sec=600, sleep_time=60):
         """
@@ -342,16 +375,16 @@ class RestOME(object):
         sleep_time: Maximum time to sleep in seconds in each job details fetch
         """
         max_sleep_time = job_wait_sec
-        sleep_interval = sleep_time
+        scheduler = get_poll_scheduler(sleep_time)
+        job_dict = None
         while max_sleep_time:
-            if max_sleep_time > sleep_interval:
-                max_sleep_time = max_sleep_time - sleep_interval
-            else:
-                sleep_interval = max_sleep_time
-                max_sleep_time = 0
+            sleep_interval = min(scheduler.next_interval(job_dict), max_sleep_time)
+            max_sleep_time = max_sleep_time - sleep_interval
             time.sleep(sleep_interval)
-            exit_poll, job_failed, job_message = self.get_job_info(job_id)
+            exit_poll, job_failed, job_message, job_dict = self._get_job_info(job_id)
             if exit_poll is True:
+                if not job_failed:
+                    scheduler.finish(job_dict)
                 return job_failed, job_message
         return True, "The job is not complete after {0} seconds.".format(job_wait_sec)
 
@@ -406,7 +439,7 @@ class RestOME(object):
 
     def _get_omam_ca_env(self):
         """Check if the value is set in REQUESTS_CA_BUNDLE or CURL_CA_BUNDLE or OMAM_CA_BUNDLE or returns None"""
-        return os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or os.environ.get("OMAM_CA_BUNDLE")
+        return get_omam_ca_env()
 
     def get_job_execution_details(self, job_id):
         try:
@@ -427,7 +460,7 @@ class RestOME(object):
         return job_detail_status
 
 
-class OmeAnsibleModule(AnsibleModule):
+class OmeAnsibleModule(ApiMetricsModuleMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
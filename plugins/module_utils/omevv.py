@@ -32,6 +32,7 @@ __metaclass__ = type
 
 from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_api import RestAPI
 from ansible.module_utils.common.parameters import env_fallback
+from ansible_collections.dellemc.openmanage.plugins.module_utils.metrics import ApiMetricsModuleMixin
 from ansible.module_utils.basic import AnsibleModule
 
 root_omevv_uri = "/omevv/GatewayService/v1"
@@ -74,7 +75,7 @@ class RestOMEVV(RestAPI):
                                          api_timeout, dump)
 
 
-class OMEVVAnsibleModule(AnsibleModule):
+class OMEVVAnsibleModule(ApiMetricsModuleMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import contextlib
+import fcntl
+import json
+import math
+import os
+import tempfile
+import time
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport_setting
+
+ADAPTIVE_POLL_ENV = "OMAM_ADAPTIVE_POLL"
+JOB_HISTORY_ENV = "OMAM_JOB_HISTORY"
+DEFAULT_JOB_HISTORY = "~/.ansible/tmp/dellemc_openmanage_job_history.json"
+MIN_INTERVAL = 2
+BACKOFF_FACTOR = 1.5
+# Weight of the latest duration in the moving average kept per job type.
+HISTORY_WEIGHT = 0.3
+
+
+def get_job_type(job):
+    """Job type of an OME job (JobType Name), a Redfish job (JobType) or None."""
+    if not isinstance(job, dict):
+        return None
+    job_type = job.get("JobType")
+    if isinstance(job_type, dict):
+        job_type = job_type.get("Name") or job_type.get("Id")
+    return str(job_type) if job_type is not None else None
+
+
+def get_job_state(job):
+    if not isinstance(job, dict):
+        return None
+    state = job.get("JobState") or job.get("TaskState") or job.get("JobStatusId")
+    if state is None and isinstance(job.get("LastRunStatus"), dict):
+        state = job["LastRunStatus"].get("Id")
+    return state
+
+
+class JobHistory(object):
+    """
+    Moving average of the job durations per job type, kept in a json file on the controller.
+    Updates are made under a lock on the file, from its latest content, and written atomically.
+    """
+
+    def __init__(self, path=DEFAULT_JOB_HISTORY):
+        self.path = os.path.expanduser(path)
+        self.durations = self._read()
+
+    def _read(self):
+        try:
+            with open(self.path) as history_file:
+                return dict(json.load(history_file))
+        except (IOError, OSError, ValueError, TypeError):
+            return {}
+
+    @contextlib.contextmanager
+    def _locked(self):
+        history_dir = os.path.dirname(self.path)
+        if history_dir and not os.path.isdir(history_dir):
+            os.makedirs(history_dir, 0o700)
+        with open(self.path + ".lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get(self, job_type):
+        entry = self.durations.get(job_type)
+        return entry.get("mean") if isinstance(entry, dict) else None
+
+    def record(self, job_type, duration):
+        try:
+            with self._locked():
+                self.durations = self._read()
+                self._update(job_type, duration)
+                self._write()
+        except (IOError, OSError):
+            self._update(job_type, duration)
+
+    def _update(self, job_type, duration):
+        entry = self.durations.get(job_type)
+        if not isinstance(entry, dict):
+            entry = {"count": 0, "mean": duration}
+        mean = entry["mean"] + HISTORY_WEIGHT * (duration - entry["mean"])
+        self.durations[job_type] = {"count": entry["count"] + 1, "mean": round(mean, 3)}
+
+    def _write(self):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or None, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(self.durations, tmp_file)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class PollScheduler(object):
+    """
+    Computes the interval before the next job poll. With adaptive polling disabled the interval is
+    always base_interval. Otherwise the remaining time is estimated from the PercentComplete progress
+    or from the average duration of the job type, the poll is placed half way to the estimate.
+    Without an estimate the interval grows from MIN_INTERVAL, a state transition starts it over.
+    """
+
+    def __init__(self, base_interval, adaptive=False, history=None, min_interval=MIN_INTERVAL, max_interval=None):
+        self.base_interval = base_interval
+        self.adaptive = adaptive
+        self.history = history
+        self.min_interval = min(min_interval, base_interval)
+        self.max_interval = max_interval or base_interval * 2
+        self.start = time.monotonic()
+        self.step = self.min_interval
+        self.job_type = None
+        self.last_state = None
+        self.progress = None
+
+    def _clamp(self, interval):
+        return int(math.ceil(max(self.min_interval, min(self.max_interval, interval))))
+
+    def _estimate_remaining(self, job, now):
+        percent = job.get("PercentComplete") if isinstance(job, dict) else None
+        if isinstance(percent, (int, float)) and not isinstance(percent, bool):
+            if self.progress is not None and percent > self.progress[1] and now > self.progress[0]:
+                rate = (percent - self.progress[1]) / (now - self.progress[0])
+                self.progress = (now, percent)
+                return (100 - percent) / rate
+            if self.progress is None or percent != self.progress[1]:
+                self.progress = (now, percent)
+        if self.history is not None and self.job_type:
+            mean = self.history.get(self.job_type)
+            if mean and mean > now - self.start:
+                return mean - (now - self.start)
+        return None
+
+    def next_interval(self, job=None):
+        """
+        :param job: (optional) last job read, used for its PercentComplete, state and type.
+        :return: seconds to wait before the next poll.
+        """
+        if not self.adaptive:
+            return self.base_interval
+        now = time.monotonic()
+        self.job_type = get_job_type(job) or self.job_type
+        state = get_job_state(job)
+        if state is not None and self.last_state is not None and state != self.last_state:
+            self.step = self.min_interval
+        self.last_state = state if state is not None else self.last_state
+        remaining = self._estimate_remaining(job, now)
+        if remaining is not None:
+            return self._clamp(remaining / 2)
+        interval = self._clamp(self.step)
+        self.step = min(self.max_interval, self.step * BACKOFF_FACTOR)
+        return interval
+
+    def finish(self, job=None):
+        """Records the duration of the finished job in the history of its job type."""
+        self.job_type = get_job_type(job) or self.job_type
+        if self.adaptive and self.history is not None and self.job_type:
+            self.history.record(self.job_type, time.monotonic() - self.start)
+
+
+def get_poll_scheduler(base_interval):
+    """Returns a PollScheduler, adaptive when OMAM_ADAPTIVE_POLL is enabled."""
+    adaptive = get_transport_setting(ADAPTIVE_POLL_ENV, False, boolean)
+    if not adaptive or not base_interval:
+        return PollScheduler(base_interval)
+    history_path = get_transport_setting(JOB_HISTORY_ENV, DEFAULT_JOB_HISTORY)
+    return PollScheduler(base_interval, adaptive=True, history=JobHistory(history_path))
@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import contextlib
+import email.utils
+import fcntl
+import hashlib
+import json
+import os
+import posixpath
+import re
+import socket
+import ssl
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.parse import unquote, urlsplit
+
+DEFAULT_STATE_DIR = "~/.ansible/tmp/dellemc_openmanage_repository"
+DEFAULT_MAX_CLIENT_CONNECTIONS = 4
+# Seconds without any request after which a spawned repository server exits.
+DEFAULT_IDLE_TIMEOUT = 900
+# Seconds allowed to a client for the TLS handshake, and to a running server to answer the reuse probe.
+HANDSHAKE_TIMEOUT = 10
+PROBE_TIMEOUT = 5
+SETTINGS_IGNORED_MSG = "The repository server of {0} was started by an earlier task with {1}, the {2} of this " \
+                       "task are ignored until it exits."
+SEND_CHUNK = 256 * 1024
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+CONTENT_TYPES = {".xml": "application/xml", ".gz": "application/gzip"}
+
+
+def parse_range(header, size):
+    """
+    Parses a single byte range of a Range header.
+    :return: (start, end) inclusive, None when the header is absent or not a single byte range, or
+        False when the range cannot be satisfied.
+    """
+    match = RANGE_PATTERN.match(header.strip()) if header else None
+    if match is None or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if not first:
+        length = int(last)
+        if not length or not size:
+            return False
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        return False
+    return start, end
+
+
+class RepositoryRequestHandler(BaseHTTPRequestHandler):
+    """Serves the files below the repository root with GET and HEAD, single byte ranges are honoured."""
+    protocol_version = "HTTP/1.1"
+    server_version = "OpenManageRepository/1.0"
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def setup(self):
+        """The TLS handshake is made in the request thread, so that a stalled client does not block the others."""
+        if isinstance(self.request, ssl.SSLSocket):
+            self.request.settimeout(HANDSHAKE_TIMEOUT)
+            self.request.do_handshake()
+            self.request.settimeout(None)
+        BaseHTTPRequestHandler.setup(self)
+
+    def _resolve(self):
+        path = posixpath.normpath(unquote(urlsplit(self.path).path))
+        parts = [part for part in path.split("/") if part and part not in (".", "..")]
+        full_path = os.path.join(self.server.root, *parts)
+        if os.path.realpath(full_path).startswith(self.server.root + os.sep) and os.path.isfile(full_path):
+            return full_path
+        return None
+
+    def _reply(self, status, headers=None):
+        self.send_response(status)
+        for key, val in (headers or {}).items():
+            self.send_header(key, val)
+        if "Content-Length" not in (headers or {}):
+            self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _serve(self, send_body):
+        client = self.client_address[0]
+        if not self.server.acquire(client):
+            self._reply(503, {"Retry-After": "5"})
+            return
+        try:
+            path = self._resolve()
+            if path is None:
+                self._reply(404)
+                return
+            stat = os.stat(path)
+            size = stat.st_size
+            byte_range = parse_range(self.headers.get("Range"), size)
+            if byte_range is False:
+                self._reply(416, {"Content-Range": "bytes */{0}".format(size)})
+                return
+            headers = {"Accept-Ranges": "bytes",
+                       "Content-Type": CONTENT_TYPES.get(os.path.splitext(path)[1].lower(), "application/octet-stream"),
+                       "Last-Modified": email.utils.formatdate(stat.st_mtime, usegmt=True)}
+            start, end, status = 0, size - 1, 200
+            if byte_range:
+                start, end = byte_range
+                status = 206
+                headers["Content-Range"] = "bytes {0}-{1}/{2}".format(start, end, size)
+            headers["Content-Length"] = str(end - start + 1)
+            self._reply(status, headers)
+            if send_body and size:
+                with open(path, "rb") as repo_file:
+                    self.server.send_file(self.connection, repo_file, start, end - start + 1)
+        finally:
+            self.server.release(client)
+
+    def do_GET(self):
+        self._serve(True)
+
+    def do_HEAD(self):
+        self._serve(False)
+
+
+class RepositoryServer(ThreadingMixIn, HTTPServer):
+    """
+    Threaded HTTP(S) server of a local firmware repository, a Catalog.xml and its update packages.
+    Each client is allowed max_client_connections concurrent requests, further requests are answered
+    with 503 and Retry-After. The files are sent with socket.sendfile, which uses os.sendfile when the
+    connection is not encrypted, and rate_limit bounds the bytes per second of each request.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, root, server_address=("", 0), max_client_connections=DEFAULT_MAX_CLIENT_CONNECTIONS,
+                 rate_limit=None, ssl_context=None, bind_and_activate=True):
+        self.root = os.path.realpath(root)
+        self.max_client_connections = max_client_connections
+        self.rate_limit = rate_limit
+        self.ssl_context = ssl_context
+        self.last_activity = time.time()
+        self._clients = {}
+        self._lock = threading.Lock()
+        if ":" in server_address[0]:
+            self.address_family = socket.AF_INET6
+        HTTPServer.__init__(self, server_address, RepositoryRequestHandler, bind_and_activate)
+
+    def get_request(self):
+        conn, addr = HTTPServer.get_request(self)
+        if self.ssl_context is not None:
+            conn = self.ssl_context.wrap_socket(conn, server_side=True, do_handshake_on_connect=False)
+        return conn, addr
+
+    @property
+    def scheme(self):
+        return "https" if self.ssl_context is not None else "http"
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    @property
+    def active(self):
+        with self._lock:
+            return sum(self._clients.values())
+
+    def acquire(self, client):
+        with self._lock:
+            self.last_activity = time.time()
+            if self._clients.get(client, 0) >= self.max_client_connections:
+                return False
+            self._clients[client] = self._clients.get(client, 0) + 1
+            return True
+
+    def release(self, client):
+        with self._lock:
+            self.last_activity = time.time()
+            self._clients[client] -= 1
+            if not self._clients[client]:
+                del self._clients[client]
+
+    def send_file(self, conn, repo_file, offset, count):
+        if not self.rate_limit:
+            conn.sendfile(repo_file, offset, count)
+            return
+        chunk = max(1, min(SEND_CHUNK, int(self.rate_limit)))
+        while count > 0:
+            started = time.time()
+            size = min(chunk, count)
+            conn.sendfile(repo_file, offset, size)
+            offset += size
+            count -= size
+            delay = float(size) / self.rate_limit - (time.time() - started)
+            if delay > 0 and count:
+                time.sleep(delay)
+
+    def idle(self, idle_timeout):
+        with self._lock:
+            return not self._clients and time.time() - self.last_activity >= idle_timeout
+
+    def serve_until_idle(self, idle_timeout=DEFAULT_IDLE_TIMEOUT, poll_interval=1.0, before_exit=None):
+        """
+        Serves until no request was received for idle_timeout seconds and no transfer is running.
+        :param before_exit: callable run once the server is idle, the server keeps serving when it returns False.
+        """
+        self.timeout = poll_interval
+        while not self.idle(idle_timeout) or (before_exit is not None and not before_exit()):
+            self.handle_request()
+
+
+def make_ssl_context(certificate, private_key=None):
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(certificate, private_key)
+    return context
+
+
+def detect_local_address(target, port=443):
+    """Address of the local interface which routes to target, the address the target can reach us on."""
+    family = socket.AF_INET6 if ":" in target.strip("[]") else socket.AF_INET
+    with contextlib.closing(socket.socket(family, socket.SOCK_DGRAM)) as probe:
+        probe.connect((target.strip("[]"), port))
+        return probe.getsockname()[0]
+
+
+def repository_url(scheme, address, port):
+    host = "[{0}]".format(address) if ":" in address else address
+    return "{0}://{1}:{2}".format(scheme, host, port)
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def _probe(scheme, address, port):
+    """
+    Sends a HEAD request to a running server, the request counts as activity and postpones its idle exit.
+    :return: False when the server does not answer.
+    """
+    if scheme == "https":
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        conn = http_client.HTTPSConnection(address, port, timeout=PROBE_TIMEOUT, context=context)
+    else:
+        conn = http_client.HTTPConnection(address, port, timeout=PROBE_TIMEOUT)
+    try:
+        conn.request("HEAD", "/")
+        conn.getresponse().read()
+        return True
+    except (OSError, http_client.HTTPException):
+        return False
+    finally:
+        conn.close()
+
+
+def _lock_path(state_path):
+    return os.path.splitext(state_path)[0] + ".lock"
+
+
+def _release_state(server, idle_timeout, state_path):
+    """
+    Removes the state of an idle server under the state lock, the state is kept when the lock is held by
+    ensure_repository_server, which is probing the server to reuse it.
+    :return: True when the server can exit.
+    """
+    with open(_lock_path(state_path), "a") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except (IOError, OSError):
+            return False
+        try:
+            if not server.idle(idle_timeout):
+                return False
+            try:
+                with open(state_path) as state_file:
+                    state = json.load(state_file)
+            except (IOError, OSError, ValueError):
+                state = None
+            if state and state.get("pid") == os.getpid():
+                os.remove(state_path)
+            return True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _spawn(server, state_path, idle_timeout):
+    """
+    Serves the repository from a detached grandchild process, so that it outlives the module.
+    :return: pid of the serving process.
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid:
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd) as pipe:
+            server_pid = int(pipe.read() or 0)
+        server.socket.close()
+        return server_pid
+    try:
+        os.close(read_fd)
+        os.setsid()
+        if os.fork():
+            os._exit(0)
+        os.write(write_fd, str(os.getpid()).encode())
+        os.close(write_fd)
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        server.serve_until_idle(idle_timeout, before_exit=lambda: _release_state(server, idle_timeout, state_path))
+        server.server_close()
+    finally:
+        os._exit(0)
+
+
+def ensure_repository_server(root, address, port=0, max_client_connections=DEFAULT_MAX_CLIENT_CONNECTIONS,
+                             rate_limit=None, certificate=None, private_key=None, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                             state_dir=DEFAULT_STATE_DIR, spawn=_spawn, warn=None):
+    """
+    Returns the url of a repository server for root, a running server started by an earlier task is
+    reused, otherwise a new one is started in a detached process which exits after idle_timeout seconds
+    without requests. The state of the servers is kept in state_dir, under a lock shared by the forks.
+    A running server is probed under the lock before it is reused, which also postpones its idle exit.
+    :param address: address of the local interface the targets reach the server on, the server listens
+        on this address only.
+    :param warn: (optional) callable which reports that a reused server keeps other settings.
+    """
+    settings = {"max_client_connections": max_client_connections, "rate_limit": rate_limit,
+                "idle_timeout": idle_timeout}
+    root = os.path.realpath(root)
+    address = address.strip("[]")
+    state_dir = os.path.expanduser(state_dir)
+    if not os.path.isdir(state_dir):
+        os.makedirs(state_dir, 0o700)
+    scheme = "https" if certificate else "http"
+    key = hashlib.sha256(json.dumps([root, address, port, scheme]).encode("utf-8")).hexdigest()
+    state_path = os.path.join(state_dir, key + ".json")
+    with open(_lock_path(state_path), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            try:
+                with open(state_path) as state_file:
+                    state = json.load(state_file)
+            except (IOError, OSError, ValueError):
+                state = None
+            if state and state.get("pid") and _pid_alive(state["pid"]) and _probe(scheme, address, state["port"]):
+                running = state.get("settings") or settings
+                changed = sorted(name for name in settings if running.get(name) != settings[name])
+                if changed and warn is not None:
+                    warn(SETTINGS_IGNORED_MSG.format(
+                        root, ", ".join("{0}={1}".format(name, running.get(name)) for name in changed),
+                        ", ".join(changed)))
+                return repository_url(scheme, address, state["port"])
+            ssl_context = make_ssl_context(certificate, private_key) if certificate else None
+            server = RepositoryServer(root, (address, port), max_client_connections=max_client_connections,
+                                      rate_limit=rate_limit, ssl_context=ssl_context)
+            port = server.port
+            pid = spawn(server, state_path, idle_timeout)
+            with open(state_path, "w") as state_file:
+                json.dump({"root": root, "port": port, "pid": pid, "settings": settings}, state_file)
+            return repository_url(scheme, address, port)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
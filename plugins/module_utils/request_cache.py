@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import re
+import threading
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport_setting
+from ansible_collections.dellemc.openmanage.plugins.module_utils.metrics import normalize_uri
+
+GET_CACHE_ENV = "OMAM_GET_CACHE"
+NOT_MODIFIED = 304
+MUTATING_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+# Resources which do not change within a module run, served without revalidation when the
+# appliance does not send an ETag. Every other resource is cached only with an ETag.
+STATIC_URI_PATTERNS = (
+    re.compile(r"^/redfish/v1/?$"),
+    re.compile(r"^/redfish/v1/(Managers|Systems|Chassis)/?$"),
+    re.compile(r"^/api/JobService/JobTypes$"),
+)
+
+
+class CachedResponse(object):
+    """Replays a cached body with the interface of the http response read by OpenURLResponse."""
+
+    def __init__(self, status, reason, headers, body):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    def read(self):
+        return self.body
+
+    def getcode(self):
+        return self.status
+
+
+class GetCache(object):
+    """
+    Per connection cache of GET responses. Entries with an ETag are revalidated with If-None-Match,
+    entries without one are reused only for the STATIC_URI_PATTERNS resources. Any mutating request
+    sent through the connection clears the cache.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.revalidated = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_static(url):
+        template = normalize_uri(url)
+        return any(pattern.match(template) for pattern in STATIC_URI_PATTERNS)
+
+    def lookup(self, url):
+        with self._lock:
+            return self.entries.get(url)
+
+    def store(self, url, resp_data):
+        """Caches a successful response which carries an ETag or belongs to a static resource."""
+        if not isinstance(resp_data.body, (bytes, bytearray, str)) or resp_data.status_code != 200:
+            return
+        headers = resp_data.headers
+        etag = headers.get("ETag") if headers is not None else None
+        if not etag and not self.is_static(url):
+            return
+        with self._lock:
+            self.entries[url] = {"etag": etag, "status": resp_data.status_code, "reason": resp_data.reason,
+                                 "headers": headers, "body": resp_data.body}
+
+    def replay(self, entry, response_class, revalidated=False):
+        with self._lock:
+            self.hits += 1
+            if revalidated:
+                self.revalidated += 1
+        return response_class(CachedResponse(entry["status"], entry["reason"], entry["headers"], entry["body"]))
+
+    def invalidate(self):
+        with self._lock:
+            self.entries.clear()
+
+
+def get_get_cache():
+    """Returns a new GetCache when OMAM_GET_CACHE is enabled, otherwise None."""
+    enabled = get_transport_setting(GET_CACHE_ENV, False, boolean)
+    return GetCache() if enabled else None
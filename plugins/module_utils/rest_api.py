@@ -31,58 +31,13 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import json
-import os
 from ansible.module_utils.urls import open_url
-from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
-
-
-class OpenURLResponse(object):
-    """Handles HTTPResponse"""
-
-    def __init__(self, response):
-        """
-        Initializes a new instance of the class.
-
-        Args:
-            response (object): The response object to read the body from.
-
-        Returns:
-            None
-        """
-        self.body = None
-        self.resp = response
-        if self.resp:
-            self.body = self.resp.read()
-
-    @property
-    def json_data(self):
-        """
-        Returns the JSON data parsed from the `body` attribute of the object.
-
-        Returns:
-            dict: The parsed JSON data.
-
-        Raises:
-            ValueError: If the `body` attribute cannot be parsed as JSON.
-        """
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
-    @property
-    def status_code(self):
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        status = self.status_code
-        return status >= 200 & status <= 299
-
-    @property
-    def token_header(self):
-        return self.resp.headers.get('X-Auth-Token')
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry import get_retry_policy
+from ansible_collections.dellemc.openmanage.plugins.module_utils.request_cache import get_get_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_core import OpenURLResponse, build_url, \
+    url_common_args, execute_request, get_omam_ca_env
 
 
 class RestAPI:
@@ -100,18 +55,17 @@ class RestAPI:
         self.protocol = protocol
         self.root_uri = root_uri
         self._headers = basic_headers or {}
+        self.transport = get_transport()
+        self.retry_policy = get_retry_policy()
+        self.get_cache = get_get_cache()
 
     def __build_url(self, path, query_param=None):
-        url = '{0}://{1}:{2}'.format(self.protocol, self.hostname, self.port)
-        if path:
-            url = '{0}{1}'.format(url, path)
-        if query_param:
-            url += "?{0}".format(urlencode(query_param).replace('+', '%20'))
-        return url
+        base_url = '{0}://{1}:{2}'.format(self.protocol, self.hostname, self.port)
+        return build_url(base_url, path, query_param=query_param, encode_space=True)
 
     def _get_omam_ca_env(self):
         """Check if the value is set in REQUESTS_CA_BUNDLE or CURL_CA_BUNDLE or OMAM_CA_BUNDLE or returns None"""
-        return os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or os.environ.get("OMAM_CA_BUNDLE")
+        return get_omam_ca_env()
 
     def _url_common_args_spec(self, method, api_timeout=None, headers=None):
         """Creates an argument common spec"""
@@ -119,15 +73,8 @@ class RestAPI:
         self._headers.update(base_headers)
         if isinstance(headers, dict):
             self._headers.update(headers)
-        return {
-            "method": method,
-            "validate_certs": self.validate_certs,
-            "ca_path": self.ca_path or self._get_omam_ca_env(),
-            "use_proxy": True,
-            "headers": self._headers,
-            "timeout": api_timeout or self.timeout,
-            "follow_redirects": 'all',
-        }
+        return url_common_args(method, self._headers, api_timeout or self.timeout, validate_certs=self.validate_certs,
+                               ca_path=self.ca_path or self._get_omam_ca_env())
 
     def _args_without_session(self, method, api_timeout, headers=None):
         """Creates an argument spec in case of basic authentication"""
@@ -174,8 +121,9 @@ class RestAPI:
             data = json.dumps(data)
         path = self.root_uri + path
         url = self.__build_url(path, query_param=query_param)
-        resp = open_url(url, data=data, **url_kwargs)
-        resp_data = OpenURLResponse(resp)
+        resp_data = execute_request(open_url, self.transport, url, data=data, retry_policy=self.retry_policy,
+                                    response_class=OpenURLResponse, cache=self.get_cache,
+                                    **url_kwargs)
         return resp_data
 
     def __enter__(self):
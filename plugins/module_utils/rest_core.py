@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import asyncio
+import functools
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from inspect import getfullargspec
+from ansible.module_utils.urls import ConnectionError
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlencode
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport_setting
+from ansible_collections.dellemc.openmanage.plugins.module_utils.metrics import is_instrumented, record_request
+from ansible_collections.dellemc.openmanage.plugins.module_utils.request_cache import MUTATING_METHODS, NOT_MODIFIED
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+FANOUT_WORKERS_ENV = "OMAM_FANOUT_WORKERS"
+JSON_BACKEND_ENV = "OMAM_JSON_BACKEND"
+# The fan-out is opt-in, the modules send their requests one at a time unless OMAM_FANOUT_WORKERS is set.
+DEFAULT_FANOUT_WORKERS = 1
+REQUEST_TIMEOUT_MSG = "The request to {0} did not complete within {1} seconds."
+JSON_PARSE_ERROR_MSG = "Unable to parse json"
+_NOT_DECODED = object()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class DecodeStats(object):
+    """Process wide counters of the JSON bodies decoded by :class:`OpenURLResponse`."""
+
+    def __init__(self):
+        self.count = 0
+        self.bytes = 0
+        self.time = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, size, elapsed):
+        with self._lock:
+            self.count += 1
+            self.bytes += size
+            self.time += elapsed
+
+    def reset(self):
+        with self._lock:
+            self.count, self.bytes, self.time = 0, 0, 0.0
+
+    def to_dict(self):
+        return {"count": self.count, "bytes": self.bytes, "time": round(self.time, 6)}
+
+
+DECODE_STATS = DecodeStats()
+
+
+def get_json_loads():
+    """
+    Returns the loads function of the JSON backend. orjson is used when installed, unless the
+    OMAM_JSON_BACKEND environment variable is set to 'json'.
+    """
+    if HAS_ORJSON and os.environ.get(JSON_BACKEND_ENV, "auto").lower() in ("auto", "orjson"):
+        return orjson.loads
+    return json.loads
+
+
+def _skip_whitespace(text, idx):
+    return _WHITESPACE.match(text, idx).end()
+
+
+def _expect(text, idx, chars):
+    if idx >= len(text) or text[idx] not in chars:
+        raise ValueError(JSON_PARSE_ERROR_MSG)
+    return text[idx]
+
+
+def iter_json_array(body, key):
+    """
+    Yields the items of the array property key of a JSON object one at a time, without building
+    the whole document. The other properties are skipped.
+    :param body: JSON text of an object.
+    :param key: name of the top level property, for example 'value' or 'Members'.
+    :return: generator of the decoded items.
+    """
+    if isinstance(body, (bytes, bytearray)):
+        body = body.decode("utf-8")
+    decoder = json.JSONDecoder()
+    idx = _skip_whitespace(body, 0)
+    _expect(body, idx, "{")
+    idx = _skip_whitespace(body, idx + 1)
+    if body[idx:idx + 1] == "}":
+        return
+    while True:
+        name, idx = decoder.raw_decode(body, idx)
+        idx = _skip_whitespace(body, idx)
+        _expect(body, idx, ":")
+        idx = _skip_whitespace(body, idx + 1)
+        if name == key and body[idx:idx + 1] == "[":
+            idx = _skip_whitespace(body, idx + 1)
+            if body[idx:idx + 1] == "]":
+                return
+            while True:
+                item, idx = decoder.raw_decode(body, idx)
+                yield item
+                idx = _skip_whitespace(body, idx)
+                if _expect(body, idx, ",]") == "]":
+                    return
+                idx = _skip_whitespace(body, idx + 1)
+        idx = decoder.raw_decode(body, idx)[1]
+        idx = _skip_whitespace(body, idx)
+        if _expect(body, idx, ",}") == "}":
+            return
+        idx = _skip_whitespace(body, idx + 1)
+
+
+class OpenURLResponse(object):
+    """
+    Handles HTTPResponse. The body is decoded on the first access of json_data only, the decoded
+    document is kept and returned on the next accesses, callers share the same object.
+    """
+
+    success_codes = None
+    decode_time = 0.0
+    decoded_bytes = 0
+    _json = _NOT_DECODED
+    _json_body = None
+
+    def __init__(self, resp):
+        self.body = None
+        self.resp = resp
+        if self.resp:
+            self.body = self.resp.read()
+
+    def _decode(self, body):
+        loads = get_json_loads() if isinstance(body, (bytes, bytearray, str)) else json.loads
+        start = time.perf_counter()
+        try:
+            data = loads(body)
+        except ValueError:
+            raise ValueError(JSON_PARSE_ERROR_MSG)
+        self.decode_time = time.perf_counter() - start
+        self.decoded_bytes = len(body)
+        DECODE_STATS.record(self.decoded_bytes, self.decode_time)
+        return data
+
+    @property
+    def json_data(self):
+        if self._json is _NOT_DECODED or self._json_body is not self.body:
+            self._json = self._decode(self.body)
+            self._json_body = self.body
+        return self._json
+
+    def iter_json_items(self, key="value"):
+        """
+        Streaming decode of a collection, yields the members of the key array one at a time.
+        When the body was already decoded the cached document is used.
+        """
+        if self._json is not _NOT_DECODED and self._json_body is self.body:
+            for item in self._json.get(key) or []:
+                yield item
+            return
+        start = time.perf_counter()
+        try:
+            for item in iter_json_array(self.body, key):
+                yield item
+        except (IndexError, UnicodeDecodeError):
+            raise ValueError(JSON_PARSE_ERROR_MSG)
+        DECODE_STATS.record(len(self.body), time.perf_counter() - start)
+
+    @property
+    def status_code(self):
+        return self.resp.getcode()
+
+    @property
+    def success(self):
+        status = self.status_code
+        if self.success_codes:
+            return status in self.success_codes
+        return 200 <= status <= 299
+
+    @property
+    def headers(self):
+        return self.resp.headers
+
+    @property
+    def reason(self):
+        return self.resp.reason
+
+    @property
+    def token_header(self):
+        return self.resp.headers.get('X-Auth-Token')
+
+
+def get_omam_ca_env():
+    """Check if the value is set in REQUESTS_CA_BUNDLE or CURL_CA_BUNDLE or OMAM_CA_BUNDLE or returns None"""
+    return os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or os.environ.get("OMAM_CA_BUNDLE")
+
+
+def build_url(base_url, path, query_param=None, encode_space=False):
+    """
+    Builds the complete url of a request.
+    :param base_url: scheme, host and port, with the api root when the path is relative to it.
+    :param path: path of the resource, returned as is when empty.
+    :param query_param: (optional) dict of query parameters.
+    :param encode_space: encodes spaces as '%20' instead of '+', OME filtering does not accept '+'.
+    :return: url
+    """
+    url = path
+    if path:
+        url = '{0}{1}'.format(base_url, path)
+    if query_param:
+        query = urlencode(query_param)
+        if encode_space:
+            query = query.replace('+', '%20')
+        url += "?{0}".format(query)
+    return url
+
+
+def url_common_args(method, headers, timeout, validate_certs=True, ca_path=None, use_proxy=True):
+    """Creates the open_url keyword arguments shared by all the clients"""
+    return {
+        "method": method,
+        "validate_certs": validate_certs,
+        "ca_path": ca_path,
+        "use_proxy": use_proxy,
+        "headers": headers,
+        "timeout": timeout,
+        "follow_redirects": 'all',
+    }
+
+
+def send_request(opener, transport, url, data=None, retry_policy=None, **url_kwargs):
+    """
+    Sends a request through the keep-alive transport when enabled, otherwise through opener.
+    The opener is the open_url of the calling module so that it can be replaced independently.
+    Transient failures are retried according to retry_policy, payloads read from a stream are
+    sent once only.
+    """
+    def send():
+        if transport is not None:
+            return transport.open_url(url, data=data, **url_kwargs)
+        return opener(url, data=data, **url_kwargs)
+    if retry_policy is None or not retry_policy.retries or hasattr(data, "read"):
+        return send()
+    return retry_policy.call(send, url_kwargs.get("method"))
+
+
+def _body_size(body):
+    return len(body) if isinstance(body, (bytes, bytearray, str)) else 0
+
+
+def _send_instrumented(opener, transport, url, data, retry_policy, response_class, url_kwargs):
+    if not is_instrumented():
+        return response_class(send_request(opener, transport, url, data=data, retry_policy=retry_policy,
+                                           **url_kwargs))
+    status, size = None, 0
+    start = time.perf_counter()
+    try:
+        resp_data = response_class(send_request(opener, transport, url, data=data, retry_policy=retry_policy,
+                                                **url_kwargs))
+        status, size = resp_data.status_code, _body_size(resp_data.body)
+        return resp_data
+    except HTTPError as err:
+        status = err.code
+        try:
+            size = int((err.headers or {}).get("Content-Length") or 0)
+        except (TypeError, ValueError):
+            size = 0
+        raise
+    finally:
+        record_request(url_kwargs.get("method"), url, status, size, time.perf_counter() - start)
+
+
+def _send_cached(opener, transport, url, data, retry_policy, response_class, url_kwargs, cache):
+    entry = cache.lookup(url)
+    if entry is not None and not entry["etag"]:
+        return cache.replay(entry, response_class)
+    if entry is not None:
+        headers = dict(url_kwargs.get("headers") or {})
+        headers["If-None-Match"] = entry["etag"]
+        url_kwargs = dict(url_kwargs, headers=headers)
+    try:
+        resp_data = _send_instrumented(opener, transport, url, data, retry_policy, response_class, url_kwargs)
+    except HTTPError as err:
+        if entry is not None and err.code == NOT_MODIFIED:
+            return cache.replay(entry, response_class, revalidated=True)
+        raise
+    if entry is not None and resp_data.status_code == NOT_MODIFIED:
+        return cache.replay(entry, response_class, revalidated=True)
+    cache.store(url, resp_data)
+    return resp_data
+
+
+def execute_request(opener, transport, url, data=None, retry_policy=None, response_class=OpenURLResponse,
+                    cache=None, **url_kwargs):
+    """
+    Sends the request with :func:`send_request` and wraps the response in response_class.
+    When instrumentation is enabled the method, uri template, status, bytes and latency are recorded,
+    see the metrics module utils. With a GetCache, GET responses are served from the cache or
+    revalidated with If-None-Match, mutating requests clear the cache.
+    """
+    if cache is not None:
+        if url_kwargs.get("method") == "GET" and data is None:
+            return _send_cached(opener, transport, url, data, retry_policy, response_class, url_kwargs, cache)
+        if url_kwargs.get("method") in MUTATING_METHODS:
+            cache.invalidate()
+    return _send_instrumented(opener, transport, url, data, retry_policy, response_class, url_kwargs)
+
+
+def _path_arg(client):
+    """Name of the path argument of the invoke_request of the client, iDRACRedfishAPI uses 'uri'."""
+    try:
+        args = getfullargspec(client.invoke_request)[0]
+    except TypeError:
+        return "path"
+    return "uri" if "uri" in args else "path"
+
+
+def make_requests(client, requests):
+    """
+    Converts the requests to keyword arguments of client.invoke_request.
+    :param requests: list of paths, which are fetched with GET, or dict of invoke_request arguments.
+    :return: list of dict
+    """
+    path_arg = _path_arg(client)
+    result = []
+    for request in requests:
+        if isinstance(request, dict):
+            kwargs = dict(request)
+            if "path" in kwargs and path_arg != "path":
+                kwargs[path_arg] = kwargs.pop("path")
+        else:
+            kwargs = {path_arg: request}
+        kwargs.setdefault("method", "GET")
+        result.append(kwargs)
+    return result
+
+
+async def async_invoke_request(client, request, timeout=None, executor=None):
+    """
+    Awaitable client.invoke_request, the blocking call runs on the executor.
+    :param request: dict of invoke_request keyword arguments.
+    :param timeout: (optional) seconds to wait for the response, a ConnectionError is raised when exceeded.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(executor, functools.partial(client.invoke_request, **request))
+    if not timeout:
+        return await future
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        path = request.get("path", request.get("uri"))
+        raise ConnectionError(REQUEST_TIMEOUT_MSG.format(path, timeout))
+
+
+async def async_gather_requests(client, requests, max_concurrency=DEFAULT_FANOUT_WORKERS, timeout=None,
+                                return_exceptions=False):
+    """
+    Sends the requests with at most max_concurrency in flight.
+    On the first failure the requests which were not sent yet are cancelled, unless return_exceptions
+    is set in which case the exception is returned in place of the response.
+    :return: list of responses in the order of requests.
+    """
+    requests = make_requests(client, requests)
+    max_concurrency = max(1, max_concurrency or 1)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    executor = ThreadPoolExecutor(max_workers=min(max_concurrency, max(1, len(requests))))
+
+    async def run(request):
+        async with semaphore:
+            return await async_invoke_request(client, request, timeout, executor)
+
+    tasks = [asyncio.ensure_future(run(request)) for request in requests]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        executor.shutdown(wait=False)
+
+
+def run_coroutine(coro):
+    """Runs the coroutine to completion, on a helper thread when called from a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    result = {}
+
+    def target():
+        try:
+            result["value"] = asyncio.run(coro)
+        except BaseException as err:
+            result["error"] = err
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+def gather_requests(client, requests, max_concurrency=None, timeout=None, return_exceptions=False):
+    """
+    Synchronous facade of :func:`async_gather_requests` used by the modules for bulk reads.
+    :param client: RestOME, Redfish, iDRACRedfishAPI, RestAPI or SessionAPI object.
+    :param requests: list of paths or dict of invoke_request keyword arguments.
+    :param max_concurrency: (optional) defaults to the OMAM_FANOUT_WORKERS environment variable, the
+        requests are sent one at a time when it is not set or below 2.
+    :param timeout: (optional) seconds to wait for each response.
+    :param return_exceptions: returns the exceptions in place of the responses instead of raising.
+    :return: list of responses in the order of requests.
+    """
+    requests = make_requests(client, requests)
+    if max_concurrency is None:
+        max_concurrency = get_transport_setting(FANOUT_WORKERS_ENV, DEFAULT_FANOUT_WORKERS, int)
+    if max_concurrency < 2 or len(requests) < 2:
+        responses = []
+        for request in requests:
+            try:
+                responses.append(client.invoke_request(**request))
+            except Exception as err:
+                if not return_exceptions:
+                    raise
+                responses.append(err)
+        return responses
+    return run_coroutine(async_gather_requests(client, requests, max_concurrency, timeout, return_exceptions))
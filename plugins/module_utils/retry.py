@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import random
+import socket
+import time
+from email.utils import parsedate_tz, mktime_tz
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport_setting
+
+RETRIES_ENV = "OMAM_RETRIES"
+RETRY_BACKOFF_ENV = "OMAM_RETRY_BACKOFF"
+RETRY_MAX_BACKOFF_ENV = "OMAM_RETRY_MAX_BACKOFF"
+DEFAULT_RETRIES = 0
+DEFAULT_BACKOFF_FACTOR = 1.0
+DEFAULT_MAX_BACKOFF = 30
+MAX_RETRY_AFTER = 120
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+# The server did not process the request for these codes, they are retried for every method.
+NOT_PROCESSED_STATUS_CODES = (429, 503)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+TRANSIENT_ERRORS = (socket.timeout, ConnectionResetError, ConnectionRefusedError, BrokenPipeError,
+                    http_client.RemoteDisconnected, http_client.BadStatusLine, ConnectionError)
+
+
+def get_retry_after(err):
+    """
+    Returns the Retry-After delay of an HTTPError in seconds, or None when absent or invalid.
+    Both the delay-seconds and the HTTP-date forms are accepted.
+    """
+    headers = getattr(err, "headers", None)
+    value = headers.get("Retry-After") if headers else None
+    if value is None:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return int(value)
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(0, mktime_tz(parsed) - time.time())
+
+
+def _connection_refused(err):
+    reason = getattr(err, "reason", err)
+    return isinstance(reason, ConnectionRefusedError)
+
+
+class RetryPolicy(object):
+    """
+    Decides which failures are retried and how long to wait before the next attempt.
+    Idempotent methods are retried on RETRY_STATUS_CODES and on transient connection errors.
+    POST and PATCH are retried only when the request was not processed by the server, that is
+    on 429, 503 or a refused connection.
+    """
+
+    def __init__(self, retries=DEFAULT_RETRIES, backoff_factor=DEFAULT_BACKOFF_FACTOR, max_backoff=DEFAULT_MAX_BACKOFF,
+                 jitter=True, exponential=True, status_codes=RETRY_STATUS_CODES, respect_retry_after=True,
+                 any_error=False):
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.exponential = exponential
+        self.status_codes = status_codes
+        self.respect_retry_after = respect_retry_after
+        self.any_error = any_error
+
+    @classmethod
+    def fixed(cls, retries, interval):
+        """Retries any error after a constant interval, used by the job polling loops."""
+        return cls(retries=retries, backoff_factor=interval, max_backoff=interval, jitter=False, exponential=False,
+                   respect_retry_after=False, any_error=True)
+
+    def is_retryable(self, err, method=None):
+        if self.any_error:
+            return True
+        idempotent = method is None or method.upper() in IDEMPOTENT_METHODS
+        if isinstance(err, HTTPError):
+            if err.code in NOT_PROCESSED_STATUS_CODES:
+                return err.code in self.status_codes
+            return idempotent and err.code in self.status_codes
+        if isinstance(err, SSLValidationError):
+            return False
+        if _connection_refused(err):
+            return True
+        if isinstance(err, URLError):
+            reason = err.reason
+            return idempotent and isinstance(reason, (socket.timeout, socket.error)) and \
+                not isinstance(reason, socket.gaierror)
+        return idempotent and isinstance(err, TRANSIENT_ERRORS)
+
+    def get_backoff(self, attempt, err=None):
+        """
+        Seconds to wait before the retry attempt, counted from 0. Retry-After takes precedence,
+        otherwise the exponential delay is capped by max_backoff and spread with full jitter.
+        """
+        if self.respect_retry_after:
+            retry_after = get_retry_after(err)
+            if retry_after is not None:
+                return min(retry_after, MAX_RETRY_AFTER)
+        delay = self.backoff_factor * (2 ** attempt) if self.exponential else self.backoff_factor
+        delay = min(delay, self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def new_state(self, method=None):
+        return RetryState(self, method)
+
+    def call(self, func, method=None, sleep=None):
+        """Calls func until it succeeds, the last error is raised once the retries are exhausted."""
+        state = self.new_state(method)
+        while True:
+            try:
+                return func()
+            except Exception as err:
+                delay = state.next_delay(err)
+                if delay is None:
+                    raise
+                (sleep or time.sleep)(delay)
+
+
+class RetryState(object):
+    """Attempts made so far for one request or one polling loop."""
+
+    def __init__(self, policy, method=None):
+        self.policy = policy
+        self.method = method
+        self.attempt = 0
+
+    def next_delay(self, err):
+        """Returns the seconds to wait before trying again, None when the error must be raised."""
+        if self.attempt >= self.policy.retries or not self.policy.is_retryable(err, self.method):
+            return None
+        delay = self.policy.get_backoff(self.attempt, err)
+        self.attempt += 1
+        return delay
+
+
+def get_retry_policy():
+    """
+    Returns the :class:`RetryPolicy` of a client. The OMAM_RETRIES, OMAM_RETRY_BACKOFF and
+    OMAM_RETRY_MAX_BACKOFF environment variables tune it. The environment can be set per task to tune a single module.
+    Retries are disabled by default.
+    """
+    return RetryPolicy(
+        retries=get_transport_setting(RETRIES_ENV, DEFAULT_RETRIES, int),
+        backoff_factor=get_transport_setting(RETRY_BACKOFF_ENV, DEFAULT_BACKOFF_FACTOR, float),
+        max_backoff=get_transport_setting(RETRY_MAX_BACKOFF_ENV, DEFAULT_MAX_BACKOFF, float))
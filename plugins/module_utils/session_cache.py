@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import binascii
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlsplit
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport_setting, rewind_body
+
+SESSION_CACHE_ENV = "OMAM_SESSION_CACHE"
+SESSION_CACHE_DIR_ENV = "OMAM_SESSION_CACHE_DIR"
+SESSION_CACHE_TTL_ENV = "OMAM_SESSION_CACHE_TTL"
+DEFAULT_CACHE_DIR = "~/.ansible/tmp/dellemc_openmanage_sessions"
+# Both OME and iDRAC expire idle sessions after 30 minutes by default.
+DEFAULT_TTL = 1500
+DEFAULT_PORT = 443
+PBKDF2_ROUNDS = 10000
+INVALID_SESSION_CODES = (401, 403, 404)
+
+
+def normalize_target(host, port=None):
+    """
+    Returns the (host, port) pair used as cache key, host may be a baseuri with a port.
+    :param host: hostname, IPv4, IPv6 with or without brackets or 'host:port'.
+    :param port: (optional) port, takes precedence over the port of the host string.
+    :return: tuple of lower case host and int port.
+    """
+    host = str(host).strip()
+    if host.count(":") > 1 and not host.startswith("["):
+        host = "[{0}]".format(host)
+    parsed = urlsplit("//" + host)
+    if port is None:
+        port = parsed.port
+    return (parsed.hostname or host).lower(), int(port or DEFAULT_PORT)
+
+
+class SessionCache(object):
+    """
+    On-disk cache of X-Auth-Token sessions on the controller, one file per host, port and user.
+    The files are only readable by the owner, the password is kept as a salted digest which must
+    match on lookup so that a changed password never reuses a session of the previous one.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL):
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.ttl = ttl
+
+    def _path(self, host, port, username):
+        host, port = normalize_target(host, port)
+        key = json.dumps([host, port, username])
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    @staticmethod
+    def _secret_digest(password, salt):
+        digest = hashlib.pbkdf2_hmac("sha256", str(password).encode("utf-8"), binascii.unhexlify(salt),
+                                     PBKDF2_ROUNDS)
+        return binascii.hexlify(digest).decode("ascii")
+
+    def _read(self, path):
+        try:
+            with open(path) as cache_file:
+                return json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _write(self, path, entry):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, 0o700)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(entry, tmp_file)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, path)
+        except (IOError, OSError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @contextlib.contextmanager
+    def locked(self, host, port, username):
+        """
+        Exclusive lock of the entry, held by a fork from the lookup to the login so that the other
+        forks wait for its session instead of logging in too.
+        :return: context manager yielding False when the lock could not be taken.
+        """
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir, 0o700)
+            lock_file = open(self._path(host, port, username)[:-len(".json")] + ".lock", "a")
+        except (IOError, OSError):
+            yield False
+            return
+        with lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def get(self, host, port, username, password):
+        """
+        Returns the cached entry with the token and session_id, or None when missing, expired or
+        cached for a different password.
+        """
+        path = self._path(host, port, username)
+        entry = self._read(path)
+        if not entry or not entry.get("token"):
+            return None
+        if entry.get("expires", 0) <= time.time():
+            self._remove(path)
+            return None
+        if self._secret_digest(password, entry.get("salt", "")) != entry.get("secret"):
+            return None
+        return entry
+
+    def put(self, host, port, username, password, token, session_id):
+        salt = binascii.hexlify(os.urandom(16)).decode("ascii")
+        host, port = normalize_target(host, port)
+        now = time.time()
+        entry = {"host": host, "port": port, "username": username, "token": token,
+                 "session_id": session_id, "salt": salt, "secret": self._secret_digest(password, salt),
+                 "created": now, "expires": now + self.ttl}
+        self._write(self._path(host, port, username), entry)
+        return entry
+
+    def touch(self, host, port, username):
+        """Extends the expiry of a session which was just used, sessions expire on inactivity."""
+        path = self._path(host, port, username)
+        entry = self._read(path)
+        if entry:
+            entry["expires"] = time.time() + self.ttl
+            self._write(path, entry)
+
+    def invalidate(self, host, port, username):
+        self._remove(self._path(host, port, username))
+
+    def invalidate_session(self, host, port, session_id):
+        """Removes the entries of a session deleted by id, the user name is not known then."""
+        host, port = normalize_target(host, port)
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            entry = self._read(path) if name.endswith(".json") else None
+            if entry and (entry.get("host"), entry.get("port")) == (host, port) and \
+                    str(entry.get("session_id")) == str(session_id):
+                self._remove(path)
+
+
+def get_session_cache():
+    """
+    Returns a :class:`SessionCache` when enabled through the OMAM_SESSION_CACHE environment
+    variable, otherwise None.
+    """
+    if not get_transport_setting(SESSION_CACHE_ENV, False, boolean):
+        return None
+    cache_dir = get_transport_setting(SESSION_CACHE_DIR_ENV, DEFAULT_CACHE_DIR)
+    ttl = get_transport_setting(SESSION_CACHE_TTL_ENV, DEFAULT_TTL, int)
+    return SessionCache(cache_dir, ttl)
+
+
+class SessionCacheMixin(object):
+    """
+    Session handling of the REST clients with the session cache. A cached session is validated
+    before reuse, is not deleted on exit and is replaced once when a request fails with 401.
+    Clients provide session_resource, _session_target(), _create_session() and _session_request().
+    """
+    session_cache = None
+    cached_session = False
+    _session_renewed = False
+
+    def _open_session(self):
+        """
+        Reuses a cached session or logs in, a new session is cached when the cache is enabled.
+        The lookup and the login run under the lock of the entry, a session which could not be
+        cached is not shared and is deleted on exit.
+        """
+        if self.session_cache is None:
+            self._create_session()
+            return
+        host, port = self._session_target()
+        with self.session_cache.locked(host, port, self.username) as locked:
+            if locked and self._reuse_cached_session():
+                return
+            self._create_session()
+            if locked and self.session_id:
+                self.session_cache.put(host, port, self.username, self.password,
+                                       self._headers.get("X-Auth-Token"), self.session_id)
+                self.cached_session = True
+
+    def _reuse_cached_session(self):
+        host, port = self._session_target()
+        entry = self.session_cache.get(host, port, self.username, self.password)
+        if entry is None:
+            return False
+        self._headers["X-Auth-Token"] = entry["token"]
+        try:
+            self._session_request("GET", self.session_resource["SESSION_ID"].format(Id=entry["session_id"]))
+        except HTTPError as err:
+            if err.code not in INVALID_SESSION_CODES:
+                raise
+            self.session_cache.invalidate(host, port, self.username)
+            self._headers.pop("X-Auth-Token", None)
+            return False
+        self.session_id = entry["session_id"]
+        self.cached_session = True
+        self.session_cache.touch(host, port, self.username)
+        return True
+
+    def _renew_session(self, err, data=None):
+        """
+        Logs in again after a cached session was rejected with 401.
+        :param data: body of the failed request, a file-like body is rewound, see :func:`rewind_body`.
+        :return: True when the failed request should be sent again.
+        """
+        if not self.cached_session or self._session_renewed or getattr(err, "code", None) != 401:
+            return False
+        if not rewind_body(data):
+            return False
+        self._session_renewed = True
+        host, port = self._session_target()
+        self.session_cache.invalidate(host, port, self.username)
+        self._headers.pop("X-Auth-Token", None)
+        self.session_id = None
+        self.cached_session = False
+        self._open_session()
+        return True
+
+    def _delete_session_on_exit(self):
+        return bool(self.session_id) and not self.cached_session
+
+
+def cache_created_session(module_params, token, session_id):
+    """Caches a session created by the session modules so that later tasks reuse it."""
+    cache = get_session_cache()
+    if cache is not None and token and module_params.get("username"):
+        cache.put(module_params.get("hostname"), module_params.get("port"), module_params.get("username"),
+                  module_params.get("password"), token, session_id)
+
+
+def forget_deleted_session(module_params, session_id):
+    """Drops a session deleted by the session modules from the cache."""
+    cache = get_session_cache()
+    if cache is not None and session_id:
+        cache.invalidate_session(module_params.get("hostname"), module_params.get("port"), session_id)
@@ -30,94 +30,18 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import json
-import os
 from ansible.module_utils.urls import open_url
-from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
-from ansible.module_utils.urls import open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry import get_retry_policy
+from ansible_collections.dellemc.openmanage.plugins.module_utils.request_cache import get_get_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_core import OpenURLResponse, build_url, \
+    url_common_args, execute_request, get_omam_ca_env
 from abc import ABC, abstractmethod
 
 HEADER_TYPE = "application/json"
 
 
-class OpenURLResponse():
-    """
-    HTTP response handler class.
-    """
-    def __init__(self, resp):
-        """
-        Initializes a new instance of the class.
-
-        Args:
-            resp (Response): The response object to read the body from.
-
-        Initializes the following instance variables:
-            - body (bytes): The body of the response, or None if the response is None.
-            - resp (Response): The response object.
-
-        If the response is not None, the body is set to the content of the response.
-        """
-        self.body = None
-        self.resp = resp
-        if self.resp:
-            self.body = self.resp.read()
-
-    @property
-    def json_data(self):
-        """
-        Returns the JSON data parsed from the `body` attribute of the object.
-
-        :return: The parsed JSON data.
-        :raises ValueError: If the `body` attribute cannot be parsed as JSON.
-        """
-        try:
-            return json.loads(self.body)
-        except ValueError as exc:
-            raise ValueError("Unable to parse json") from exc
-
-    @property
-    def status_code(self):
-        """
-        Get the status code of the response.
-
-        Returns:
-            int: The status code of the response.
-        """
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        """
-        Returns a boolean indicating whether the status code of the response is within the range
-          of 200-299.
-
-        :return: True if the status code is within the range of 200-299, False otherwise.
-        :rtype: bool
-        """
-        status = self.status_code
-        return status >= 200 & status <= 299
-
-    @property
-    def headers(self):
-        """
-        Returns the headers of the response object.
-
-        :return: A dictionary containing the headers of the response object.
-        :rtype: dict
-        """
-        return self.resp.headers
-
-    @property
-    def reason(self):
-        """
-        Get the reason for the response.
-
-        Returns:
-            str: The reason for the response.
-        """
-        return self.resp.reason
-
-
 class SessionAPI():
     """
     Main class for session operations.
@@ -151,6 +75,9 @@ class SessionAPI():
         self.use_proxy = module_params.get("use_proxy", True)
         self.protocol = 'https'
         self.ipaddress = config_ipv6(self.ipaddress)
+        self.transport = get_transport()
+        self.retry_policy = get_retry_policy()
+        self.get_cache = get_get_cache()
         self.set_headers(module_params)
 
     def set_headers(self, module_params):
@@ -214,13 +141,8 @@ class SessionAPI():
             >>> session._build_url("/api/endpoint", {"param1": "value1", "param2": "value2"})
             "/api/endpoint?param1=value1&param2=value2"
         """
-        url = path
-        base_uri = self._get_url(url)
-        if path:
-            url = base_uri
-        if query_param:
-            url += f"?{urlencode(query_param)}"
-        return url
+        url = self._get_url(path) if path else path
+        return build_url("", url, query_param=query_param)
 
     def _url_common_args_spec(self, method, api_timeout, headers=None, url_kwargs=None):
         """
@@ -251,15 +173,8 @@ class SessionAPI():
         req_header = self._headers
         if headers:
             req_header.update(headers)
-        url_params = {
-            "method": method,
-            "validate_certs": self.validate_certs,
-            "ca_path": self.ca_path,
-            "use_proxy": self.use_proxy,
-            "headers": req_header,
-            "timeout": api_timeout,
-            "follow_redirects": 'all'
-        }
+        url_params = url_common_args(method, req_header, api_timeout, validate_certs=self.validate_certs,
+                                     ca_path=self.ca_path, use_proxy=self.use_proxy)
         if url_kwargs:
             url_params.update(url_kwargs)
         return url_params
@@ -308,8 +223,9 @@ class SessionAPI():
         if data and dump:
             data = json.dumps(data)
         url = self._build_url(uri, query_param=query_param)
-        resp = open_url(url, data=data, **url_kwargs)
-        resp_data = OpenURLResponse(resp)
+        resp_data = execute_request(open_url, self.transport, url, data=data, retry_policy=self.retry_policy,
+                                    response_class=OpenURLResponse, cache=self.get_cache,
+                                    **url_kwargs)
         return resp_data
 
     def _get_omam_ca_env(self):
@@ -321,9 +237,7 @@ class SessionAPI():
         :return: The value of the environment variable, or None if none of the variables are set.
         :rtype: str or None
         """
-        return (os.environ.get("REQUESTS_CA_BUNDLE") or
-                os.environ.get("CURL_CA_BUNDLE") or
-                os.environ.get("OMAM_CA_BUNDLE"))
+        return get_omam_ca_env()
 
 
 class Session(ABC):
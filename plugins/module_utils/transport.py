@@ -0,0 +1,424 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import base64
+import io
+import os
+import socket
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationError
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlsplit, urljoin
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
+from ansible.module_utils.parsing.convert_bool import boolean
+
+KEEPALIVE_ENV = "OMAM_HTTP_KEEPALIVE"
+POOL_SIZE_ENV = "OMAM_HTTP_POOL_SIZE"
+IDLE_TIMEOUT_ENV = "OMAM_HTTP_IDLE_TIMEOUT"
+DEFAULT_POOL_SIZE = 4
+DEFAULT_IDLE_TIMEOUT = 60
+MAX_REDIRECTS = 10
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+# Headers dropped when a redirect leaves the original host, or when the payload is not sent again.
+AUTH_HEADERS = ("authorization", "x-auth-token")
+CONTENT_HEADERS = ("content-length", "content-type", "transfer-encoding")
+USER_AGENT = "ansible-httpget"
+STALE_CONNECTION_ERRORS = (http_client.RemoteDisconnected, http_client.BadStatusLine,
+                           ConnectionResetError, BrokenPipeError)
+
+_POOL_MANAGER = None
+_POOL_MANAGER_LOCK = threading.Lock()
+
+
+def get_transport_setting(env, default=None, type_conv=str):
+    """
+    Reads a transport tunable from the environment, tunables are not module options so that every
+    module shares them. The environment can be set per task to tune a single module.
+    :param env: name of the environment variable.
+    :param default: value returned when the variable is not set or the value is invalid.
+    :param type_conv: callable used to convert the raw value.
+    :return: converted value or default.
+    """
+    value = os.environ.get(env)
+    if value is None or value == "":
+        return default
+    try:
+        return type_conv(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def map_concurrently(func, items, max_workers):
+    """
+    Calls func for each item on a bounded pool of worker threads.
+    :param func: callable invoked with a single item.
+    :param items: list of items.
+    :param max_workers: maximum number of concurrent calls, values below 2 call func one item at a time.
+    :return: list of results in the same order as items, the first exception raised by func is re-raised.
+    """
+    items = list(items)
+    if max_workers is None or max_workers < 2 or len(items) < 2:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+class TransportStats(object):
+    """Connection level counters of a pool manager."""
+
+    def __init__(self):
+        self.requests = 0
+        self.handshakes = 0
+        self.reused = 0
+        self.handshake_time = 0.0
+        self._lock = threading.Lock()
+
+    def record_handshake(self, elapsed):
+        with self._lock:
+            self.handshakes += 1
+            self.handshake_time += elapsed
+
+    def record_request(self, reused):
+        with self._lock:
+            self.requests += 1
+            if reused:
+                self.reused += 1
+
+    @property
+    def time_saved(self):
+        """Estimated seconds saved, average handshake time multiplied by the reused requests."""
+        if not self.handshakes:
+            return 0.0
+        return (self.handshake_time / self.handshakes) * self.reused
+
+    def to_dict(self):
+        return {"requests": self.requests, "handshakes": self.handshakes, "reused": self.reused,
+                "handshake_time": round(self.handshake_time, 4),
+                "time_saved": round(self.time_saved, 4)}
+
+
+class PooledResponse(object):
+    """File like response, compatible with the object returned by open_url"""
+
+    def __init__(self, url, status, reason, headers, body):
+        self.url = url
+        self.status = status
+        self.code = status
+        self.reason = reason
+        self.headers = headers
+        self.msg = headers
+        self._fp = io.BytesIO(body)
+
+    def read(self, amt=None):
+        return self._fp.read() if amt is None else self._fp.read(amt)
+
+    def getcode(self):
+        return self.status
+
+    def geturl(self):
+        return self.url
+
+    def info(self):
+        return self.headers
+
+    def getheaders(self):
+        return list(self.headers.items())
+
+    def close(self):
+        self._fp.close()
+
+
+class HTTPConnectionPool(object):
+    """Keeps idle HTTP/1.1 connections of a single host for reuse."""
+
+    def __init__(self, scheme, host, port, ssl_context=None, max_size=DEFAULT_POOL_SIZE,
+                 idle_timeout=DEFAULT_IDLE_TIMEOUT, stats=None):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.stats = stats or TransportStats()
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _new_conn(self, timeout):
+        if self.scheme == "https":
+            conn = http_client.HTTPSConnection(self.host, self.port, timeout=timeout, context=self.ssl_context)
+        else:
+            conn = http_client.HTTPConnection(self.host, self.port, timeout=timeout)
+        start = time.time()
+        conn.connect()
+        self.stats.record_handshake(time.time() - start)
+        return conn
+
+    def _get_conn(self, timeout):
+        """Returns an idle connection which has not expired, or opens a new one."""
+        now = time.time()
+        with self._lock:
+            while self._idle:
+                conn, last_used = self._idle.pop()
+                if now - last_used < self.idle_timeout and conn.sock is not None:
+                    conn.timeout = timeout
+                    conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+        return self._new_conn(timeout), False
+
+    def _put_conn(self, conn):
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append((conn, time.time()))
+                return
+        conn.close()
+
+    def urlopen(self, method, path, body=None, headers=None, timeout=30):
+        """
+        Sends a request on a pooled connection.
+        A reused connection closed by the peer is replaced by a new one and the request is sent once again,
+        unless the body is a file-like object which cannot be rewound, see :func:`rewind_body`.
+        :returns: tuple of status, reason, headers and body
+        """
+        conn, reused = self._get_conn(timeout)
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            resp = conn.getresponse()
+            data = resp.read()
+        except STALE_CONNECTION_ERRORS:
+            conn.close()
+            if not reused or not rewind_body(body):
+                raise
+            conn, reused = self._new_conn(timeout), False
+            conn.request(method, path, body=body, headers=headers or {})
+            resp = conn.getresponse()
+            data = resp.read()
+        except Exception:
+            conn.close()
+            raise
+        self.stats.record_request(reused)
+        if resp.will_close:
+            conn.close()
+        else:
+            self._put_conn(conn)
+        return resp.status, resp.reason, resp.msg, data
+
+    def close(self):
+        with self._lock:
+            while self._idle:
+                conn, dummy = self._idle.pop()
+                conn.close()
+
+
+def rewind_body(body):
+    """
+    Makes a request body ready to be sent again. A file-like body has been read by the first attempt,
+    it is sent again only when it provides rewind(), such as :class:`upload.StreamingBody`.
+    :return: False when the body cannot be sent again.
+    """
+    if body is None or not hasattr(body, "read"):
+        return True
+    rewind = getattr(body, "rewind", None)
+    if not callable(rewind):
+        return False
+    rewind()
+    return True
+
+
+def _origin(parts):
+    return parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80)
+
+
+def _has_header(headers, name):
+    return any(key.lower() == name.lower() for key in headers)
+
+
+def _drop_headers(headers, names):
+    return dict((key, val) for key, val in headers.items() if key.lower() not in names)
+
+
+def _redirect_method(follow_redirects, status, method):
+    """
+    Method of the redirected request, following the rules of the redirect handler of open_url.
+    :return: the method, or None when the redirect is not to be followed.
+    """
+    if follow_redirects in ('urllib2', 'urllib'):
+        if method in ("GET", "HEAD") or (status in (301, 302, 303) and method == "POST"):
+            return "HEAD" if method == "HEAD" else "GET"
+        return None
+    if follow_redirects not in ('all', 'yes', True, 'safe') or \
+            (follow_redirects == 'safe' and method not in ("GET", "HEAD")):
+        return None
+    if (status in (302, 303) and method != "HEAD") or (status == 301 and method == "POST"):
+        return "GET"
+    return method
+
+
+class PoolManager(object):
+    """
+    Keep-alive transport shared by the REST clients.
+    Provides an :func:`open_url` compatible entry point and keeps one :class:`HTTPConnectionPool` per host.
+    """
+
+    def __init__(self, max_size=DEFAULT_POOL_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.stats = TransportStats()
+        self.pools = {}
+        self._lock = threading.Lock()
+
+    def _ssl_context(self, validate_certs, ca_path):
+        if not validate_certs:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif ca_path and os.path.isdir(ca_path):
+            context = ssl.create_default_context(capath=ca_path)
+        else:
+            context = ssl.create_default_context(cafile=ca_path)
+        return context
+
+    def connection_pool(self, scheme, host, port, validate_certs=True, ca_path=None):
+        key = (scheme, host, port, bool(validate_certs), ca_path)
+        with self._lock:
+            pool = self.pools.get(key)
+            if pool is None:
+                context = self._ssl_context(validate_certs, ca_path) if scheme == "https" else None
+                pool = HTTPConnectionPool(scheme, host, port, ssl_context=context, max_size=self.max_size,
+                                          idle_timeout=self.idle_timeout, stats=self.stats)
+                self.pools[key] = pool
+        return pool
+
+    @staticmethod
+    def _uses_proxy(url, host):
+        scheme = urlsplit(url).scheme
+        return scheme in getproxies() and not proxy_bypass(host)
+
+    def open_url(self, url, data=None, headers=None, method=None, use_proxy=True, validate_certs=True,
+                 url_username=None, url_password=None, force_basic_auth=False, timeout=30,
+                 ca_path=None, follow_redirects='urllib2', **kwargs):
+        """
+        Sends a request over a pooled keep-alive connection, the arguments are the same as :func:`open_url`.
+        Requests which have to go through a proxy are handed over to :func:`open_url`.
+        """
+        parts = urlsplit(url)
+        host = parts.hostname
+        if use_proxy and self._uses_proxy(url, host):
+            return open_url(url, data=data, headers=headers, method=method, use_proxy=use_proxy,
+                            validate_certs=validate_certs, url_username=url_username, url_password=url_password,
+                            force_basic_auth=force_basic_auth, timeout=timeout, ca_path=ca_path,
+                            follow_redirects=follow_redirects, **kwargs)
+        req_headers = {"User-Agent": USER_AGENT, "Connection": "keep-alive"}
+        req_headers.update(headers or {})
+        basic_auth = None
+        if url_username is not None:
+            credentials = "{0}:{1}".format(url_username, url_password or "")
+            basic_auth = "Basic {0}".format(base64.b64encode(credentials.encode("utf-8")).decode("ascii"))
+            # Like open_url, credentials are sent up front only when forced, otherwise on a Basic challenge.
+            if force_basic_auth:
+                req_headers["Authorization"] = basic_auth
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        method = (method or ("POST" if data is not None else "GET")).upper()
+        origin = _origin(parts)
+        for dummy in range(MAX_REDIRECTS + 1):
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            pool = self.connection_pool(parts.scheme, host, port, validate_certs, ca_path)
+            path = parts.path or "/"
+            if parts.query:
+                path = "{0}?{1}".format(path, parts.query)
+            try:
+                status, reason, resp_headers, body = pool.urlopen(method, path, body=data,
+                                                                  headers=req_headers, timeout=timeout)
+            except ssl.CertificateError as err:
+                raise SSLValidationError("Failed to validate the SSL certificate for {0}:{1}. {2}".format(
+                    host, port, err))
+            except ssl.SSLError as err:
+                raise SSLValidationError(str(err))
+            except (socket.error, http_client.HTTPException) as err:
+                raise URLError(err)
+            if status == 401 and basic_auth and not _has_header(req_headers, "Authorization") and \
+                    "basic" in (resp_headers.get("WWW-Authenticate") or "").lower() and rewind_body(data):
+                req_headers["Authorization"] = basic_auth
+                continue
+            location = resp_headers.get("Location")
+            if status in REDIRECT_CODES and location:
+                redirect_method = _redirect_method(follow_redirects, status, method)
+                resend = status in (307, 308) and follow_redirects not in ('urllib2', 'urllib')
+                if redirect_method is None or (resend and not rewind_body(data)):
+                    raise HTTPError(url, status, reason, resp_headers, io.BytesIO(body))
+                url = urljoin(url, location)
+                parts = urlsplit(url)
+                host = parts.hostname
+                if not resend:
+                    data = None
+                    req_headers = _drop_headers(req_headers, CONTENT_HEADERS)
+                if _origin(parts) != origin:
+                    req_headers = _drop_headers(req_headers, AUTH_HEADERS)
+                    basic_auth = None
+                method = redirect_method
+                continue
+            if status >= 400:
+                raise HTTPError(url, status, reason, resp_headers, io.BytesIO(body))
+            return PooledResponse(url, status, reason, resp_headers, body)
+        raise ConnectionError("Too many redirects while requesting {0}".format(url))
+
+    def close(self):
+        with self._lock:
+            for pool in self.pools.values():
+                pool.close()
+            self.pools = {}
+
+
+def get_pool_manager(max_size=DEFAULT_POOL_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    """Returns the process wide :class:`PoolManager`, created on first use."""
+    global _POOL_MANAGER
+    with _POOL_MANAGER_LOCK:
+        if _POOL_MANAGER is None:
+            _POOL_MANAGER = PoolManager(max_size=max_size, idle_timeout=idle_timeout)
+    return _POOL_MANAGER
+
+
+def get_transport():
+    """
+    Returns the keep-alive :class:`PoolManager` when enabled through the OMAM_HTTP_KEEPALIVE
+    environment variable, otherwise None.
+    """
+    if not get_transport_setting(KEEPALIVE_ENV, False, boolean):
+        return None
+    max_size = get_transport_setting(POOL_SIZE_ENV, DEFAULT_POOL_SIZE, int)
+    idle_timeout = get_transport_setting(IDLE_TIMEOUT_ENV, DEFAULT_IDLE_TIMEOUT, int)
+    return get_pool_manager(max_size=max_size, idle_timeout=idle_timeout)
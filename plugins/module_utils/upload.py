@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import binascii
+import os
+import time
+
+CHUNK_SIZE = 1024 * 1024
+PROGRESS_STEP = 10
+PROGRESS_MSG = "Uploaded {sent} of {total} bytes ({percent}%) at {throughput:.2f} MB/s."
+
+
+class UploadProgress(object):
+    """
+    Counts the bytes of a request body as they are sent, the callback is called each time another
+    PROGRESS_STEP percent of the body has been sent.
+    """
+
+    def __init__(self, total, callback=None, step=PROGRESS_STEP):
+        self.total = total
+        self.callback = callback
+        self.step = step
+        self.sent = 0
+        self.started = None
+        self.finished = None
+        self._reported = -1
+
+    def update(self, count):
+        now = time.time()
+        if self.started is None:
+            self.started = now
+        self.sent += count
+        if self.sent >= self.total:
+            self.finished = now
+        percent = self.percent
+        if self.callback is not None and (percent // self.step > self._reported or self.finished == now):
+            self._reported = percent // self.step
+            self.callback(self)
+
+    @property
+    def percent(self):
+        return 100 if not self.total else min(100, self.sent * 100 // self.total)
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    @property
+    def throughput(self):
+        """Bytes per second."""
+        elapsed = self.elapsed
+        return self.sent / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self):
+        return {"bytes_sent": self.sent, "bytes_total": self.total, "percent": self.percent,
+                "elapsed": round(self.elapsed, 3), "throughput": round(self.throughput, 1)}
+
+    def __str__(self):
+        return PROGRESS_MSG.format(sent=self.sent, total=self.total, percent=self.percent,
+                                   throughput=self.throughput / (1024 * 1024))
+
+
+class StreamingBody(object):
+    """
+    File-like request body made of in-memory byte strings and files which are read from disk in
+    chunks as the request is sent. The length is known beforehand so that the request is sent with
+    a Content-Length instead of being buffered. A request sent again starts over with :meth:`rewind`.
+    """
+
+    def __init__(self, parts, chunk_size=CHUNK_SIZE, progress_callback=None):
+        self.parts = parts
+        self.chunk_size = chunk_size
+        self._length = sum(os.path.getsize(part) if isinstance(part, str) else len(part) for part in parts)
+        self.progress = UploadProgress(self._length, progress_callback)
+        self._index = 0
+        self._offset = 0
+        self._file = None
+
+    def __len__(self):
+        return self._length
+
+    def _read_part(self, size):
+        part = self.parts[self._index]
+        if isinstance(part, str):
+            if self._file is None:
+                self._file = open(part, "rb")
+            data = self._file.read(size)
+            if not data:
+                self._file.close()
+                self._file = None
+        else:
+            data = part[self._offset:self._offset + size]
+            self._offset += len(data)
+        if not data:
+            self._index += 1
+            self._offset = 0
+        return data
+
+    def read(self, size=-1):
+        """Returns at most size bytes, up to chunk_size bytes when size is not given."""
+        if size is None or size < 0:
+            size = self.chunk_size
+        while self._index < len(self.parts):
+            data = self._read_part(size)
+            if data:
+                self.progress.update(len(data))
+                return data
+        return b""
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def rewind(self):
+        """Starts the body over, the progress is counted again from zero."""
+        self.close()
+        self._index = 0
+        self._offset = 0
+        self.progress = UploadProgress(self._length, self.progress.callback, self.progress.step)
+
+    def headers(self, content_type):
+        return {"Content-Type": content_type, "Content-Length": str(self._length)}
+
+
+def _quote_param(value):
+    return str(value).replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class MultipartFileBody(StreamingBody):
+    """multipart/form-data body with a single file field, the file is streamed from disk."""
+
+    def __init__(self, path, field_name="file", filename=None, file_content_type="application/octet-stream",
+                 boundary=None, chunk_size=CHUNK_SIZE, progress_callback=None):
+        self.boundary = boundary or binascii.hexlify(os.urandom(16)).decode("ascii")
+        head = "--{0}\r\nContent-Disposition: form-data; name=\"{1}\"; filename=\"{2}\"\r\n" \
+               "Content-Type: {3}\r\n\r\n".format(self.boundary, _quote_param(field_name),
+                                                  _quote_param(filename or os.path.basename(path)),
+                                                  file_content_type)
+        tail = "\r\n--{0}--\r\n".format(self.boundary)
+        super(MultipartFileBody, self).__init__([head.encode("utf-8"), path, tail.encode("utf-8")],
+                                                chunk_size=chunk_size, progress_callback=progress_callback)
+
+    @property
+    def content_type(self):
+        return "multipart/form-data; boundary={0}".format(self.boundary)
+
+
+def log_progress(module):
+    """Progress callback writing the upload progress and throughput to the module log."""
+    def callback(progress):
+        module.log(str(progress))
+    return callback
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport_setting
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import normalize_target
+
+UPLOAD_CACHE_ENV = "OMAM_UPLOAD_CACHE"
+UPLOAD_CACHE_DIR_ENV = "OMAM_UPLOAD_CACHE_DIR"
+DEFAULT_CACHE_DIR = "~/.ansible/tmp/dellemc_openmanage_uploads"
+
+
+def file_sha256(path):
+    """SHA-256 of a file, the file is memory mapped so that the digest reads the pages without copying them."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as image_file:
+        if os.fstat(image_file.fileno()).st_size:
+            with contextlib.closing(mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ)) as mapped:
+                digest.update(mapped)
+    return digest.hexdigest()
+
+
+class UploadCache(object):
+    """
+    Controller side cache of the firmware images pushed to the targets, shared by the forks of a run.
+    An image is identified by the SHA-256 of its content, computed once for a path, size and mtime.
+    For each target the location returned by the push is kept, the push is skipped while the firmware
+    inventory of the target still lists that location. The inventory ids of staged images carry the
+    component and the version, e.g. Available-159-2.4.7, so a listed location is the same version.
+    The entries are updated under an exclusive file lock, the first fork computes the digest and
+    the others read it.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = os.path.expanduser(cache_dir)
+
+    def _path(self, name):
+        return os.path.join(self.cache_dir, name + ".json")
+
+    @contextlib.contextmanager
+    def _locked(self, name):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, 0o700)
+        with open(os.path.join(self.cache_dir, name + ".lock"), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self, name):
+        try:
+            with open(self._path(name)) as cache_file:
+                return json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _write(self, name, entry):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(entry, tmp_file)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self._path(name))
+        except (IOError, OSError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def image_digest(self, path):
+        """SHA-256 of the image, read from the cache while the file keeps its size and mtime."""
+        stat = os.stat(path)
+        identity = json.dumps([os.path.realpath(path), stat.st_size, stat.st_mtime_ns])
+        name = "file-" + hashlib.sha256(identity.encode("utf-8")).hexdigest()
+        with self._locked(name):
+            entry = self._read(name)
+            if not entry or not entry.get("sha256"):
+                entry = {"path": os.path.realpath(path), "size": stat.st_size, "sha256": file_sha256(path)}
+                self._write(name, entry)
+        return entry["sha256"]
+
+    def get_staged(self, digest, target):
+        """
+        Image pushed earlier to the target.
+        :return: dict with the location and the version reported by the target, or None.
+        """
+        entry = self._read("image-" + digest) or {}
+        staged = entry.get("staged", {}).get("{0}:{1}".format(*normalize_target(target)))
+        return staged if isinstance(staged, dict) and staged.get("location") else None
+
+    def set_staged(self, digest, target, location, version=None):
+        """Records the location and the version of the image pushed to the target, a None location forgets it."""
+        name = "image-" + digest
+        with self._locked(name):
+            entry = self._read(name) or {"sha256": digest, "staged": {}}
+            key = "{0}:{1}".format(*normalize_target(target))
+            if location:
+                entry["staged"][key] = {"location": location, "version": version}
+            else:
+                entry["staged"].pop(key, None)
+            self._write(name, entry)
+
+
+def get_upload_cache():
+    """
+    Returns an :class:`UploadCache` when enabled through the OMAM_UPLOAD_CACHE environment
+    variable, otherwise None.
+    """
+    if not get_transport_setting(UPLOAD_CACHE_ENV, False, boolean):
+        return None
+    return UploadCache(get_transport_setting(UPLOAD_CACHE_DIR_ENV, DEFAULT_CACHE_DIR))
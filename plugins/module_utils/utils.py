@@ -65,6 +65,10 @@ import re
 from ansible.module_utils.six.moves.urllib.error import HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.six.moves.urllib.parse import parse_qsl
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry import RetryPolicy
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_events import get_job_event_waiter
+from ansible_collections.dellemc.openmanage.plugins.module_utils.poll_scheduler import get_poll_scheduler
 
 
 def strip_substr_dict(odata_dict, chkstr='@odata.', case_sensitive=False):
@@ -143,7 +147,7 @@ def job_tracking(rest_obj, job_uri, max_job_wait_sec=600, job_state_var=('LastRu
     # }
     # ensure job states are mutually exclusive
     max_retries = max_job_wait_sec // sleep_interval_secs
-    unresp = max_unresponsive_wait // sleep_interval_secs
+    unresponsive = RetryPolicy.fixed(max_unresponsive_wait // sleep_interval_secs, sleep_interval_secs).new_state()
     loop_ctr = 0
     job_failed = True
     job_dict = {}
@@ -152,38 +156,40 @@ def job_tracking(rest_obj, job_uri, max_job_wait_sec=600, job_state_var=('LastRu
         return job_failed, "Overlapping job states found.", job_dict, wait_time
     msg = "Job tracking started."
     time.sleep(initial_wait)
-    while loop_ctr < max_retries:
-        loop_ctr += 1
-        try:
-            job_resp = rest_obj.invoke_request('GET', job_uri)
-            job_dict = job_resp.json_data
-            job_status = job_dict
-            for x in job_state_var:
-                job_status = job_status.get(x, {})
-            if job_status in job_complete_states:
-                job_failed = False
-                msg = "Job tracking completed."
-                loop_ctr = max_retries
-            elif job_status in job_fail_states:
-                job_failed = True
-                msg = "Job is in Failed state."
-                loop_ctr = max_retries
-            if job_running_states:
-                if job_status in job_running_states:
-                    time.sleep(sleep_interval_secs)
-                    wait_time = wait_time + sleep_interval_secs
-            else:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-        except Exception as err:
-            if unresp:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-            else:
-                job_failed = True
-                msg = "Exception in job tracking " + str(err)
-                break
-            unresp = unresp - 1
+    waiter = get_job_event_waiter(rest_obj, job_uri)
+    scheduler = get_poll_scheduler(sleep_interval_secs)
+    try:
+        while loop_ctr < max_retries:
+            loop_ctr += 1
+            try:
+                job_resp = rest_obj.invoke_request('GET', job_uri)
+                job_dict = job_resp.json_data
+                job_status = job_dict
+                for x in job_state_var:
+                    job_status = job_status.get(x, {})
+                if job_status in job_complete_states:
+                    job_failed = False
+                    msg = "Job tracking completed."
+                    scheduler.finish(job_dict)
+                    break
+                if job_status in job_fail_states:
+                    job_failed = True
+                    msg = "Job is in Failed state."
+                    break
+                if not job_running_states or job_status in job_running_states:
+                    elapsed = waiter.wait(scheduler.next_interval(job_dict))
+                    wait_time = wait_time + elapsed
+                    loop_ctr -= 1 - elapsed / sleep_interval_secs  # the budget is counted in sleep_interval_secs
+            except Exception as err:
+                delay = unresponsive.next_delay(err)
+                if delay is None:
+                    job_failed = True
+                    msg = "Exception in job tracking " + str(err)
+                    break
+                time.sleep(delay)
+                wait_time = wait_time + delay
+    finally:
+        waiter.close()
     return job_failed, msg, job_dict, wait_time
 
 
@@ -198,7 +204,7 @@ def idrac_redfish_job_tracking(
     # "Scheduling", "ReadyForExecution", "Waiting", "Paused", "Failed", "CompletedWithErrors", "RebootPending",
     # "RebootFailed", "RebootCompleted", "PendingActivation", "Unknown"]
     max_retries = max_job_wait_sec // sleep_interval_secs
-    unresp = max_unresponsive_wait // sleep_interval_secs
+    unresponsive = RetryPolicy.fixed(max_unresponsive_wait // sleep_interval_secs, sleep_interval_secs).new_state()
     loop_ctr = 0
     job_failed = True
     job_dict = {}
@@ -207,36 +213,42 @@ def idrac_redfish_job_tracking(
         return job_failed, "Overlapping job states found.", job_dict, wait_time
     msg = "Job tracking started."
     time.sleep(initial_wait)
-    while loop_ctr < max_retries:
-        loop_ctr += 1
-        try:
-            job_resp = rest_obj.invoke_request(job_uri, 'GET')
-            job_dict = job_resp.json_data
-            job_status = job_dict
-            job_status = job_status.get(job_state_var, "Unknown")
-            if job_status in job_running_states:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-            elif job_status in job_complete_states:
-                job_failed = False
-                msg = "Job tracking completed."
-                loop_ctr = max_retries
-            elif job_status in job_fail_states:
-                job_failed = True
-                msg = "Job is in {0} state.".format(job_status)
-                loop_ctr = max_retries
-            else:  # unrecognised states, just wait
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-        except Exception as err:
-            if unresp:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-            else:
-                job_failed = True
-                msg = "Exception in job tracking " + str(err)
-                break
-            unresp = unresp - 1
+    waiter = get_job_event_waiter(rest_obj, job_uri)
+    scheduler = get_poll_scheduler(sleep_interval_secs)
+    try:
+        while loop_ctr < max_retries:
+            loop_ctr += 1
+            try:
+                job_resp = rest_obj.invoke_request(job_uri, 'GET')
+                job_dict = job_resp.json_data
+                job_status = job_dict
+                job_status = job_status.get(job_state_var, "Unknown")
+                if job_status in job_running_states:
+                    elapsed = waiter.wait(scheduler.next_interval(job_dict))
+                    wait_time = wait_time + elapsed
+                    loop_ctr -= 1 - elapsed / sleep_interval_secs  # the budget is counted in sleep_interval_secs
+                elif job_status in job_complete_states:
+                    job_failed = False
+                    msg = "Job tracking completed."
+                    scheduler.finish(job_dict)
+                    break
+                elif job_status in job_fail_states:
+                    job_failed = True
+                    msg = "Job is in {0} state.".format(job_status)
+                    break
+                else:  # unrecognised states, just wait
+                    time.sleep(sleep_interval_secs)
+                    wait_time = wait_time + sleep_interval_secs
+            except Exception as err:
+                delay = unresponsive.next_delay(err)
+                if delay is None:
+                    job_failed = True
+                    msg = "Exception in job tracking " + str(err)
+                    break
+                time.sleep(delay)
+                wait_time = wait_time + delay
+    finally:
+        waiter.close()
     return job_failed, msg, job_dict, wait_time
 
 
@@ -273,17 +285,21 @@ def wait_for_job_completion(redfish_obj, uri, job_wait=True, wait_timeout=120, s
     max_sleep_time = wait_timeout
     sleep_interval = sleep_time
     if job_wait:
-        while max_sleep_time:
-            if max_sleep_time > sleep_interval:
-                max_sleep_time = max_sleep_time - sleep_interval
-            else:
-                sleep_interval = max_sleep_time
-                max_sleep_time = 0
-            time.sleep(sleep_interval)
-            job_resp = redfish_obj.invoke_request("GET", uri)
-            if job_resp.json_data.get("PercentComplete") == 100:
-                time.sleep(10)
-                return job_resp, ""
+        waiter = get_job_event_waiter(redfish_obj, uri)
+        try:
+            while max_sleep_time:
+                if max_sleep_time > sleep_interval:
+                    max_sleep_time = max_sleep_time - sleep_interval
+                else:
+                    sleep_interval = max_sleep_time
+                    max_sleep_time = 0
+                max_sleep_time = max_sleep_time + sleep_interval - waiter.wait(sleep_interval)
+                job_resp = redfish_obj.invoke_request("GET", uri)
+                if job_resp.json_data.get("PercentComplete") == 100:
+                    time.sleep(10)
+                    return job_resp, ""
+        finally:
+            waiter.close()
     else:
         job_resp = redfish_obj.invoke_request("GET", uri)
         time.sleep(10)
@@ -419,6 +435,63 @@ def get_all_data_with_pagination(ome_obj, uri, query_param=None):
     return {"resp_obj": resp, "report_list": report_list}
 
 
+def _next_page_request(next_link, carry_query):
+    """Splits an @odata.nextLink into a path and query parameters, carrying over the original query."""
+    next_path = next_link.split("/api", 1)[-1].lstrip("/")
+    next_path, dummy, next_query = next_path.partition("?")
+    query_param = dict(parse_qsl(next_query))
+    for key, val in carry_query.items():
+        query_param.setdefault(key, val)
+    return next_path, query_param
+
+
+def iter_pages_with_pagination(ome_obj, uri, query_param=None, select=None):
+    """
+    Streams an OME collection page by page, the next page is requested only when the caller asks for it.
+    Follows '@odata.nextLink', when the response has no next link and the caller did not page the request
+    with $top or $skip, the remaining $top/$skip windows are derived from '@odata.count'.
+    :param ome_obj: RestOME object.
+    :param uri: collection uri.
+    :param query_param: (optional) query parameters, carried over to every page.
+    :param select: (optional) list of property names sent as $select.
+    :return: generator of the decoded json of each page.
+    """
+    query_param = dict(query_param or {})
+    if select:
+        query_param["$select"] = select if isinstance(select, str) else ",".join(select)
+    carry_query = dict((k, v) for k, v in query_param.items() if k not in ("$top", "$skip"))
+    windowed = "$top" not in query_param and "$skip" not in query_param
+    data = ome_obj.invoke_request('GET', uri, query_param=query_param or None).json_data
+    page_size = len(data.get("value", []))
+    fetched = page_size
+    total_count = data.get("@odata.count", 0)
+    yield data
+    while True:
+        next_link = data.get("@odata.nextLink")
+        if next_link:
+            next_path, next_query = _next_page_request(next_link, carry_query)
+        elif windowed and page_size and fetched < total_count:
+            next_path, next_query = uri, dict(carry_query, **{"$top": page_size, "$skip": fetched})
+        else:
+            break
+        data = ome_obj.invoke_request('GET', next_path, query_param=next_query).json_data
+        value = data.get("value", [])
+        if not value and not data.get("@odata.nextLink"):
+            break
+        fetched += len(value)
+        yield data
+
+
+def iter_items_with_pagination(ome_obj, uri, query_param=None, select=None):
+    """
+    Streams the items of an OME collection, see :func:`iter_pages_with_pagination`.
+    Callers can filter, map or stop early without holding the full collection in memory.
+    """
+    for page in iter_pages_with_pagination(ome_obj, uri, query_param=query_param, select=select):
+        for item in page.get("value", []):
+            yield item
+
+
 def remove_key(data, regex_pattern='@odata.'):
     '''
     :param data: the dict/list to be stripped of unwanted keys
@@ -464,20 +537,24 @@ def wait_for_redfish_job_complete(redfish_obj, job_uri, job_wait=True, wait_time
     job_msg = "The job is not complete after {0} seconds.".format(wait_timeout)
     job_resp = {}
     if job_wait:
-        while max_sleep_time:
-            if max_sleep_time > sleep_interval:
-                max_sleep_time = max_sleep_time - sleep_interval
-            else:
-                sleep_interval = max_sleep_time
-                max_sleep_time = 0
-            time.sleep(sleep_interval)
-            job_resp = redfish_obj.invoke_request("GET", job_uri, api_timeout=120)
-            if job_resp.json_data.get("PercentComplete") == 100:
-                time.sleep(10)
-                return job_resp, ""
-            if job_resp.json_data.get("JobState") == "RebootFailed":
-                time.sleep(10)
-                return job_resp, job_msg
+        waiter = get_job_event_waiter(redfish_obj, job_uri)
+        try:
+            while max_sleep_time:
+                if max_sleep_time > sleep_interval:
+                    max_sleep_time = max_sleep_time - sleep_interval
+                else:
+                    sleep_interval = max_sleep_time
+                    max_sleep_time = 0
+                max_sleep_time = max_sleep_time + sleep_interval - waiter.wait(sleep_interval)
+                job_resp = redfish_obj.invoke_request("GET", job_uri, api_timeout=120)
+                if job_resp.json_data.get("PercentComplete") == 100:
+                    time.sleep(10)
+                    return job_resp, ""
+                if job_resp.json_data.get("JobState") == "RebootFailed":
+                    time.sleep(10)
+                    return job_resp, job_msg
+        finally:
+            waiter.close()
     else:
         time.sleep(10)
         job_resp = redfish_obj.invoke_request("GET", job_uri, api_timeout=120)
@@ -28,9 +28,54 @@ extends_documentation_fragment:
   - dellemc.openmanage.idrac_auth_options
 options:
     share_name:
-        description: Network share path of update repository. CIFS, NFS, HTTP, HTTPS and FTP share types are supported.
+        description:
+          - Network share path of update repository. CIFS, NFS, HTTP, HTTPS and FTP share types are supported.
+          - I(share_name) is mutually exclusive with I(local_repository), one of them is required.
         type: str
-        required: true
+    local_repository:
+        description:
+          - Serves a repository directory of the ansible controller, or of the host the task is delegated to,
+            over HTTP or HTTPS and points the iDRAC at it instead of at I(share_name).
+          - The server is started in the background by the first task and is reused by the following tasks
+            which serve the same I(path), it exits after I(idle_timeout) seconds without requests.
+          - A reused server keeps the I(max_client_connections), I(rate_limit) and I(idle_timeout) of the
+            task which started it, a warning is reported when they differ.
+          - Byte range requests are supported so that the iDRAC can resume interrupted downloads.
+        type: dict
+        version_added: 9.10.0
+        suboptions:
+          path:
+            description: Local directory which contains the I(catalog_file_name) and the update packages.
+            type: path
+            required: true
+          address:
+            description:
+              - Address of the local host the iDRAC downloads from.
+              - When not provided, the address of the interface which routes to I(idrac_ip) is used.
+            type: str
+          port:
+            description: Port the repository server listens on, C(0) selects a free port.
+            type: int
+            default: 0
+          max_client_connections:
+            description:
+              - Maximum concurrent downloads of a single iDRAC.
+              - Further requests are answered with HTTP 503 and a Retry-After header.
+            type: int
+            default: 4
+          rate_limit:
+            description: Maximum transfer rate of each download in bytes per second, not limited when not provided.
+            type: int
+          idle_timeout:
+            description: Seconds without requests after which the repository server exits.
+            type: int
+            default: 900
+          certificate:
+            description: Certificate file in PEM format, the repository is served over HTTPS when provided.
+            type: path
+          private_key:
+            description: Private key file of the I(certificate) in PEM format, when not part of the I(certificate).
+            type: path
     share_user:
         description: Network share user in the format 'user@domain' or 'domain\\user' if user is
             part of a domain else 'user'. This option is mandatory for CIFS Network Share.
@@ -49,7 +94,7 @@ options:
         type: bool
         default: true
     catalog_file_name:
-        description: Catalog file name relative to the I(share_name).
+        description: Catalog file name relative to the I(share_name) or I(local_repository) path.
         type: str
         default: 'Catalog.xml'
     ignore_cert_warning:
@@ -111,6 +156,25 @@ options:
     proxy_passwd:
         description: The password for the proxy server.
         type: str
+    precheck:
+        description:
+          - Compares the firmware inventory of the iDRAC with a local copy of the catalog before the
+            repository update is submitted.
+          - If every installed component is at the catalog version, then the module exits with no changes
+            and no job is created on the iDRAC.
+          - The catalog is read from I(precheck_catalog), else from the I(local_repository) path, else from
+            I(share_mnt).
+          - If no local copy of the catalog is found, the firmware inventory cannot be read, or no installed
+            component is listed in the catalog for the system, then a warning is reported and the update is
+            submitted to the iDRAC.
+          - This is applicable only for iDRACs that support Redfish.
+        type: bool
+        default: false
+        version_added: 9.10.0
+    precheck_catalog:
+        description: Local copy of the I(catalog_file_name) of the repository used by I(precheck).
+        type: path
+        version_added: 9.10.0
 
 requirements:
     - "omsdk >= 1.2.503"
@@ -126,6 +190,8 @@ notes:
     - For server with iDRAC firmware 5.00.00.00 and later, if the repository contains unsupported packages, then the
         module will return success with a proper message.
     - This module supports both IPv4 and IPv6 address for I(idrac_ip) and I(share_name).
+    - I(local_repository) is supported on Linux hosts only, the iDRAC must be able to reach the repository
+        server on the I(local_repository) address and port.
     - This module supports C(check_mode).
 '''
 
@@ -206,6 +272,34 @@ EXAMPLES = """
        reboot: true
        job_wait: true
        apply_update: true
+
+- name: Update firmware from repository on a HTTPS, skipping servers that are up to date
+  dellemc.openmanage.idrac_firmware:
+       idrac_ip: "192.168.0.1"
+       idrac_user: "user_name"
+       idrac_password: "user_password"
+       ca_path: "/path/to/ca_cert.pem"
+       share_name: "https://downloads.dell.com"
+       precheck: true
+       precheck_catalog: "/opt/dell/Catalog.xml"
+       reboot: true
+       job_wait: true
+       apply_update: true
+
+- name: Update firmware from a repository served by the ansible controller
+  dellemc.openmanage.idrac_firmware:
+       idrac_ip: "192.168.0.1"
+       idrac_user: "user_name"
+       idrac_password: "user_password"
+       ca_path: "/path/to/ca_cert.pem"
+       local_repository:
+         path: "/opt/dell/repository"
+         max_client_connections: 2
+         rate_limit: 10485760
+       catalog_file_name: "Catalog.xml"
+       reboot: true
+       job_wait: true
+       apply_update: true
 """
 
 RETURN = """
@@ -238,6 +332,11 @@ from ssl import SSLError
 from xml.etree import ElementTree as ET
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_tracker import BatchJobTracker, \
+    fetch_redfish_jobs
+from ansible_collections.dellemc.openmanage.plugins.module_utils.firmware_catalog import get_firmware_catalog
+from ansible_collections.dellemc.openmanage.plugins.module_utils.repo_server import ensure_repository_server, \
+    detect_local_address
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.six.moves.urllib.parse import urlparse
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -259,6 +358,7 @@ PATH = "/redfish/v1/Dell/Systems/System.Embedded.1/DellSoftwareInstallationServi
 GET_REPO_BASED_UPDATE_LIST_PATH = "/redfish/v1/Dell/Systems/System.Embedded.1/DellSoftwareInstallationService/" \
                                   "Actions/DellSoftwareInstallationService.GetRepoBasedUpdateList"
 JOB_URI = "/redfish/v1/JobService/Jobs/{job_id}"
+JOB_COLLECTION_URI = "/redfish/v1/JobService/Jobs?$expand=*($levels=1)"
 iDRAC_JOB_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/{job_id}"
 LOG_SERVICE_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/LogServices/Lclog"
 iDRAC9_LC_LOG = "/redfish/v1/Managers/iDRAC.Embedded.1/LogServices/Lclog/Entries"
@@ -271,6 +371,12 @@ REDFISH_VERSION = "3.30"
 INTERVAL = 30  # polling interval
 WAIT_COUNT = 240
 JOB_WAIT_MSG = 'Job wait timed out after {0} minutes'
+CATALOG_NOT_FOUND = "Unable to find the catalog file '{0}' in the local repository '{1}'."
+REPO_SERVER_ERROR = "Unable to start the local repository server: {0}"
+FIRMWARE_INVENTORY_URI = "/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)"
+SYSTEM_URI = "/redfish/v1/Systems/System.Embedded.1"
+PRECHECK_SKIPPED = "Skipped the firmware pre-check, {0}."
+NO_CHANGES_MSG = "No changes found to commit!"
 
 
 def wait_for_job_completion(module, job_uri, job_wait=False, reboot=False, apply_update=False):
@@ -323,15 +429,116 @@ def _validate_catalog_file(catalog_file_name):
         raise ValueError('catalog_file_name should be an XML file.')
 
 
+def start_local_repository(module):
+    """Serves the local repository and points share_name at it."""
+    repo = module.params['local_repository']
+    path = repo['path']
+    catalog_file_name = module.params['catalog_file_name']
+    catalog_path = os.path.join(path, catalog_file_name)
+    if not os.path.isfile(catalog_path):
+        raise ValueError(CATALOG_NOT_FOUND.format(catalog_file_name, path))
+    # Rejects a catalog the iDRAC would fail on only after downloading it.
+    get_firmware_catalog(catalog_path)
+    try:
+        address = repo.get('address') or detect_local_address(module.params['idrac_ip'])
+        module.params['share_name'] = ensure_repository_server(
+            path, address, port=repo['port'], max_client_connections=repo['max_client_connections'],
+            rate_limit=repo.get('rate_limit'), certificate=repo.get('certificate'),
+            private_key=repo.get('private_key'), idle_timeout=repo['idle_timeout'], warn=module.warn)
+    except OSError as err:
+        raise RuntimeError(REPO_SERVER_ERROR.format(err))
+
+
+def _get_precheck_catalog(module):
+    params = module.params
+    if params['precheck_catalog']:
+        return params['precheck_catalog']
+    for base in ((params['local_repository'] or {}).get('path'), params['share_mnt']):
+        if base and os.path.isfile(os.path.join(base, params['catalog_file_name'])):
+            return os.path.join(base, params['catalog_file_name'])
+    return None
+
+
+def firmware_precheck(idrac, module):
+    """
+    Compares the firmware inventory with the local copy of the catalog and exits when no component has
+    a newer package, the repository update is then not submitted. The pre-check is an optimization, on
+    any error the update proceeds as without it.
+    """
+    catalog_path = _get_precheck_catalog(module)
+    if catalog_path is None:
+        module.warn(PRECHECK_SKIPPED.format("a local copy of the catalog is not available"))
+        return
+    try:
+        catalog = get_firmware_catalog(catalog_path)
+        inventory = idrac.invoke_request(FIRMWARE_INVENTORY_URI, "GET").json_data.get("Members") or []
+        # Members are links only when $expand is not supported.
+        if not inventory or any("Id" not in member for member in inventory):
+            module.warn(PRECHECK_SKIPPED.format("the firmware inventory is not available"))
+            return
+        system = idrac.invoke_request(SYSTEM_URI, "GET").json_data
+        system_id = (((system.get("Oem") or {}).get("Dell") or {}).get("DellSystem") or {}).get("SystemID")
+        model = system.get("Model")
+    except (HTTPError, URLError, ValueError, OSError, AttributeError) as err:
+        # AttributeError when a response body is empty or not a JSON object.
+        module.warn(PRECHECK_SKIPPED.format(err))
+        return
+    updates = catalog.get_updates(inventory, system_id, model)
+    if updates is None:
+        module.warn(PRECHECK_SKIPPED.format("no installed component is listed in the catalog for the system"))
+    elif not updates:
+        module.exit_json(msg=NO_CHANGES_MSG if module.check_mode else EXIT_MESSAGE)
+
+
 def get_check_mode_status(status, module):
     if status['job_details']["Data"]["GetRepoBasedUpdateList_OUTPUT"].get("Message") == MESSAGE.rstrip(".") and \
             status.get('JobStatus') == "Completed":
         if module.check_mode:
-            module.exit_json(msg="No changes found to commit!")
+            module.exit_json(msg=NO_CHANGES_MSG)
         module.exit_json(msg=EXIT_MESSAGE)
 
 
-def get_job_status(module, each_comp, idrac):
+def is_component_job_finished(job, reboot, apply_update):
+    job_state = job.get("JobState")
+    if job.get("PercentComplete") == 100 and job_state == "Completed":  # apply now
+        return True
+    return job_state in ["Starting", "Running", "Pending", "New"] and not reboot and apply_update  # apply on
+
+
+def track_component_jobs(module, components):
+    """
+    Reads the update jobs of all the components together, one job collection request per interval
+    instead of one wait per component. Returns an empty dict when there is nothing to batch, the
+    component is then tracked on its own. When the jobs stop being readable the jobs read so far
+    are returned and the jobs still pending are reported as timed out.
+    :return: dict of job id to a tuple of job and timeout message.
+    """
+    job_ids = [comp.get("JobID") for comp in components if comp.get("JobID") is not None]
+    if len(job_ids) < 2:
+        return {}
+    reboot, apply_update = module.params['reboot'], module.params['apply_update']
+    tracker = BatchJobTracker(None, job_ids, fetch_component_jobs,
+                              lambda job: is_component_job_finished(job, reboot, apply_update),
+                              sleep_interval=INTERVAL, wait_timeout=WAIT_COUNT * INTERVAL)
+    try:
+        with iDRACRedfishAPI(module.params) as redfish:
+            tracker.rest_obj = redfish
+            if module.params['job_wait']:
+                tracker.wait()
+            else:
+                tracker.jobs, tracker.pending = fetch_component_jobs(redfish, job_ids), []
+    except (HTTPError, URLError, ValueError, KeyError):
+        pass
+    jobs, pending = tracker.jobs, tracker.pending
+    timeout_msg = JOB_WAIT_MSG.format((WAIT_COUNT * INTERVAL) / 60)
+    return dict((job_id, (jobs.get(job_id), timeout_msg if job_id in pending else None)) for job_id in job_ids)
+
+
+def fetch_component_jobs(redfish, job_ids):
+    return fetch_redfish_jobs(redfish, job_ids, collection_uri=JOB_COLLECTION_URI, job_uri=JOB_URI)
+
+
+def get_job_status(module, each_comp, idrac, tracked_job=None):
     failed, each_comp['JobStatus'], each_comp['Message'] = False, None, None
     job_wait = module.params['job_wait']
     reboot = module.params['reboot']
@@ -350,10 +557,13 @@ def get_job_status(module, each_comp, idrac):
                 each_comp['JobStatus'] = "Critical"
                 failed = True
         else:
-            resp, msg = wait_for_job_completion(module, JOB_URI.format(job_id=each_comp.get("JobID")), job_wait, reboot,
-                                                apply_update)
+            if tracked_job is not None:
+                resp_data, msg = tracked_job
+            else:
+                resp, msg = wait_for_job_completion(module, JOB_URI.format(job_id=each_comp.get("JobID")), job_wait,
+                                                    reboot, apply_update)
+                resp_data = None if msg else resp.json_data
             if not msg:
-                resp_data = resp.json_data
                 if resp_data.get('Messages'):
                     each_comp['Message'] = resp_data.get('Messages')[0]['Message']
                 each_comp['JobStatus'] = resp_data.get('JobStatus')
@@ -369,9 +579,11 @@ def _convert_xmltojson(module, job_details, idrac):
     data, repo_status, failed_status = [], False, False
     try:
         xmldata = ET.fromstring(job_details['PackageList'])
-        for iname in xmldata.iter('INSTANCENAME'):
-            comp_data = dict([(attr.attrib['NAME'], txt.text) for attr in iname.iter("PROPERTY") for txt in attr])
-            component, failed = get_job_status(module, comp_data, idrac)
+        components = [dict([(attr.attrib['NAME'], txt.text) for attr in iname.iter("PROPERTY") for txt in attr])
+                      for iname in xmldata.iter('INSTANCENAME')]
+        tracked_jobs = {} if idrac else track_component_jobs(module, components)
+        for comp_data in components:
+            component, failed = get_job_status(module, comp_data, idrac, tracked_jobs.get(comp_data.get("JobID")))
             # get the any single component update failure and record the only very first failure on failed_status True
             if not failed_status and failed:
                 failed_status = True
@@ -585,7 +797,7 @@ def update_firmware_omsdk(idrac, module):
 
     if module.check_mode and not (json_data.get('PackageList') or json_data.get('Data')) and \
             msg['update_status']['JobStatus'] == 'Completed':
-        module.exit_json(msg="No changes found to commit!")
+        module.exit_json(msg=NO_CHANGES_MSG)
     elif module.check_mode and (json_data.get('PackageList') or json_data.get('Data')) and \
             msg['update_status']['JobStatus'] == 'Completed':
         module.exit_json(msg="Changes found to commit!", changed=True,
@@ -702,7 +914,7 @@ def update_firmware_redfish(idrac, module, repo_urls):
 
     if module.check_mode and not (json_data.get('PackageList') or json_data.get('Data')) and \
             msg['update_status']['JobStatus'] == 'OK':
-        module.exit_json(msg="No changes found to commit!")
+        module.exit_json(msg=NO_CHANGES_MSG)
     elif module.check_mode and (json_data.get('PackageList') or json_data.get('Data')) and \
             msg['update_status']['JobStatus'] == 'OK':
         module.exit_json(msg="Changes found to commit!", changed=True,
@@ -731,7 +943,17 @@ def update_firmware_redfish(idrac, module, repo_urls):
 
 def main():
     specs = {
-        "share_name": {"required": True, "type": 'str'},
+        "share_name": {"type": 'str'},
+        "local_repository": {"type": 'dict', "options": {
+            "path": {"type": 'path', "required": True},
+            "address": {"type": 'str'},
+            "port": {"type": 'int', "default": 0},
+            "max_client_connections": {"type": 'int', "default": 4},
+            "rate_limit": {"type": 'int'},
+            "idle_timeout": {"type": 'int', "default": 900},
+            "certificate": {"type": 'path'},
+            "private_key": {"type": 'path', "no_log": False},
+        }},
         "share_user": {"type": 'str'},
         "share_password": {"type": 'str', "aliases": ['share_pwd'], "no_log": True},
         "share_mnt": {"type": 'str'},
@@ -748,6 +970,8 @@ def main():
         "proxy_port": {"type": 'int'},
         "proxy_uname": {"type": 'str'},
         "proxy_passwd": {"type": 'str', "no_log": True},
+        "precheck": {"type": 'bool', "default": False},
+        "precheck_catalog": {"type": 'path'},
     }
     specs.update(idrac_auth_params)
     module = AnsibleModule(
@@ -756,6 +980,8 @@ def main():
             # ['proxy_type', 'SOCKS', ('proxy_port',)],
             ['proxy_support', 'ParametersProxy', ('proxy_server', 'proxy_type', 'proxy_port',)],
         ],
+        mutually_exclusive=[('share_name', 'local_repository')],
+        required_one_of=[('share_name', 'local_repository')],
         supports_check_mode=True)
 
     redfish_check = False
@@ -771,6 +997,11 @@ def main():
     try:
         # Validate the catalog file
         _validate_catalog_file(module.params['catalog_file_name'])
+        if module.params['precheck'] and redfish_check:
+            with iDRACRedfishAPI(module.params) as redfish_obj:
+                firmware_precheck(redfish_obj, module)
+        if module.params['local_repository']:
+            start_local_repository(module)
         if module.check_mode:
             module.params['apply_update'] = False
             module.params['reboot'] = False
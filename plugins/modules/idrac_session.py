@@ -91,6 +91,8 @@ notes:
     - This module supports IPv4 and IPv6 addresses.
     - This module supports C(check_mode).
     - This module will always report changes found to be applied when I(state) is C(present).
+    - When the environment variable C(OMAM_SESSION_CACHE) is set to C(true), a created session is cached on the
+      controller and is reused by later tasks for the same host, port and user. A deleted session is removed from the cache.
 """
 
 EXAMPLES = r"""
@@ -214,6 +216,8 @@ error_info:
 import json
 from urllib.error import HTTPError, URLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.session_utils import SessionAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import cache_created_session, \
+    forget_deleted_session
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.common.parameters import env_fallback
@@ -299,6 +303,7 @@ class CreateSession(Session):
             session_details = session_response.json_data
             session_data = remove_key(session_details, regex_pattern=ODATA_REGEX)
             x_auth_token = session_response.headers.get('X-Auth-Token')
+            cache_created_session(self.module.params, x_auth_token, session_details.get("Id"))
             self.module.exit_json(msg=CREATE_SUCCESS_MSG,
                                   changed=True,
                                   session_data=session_data,
@@ -345,6 +350,7 @@ class DeleteSession(Session):
                                                                  "DELETE")
                     status = session_response.status_code
                     if status == 200:
+                        forget_deleted_session(self.module.params, session_id)
                         self.module.exit_json(msg=DELETE_SUCCESS_MSG, changed=True)
                 except HTTPError as err:
                     filter_err = remove_key(json.load(err), regex_pattern=ODATA_REGEX)
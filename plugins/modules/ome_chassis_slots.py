@@ -257,10 +257,10 @@ from ssl import SSLError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_tracker import BatchJobTracker, fetch_ome_jobs
 from ansible.module_utils.common.dict_transformations import recursive_diff
 
 DEVICE_URI = "DeviceService/Devices"
-JOB_URI = "JobService/Jobs"
 DEVICE_REPEATED = "Duplicate device entry found for devices with identifiers {0}."
 INVALID_SLOT_DEVICE = "Unable to rename one or more slots because either the specified device is invalid or slots " \
                       "cannot be configured. The devices for which the slots cannot be renamed are: {0}."
@@ -279,6 +279,7 @@ SLOT_NUM_DUP = "Slot numbers are repeated for chassis {0}."
 CHASSIS_REPEATED = "Duplicate chassis entry found for chassis with service tags {0}."
 SETTLING_TIME = 2  # time gap between so consecutive job trigger
 JOB_TIMEOUT = 300
+JOB_INCOMPLETE = (2050, 2030, 2040, 2080)  # Running, Queued, Starting, New
 JOB_INTERVAL = 5
 
 
@@ -379,38 +380,28 @@ def start_slot_name_jobs(rest_obj, slot_data):
     return failed_jobs
 
 
+def is_slot_job_finished(job):
+    return job.get('LastRunStatus', {}).get('Id') not in JOB_INCOMPLETE
+
+
 def get_job_states(module, rest_obj, slot_data):
     job_dict = dict([(slot['JobId'], k) for k, slot in slot_data.items() if slot['JobId']])
-    query_params = {"$filter": "JobType/Id eq 3"}  # optimize this
-    count = JOB_TIMEOUT // SETTLING_TIME
-    job_incomplete = [2050, 2030, 2040, 2080]  # Running, Queued, Starting, New
-    while count > 0 and job_dict:
+    if job_dict:
+        tracker = BatchJobTracker(rest_obj, list(job_dict), fetch_ome_jobs, is_slot_job_finished,
+                                  sleep_interval=SETTLING_TIME, wait_timeout=JOB_TIMEOUT,
+                                  max_unresponsive_wait=3 * SETTLING_TIME)  # 3 times retry for HTTP error
         try:
-            job_resp = rest_obj.invoke_request("GET", JOB_URI, query_param=query_params)
-            jobs = job_resp.json_data.get('value')
+            jobs = tracker.wait()[0]
         except HTTPError:
-            count = count - 50  # 3 times retry for HTTP error
-            time.sleep(SETTLING_TIME)
-            continue
-        job_over = []
-        for job in jobs:
-            id = job.get('Id')
-            if id in job_dict:
-                lrs = job.get('LastRunStatus')
-                slot = slot_data[job_dict[id]]
-                if lrs.get('Id') in job_incomplete:  # Running, not failed, not completed state
-                    job_over.append(False)
-                elif lrs.get('Id') == 2060:
-                    job_over.append(True)
-                    slot['SlotName'] = slot.pop('new_name')
-                    job_dict.pop(id)
-                else:
-                    slot['JobStatus'] = lrs.get('Name')
-                    job_over.append(True)  # Failed states - job not running
-        if all(job_over) or not job_dict:
-            break
-        count = count - 1
-        time.sleep(SETTLING_TIME)
+            jobs = tracker.jobs
+        for id, job in jobs.items():
+            lrs = job.get('LastRunStatus')
+            slot = slot_data[job_dict[id]]
+            if lrs.get('Id') == 2060:
+                slot['SlotName'] = slot.pop('new_name')
+                job_dict.pop(id)
+            elif lrs.get('Id') not in JOB_INCOMPLETE:
+                slot['JobStatus'] = lrs.get('Name')  # Failed states - job not running
     failed_jobs = dict([(k, slot_data.pop(k)) for k in job_dict.values()])
     return failed_jobs
 
@@ -149,6 +149,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_core import gather_requests
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
@@ -208,9 +209,9 @@ def compliance_report(module, rest_obj):
             report = baseline_report.get("value")
         device_compliance = report
         if device_compliance:
-            for each in device_compliance:
-                compliance_uri = COMPLIANCE_URI.format(baseline_id, each["Id"])
-                attr_group = rest_obj.invoke_request("GET", compliance_uri)
+            compliance_uris = [COMPLIANCE_URI.format(baseline_id, each["Id"]) for each in device_compliance]
+            attr_groups = gather_requests(rest_obj, compliance_uris)
+            for each, attr_group in zip(device_compliance, attr_groups):
                 each["ComplianceAttributeGroups"] = attr_group.json_data.get("ComplianceAttributeGroups")
     return device_compliance
 
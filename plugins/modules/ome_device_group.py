@@ -278,6 +278,10 @@ error_info:
 import json
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_resolver import DeviceResolver, \
+    invalid_device_message
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ip_ranges import IPRangeSet, parse_address, \
+    format_address
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 
@@ -356,27 +360,28 @@ def get_all_ips(ip_addresses, module):
     return ip_addresses_list
 
 
-def get_device_id_from_ip(ip_addresses, device_list, module):
-    ip_map = dict(
-        [(each_device["DeviceManagement"][0]["NetworkAddress"], each_device["Id"]) for each_device in device_list
-         if each_device["DeviceManagement"]])
+def _ip_interval(ip_format):
+    if isinstance(ip_format, IPAddress):
+        return ip_format.version, int(ip_format), int(ip_format)
+    return ip_format.version, ip_format.first, ip_format.last
+
+
+def _match_device_ips(ip_ranges, device_list):
     device_id_list_map = {}
-    for available_ip, device_id in ip_map.items():
-        for ip_formats in ip_addresses:
-            if isinstance(ip_formats, IPAddress):
-                try:
-                    ome_ip = IPAddress(available_ip)
-                except AddrFormatError:
-                    ome_ip = IPAddress(available_ip.replace(']', '').replace('[', ''))
-                if ome_ip == ip_formats:
-                    device_id_list_map.update({device_id: str(ip_formats)})
-            if not isinstance(ip_formats, IPAddress):
-                try:
-                    ome_ip = IPAddress(available_ip)
-                except AddrFormatError:
-                    ome_ip = IPAddress(available_ip.replace(']', '').replace('[', ''))
-                if ome_ip in ip_formats:
-                    device_id_list_map.update({device_id: str(ome_ip)})
+    for each_device in device_list:
+        if not each_device["DeviceManagement"]:
+            continue
+        ome_ip = parse_address(each_device["DeviceManagement"][0]["NetworkAddress"])
+        if ome_ip is not None and ip_ranges.contains(*ome_ip):
+            device_id_list_map[each_device["Id"]] = format_address(*ome_ip)
+    return device_id_list_map
+
+
+def get_device_id_from_ip(ip_addresses, device_list, module, resolver=None):
+    ip_ranges = IPRangeSet(_ip_interval(ip_format) for ip_format in ip_addresses)
+    device_id_list_map = _match_device_ips(ip_ranges, device_list)
+    if len(device_id_list_map) == 0 and resolver is not None and resolver.refresh():
+        device_id_list_map = _match_device_ips(ip_ranges, resolver.load_all())
     if len(device_id_list_map) == 0:
         module.fail_json(msg=IP_NOT_EXISTS)
     return device_id_list_map
@@ -386,8 +391,7 @@ def get_device_id(rest_obj, module):
     device_id_list = module.params.get("device_ids")
     device_tag_list = module.params.get("device_service_tags")
     ip_addresses = module.params.get("ip_addresses")
-    device_list = rest_obj.get_all_report_details(DEVICE_URI)
-    invalid, each_device_list, each_tag_to_id = [], [], []
+    each_device_list = []
     if device_id_list or device_tag_list:
         if device_id_list:
             key = "Id"
@@ -395,22 +399,16 @@ def get_device_id(rest_obj, module):
         elif device_tag_list:
             key = "DeviceServiceTag"
             each_device_list = device_tag_list
-
-        for each in each_device_list:
-            each_device = list(filter(lambda d: d[key] in [each], device_list["report_list"]))
-            if key == "DeviceServiceTag" and each_device:
-                each_tag_to_id.append(each_device[0]["Id"])
-            if not each_device:
-                invalid.append(str(each))
+        each_tag_to_id, invalid = DeviceResolver(rest_obj, uri=DEVICE_URI).get_ids(key, each_device_list)
         if invalid:
             value = "id" if key == "Id" else "service tag"
-            module.fail_json(msg="Unable to complete the operation because the entered "
-                                 "target device {0}(s) '{1}' are invalid.".format(value, ",".join(set(invalid))))
-        if each_tag_to_id:
+            module.fail_json(msg=invalid_device_message(value, invalid))
+        if key == "DeviceServiceTag":
             each_device_list = each_tag_to_id
     else:
         all_ips = get_all_ips(ip_addresses, module)
-        each_device_list = get_device_id_from_ip(all_ips, device_list["report_list"], module)
+        resolver = DeviceResolver(rest_obj, uri=DEVICE_URI)
+        each_device_list = get_device_id_from_ip(all_ips, resolver.load_all(), module, resolver)
         key = "IPAddresses"
     return each_device_list, key
 
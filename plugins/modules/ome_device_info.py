@@ -198,6 +198,7 @@ from ssl import SSLError
 
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_resolver import DeviceResolver
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
@@ -216,29 +217,6 @@ DEVICE_RESOURCE_COLLECTION = {
 }
 
 
-def update_device_details_with_filtering(missing_service_tags, service_tag_dict, rest_obj):
-    """
-    This is a workaround solutions.
-    Use filtering query, in case fetching all report list fails for some reason.
-    Updates service_tag_dict if filtering request is success.
-    :param missing_service_tags:  Service tags which are unable to fetch from pagination request.
-    :param service_tag_dict: this contains device id mapping with tags
-    :param rest_obj: ome connection object
-    :return: None.
-    """
-    try:
-        for tag in missing_service_tags:
-            query = "DeviceServiceTag eq '{0}'".format(tag)
-            query_param = {"$filter": query}
-            resp = rest_obj.invoke_request('GET', DEVICE_RESOURCE_COLLECTION[DEVICE_LIST]["resource"], query_param=query_param)
-            value = resp.json_data["value"]
-            if value and value[0]["DeviceServiceTag"] == tag:
-                service_tag_dict.update({value[0]["Id"]: value[0]["DeviceServiceTag"]})
-                missing_service_tags.remove(tag)
-    except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
-        raise err
-
-
 def _get_device_id_from_service_tags(service_tags, rest_obj):
     """
     Get device ids from device service tag
@@ -247,14 +225,10 @@ def _get_device_id_from_service_tags(service_tags, rest_obj):
     :arg rest_obj: RestOME class object in case of request with session.
     :returns: dict eg: {1345:"MXL1245"}
     """
-    device_list = rest_obj.get_all_report_details(DEVICE_RESOURCE_COLLECTION[DEVICE_LIST]["resource"])["report_list"]
-    service_tag_dict = {}
-    for item in device_list:
-        if item["DeviceServiceTag"] in service_tags:
-            service_tag_dict.update({item["Id"]: item["DeviceServiceTag"]})
-    available_service_tags = service_tag_dict.values()
-    missing_service_tags = list(set(service_tags) - set(available_service_tags))
-    update_device_details_with_filtering(missing_service_tags, service_tag_dict, rest_obj)
+    resolver = DeviceResolver(rest_obj, select=("Id", "DeviceServiceTag"),
+                              uri=DEVICE_RESOURCE_COLLECTION[DEVICE_LIST]["resource"])
+    found, missing_service_tags = resolver.resolve("DeviceServiceTag", service_tags)
+    service_tag_dict = dict((device["Id"], tag) for tag, device in found.items())
     device_fact_error_report.update(dict((tag, DESC_HTTP_ERROR) for tag in missing_service_tags))
     return service_tag_dict
 
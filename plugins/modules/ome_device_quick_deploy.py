@@ -352,6 +352,7 @@ from ssl import SSLError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ip_ranges import parse_address
 
 DOMAIN_URI = "ManagementDomainService/Domains"
 DEVICE_URI = "DeviceService/Devices"
@@ -425,9 +426,10 @@ def get_ip_from_host(hostname):
 def get_chassis_device(module, rest_obj):
     key, value = None, None
     ipaddress = get_ip_from_host(module.params["hostname"])
+    target = parse_address(ipaddress) or ipaddress
     resp = rest_obj.invoke_request("GET", DOMAIN_URI)
     for data in resp.json_data["value"]:
-        if ipaddress in data["PublicAddress"]:
+        if target in [parse_address(address) or address for address in data["PublicAddress"]]:
             key, value = ("Id", data["DeviceId"])
             break
     else:
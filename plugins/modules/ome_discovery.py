@@ -92,6 +92,15 @@ options:
       - This option is only applicable if I(job_wait) is C(true).
     type: bool
     default: false
+  skip_covered_addresses:
+    description:
+      - If C(true), then an IP address, range or CIDR of I(network_address_detail) whose addresses are all covered by
+        another entry of the same discovery target is not sent to the appliance. The skipped entries are reported as
+        warnings.
+      - If C(false), then all the entries of I(network_address_detail) are sent to the appliance.
+    type: bool
+    default: false
+    version_added: 9.10.0
   discovery_config_targets:
     description:
       - Provide the list of discovery targets.
@@ -122,6 +131,7 @@ options:
           - "   192.35.0.0/255.255.255.0"
           - C(NOTE) The range size for the number of IP addresses is limited to 16,385 (0x4001).
           - C(NOTE) Both IPv6 and IPv6 CIDR formats are supported.
+          - C(NOTE) See I(skip_covered_addresses) to send only the entries which are not covered by another entry.
         type: list
         elements: str
         required: true
@@ -644,8 +654,11 @@ error_info:
 
 import json
 import time
+from collections import Counter
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict
+from ansible_collections.dellemc.openmanage.plugins.module_utils.poll_scheduler import get_poll_scheduler
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ip_ranges import collapse_ip_specs
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.common.dict_transformations import snake_dict_to_camel_dict
@@ -670,6 +683,7 @@ INVALID_DEVICES = "Invalid device types found - {0}."
 DISCOVERY_PARTIAL = "Some IPs are not discovered."
 ATLEAST_ONE_PROTOCOL = "Protocol not applicable for given device types."
 INVALID_DISCOVERY_ID = "Invalid discovery ID provided."
+COVERED_ADDRESSES = "Skipped the network addresses {0} which are covered by other entries of the same target."
 SETTLING_TIME = 5
 JOB_STATUS_MAP = {
     2020: "Scheduled", 2030: "Queued", 2040: "Starting", 2050: "Running", 2060: "completed successfully",
@@ -776,6 +790,7 @@ def discovery_job_tracking(rest_obj, job_id, job_wait_sec):
     failed_job_status = [2070, 2100, 2101, 2102, 2103]
     success_job_status = [2060, 2020, 2090]
     job_url = (DISCOVERY_JOBS_URI + "({job_id})").format(job_id=job_id)
+    scheduler = get_poll_scheduler(sleep_interval)
     loop_ctr = 0
     time.sleep(SETTLING_TIME)
     while loop_ctr < max_retries:
@@ -785,10 +800,13 @@ def discovery_job_tracking(rest_obj, job_id, job_wait_sec):
             job_dict = job_resp.json_data
             job_status = job_dict['JobStatusId']
             if job_status in success_job_status:
+                scheduler.finish(dict(job_dict, JobType="Discovery"))
                 return JOB_TRACK_SUCCESS.format(JOB_STATUS_MAP[job_status])
             elif job_status in failed_job_status:
                 return JOB_TRACK_FAIL.format(JOB_STATUS_MAP[job_status])
-            time.sleep(sleep_interval)
+            delay = scheduler.next_interval(dict(job_dict, JobType="Discovery"))
+            time.sleep(delay)
+            loop_ctr -= 1 - delay / sleep_interval  # the budget is counted in sleep_interval
         except HTTPError:
             return JOB_TRACK_UNABLE.format(job_id)
         except Exception as err:
@@ -873,7 +891,13 @@ def get_discovery_config(module, rest_obj):
         if len(devices) != len(disc_cfg['DeviceType']):
             invalid_dev = set(devices) - set(dev_id_map.keys())
             module.fail_json(msg=INVALID_DEVICES.format(','.join(invalid_dev)))
-        disc_cfg["DiscoveryConfigTargets"] = list({"NetworkAddressDetail": ip} for ip in disc_config["network_address_detail"])
+        addresses = disc_config["network_address_detail"]
+        if module.params.get("skip_covered_addresses"):
+            addresses = collapse_ip_specs(addresses)
+            covered = list((Counter(disc_config["network_address_detail"]) - Counter(addresses)).elements())
+            if covered:
+                module.warn(COVERED_ADDRESSES.format(", ".join(covered)))
+        disc_cfg["DiscoveryConfigTargets"] = list({"NetworkAddressDetail": ip} for ip in addresses)
         conn_profile = get_connection_profile(disc_config)
         given_protos = list(x["type"] for x in conn_profile['credentials'])
         req_protos = []
@@ -1053,7 +1077,8 @@ def main():
         "trap_destination": {"type": 'bool', "default": False},
         "community_string": {"type": 'bool', "default": False},
         "email_recipient": {"type": 'str'},
-        "ignore_partial_failure": {"type": 'bool', "default": False}
+        "ignore_partial_failure": {"type": 'bool', "default": False},
+        "skip_covered_addresses": {"type": 'bool', "default": False}
     }
 
     module = OmeAnsibleModule(
@@ -352,6 +352,8 @@ error_info:
 import json
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_resolver import DeviceResolver
+from ansible_collections.dellemc.openmanage.plugins.module_utils.upload import StreamingBody, log_progress
 from ansible.module_utils.urls import ConnectionError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
@@ -453,43 +455,34 @@ def get_dup_applicability_payload(file_token, device_ids=None, group_ids=None, b
 def upload_dup_file(rest_obj, module):
     """Upload DUP file to OME and get a file token."""
     upload_uri = "UpdateService/Actions/UpdateService.UploadFile"
-    headers = {"Content-Type": "application/octet-stream", "Accept": "application/octet-stream"}
     upload_success, token = False, None
     dup_file = module.params['dup_file']
-    with open(dup_file, 'rb') as payload:
-        payload = payload.read()
+    payload = StreamingBody([dup_file], progress_callback=log_progress(module))
+    headers = payload.headers("application/octet-stream")
+    headers["Accept"] = "application/octet-stream"
+    try:
         response = rest_obj.invoke_request("POST", upload_uri, data=payload, headers=headers,
                                            api_timeout=100, dump=False)
-        if response.status_code == 200:
-            upload_success = True
-            token = str(response.json_data)
-        else:
-            module.fail_json(msg="Unable to upload {0} to {1}".format(dup_file, module.params['hostname']))
+    finally:
+        payload.close()
+    if response.status_code == 200:
+        upload_success = True
+        token = str(response.json_data)
+    else:
+        module.fail_json(msg="Unable to upload {0} to {1}".format(dup_file, module.params['hostname']))
     return upload_success, token
 
 
 def get_device_ids(rest_obj, module, device_id_tags):
     """Getting the list of device ids filtered from the device inventory."""
-    device_id = []
-    resp = rest_obj.get_all_report_details("DeviceService/Devices")
-    if resp.get("report_list"):
-        device_resp = dict([(str(device['Id']), device['DeviceServiceTag']) for device in resp["report_list"]])
-        device_tags = map(str, device_id_tags)
-        invalid_tags = []
-        for tag in device_tags:
-            if tag in device_resp.keys():
-                device_id.append(tag)
-            elif tag in device_resp.values():
-                ids = list(device_resp.keys())[list(device_resp.values()).index(tag)]
-                device_id.append(ids)
-            else:
-                invalid_tags.append(tag)
-        if invalid_tags:
-            module.fail_json(
-                msg="Unable to complete the operation because the entered target device service"
-                    " tag(s) or device id(s) '{0}' are invalid.".format(",".join(set(invalid_tags))))
-    else:
-        module.fail_json(msg="Failed to fetch the device facts.")
+    device_tags = list(map(str, device_id_tags))
+    found, invalid_tags = DeviceResolver(rest_obj, select=["Id", "DeviceServiceTag"]).resolve_any(device_tags)
+    if invalid_tags:
+        module.fail_json(
+            msg="Unable to complete the operation because the entered target device service"
+                " tag(s) or device id(s) '{0}' are invalid.".format(",".join(invalid_tags)))
+    device_id = [str(device['Id']) for device in found.values()]
+    device_resp = dict((str(device['Id']), device['DeviceServiceTag']) for device in found.values())
     return device_id, device_resp
 
 
@@ -603,7 +596,9 @@ def _validate_device_attributes(module):
 
 def get_device_component_map(rest_obj, module):
     device_id_tags = _validate_device_attributes(module)
-    device_ids, id_tag_map = get_device_ids(rest_obj, module, device_id_tags)
+    device_ids, id_tag_map = [], {}
+    if device_id_tags:
+        device_ids, id_tag_map = get_device_ids(rest_obj, module, device_id_tags)
     comps = module.params.get('components')
     dev_comp_map = {}
     if device_ids:
@@ -316,6 +316,7 @@ GROUP_ID = 6000
 import json
 import time
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_resolver import DeviceResolver
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.common.dict_transformations import recursive_diff
@@ -370,25 +371,19 @@ def get_catrepo_ids(module, cat_name, rest_obj):
 
 def get_dev_ids(module, rest_obj, param, devkey):
     paramlist = module.params[param]
-    resp_data = rest_obj.get_all_items_with_pagination("DeviceService/Devices")
-    values = resp_data["value"]
+    device_resp, missing = DeviceResolver(rest_obj, select=("Id", "DeviceServiceTag", "Type")).resolve(devkey, paramlist)
+    if missing:
+        module.fail_json(msg="Unable to complete the operation because the entered target"
+                             " {0} '{1}' is invalid.".format(devkey, missing[0]))
     targets = []
-    if values:
-        devlist = values
-        device_resp = {device[devkey]: device for device in devlist}
-        for st in paramlist:
-            if st in device_resp:
-                djson = device_resp[st]
-                target = {}
-                device_type = {}
-                device_type['Id'] = djson['Type']
-                device_type['Name'] = "DEVICE"
-                target['Id'] = djson['Id']
-                target['Type'] = device_type
-                targets.append(target)
-            else:
-                module.fail_json(msg="Unable to complete the operation because the entered target"
-                                     " {0} '{1}' is invalid.".format(devkey, st))
+    for djson in device_resp.values():
+        target = {}
+        device_type = {}
+        device_type['Id'] = djson['Type']
+        device_type['Name'] = "DEVICE"
+        target['Id'] = djson['Id']
+        target['Type'] = device_type
+        targets.append(target)
     return targets
 
 
@@ -158,11 +158,13 @@ job_status:
 import json
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_resolver import DeviceResolver
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
 VALID_OPERATION = {"on": 2, "off": 12, "coldboot": 5, "warmboot": 10, "shutdown": 8}
 POWER_STATE_MAP = {"on": 17, "off": 18, "poweringon": 20, "poweringoff": 21}
+DEVICE_STATE_FIELDS = ("Id", "DeviceServiceTag", "PowerState", "Type")
 NOT_APPLICABLE_OPTIONS = ["coldboot", "warmboot", "shutdown"]
 
 
@@ -215,14 +217,16 @@ def get_device_resource(module, rest_obj):
     power_state = module.params['power_state']
     device_id = module.params['device_id']
     service_tag = module.params['device_service_tag']
-    resp_data = rest_obj.get_all_report_details("DeviceService/Devices")
-    if resp_data['report_list'] and service_tag is not None:
-        device_resp = dict([(device.get('DeviceServiceTag'), str(device.get('Id'))) for device in resp_data['report_list']])
-        if service_tag in device_resp:
-            device_id = device_resp[service_tag]
-        else:
+    resolver = DeviceResolver(rest_obj, select=DEVICE_STATE_FIELDS)
+    if service_tag is not None:
+        found, missing = resolver.resolve("DeviceServiceTag", [service_tag])
+        if missing:
             module.fail_json(msg="Unable to complete the operation because the entered target"
                                  " device service tag '{0}' is invalid.".format(service_tag))
+        device_id = str(found[service_tag].get('Id'))
+    else:
+        found, missing = resolver.resolve("Id", [device_id])
+    resp_data = {"report_list": list(found.values())}
     current_state, device_type = get_device_state(module, resp_data, device_id)
 
     # For check mode changes.
@@ -547,6 +547,7 @@ import json
 import time
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_resolver import DeviceResolver
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import apply_diff_key, job_tracking
@@ -624,22 +625,19 @@ def get_device_ids(module, rest_obj):
     """Getting the list of device ids filtered from the device inventory."""
     target_ids = []
     if module.params.get('device_service_tag') or module.params.get('device_id'):
-        # device_list = get_group_devices_all(rest_obj, DEVICE_URI)
-        device_list = rest_obj.get_all_report_details(DEVICE_URI)['report_list']
-        device_tag_id_map = dict([(device.get('DeviceServiceTag'), device.get('Id')) for device in device_list])
+        resolver = DeviceResolver(rest_obj, select=("Id", "DeviceServiceTag"), uri=DEVICE_URI)
         device_id = module.params.get('device_id')
-        invalid_ids = set(device_id) - set(device_tag_id_map.values())
+        dummy, invalid_ids = resolver.resolve("Id", device_id)
         if invalid_ids:
             fail_module(module, msg="Unable to complete the operation because the entered target device"
-                                    " id(s) '{0}' are invalid.".format(",".join(list(map(str, set(invalid_ids))))))
+                                    " id(s) '{0}' are invalid.".format(",".join(map(str, invalid_ids))))
         target_ids.extend(device_id)
         service_tags = module.params.get('device_service_tag')
-        invalid_tags = set(service_tags) - set(device_tag_id_map.keys())
+        tag_ids, invalid_tags = resolver.get_ids("DeviceServiceTag", service_tags)
         if invalid_tags:
             fail_module(module, msg="Unable to complete the operation because the entered target service"
-                                    " tag(s) '{0}' are invalid.".format(",".join(set(invalid_tags))))
-        for tag in service_tags:  # append ids for service tags
-            target_ids.append(device_tag_id_map.get(tag))
+                                    " tag(s) '{0}' are invalid.".format(",".join(invalid_tags)))
+        target_ids.extend(tag_ids)  # append ids for service tags
     if module.params.get('device_group_names'):
         target_ids.extend(get_group_details(rest_obj, module))
     return list(set(target_ids))  # set to eliminate duplicates
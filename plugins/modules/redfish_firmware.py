@@ -51,7 +51,6 @@ options:
         default: 3600
 requirements:
     - "python >= 3.9.6"
-    - "urllib3"
 author:
     - "Felix Stephen (@felixs88)"
     - "Husniya Hameed (@husniya_hameed)"
@@ -63,6 +62,10 @@ notes:
     - This module supports both IPv4 and IPv6 addresses.
     - This module supports only iDRAC9 and above.
     - This module does not support C(check_mode).
+    - When the C(OMAM_UPLOAD_CACHE) environment variable is set to C(true), a local image is not pushed again to a
+      target whose firmware inventory still lists the image staged by an earlier push of the same content.
+    - The staged image is matched by the inventory id and the version recorded by the earlier push, the content
+      staged on the target is not hashed again.
 """
 
 EXAMPLES = """
@@ -145,17 +148,12 @@ import os
 import time
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish, RedfishAnsibleModule
-from ansible.module_utils.basic import missing_required_lib
+from ansible_collections.dellemc.openmanage.plugins.module_utils.poll_scheduler import get_poll_scheduler
+from ansible_collections.dellemc.openmanage.plugins.module_utils.upload import MultipartFileBody, log_progress
+from ansible_collections.dellemc.openmanage.plugins.module_utils.upload_cache import get_upload_cache
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
-try:
-    from urllib3.fields import RequestField
-    from urllib3.filepost import encode_multipart_formdata
-    HAS_LIB = True
-except ImportError:
-    HAS_LIB = False
-
 UPDATE_SERVICE = "UpdateService"
 JOB_URI = "JobService/Jobs/{job_id}"
 JOB_WAIT_MSG = 'Job wait timed out after {0} seconds.'
@@ -169,16 +167,12 @@ JOBSTATUS_SCHEDULED = "scheduled"
 JOBSTATUS_ERRORED = "errored"
 
 
-def _encode_form_data(payload_file):
-    """Encode multipart/form-data for file upload."""
-    fields = []
-    f_name, f_data, f_type = payload_file.get("file")
-    f_binary = f_data.read()
-    req_field = RequestField(name="file", data=f_binary, filename=f_name)
-    req_field.make_multipart(content_type=f_type)
-    fields.append(req_field)
-    data, content_type = encode_multipart_formdata(fields)
-    return data, content_type
+def _encode_form_data(payload_file, progress_callback=None):
+    """Encode multipart/form-data for file upload, the file is streamed from disk when the request is sent."""
+    f_name, f_path, f_type = payload_file.get("file")
+    data = MultipartFileBody(f_path, field_name="file", filename=f_name, file_content_type=f_type,
+                             progress_callback=progress_callback)
+    return data, data.content_type
 
 
 def _get_update_service_target(obj, module):
@@ -201,6 +195,46 @@ def _get_update_service_target(obj, module):
     return str(inventory_uri), str(push_uri), str(update_uri)
 
 
+def _get_image_digest(module, image_path):
+    """Upload cache and SHA-256 of the image when the upload cache is enabled, see get_upload_cache."""
+    upload_cache = get_upload_cache()
+    if upload_cache is None:
+        return None, None
+    try:
+        return upload_cache, upload_cache.image_digest(image_path)
+    except (IOError, OSError) as err:
+        module.warn("Upload cache is not used, {0}".format(err))
+        return None, None
+
+
+def _get_staged_version(obj, location):
+    """Version of the firmware inventory member of a staged image, None when it cannot be read."""
+    try:
+        return (obj.invoke_request("GET", location).json_data or {}).get("Version")
+    except (HTTPError, URLError, ValueError, AttributeError):
+        return None
+
+
+def _get_staged_location(module, obj, upload_cache, digest, resp_inv):
+    """
+    Location of the image pushed earlier to the target, when the firmware inventory still lists it
+    with the version recorded by that push.
+    """
+    if digest is None:
+        return None
+    staged = upload_cache.get_staged(digest, module.params["baseuri"])
+    if not staged:
+        return None
+    location = staged["location"]
+    inventory = resp_inv.json_data or {}
+    members = [str(member.get("@odata.id", "")).rstrip("/") for member in inventory.get("Members", [])]
+    if location.rstrip("/") in members and staged.get("version") and \
+            _get_staged_version(obj, location) == staged["version"]:
+        return location
+    upload_cache.set_staged(digest, module.params["baseuri"], None)
+    return None
+
+
 def firmware_update(obj, module):
     """Firmware update using single binary file from Local path or HTTP location."""
     image_path = module.params.get("image_uri")
@@ -211,14 +245,24 @@ def firmware_update(obj, module):
         update_status = obj.invoke_request("POST", update_uri, data=payload)
     else:
         resp_inv = obj.invoke_request("GET", inventory_uri)
-        with open(os.path.join(image_path), "rb") as img_file:
-            binary_payload = {"file": (image_path.split(os.sep)[-1], img_file, "multipart/form-data")}
-            data, ctype = _encode_form_data(binary_payload)
+        upload_cache, digest = _get_image_digest(module, image_path)
+        location = _get_staged_location(module, obj, upload_cache, digest, resp_inv)
+        if location:
+            return obj.invoke_request("POST", update_uri, data={"ImageURI": location})
+        binary_payload = {"file": (image_path.split(os.sep)[-1], image_path, "multipart/form-data")}
+        data, ctype = _encode_form_data(binary_payload, log_progress(module))
         headers = {"If-Match": resp_inv.headers.get("etag")}
-        headers.update({"Content-Type": ctype})
-        upload_status = obj.invoke_request("POST", push_uri, data=data, headers=headers, dump=False, api_timeout=module.params["timeout"])
+        headers.update({"Content-Type": ctype, "Content-Length": str(len(data))})
+        try:
+            upload_status = obj.invoke_request("POST", push_uri, data=data, headers=headers, dump=False,
+                                               api_timeout=module.params["timeout"])
+        finally:
+            data.close()
         if upload_status.status_code == 201:
             payload = {"ImageURI": upload_status.headers.get("location")}
+            if digest is not None:
+                upload_cache.set_staged(digest, module.params["baseuri"], payload["ImageURI"],
+                                        _get_staged_version(obj, payload["ImageURI"]))
             update_status = obj.invoke_request("POST", update_uri, data=payload)
         else:
             update_status = upload_status
@@ -231,10 +275,12 @@ def wait_for_job_completion(module, job_uri, job_wait_timeout=900, interval=30):
             track_counter = 0
             final_jobstatus = ""
             job_msg = ""
+            scheduler = get_poll_scheduler(interval)
             while track_counter <= job_wait_timeout:
                 try:
                     response = obj.invoke_request("GET", "{0}{1}".format(obj.root_uri, job_uri))
                     if response.json_data.get("PercentComplete") == 100 and response.json_data.get("JobState") == "Completed":
+                        scheduler.finish(response.json_data)
                         if response.json_data.get("JobStatus") == "OK":
                             final_jobstatus = JOBSTATUS_SUCCESS
                             job_msg = SUCCESS_JOB_MSG
@@ -242,8 +288,9 @@ def wait_for_job_completion(module, job_uri, job_wait_timeout=900, interval=30):
                             final_jobstatus = JOBSTATUS_FAILED
                             job_msg = FAIL_JOB_MSG
                         break
-                    track_counter += interval
-                    time.sleep(interval)
+                    delay = scheduler.next_interval(response.json_data)
+                    track_counter += delay
+                    time.sleep(delay)
                 except (HTTPError, URLError):
                     track_counter += interval
                     time.sleep(interval)
@@ -275,8 +322,6 @@ def main():
     module = RedfishAnsibleModule(
         argument_spec=specs,
         supports_check_mode=False)
-    if not HAS_LIB:
-        module.fail_json(msg=missing_required_lib("urllib3"))
     try:
         message = "Failed to submit the firmware update task."
         with Redfish(module.params, req_session=True) as obj:
@@ -148,6 +148,8 @@ from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import
     SESSION_RESOURCE_COLLECTION
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import wait_for_redfish_reboot_job, \
     wait_for_redfish_job_complete, strip_substr_dict, MANAGER_JOB_ID_URI, RESET_UNTRACK, MANAGERS_URI, RESET_SUCCESS
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_tracker import BatchJobTracker, \
+    fetch_redfish_jobs
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
@@ -206,17 +208,28 @@ def get_rollback_preview_target(redfish_obj, module):
     return list(prev_uri.values()), reboot_uri, update_uri
 
 
+def is_rollback_job_finished(job):
+    return job.get("PercentComplete") == 100 or job.get("JobState") == "RebootFailed"
+
+
 def get_job_status(redfish_obj, module, job_ids, job_wait=True):
-    each_status, failed_count, js_job_msg = [], 0, ""
+    each_status, failed_count = [], 0
     wait_timeout = module.params["reboot_timeout"]
+    if job_wait:
+        tracker = BatchJobTracker(redfish_obj, job_ids, fetch_redfish_jobs, is_rollback_job_finished,
+                                  wait_timeout=wait_timeout)
+        jobs, pending = tracker.wait()
+        stalled = pending + [each for each in job_ids if each not in pending and
+                             jobs[each].get("PercentComplete") != 100]
+        if stalled:
+            module.exit_json(msg=JOB_WAIT_MSG.format(wait_timeout),
+                             job_status=[strip_substr_dict(jobs.get(stalled[0], {}))], changed=True)
+        time.sleep(10)
+    else:
+        time.sleep(10)
+        jobs = fetch_redfish_jobs(redfish_obj, job_ids)
     for each in job_ids:
-        each_job_uri = MANAGER_JOB_ID_URI.format(each)
-        job_resp, js_job_msg = wait_for_redfish_job_complete(redfish_obj, each_job_uri, job_wait=job_wait,
-                                                             wait_timeout=wait_timeout)
-        if job_resp and js_job_msg:
-            module.exit_json(msg=JOB_WAIT_MSG.format(wait_timeout), job_status=[strip_substr_dict(job_resp.json_data)],
-                             changed=True)
-        job_status = job_resp.json_data
+        job_status = jobs[each]
         if job_status["JobState"] == "Failed":
             failed_count += 1
         strip_odata = strip_substr_dict(job_status)
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import copy
+import json
+import threading
+import pytest
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.errors import AnsibleParserError
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible.plugins.loader import inventory_loader
+from ansible_collections.dellemc.openmanage.plugins.inventory import ome_inventory
+from unittest.mock import MagicMock
+
+INVENTORY_PATH = 'ansible_collections.dellemc.openmanage.plugins.inventory.ome_inventory.'
+
+
+def _group(group_id, name, visible=True, parent_id=0):
+    return {"Id": group_id, "Name": name, "Visible": visible, "ParentId": parent_id, "MembershipTypeId": 12,
+            "UpdatedTime": "2026-10-01 10:00:00.000",
+            "AllLeafDevices@odata.navigationLink": "/api/GroupService/Groups({0})/AllLeafDevices".format(group_id),
+            "SubGroups@odata.navigationLink": "/api/GroupService/Groups({0})/SubGroups".format(group_id)}
+
+
+def _device(device_id, address, inventory_time="2026-10-01 10:00:00.000"):
+    return {"Id": device_id, "DeviceManagement": [{"NetworkAddress": address}] if address else [],
+            "LastInventoryTime": inventory_time, "LastStatusTime": "2026-10-01 09:00:00.000",
+            "Model": "PowerEdge R{0}".format(device_id * 10), "DeviceServiceTag": "SVC{0}".format(device_id),
+            "Status": 4000 if device_id == 12 else 1000}
+
+
+ALL_GROUPS = [_group(1, "All Devices"), _group(2, "Servers", parent_id=1), _group(3, "Rack1", parent_id=2),
+              _group(4, "Hidden", False, parent_id=1), _group(5, "Storage", parent_id=1)]
+GROUPS = {"GroupService/Groups": ALL_GROUPS,
+          "GroupService/Groups(1)/SubGroups": [ALL_GROUPS[1], ALL_GROUPS[3], ALL_GROUPS[4]],
+          "GroupService/Groups(2)/SubGroups": [ALL_GROUPS[2]],
+          "GroupService/Groups(3)/SubGroups": [],
+          "GroupService/Groups(5)/SubGroups": []}
+DEVICES = {"GroupService/Groups(1)/AllLeafDevices": [_device(11, "192.168.0.1"), _device(12, "192.168.0.2"),
+                                                     _device(13, "[2001:db8::1]"), _device(14, None)],
+           "GroupService/Groups(2)/AllLeafDevices": [_device(12, "192.168.0.2")],
+           "GroupService/Groups(3)/AllLeafDevices": [_device(13, "[2001:db8::1]"), _device(14, None)],
+           "GroupService/Groups(5)/AllLeafDevices": []}
+
+
+class FakeOME(object):
+    instances = []
+    groups = {}
+    devices = {}
+    changed = []
+    filter_error = False
+    appliances = {}
+
+    def __init__(self, module_params, req_session=False):
+        self.module_params = module_params
+        self.req_session = req_session
+        self.groups, self.devices = self.appliances.get(module_params["hostname"], (self.groups, self.devices))
+        self.requests = []
+        self.selects = []
+        self.threads = set()
+        self.sessions = 0
+        FakeOME.instances.append(self)
+
+    def __enter__(self):
+        self.sessions += 1
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def invoke_request(self, method, uri, query_param=None):
+        self.requests.append(uri)
+        return MagicMock(json_data={"value": copy.deepcopy(self.groups[uri])})
+
+    def iter_items(self, uri, query_param=None, select=None):
+        self.requests.append(uri)
+        self.selects.append(select)
+        self.threads.add(threading.current_thread().name)
+        if uri == "DeviceService/Devices" and query_param:
+            if self.filter_error:
+                raise HTTPError("https://testhost.com", 400, "Bad Request", {}, None)
+            self.requests.append(query_param["$filter"])
+            return iter(copy.deepcopy(self.changed))
+        if uri == "DeviceService/Devices":
+            return iter(copy.deepcopy(self.devices["GroupService/Groups(1)/AllLeafDevices"]))
+        return iter(copy.deepcopy(self.devices[uri]))
+
+
+@pytest.fixture
+def fake_ome(mocker):
+    FakeOME.instances = []
+    FakeOME.groups = copy.deepcopy(GROUPS)
+    FakeOME.devices = copy.deepcopy(DEVICES)
+    FakeOME.changed = []
+    FakeOME.filter_error = False
+    FakeOME.appliances = {}
+    mocker.patch(INVENTORY_PATH + 'RestOME', FakeOME)
+    return FakeOME
+
+
+def _load_plugin():
+    plugin = ome_inventory.InventoryModule()
+    inventory_loader._load_config_defs(plugin.NAME, ome_inventory, ome_inventory.__file__)
+    inventory_loader._update_object(plugin, plugin.NAME, ome_inventory.__file__, resolved=plugin.NAME)
+    return plugin
+
+
+def _parse(tmp_path, extra="", cache=True):
+    config = tmp_path / "ome_inventory.yml"
+    config.write_text("plugin: dellemc.openmanage.ome_inventory\nhostname: 192.168.0.10\n"
+                      "username: user\npassword: pwd\n" + extra)
+    plugin = _load_plugin()
+    inventory = InventoryData()
+    plugin.parse(inventory, DataLoader(), str(config), cache=cache)
+    plugin.update_cache_if_changed()
+    return plugin, inventory
+
+
+class TestOmeInventory(object):
+
+    def test_parse_walks_groups_with_one_session(self, fake_ome, tmp_path):
+        plugin, inventory = _parse(tmp_path, "fanout_workers: 3\nhost_vars:\n  user: root\n")
+        assert len(fake_ome.instances) == 1
+        ome = fake_ome.instances[0]
+        assert ome.req_session is True
+        assert ome.sessions == 1
+        assert ome.module_params["hostname"] == "192.168.0.10"
+        assert any(name.startswith("ThreadPoolExecutor") for name in ome.threads)
+        assert sorted(grp.name for grp in inventory.groups["All Devices"].child_groups) == ["Servers", "Storage"]
+        assert [grp.name for grp in inventory.groups["Servers"].child_groups] == ["Rack1"]
+        assert "Hidden" not in inventory.groups
+        assert [host.name for host in inventory.groups["Rack1"].get_hosts()] == ["2001:db8::1"]
+        assert sorted(host.name for host in inventory.groups["All Devices"].get_hosts()) == \
+            ["192.168.0.1", "192.168.0.2", "2001:db8::1"]
+        assert inventory.get_host("192.168.0.1").vars["user"] == "root"
+        assert inventory.get_host("192.168.0.1").vars["idrac_ip"] == "192.168.0.1"
+        assert "GroupService/Groups(4)/AllLeafDevices" not in ome.requests
+
+    def test_parse_sequential_walk(self, fake_ome, tmp_path):
+        plugin, inventory = _parse(tmp_path, "fanout_workers: 1\nome_group_name: servers\n")
+        ome = fake_ome.instances[0]
+        assert ome.threads == {threading.current_thread().name}
+        assert "All Devices" not in inventory.groups
+        assert sorted(host.name for host in inventory.groups["Servers"].get_hosts()) == \
+            ["192.168.0.2", "2001:db8::1"]
+
+    def test_parse_uses_inventory_cache(self, fake_ome, tmp_path):
+        cache_options = "cache: true\ncache_plugin: jsonfile\ncache_connection: {0}\n" \
+                        "cache_timeout: 3600\n".format(tmp_path / "cache")
+        _parse(tmp_path, cache_options, cache=True)
+        assert len(fake_ome.instances) == 1
+        plugin, inventory = _parse(tmp_path, cache_options + "group_vars:\n  Rack1:\n    rack: 1\n", cache=True)
+        assert len(fake_ome.instances) == 1
+        assert [host.name for host in inventory.groups["Rack1"].get_hosts()] == ["2001:db8::1"]
+        assert inventory.groups["Rack1"].vars == {"rack": 1}
+        _parse(tmp_path, cache_options, cache=False)
+        assert len(fake_ome.instances) == 2
+
+    def test_parse_device_fields_and_constructed_groups(self, fake_ome, tmp_path):
+        options = "device_fields:\n  - Model\n  - DeviceServiceTag\n  - Status\n" \
+                  "keyed_groups:\n  - key: ome_model\n    prefix: model\n" \
+                  "groups:\n  critical: ome_status == 4000\n" \
+                  "compose:\n  service_tag: ome_device_service_tag | lower\n"
+        plugin, inventory = _parse(tmp_path, options)
+        ome = fake_ome.instances[0]
+        assert ome.selects[0] == ["Id", "DeviceManagement", "DeviceServiceTag", "LastInventoryTime",
+                                  "LastStatusTime", "Model", "Status"]
+        host_vars = inventory.get_host("192.168.0.1").vars
+        assert host_vars["ome_model"] == "PowerEdge R110"
+        assert host_vars["ome_device_service_tag"] == "SVC11"
+        assert host_vars["service_tag"] == "svc11"
+        assert [host.name for host in inventory.groups["critical"].get_hosts()] == ["192.168.0.2"]
+        assert [host.name for host in inventory.groups["model_PowerEdge_R130"].get_hosts()] == ["2001:db8::1"]
+
+    def test_parse_cache_ignored_on_device_fields_change(self, fake_ome, tmp_path):
+        cache_options = "cache: true\ncache_plugin: jsonfile\ncache_connection: {0}\n" \
+                        "cache_timeout: 3600\n".format(tmp_path / "cache")
+        _parse(tmp_path, cache_options)
+        plugin, inventory = _parse(tmp_path, cache_options + "device_fields:\n  - Model\n")
+        assert len(fake_ome.instances) == 2
+        assert inventory.get_host("192.168.0.2").vars["ome_model"] == "PowerEdge R120"
+
+    def test_parse_federated_appliances(self, fake_ome, tmp_path):
+        dc2_groups = {"GroupService/Groups": [_group(1, "All Devices"), _group(7, "Edge", parent_id=1)],
+                      "GroupService/Groups(1)/SubGroups": [_group(7, "Edge", parent_id=1)],
+                      "GroupService/Groups(7)/SubGroups": []}
+        duplicate = dict(_device(12, "10.0.0.2"), Id=21)
+        dc2_devices = {"GroupService/Groups(1)/AllLeafDevices": [duplicate, _device(22, "10.0.0.3")],
+                       "GroupService/Groups(7)/AllLeafDevices": [duplicate, _device(22, "10.0.0.3")]}
+        fake_ome.appliances = {"ome-dc2": (dc2_groups, dc2_devices)}
+        options = "appliances:\n  - hostname: ome-dc1\n  - hostname: ome-dc2\n    username: admin\n" \
+                  "    ome_group_name: Edge\n"
+        config = tmp_path / "ome_inventory.yml"
+        config.write_text("plugin: dellemc.openmanage.ome_inventory\nusername: user\npassword: pwd\n" + options)
+        plugin = _load_plugin()
+        inventory = InventoryData()
+        plugin.parse(inventory, DataLoader(), str(config))
+        assert sorted((ome.module_params["hostname"], ome.module_params["username"])
+                      for ome in fake_ome.instances) == [("ome-dc1", "user"), ("ome-dc2", "admin")]
+        assert sorted(host.name for host in inventory.groups["Edge"].get_hosts()) == ["10.0.0.3", "192.168.0.2"]
+        assert "10.0.0.2" not in inventory.hosts
+        assert inventory.get_host("192.168.0.2").vars["ome_appliance"] == "ome-dc1"
+        assert inventory.get_host("10.0.0.3").vars["ome_appliance"] == "ome-dc2"
+        assert "Servers" in inventory.groups
+
+    def test_parse_hostname_required(self, fake_ome, tmp_path, monkeypatch):
+        monkeypatch.delenv("OME_HOSTNAME", raising=False)
+        config = tmp_path / "ome_inventory.yml"
+        config.write_text("plugin: dellemc.openmanage.ome_inventory\nusername: user\npassword: pwd\n")
+        plugin = _load_plugin()
+        with pytest.raises(AnsibleParserError, match="Either hostname or appliances is required"):
+            plugin.parse(InventoryData(), DataLoader(), str(config))
+
+    def test_incremental_refresh_patches_changed_devices(self, fake_ome, tmp_path):
+        options = "incremental_refresh: true\nsnapshot_path: {0}\n".format(tmp_path / "snapshot.json")
+        _parse(tmp_path, options)
+        snapshot = json.loads((tmp_path / "snapshot.json").read_text())
+        assert snapshot["sync_time"] == "2026-10-01 10:00:00.000"
+        assert snapshot["devices"] == {"11": "192.168.0.1", "12": "192.168.0.2", "13": "2001:db8::1", "14": None}
+        changed = _device(12, "192.168.0.20", "2026-10-02 10:00:00.000")
+        fake_ome.changed = [changed]
+        fake_ome.devices["GroupService/Groups(1)/AllLeafDevices"][1] = changed
+        plugin, inventory = _parse(tmp_path, options)
+        ome = fake_ome.instances[-1]
+        assert not [uri for uri in ome.requests if uri.endswith(("AllLeafDevices", "SubGroups"))]
+        assert "LastInventoryTime ge '2026-10-01 10:00:00.000' or LastStatusTime ge '2026-10-01 10:00:00.000'" \
+            in ome.requests
+        assert sorted(host.name for host in inventory.groups["Servers"].get_hosts()) == \
+            ["192.168.0.20", "2001:db8::1"]
+        assert json.loads((tmp_path / "snapshot.json").read_text())["sync_time"] == "2026-10-02 10:00:00.000"
+
+    def test_incremental_refresh_added_device_and_group(self, fake_ome, tmp_path):
+        options = "incremental_refresh: true\nsnapshot_path: {0}\n".format(tmp_path / "snapshot.json")
+        _parse(tmp_path, options)
+        added = _device(15, "192.168.0.5", "2026-10-02 10:00:00.000")
+        fake_ome.changed = [added]
+        fake_ome.devices["GroupService/Groups(1)/AllLeafDevices"].append(added)
+        fake_ome.devices["GroupService/Groups(6)/AllLeafDevices"] = [added]
+        fake_ome.groups["GroupService/Groups"].append(_group(6, "Rack2", parent_id=2))
+        fake_ome.groups["GroupService/Groups(2)/SubGroups"].append(_group(6, "Rack2", parent_id=2))
+        fake_ome.groups["GroupService/Groups(6)/SubGroups"] = []
+        plugin, inventory = _parse(tmp_path, options)
+        ome = fake_ome.instances[-1]
+        assert "GroupService/Groups(2)/SubGroups" in ome.requests
+        assert "GroupService/Groups(1)/SubGroups" not in ome.requests
+        assert sorted(grp.name for grp in inventory.groups["Servers"].child_groups) == ["Rack1", "Rack2"]
+        assert [host.name for host in inventory.groups["Rack2"].get_hosts()] == ["192.168.0.5"]
+
+    def test_incremental_refresh_removed_device(self, fake_ome, tmp_path):
+        options = "incremental_refresh: true\nsnapshot_path: {0}\n".format(tmp_path / "snapshot.json")
+        _parse(tmp_path, options)
+        fake_ome.devices["GroupService/Groups(1)/AllLeafDevices"].pop(0)
+        plugin, inventory = _parse(tmp_path, options)
+        assert "192.168.0.1" not in inventory.hosts
+        assert "11" not in json.loads((tmp_path / "snapshot.json").read_text())["devices"]
+
+    def test_incremental_refresh_filter_rejected(self, fake_ome, tmp_path):
+        options = "incremental_refresh: true\nsnapshot_path: {0}\n".format(tmp_path / "snapshot.json")
+        _parse(tmp_path, options)
+        fake_ome.filter_error = True
+        plugin, inventory = _parse(tmp_path, options)
+        assert "GroupService/Groups(3)/AllLeafDevices" in fake_ome.instances[-1].requests
+        assert [host.name for host in inventory.groups["Rack1"].get_hosts()] == ["2001:db8::1"]
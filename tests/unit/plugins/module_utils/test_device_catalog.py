@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import device_catalog
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_catalog import DeviceCatalog, \
+    appliance_key, get_device_catalog, get_catalog_refresh
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_resolver import DeviceResolver
+from unittest.mock import MagicMock
+
+TEST_HOST = 'https://testhost.com/'
+APPLIANCE = "ome.example.com:443:admin"
+
+
+def _device(device_id, tag, address, changed="2025-01-01 10:00:00.000"):
+    return {"Id": device_id, "DeviceServiceTag": tag, "DeviceName": "host" + str(device_id),
+            "Identifier": tag, "Type": 1000, "Model": "R740", "LastInventoryTime": changed, "LastStatusTime": None,
+            "DeviceManagement": [{"NetworkAddress": address, "MacAddress": "00:00:00:00:00:00"}]}
+
+
+DEVICES = [_device(1, "ABC1", "192.168.0.1"), _device(2, "ABC2", "[2001:db8::2]")]
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = DeviceCatalog(str(tmp_path / "catalog" / "devices.sqlite"), ttl=0)
+    yield catalog
+    catalog.close()
+
+
+def _rest_obj(devices, changed=None, device_ids=None):
+    rest_obj = MagicMock()
+    rest_obj.get_all_report_details.return_value = {"report_list": [dict(device) for device in devices]}
+
+    def iter_items(uri, query_param=None, select=None):
+        if select == ["Id"]:
+            return iter({"Id": device_id} for device_id in device_ids)
+        return iter(dict(device) for device in changed)
+    rest_obj.iter_items.side_effect = iter_items
+    return rest_obj
+
+
+class TestDeviceCatalog(object):
+
+    def test_full_sync_and_find(self, catalog):
+        rest_obj = _rest_obj(DEVICES)
+        assert catalog.sync(rest_obj, APPLIANCE) is True
+        assert [device["Id"] for device in catalog.find(APPLIANCE, "DeviceServiceTag", ["ABC2", "XYZ"])] == [2]
+        assert catalog.find(APPLIANCE, "Id", [1])[0]["DeviceManagement"][0]["NetworkAddress"] == "192.168.0.1"
+        assert catalog.find(APPLIANCE, "NetworkAddress", ["2001:db8::2"])[0]["Id"] == 2
+        assert "LastInventoryTime" not in catalog.all(APPLIANCE)[0]
+        assert catalog.find("other:443:admin", "Id", [1]) == []
+        assert catalog._sync_state(APPLIANCE)[0] == "2025-01-01 10:00:00.000"
+
+    def test_incremental_sync(self, catalog):
+        catalog.sync(_rest_obj(DEVICES), APPLIANCE)
+        changed = _device(2, "ABC2", "192.168.0.22", "2025-01-02 10:00:00.000")
+        added = _device(3, "ABC3", "192.168.0.3")
+        rest_obj = _rest_obj([added], changed=[changed], device_ids=[2, 3])
+        catalog.sync(rest_obj, APPLIANCE)
+        query = rest_obj.iter_items.call_args_list[0][1]["query_param"]
+        assert query["$filter"] == "LastInventoryTime ge '2025-01-01 10:00:00.000' or " \
+                                   "LastStatusTime ge '2025-01-01 10:00:00.000'"
+        assert rest_obj.get_all_report_details.call_args[1]["query_param"]["$filter"] == "Id eq 3"
+        assert [device["Id"] for device in catalog.all(APPLIANCE)] == [2, 3]
+        assert catalog.find(APPLIANCE, "NetworkAddress", ["2001:db8::2"]) == []
+        assert catalog.find(APPLIANCE, "NetworkAddress", ["192.168.0.22"])[0]["Id"] == 2
+        assert catalog._sync_state(APPLIANCE)[0] == "2025-01-02 10:00:00.000"
+
+    def test_sync_within_ttl(self, catalog):
+        catalog.ttl = 300
+        catalog.sync(_rest_obj(DEVICES), APPLIANCE)
+        rest_obj = _rest_obj(DEVICES)
+        assert catalog.sync(rest_obj, APPLIANCE) is False
+        assert catalog.sync(rest_obj, APPLIANCE, force=True) is True
+        assert rest_obj.get_all_report_details.call_count == 1
+        assert not rest_obj.iter_items.called
+
+    def test_sync_filter_rejected(self, catalog):
+        catalog.sync(_rest_obj(DEVICES), APPLIANCE)
+        rest_obj = _rest_obj([DEVICES[0]])
+        rest_obj.iter_items.side_effect = HTTPError(TEST_HOST, 400, "Bad Request", {}, None)
+        catalog.sync(rest_obj, APPLIANCE)
+        assert [device["Id"] for device in catalog.all(APPLIANCE)] == [1]
+
+    def test_schema_version_change(self, catalog, monkeypatch):
+        catalog.sync(_rest_obj(DEVICES), APPLIANCE)
+        catalog.close()
+        monkeypatch.setattr(device_catalog, "SCHEMA_VERSION", 2)
+        assert catalog.all(APPLIANCE) == []
+
+    def test_put(self, catalog):
+        catalog.sync(_rest_obj([]), APPLIANCE)
+        catalog.put(APPLIANCE, [{"Id": 5, "DeviceServiceTag": "ABC5"}, DEVICES[0]])
+        assert [device["Id"] for device in catalog.all(APPLIANCE)] == [1]
+        assert catalog._sync_state(APPLIANCE)[0] is None
+
+    def test_settings(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(device_catalog.DEVICE_CATALOG_ENV, raising=False)
+        assert get_device_catalog() is None
+        monkeypatch.setenv(device_catalog.DEVICE_CATALOG_ENV, "yes")
+        monkeypatch.setenv(device_catalog.DEVICE_CATALOG_PATH_ENV, str(tmp_path / "devices.sqlite"))
+        monkeypatch.setenv(device_catalog.DEVICE_CATALOG_REFRESH_ENV, "true")
+        catalog = get_device_catalog()
+        assert catalog.path == str(tmp_path / "devices.sqlite")
+        assert catalog.ttl == device_catalog.DEFAULT_TTL
+        assert get_catalog_refresh() is True
+        assert appliance_key({"hostname": "OME.example.com", "port": 443, "username": "admin"}) == APPLIANCE
+
+    def test_resolver_uses_catalog(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(device_catalog.DEVICE_CATALOG_ENV, "yes")
+        monkeypatch.setenv(device_catalog.DEVICE_CATALOG_PATH_ENV, str(tmp_path / "devices.sqlite"))
+        rest_obj = _rest_obj(DEVICES)
+        rest_obj.module_params = {"hostname": "ome.example.com", "username": "admin"}
+        resolver = DeviceResolver(rest_obj, select=("Id", "DeviceServiceTag"))
+        assert resolver.get_ids("DeviceServiceTag", ["ABC2", "ABC1"]) == ([2, 1], [])
+        assert resolver.devices[2] == {"Id": 2, "DeviceServiceTag": "ABC2"}
+        assert rest_obj.get_all_report_details.call_count == 1
+        rest_obj.get_all_report_details.return_value = {"report_list": [_device(7, "ABC7", "192.168.0.7")]}
+        assert DeviceResolver(rest_obj).get_ids("DeviceServiceTag", ["ABC7", "ABC1"]) == ([7, 1], [])
+        assert rest_obj.get_all_report_details.call_args[1]["query_param"]["$filter"] == "DeviceServiceTag eq 'ABC7'"
+        assert DeviceResolver(rest_obj).resolve("NetworkAddress", ["192.168.0.7"])[0]["192.168.0.7"]["Id"] == 7
+        assert rest_obj.get_all_report_details.call_count == 2
+        resolver = DeviceResolver(rest_obj, select=("Id", "PowerState"))
+        assert resolver.catalog is None
+
+    def test_resolver_syncs_on_miss_within_ttl(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(device_catalog.DEVICE_CATALOG_ENV, "yes")
+        monkeypatch.setenv(device_catalog.DEVICE_CATALOG_PATH_ENV, str(tmp_path / "devices.sqlite"))
+        rest_obj = _rest_obj(DEVICES)
+        rest_obj.module_params = {"hostname": "ome.example.com", "username": "admin"}
+        assert DeviceResolver(rest_obj).resolve("NetworkAddress", ["192.168.0.1"])[1] == []
+        added = _device(7, "ABC7", "192.168.0.7", changed="2025-01-02 10:00:00.000")
+        rest_obj = _rest_obj(DEVICES, changed=[added], device_ids=[1, 2, 7])
+        rest_obj.module_params = {"hostname": "ome.example.com", "username": "admin"}
+        resolver = DeviceResolver(rest_obj)
+        assert resolver.resolve("NetworkAddress", ["192.168.0.1"])[1] == []
+        assert not rest_obj.iter_items.called
+        found, missing = resolver.resolve("NetworkAddress", ["192.168.0.7", "192.168.0.9"])
+        assert found["192.168.0.7"]["Id"] == 7 and missing == ["192.168.0.9"]
+        assert rest_obj.iter_items.call_count == 2
+        assert not rest_obj.get_all_report_details.called
+        assert resolver.resolve("NetworkAddress", ["192.168.0.9"])[1] == ["192.168.0.9"]
+        assert rest_obj.iter_items.call_count == 2
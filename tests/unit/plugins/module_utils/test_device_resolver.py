@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_resolver import DeviceResolver, \
+    get_management_addresses, invalid_device_message
+from unittest.mock import MagicMock
+
+DEVICES = [{"Id": 1, "DeviceServiceTag": "ABC1", "DeviceName": "server1",
+            "DeviceManagement": [{"NetworkAddress": "192.168.0.1"}]},
+           {"Id": 2, "DeviceServiceTag": "ABC2", "DeviceName": "server2",
+            "DeviceManagement": [{"NetworkAddress": "[2001:db8::2]"}, {"NetworkAddress": "192.168.0.2"}]},
+           {"Id": 3, "DeviceServiceTag": "ABC3", "DeviceName": "chassis", "DeviceManagement": []}]
+
+
+def _rest_obj(*reports):
+    rest_obj = MagicMock()
+    rest_obj.get_all_report_details.side_effect = [{"report_list": [dict(device) for device in report]}
+                                                   for report in reports]
+    return rest_obj
+
+
+class TestDeviceResolver(object):
+
+    def test_resolve_batches_missing_values(self):
+        rest_obj = _rest_obj([DEVICES[0], DEVICES[1]])
+        resolver = DeviceResolver(rest_obj)
+        found, missing = resolver.resolve("DeviceServiceTag", ["ABC2", "ABC1", "XYZ", "ABC2"])
+        assert list(found) == ["ABC2", "ABC1"]
+        assert found["ABC1"]["Id"] == 1
+        assert missing == ["XYZ"]
+        assert rest_obj.get_all_report_details.call_count == 1
+        assert rest_obj.get_all_report_details.call_args[1]["query_param"]["$filter"] == \
+            "(DeviceServiceTag eq 'ABC2' or DeviceServiceTag eq 'ABC1' or DeviceServiceTag eq 'XYZ')"
+        assert resolver.lookup("Id", "2")["DeviceServiceTag"] == "ABC2"
+        assert resolver.lookup("DeviceName", "server1")["Id"] == 1
+
+    def test_resolve_served_from_index(self):
+        rest_obj = _rest_obj([DEVICES[0]], [DEVICES[1]])
+        resolver = DeviceResolver(rest_obj)
+        resolver.resolve("Id", [1])
+        assert resolver.get_ids("DeviceServiceTag", ["ABC1"]) == ([1], [])
+        assert rest_obj.get_all_report_details.call_count == 1
+        assert resolver.get_ids("Id", ["2", "abc"]) == ([2], ["abc"])
+        assert rest_obj.get_all_report_details.call_args[1]["query_param"]["$filter"] == "Id eq 2"
+
+    def test_resolve_adds_key_to_select(self):
+        rest_obj = _rest_obj([{"Id": 24, "Identifier": "TAG1", "Type": 1000}])
+        found, missing = DeviceResolver(rest_obj, select=("Id", "Type")).resolve("Identifier", ["TAG1"])
+        assert found["TAG1"]["Id"] == 24
+        assert rest_obj.get_all_report_details.call_args[1]["query_param"]["$select"] == "Id,Type,Identifier"
+
+    def test_resolve_any(self):
+        rest_obj = _rest_obj([DEVICES[0]], [DEVICES[1]])
+        found, missing = DeviceResolver(rest_obj).resolve_any(["1", "ABC2", "ABC9"])
+        assert [device["Id"] for device in found.values()] == [1, 2]
+        assert missing == ["ABC9"]
+        assert rest_obj.get_all_report_details.call_args_list[0][1]["query_param"]["$filter"] == "Id eq 1"
+        assert rest_obj.get_all_report_details.call_args_list[1][1]["query_param"]["$filter"] == \
+            "(DeviceServiceTag eq 'ABC2' or DeviceServiceTag eq 'ABC9')"
+
+    def test_resolve_management_address(self):
+        rest_obj = _rest_obj(DEVICES)
+        resolver = DeviceResolver(rest_obj)
+        found, missing = resolver.resolve("NetworkAddress", ["192.168.0.2", "[2001:db8::2]", "10.0.0.1"])
+        assert [device["Id"] for device in found.values()] == [2, 2]
+        assert missing == ["10.0.0.1"]
+        assert "$filter" not in rest_obj.get_all_report_details.call_args[1]["query_param"]
+        assert resolver.complete
+        assert resolver.resolve("DeviceServiceTag", ["ABC9"]) == ({}, ["ABC9"])
+        assert rest_obj.get_all_report_details.call_count == 1
+
+    @pytest.mark.parametrize("device, expected", [
+        (DEVICES[1], ["2001:db8::2", "192.168.0.2"]), (DEVICES[2], []), ({"Id": 4}, [])])
+    def test_get_management_addresses(self, device, expected):
+        assert get_management_addresses(device) == expected
+
+    def test_invalid_device_message(self):
+        assert invalid_device_message("service tag", ["A", "B"]) == \
+            "Unable to complete the operation because the entered target device service tag(s) 'A,B' are invalid."
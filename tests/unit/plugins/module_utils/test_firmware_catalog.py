@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+import pytest
+from ansible_collections.dellemc.openmanage.plugins.module_utils import firmware_catalog
+from ansible_collections.dellemc.openmanage.plugins.module_utils.firmware_catalog import FirmwareCatalog, \
+    get_firmware_catalog, inventory_component, load_catalog, normalize_system_id, pci_key, version_key
+
+CATALOG_XML = u"""<?xml version="1.0" encoding="utf-16"?>
+<Manifest baseLocation="downloads.dell.com" releaseID="GXHJC" version="24.03.00">
+  <SoftwareBundle bundleID="B1"><Contents><Package path="BIOS_OLD.EXE"/></Contents></SoftwareBundle>
+  <SoftwareComponent packageID="OLD01" path="FOLDER1/BIOS_OLD.EXE" vendorVersion="2.9.0" dellVersion="2.9.0"
+      packageType="LWXP" rebootRequired="true" size="1024">
+    <Name><Display lang="en"><![CDATA[BIOS 2.9.0]]></Display></Name>
+    <ComponentType value="BIOS"/>
+    <SupportedDevices><Device componentID="159" embedded="1"><Display lang="en">BIOS</Display></Device>
+    </SupportedDevices>
+    <SupportedSystems><Brand key="3" prefix="PE"><Display lang="en">PowerEdge</Display>
+      <Model systemID="0716" systemIDType="BIOS"><Display lang="en">R740</Display></Model></Brand>
+    </SupportedSystems>
+    <Criticality value="1"/>
+  </SoftwareComponent>
+  <SoftwareComponent packageID="NEW01" path="FOLDER2/BIOS_NEW.EXE" vendorVersion="2.10.2" dellVersion="2.10.2"
+      packageType="LWXP" rebootRequired="true" size="2048">
+    <Name><Display lang="en">BIOS 2.10.2</Display></Name>
+    <ComponentType value="BIOS"/>
+    <SupportedDevices><Device componentID="159" embedded="1"/></SupportedDevices>
+    <SupportedSystems><Brand key="3" prefix="PE">
+      <Model systemID="0716" systemIDType="BIOS"><Display lang="en">R740</Display></Model></Brand>
+    </SupportedSystems>
+    <Criticality value="2"/>
+  </SoftwareComponent>
+  <SoftwareComponent packageID="R640B" path="FOLDER3/BIOS_R640.EXE" vendorVersion="2.19.1" packageType="LWXP">
+    <ComponentType value="BIOS"/>
+    <SupportedDevices><Device componentID="159" embedded="1"/></SupportedDevices>
+    <SupportedSystems><Brand key="3" prefix="PE">
+      <Model systemID="0717" systemIDType="BIOS"><Display lang="en">R640</Display></Model></Brand>
+    </SupportedSystems>
+  </SoftwareComponent>
+  <SoftwareComponent packageID="NIC01" path="FOLDER4/NIC.EXE" vendorVersion="22.31.6" packageType="LWXP">
+    <ComponentType value="FRMW"/>
+    <SupportedDevices><Device componentID="0">
+      <PCIInfo deviceID="165f" subDeviceID="1f5b" subVendorID="1028" vendorID="14e4"/></Device>
+    </SupportedDevices>
+  </SoftwareComponent>
+</Manifest>
+"""
+
+INVENTORY = [
+    {"Id": "Installed-159-2.9.0", "Name": "BIOS", "Version": "2.9.0", "Updateable": True, "SoftwareId": "159"},
+    {"Id": "Previous-159-2.8.0", "Name": "BIOS", "Version": "2.8.0", "Updateable": True},
+    {"Id": "Installed-0-22.31.6__NIC.Integrated.1-1-1", "Name": "NIC", "Version": "22.31.6", "Updateable": True,
+     "Oem": {"Dell": {"DellSoftwareInventory": {"ComponentID": "0", "VendorID": "14E4", "DeviceID": "165F",
+                                                "SubVendorID": "1028", "SubDeviceID": "1F5B"}}}},
+    {"Id": "Installed-25227-7.00.00.00", "Name": "iDRAC", "Version": "7.00.00.00", "Updateable": True},
+    {"Id": "Installed-101-1.0", "Name": "TPM", "Version": "1.0", "Updateable": False},
+]
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = tmp_path / "Catalog.xml"
+    path.write_bytes(CATALOG_XML.encode("utf-16"))
+    return str(path)
+
+
+class TestFirmwareCatalog(object):
+
+    @pytest.mark.parametrize("older, newer", [("2.9.0", "2.10.2"), ("A05", "A06"), ("22.31.6", "22.31.10"),
+                                              ("1.0", "1.0.1"), ("52.26.0-5179", "52.26.0-5180")])
+    def test_version_key(self, older, newer):
+        assert version_key(older) < version_key(newer)
+        assert version_key("22.31.06") == version_key("22.31.6")
+
+    @pytest.mark.parametrize("value, expected", [(1814, "0716"), ("1814", "0716"), (" 1953 ", "07A1"),
+                                                 ("0x0716", "0716"), ("0x7a1", "07A1"), ("07a1", "07A1"), ("", None),
+                                                 (None, None)])
+    def test_normalize_system_id(self, value, expected):
+        assert normalize_system_id(value) == expected
+
+    def test_pci_key(self):
+        assert pci_key("14e4", "165f", "1028", "1f5b") == "14E4:165F:1028:1F5B"
+        assert pci_key("14e4", "165f") == "14E4:165F::"
+        assert pci_key("", "165f") is None
+
+    def test_parse(self, catalog_path):
+        catalog = FirmwareCatalog.parse(catalog_path)
+        assert catalog.manifest["releaseID"] == "GXHJC"
+        assert [pkg["package_id"] for pkg in catalog.packages] == ["OLD01", "NEW01", "R640B", "NIC01"]
+        bios = catalog.packages[0]
+        assert bios["name"] == "BIOS 2.9.0"
+        assert bios["components"] == ("159",)
+        assert bios["systems"] == ("0716",)
+        assert bios["models"] == ("R740",)
+        assert bios["reboot_required"] is True
+        assert bios["criticality"] == "1"
+        assert catalog.packages[3]["pci"] == ("14E4:165F:1028:1F5B",)
+
+    @pytest.mark.parametrize("content", [u"<Manifest", u"<Catalog/>", u""])
+    def test_parse_invalid(self, tmp_path, content):
+        path = tmp_path / "Catalog.xml"
+        path.write_text(content)
+        with pytest.raises(ValueError) as err:
+            FirmwareCatalog.parse(str(path))
+        assert "Unable to parse the catalog file" in str(err.value)
+
+    def test_find(self, catalog_path):
+        catalog = FirmwareCatalog.parse(catalog_path)
+        assert [pkg["version"] for pkg in catalog.find("159")] == ["2.19.1", "2.10.2", "2.9.0"]
+        assert [pkg["version"] for pkg in catalog.find(159, system_id=1814)] == ["2.10.2", "2.9.0"]
+        assert catalog.latest("159", model="PowerEdge R640")["package_id"] == "R640B"
+        assert catalog.latest("0", pci="14E4:165F:1028:1F5B", system_id="1814")["package_id"] == "NIC01"
+        assert catalog.latest("404") is None
+        assert [pkg["package_id"] for pkg in catalog.packages_for_system("0x0716")] == ["OLD01", "NEW01"]
+        assert [pkg["package_id"] for pkg in catalog.packages_for_system(model="R640")] == ["R640B"]
+
+    def test_inventory_component(self):
+        assert inventory_component(INVENTORY[0])["component_id"] == "159"
+        assert inventory_component(INVENTORY[1]) is None
+        assert inventory_component(INVENTORY[2]) == {
+            "id": INVENTORY[2]["Id"], "name": "NIC", "version": "22.31.6", "component_id": None,
+            "pci": "14E4:165F:1028:1F5B"}
+        assert inventory_component(INVENTORY[3])["component_id"] == "25227"
+        assert inventory_component(INVENTORY[4]) is None
+
+    def test_get_updates(self, catalog_path):
+        catalog = FirmwareCatalog.parse(catalog_path)
+        updates = catalog.get_updates(INVENTORY, system_id=1814)
+        assert updates == [{"Id": "Installed-159-2.9.0", "Name": "BIOS", "InstalledVersion": "2.9.0",
+                            "CatalogVersion": "2.10.2", "PackagePath": "FOLDER2/BIOS_NEW.EXE", "Criticality": "2",
+                            "RebootRequired": True}]
+        current = [dict(INVENTORY[0], Id="Installed-159-2.10.2", Version="2.10.2")] + INVENTORY[1:]
+        assert catalog.get_updates(current, system_id=1814) == []
+        assert catalog.get_updates(INVENTORY, system_id="1814") == updates
+        assert catalog.get_updates(INVENTORY[:2] + INVENTORY[3:], system_id=1953) is None
+        assert catalog.get_updates(INVENTORY[1:2], system_id=1814) is None
+
+    def test_load_catalog_cache(self, catalog_path, tmp_path, mocker):
+        cache_dir = str(tmp_path / "cache")
+        catalog = load_catalog(catalog_path, cache_dir)
+        assert len(os.listdir(cache_dir)) == 1
+        parse_mock = mocker.patch.object(FirmwareCatalog, "parse", side_effect=AssertionError("parsed"))
+        cached = load_catalog(catalog_path, cache_dir)
+        assert not parse_mock.called
+        assert cached.packages == catalog.packages
+        assert cached.index == catalog.index
+        assert cached.digest == catalog.digest
+        assert cached.latest("159", system_id=1814)["version"] == "2.10.2"
+
+    def test_load_catalog_cache_invalidated(self, catalog_path, tmp_path, monkeypatch):
+        cache_dir = str(tmp_path / "cache")
+        load_catalog(catalog_path, cache_dir)
+        with open(catalog_path, "wb") as catalog_file:
+            catalog_file.write(CATALOG_XML.replace(u'vendorVersion="2.10.2"', u'vendorVersion="2.11.0"')
+                               .encode("utf-16"))
+        assert load_catalog(catalog_path, cache_dir).latest("159", system_id=1814)["version"] == "2.11.0"
+        monkeypatch.setattr(firmware_catalog, "CACHE_FORMAT", firmware_catalog.CACHE_FORMAT + 1)
+        cache_file = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+        assert FirmwareCatalog.from_cache(cache_file) is None
+
+    def test_load_catalog_cache_corrupt(self, catalog_path, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        catalog = load_catalog(catalog_path, cache_dir)
+        cache_file = os.path.join(cache_dir, "catalog-{0}.bin".format(catalog.digest))
+        with open(cache_file, "wb") as corrupt:
+            corrupt.write(b"\x00garbage")
+        assert load_catalog(catalog_path, cache_dir).packages == catalog.packages
+
+    def test_prune_cache(self, tmp_path):
+        for idx in range(4):
+            path = tmp_path / "catalog-{0}.bin".format(idx)
+            path.write_bytes(b"")
+            os.utime(str(path), (idx, idx))
+        firmware_catalog._prune_cache(str(tmp_path), keep=2)
+        assert sorted(os.listdir(str(tmp_path))) == ["catalog-2.bin", "catalog-3.bin"]
+
+    def test_get_firmware_catalog(self, catalog_path, tmp_path, monkeypatch):
+        monkeypatch.setenv(firmware_catalog.CATALOG_CACHE_DIR_ENV, str(tmp_path / "cache"))
+        get_firmware_catalog(catalog_path)
+        assert len(os.listdir(str(tmp_path / "cache"))) == 1
+        monkeypatch.setenv(firmware_catalog.CATALOG_CACHE_ENV, "false")
+        monkeypatch.setenv(firmware_catalog.CATALOG_CACHE_DIR_ENV, str(tmp_path / "disabled"))
+        assert len(get_firmware_catalog(catalog_path).packages) == 4
+        assert not os.path.exists(str(tmp_path / "disabled"))
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ip_ranges import IPRangeSet, parse_address, \
+    format_address, parse_ip_spec, collapse_ip_specs
+
+
+class TestIPRanges(object):
+
+    @pytest.mark.parametrize("value, expected", [
+        ("192.168.0.1", (4, 3232235521)),
+        ("[fe80::1]", (6, 0xfe800000000000000000000000000001)),
+        ("fe80::1%eth0", (6, 0xfe800000000000000000000000000001)),
+        ("hostname", None), ("", None), (None, None)])
+    def test_parse_address(self, value, expected):
+        assert parse_address(value) == expected
+
+    def test_format_address(self):
+        assert format_address(4, 3232235521) == "192.168.0.1"
+        assert format_address(*parse_address("FE80:0:0::DE0:B6B3:A764:0")) == "fe80::de0:b6b3:a764:0"
+
+    @pytest.mark.parametrize("spec, expected", [
+        ("192.168.0.1", (4, 3232235521, 3232235521)),
+        ("192.168.0.5/30", (4, 3232235524, 3232235527)),
+        ("192.168.0.1-192.168.0.9", (4, 3232235521, 3232235529)),
+        ("::1-::3", (6, 1, 3))])
+    def test_parse_ip_spec(self, spec, expected):
+        assert parse_ip_spec(spec) == expected
+
+    @pytest.mark.parametrize("spec", ["192.168.0.9-192.168.0.1", "192.168.0.1-::1", "192.168.0.1-255",
+                                      "192.168.0.0/255.255.255.0", "192.168.0.*", "host.domain.tld"])
+    def test_parse_ip_spec_invalid(self, spec):
+        with pytest.raises(ValueError):
+            parse_ip_spec(spec)
+
+    def test_range_set_contains(self):
+        ranges = IPRangeSet.from_specs(["192.168.3.0/24", "192.168.4.1-192.168.4.9", "192.168.4.10",
+                                        "192.168.2.10", "fe80::/16"])
+        ranges.add(4, 1, 1)
+        assert "192.168.3.255" in ranges
+        assert "192.168.4.10" in ranges
+        assert "192.168.4.11" not in ranges
+        assert "192.168.2.9" not in ranges
+        assert "[fe80::de0:b6b3:a764:0]" in ranges
+        assert "fe90::1" not in ranges
+        assert "0.0.0.1" in ranges
+        assert "::1" not in ranges
+        assert "hostname" not in ranges
+        assert ranges._starts[4] == [1, 3232236042, 3232236288, 3232236545]
+
+    def test_collapse_ip_specs(self):
+        specs = ["192.168.1.5", "host.domain.tld", "192.168.1.0/24", "192.168.1.5", "192.168.1.10-192.168.1.20",
+                 "192.168.0.0-192.168.1.0", "fe80::1", "192.168.0.0-192.168.1.0", "host.domain.tld"]
+        assert collapse_ip_specs(specs) == ["host.domain.tld", "192.168.1.0/24", "192.168.0.0-192.168.1.0",
+                                            "fe80::1", "host.domain.tld"]
+        assert collapse_ip_specs([]) == []
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import io
+import json
+import queue
+import threading
+import time
+import pytest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from ansible_collections.dellemc.openmanage.plugins.module_utils import job_events
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_events import iter_sse_events, get_job_id, \
+    get_job_event_waiter, JobEventWaiter, PollingWaiter
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import idrac_redfish_job_tracking, \
+    job_tracking, wait_for_job_completion, wait_for_redfish_job_complete
+from unittest.mock import MagicMock
+
+JOB_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_123"
+
+
+class _ThreadingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class FakeRedfishService(object):
+    """Serves one job resource and the SSE stream on which its state changes are announced."""
+
+    def __init__(self):
+        self.job_state = "Running"
+        self.job_gets = 0
+        self.subscribers = []
+        self.stopped = threading.Event()
+
+    def publish(self, job_state, message_id="JID_123"):
+        self.job_state = job_state
+        payload = json.dumps({"Events": [{"MessageId": "IDRAC.2.8.JCP001", "MessageArgs": [message_id]}]})
+        for subscriber in list(self.subscribers):
+            subscriber.put(payload)
+
+    def handler(self):
+        service = self
+
+        class _Handler(BaseHTTPRequestHandler):
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.startswith(job_events.SSE_URI):
+                    self._stream()
+                    return
+                service.job_gets += 1
+                payload = json.dumps({"Id": "JID_123", "JobState": service.job_state}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _stream(self):
+                events = queue.Queue()
+                service.subscribers.append(events)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                self.wfile.write(b": keep-alive\n\n")
+                self.wfile.flush()
+                while not service.stopped.is_set():
+                    try:
+                        payload = events.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    self.wfile.write("id: 1\ndata: {0}\n\n".format(payload).encode())
+                    self.wfile.flush()
+        return _Handler
+
+
+@pytest.fixture
+def redfish_service():
+    service = FakeRedfishService()
+    server = _ThreadingServer(("127.0.0.1", 0), service.handler())
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    service.port = server.server_address[1]
+    yield service
+    service.stopped.set()
+    server.shutdown()
+    server.server_close()
+
+
+def _idrac_client(port):
+    params = {'idrac_ip': '127.0.0.1', 'idrac_user': 'username', 'idrac_password': 'password', 'idrac_port': port}
+    client = iDRACRedfishAPI(params)
+    client.protocol = "http"
+    return client
+
+
+class TestJobEvents(object):
+
+    def test_iter_sse_events(self):
+        stream = io.BytesIO(b": keep-alive\n\nevent: Alert\nid: 7\ndata: {\"a\": 1,\ndata:  \"b\": 2}\n\n"
+                            b"data: second\r\n\r\n")
+        events = list(iter_sse_events(stream))
+        assert events[0] == {"event": "Alert", "id": "7", "data": "{\"a\": 1,\n \"b\": 2}"}
+        assert events[1]["data"] == "second" and events[1]["event"] == "message"
+
+    def test_get_job_id(self):
+        assert get_job_id(JOB_URI) == "JID_123"
+        assert get_job_id(JOB_URI + "/") == "JID_123"
+        assert get_job_id(None) is None
+
+    def test_polling_waiter_when_disabled(self, monkeypatch):
+        monkeypatch.delenv(job_events.JOB_EVENTS_ENV, raising=False)
+        assert isinstance(get_job_event_waiter(MagicMock(), JOB_URI), PollingWaiter)
+
+    def test_polling_waiter_when_stream_fails(self, monkeypatch):
+        monkeypatch.setenv(job_events.JOB_EVENTS_ENV, "true")
+        client = MagicMock()
+        client.open_event_stream.side_effect = IOError("refused")
+        assert isinstance(get_job_event_waiter(client, JOB_URI), PollingWaiter)
+
+    def test_waiter_falls_back_after_stream_end(self, mocker):
+        sleep_mock = mocker.patch("time.sleep")
+        waiter = JobEventWaiter(io.BytesIO(b"data: JID_123\n\n"), job_id="JID_123")
+        waiter._thread.join(2)
+        assert waiter.closed
+        assert waiter.wait(5) == 5
+        sleep_mock.assert_called_once_with(5)
+
+    def test_waiter_ignores_other_jobs(self, redfish_service):
+        client = _idrac_client(redfish_service.port)
+        waiter = JobEventWaiter(client.open_event_stream(job_events.SSE_URI, api_timeout=10), job_id="JID_123")
+        while not redfish_service.subscribers:
+            time.sleep(0.01)
+        redfish_service.publish("Running", message_id="JID_999")
+        assert waiter.wait(1) == 1
+        threading.Timer(0.2, redfish_service.publish, args=("Completed",)).start()
+        assert waiter.wait(10) < 10
+        assert waiter.wakeups == 1
+        waiter.close()
+
+    def test_job_tracking_woken_by_event(self, redfish_service, monkeypatch):
+        monkeypatch.setenv(job_events.JOB_EVENTS_ENV, "true")
+        client = _idrac_client(redfish_service.port)
+
+        def complete_job():
+            while not redfish_service.subscribers or not redfish_service.job_gets:
+                time.sleep(0.01)
+            redfish_service.publish("Completed")
+        threading.Thread(target=complete_job).start()
+        start = time.monotonic()
+        job_failed, msg, job_dict, wait_time = idrac_redfish_job_tracking(
+            client, JOB_URI, max_job_wait_sec=120, sleep_interval_secs=30, initial_wait=0)
+        assert time.monotonic() - start < 20
+        assert not job_failed
+        assert job_dict["JobState"] == "Completed"
+        assert wait_time < 30
+        assert redfish_service.job_gets == 2
+
+    @pytest.mark.parametrize("wait_func", [wait_for_job_completion, wait_for_redfish_job_complete])
+    def test_waiter_closed_when_request_fails(self, wait_func, mocker):
+        waiter = mocker.patch("ansible_collections.dellemc.openmanage.plugins.module_utils.utils.get_job_event_waiter")
+        waiter.return_value.wait.return_value = 10
+        client = MagicMock()
+        client.invoke_request.side_effect = IOError("connection reset")
+        with pytest.raises(IOError):
+            wait_func(client, JOB_URI)
+        waiter.return_value.close.assert_called_once_with()
+
+    @pytest.mark.parametrize("state, failed", [(2060, False), (2070, True)])
+    def test_job_tracking_stops_at_final_state(self, state, failed, mocker):
+        mocker.patch("ansible_collections.dellemc.openmanage.plugins.module_utils.utils.time.sleep")
+        waiter = mocker.patch("ansible_collections.dellemc.openmanage.plugins.module_utils.utils.get_job_event_waiter")
+        waiter.return_value.wait.return_value = 2
+        client = MagicMock()
+        client.invoke_request.side_effect = [MagicMock(json_data={"LastRunStatus": {"Id": state}})] * 3 + \
+            [IOError("polled again")] * 10
+        job_failed, msg, job_dict, wait_time = job_tracking(client, "JobService/Jobs(10)", job_running_states=(),
+                                                            sleep_interval_secs=10)
+        assert job_failed is failed
+        assert client.invoke_request.call_count == 1
+        assert not waiter.return_value.wait.called
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_tracker import BatchJobTracker, \
+    fetch_ome_jobs, fetch_redfish_jobs
+from unittest.mock import MagicMock
+
+TEST_HOST = 'https://testhost.com/'
+
+
+def _response(json_data):
+    resp = MagicMock()
+    resp.json_data = json_data
+    return resp
+
+
+class TestJobTracker(object):
+
+    def test_fetch_ome_jobs(self):
+        rest_obj = MagicMock()
+        rest_obj.invoke_request.return_value = _response({"value": [{"Id": 1}, {"Id": 2}]})
+        jobs = fetch_ome_jobs(rest_obj, [1, 2])
+        assert sorted(jobs) == [1, 2]
+        rest_obj.invoke_request.assert_called_once_with("GET", "JobService/Jobs",
+                                                        query_param={"$filter": "(Id eq 1 or Id eq 2)"})
+
+    def test_fetch_redfish_jobs_without_expand(self):
+        rest_obj = MagicMock()
+        rest_obj.invoke_request.side_effect = [
+            _response({"Members": [{"@odata.id": "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_1"},
+                                   {"Id": "JID_2", "JobState": "Completed"}]}),
+            _response({"Id": "JID_1", "JobState": "Running"})]
+        jobs = fetch_redfish_jobs(rest_obj, ["JID_1", "JID_2"])
+        assert jobs["JID_1"]["JobState"] == "Running" and jobs["JID_2"]["JobState"] == "Completed"
+        assert rest_obj.invoke_request.call_args_list[1][1]["path"] == \
+            "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_1"
+
+    def test_wait_one_request_per_cycle(self, mocker):
+        sleep_mock = mocker.patch('time.sleep')
+        states = iter([{"JID_1": {"JobState": "Running"}, "JID_2": {"JobState": "Completed"}},
+                       {"JID_1": {"JobState": "Completed"}}])
+        requested = []
+
+        def fetch_jobs(rest_obj, job_ids):
+            requested.append(list(job_ids))
+            return next(states)
+        tracker = BatchJobTracker(MagicMock(), ["JID_1", "JID_2", "JID_1"], fetch_jobs,
+                                  lambda job: job["JobState"] == "Completed", sleep_interval=5)
+        jobs, pending = tracker.wait()
+        assert requested == [["JID_1", "JID_2"], ["JID_1"]]
+        assert pending == [] and jobs["JID_1"]["JobState"] == "Completed"
+        sleep_mock.assert_called_once_with(5)
+
+    def test_wait_timeout(self, mocker):
+        mocker.patch('time.sleep')
+        tracker = BatchJobTracker(MagicMock(), ["JID_1"], lambda rest_obj, ids: {"JID_1": {"JobState": "Running"}},
+                                  lambda job: False, sleep_interval=10, wait_timeout=30)
+        jobs, pending = tracker.wait()
+        assert pending == ["JID_1"]
+        assert tracker.polls == 4
+
+    def test_wait_unresponsive(self, mocker):
+        mocker.patch('time.sleep')
+        fetch_jobs = MagicMock(side_effect=[HTTPError(TEST_HOST, 503, "Unavailable", {}, None),
+                                            {"JID_1": {"JobState": "Completed"}}])
+        tracker = BatchJobTracker(MagicMock(), ["JID_1"], fetch_jobs, lambda job: True, sleep_interval=10)
+        assert tracker.wait() == ({"JID_1": {"JobState": "Completed"}}, [])
+        fetch_jobs.side_effect = HTTPError(TEST_HOST, 503, "Unavailable", {}, None)
+        tracker = BatchJobTracker(MagicMock(), ["JID_1"], fetch_jobs, lambda job: True, sleep_interval=10,
+                                  max_unresponsive_wait=20)
+        with pytest.raises(HTTPError):
+            tracker.wait()
+        assert fetch_jobs.call_count == 5
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import pytest
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import metrics
+from ansible_collections.dellemc.openmanage.plugins.module_utils.metrics import RequestMetrics, normalize_uri, \
+    percentile, add_api_metrics
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from unittest.mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+
+
+@pytest.fixture
+def request_metrics(monkeypatch):
+    collector = RequestMetrics()
+    monkeypatch.setattr(metrics, "_REQUEST_METRICS", collector)
+    monkeypatch.setenv(metrics.API_METRICS_ENV, "true")
+    monkeypatch.delenv(metrics.API_TRACE_ENV, raising=False)
+    return collector
+
+
+class TestMetrics(object):
+
+    @pytest.mark.parametrize("url, expected", [
+        ("https://host:443/api/DeviceService/Devices(10)/InventoryDetails?$top=1",
+         "/api/DeviceService/Devices({id})/InventoryDetails"),
+        ("/api/JobService/Jobs(1234)", "/api/JobService/Jobs({id})"),
+        ("/api/TemplateService/Templates('abc')", "/api/TemplateService/Templates('{id}')"),
+        ("/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_123456789012", "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/{id}"),
+        ("/redfish/v1/SessionService/Sessions/12", "/redfish/v1/SessionService/Sessions/{id}"),
+        ("/api/v1/Tasks/0e5d1c7a-9a6b-4c1d-8b2e-3f4a5b6c7d8e/Status", "/api/v1/Tasks/{id}/Status"),
+        ("/redfish/v1/Systems/System.Embedded.1", "/redfish/v1/Systems/System.Embedded.1"),
+    ])
+    def test_normalize_uri(self, url, expected):
+        assert normalize_uri(url) == expected
+
+    def test_percentile(self):
+        values = [0.1 * idx for idx in range(1, 21)]
+        assert percentile(values, 50) == values[9]
+        assert percentile(values, 95) == values[18]
+        assert percentile([], 95) == 0.0
+
+    def test_summary(self, request_metrics):
+        request_metrics.record("GET", "/api/DeviceService/Devices(1)", 200, 100, 0.2)
+        request_metrics.record("GET", "/api/DeviceService/Devices(2)", 200, 50, 0.4)
+        request_metrics.record("POST", "/api/JobService/Jobs", 400, 10, 0.1)
+        summary = request_metrics.summary()
+        assert summary["count"] == 3
+        assert summary["total_bytes"] == 160
+        devices = summary["endpoints"]["GET /api/DeviceService/Devices({id})"]
+        assert devices["count"] == 2 and devices["bytes"] == 150 and devices["errors"] == 0
+        assert devices["p50"] == 0.2 and devices["p95"] == 0.4
+        assert summary["endpoints"]["POST /api/JobService/Jobs"]["errors"] == 1
+
+    def test_trace_file(self, request_metrics, tmp_path, monkeypatch):
+        trace = tmp_path / "trace.jsonl"
+        monkeypatch.setenv(metrics.API_TRACE_ENV, str(trace))
+        request_metrics.record("GET", "/api/JobService/Jobs(5)", 200, 20, 0.01)
+        request_metrics.record("DELETE", "/api/SessionService/Sessions('x')", 204, 0, 0.02)
+        lines = [json.loads(line) for line in trace.read_text().splitlines()]
+        assert [line["uri"] for line in lines] == ["/api/JobService/Jobs({id})", "/api/SessionService/Sessions('{id}')"]
+        assert "pid" in lines[0] and "time" in lines[0]
+
+    def test_add_api_metrics_disabled(self, monkeypatch):
+        monkeypatch.delenv(metrics.API_METRICS_ENV, raising=False)
+        assert add_api_metrics({"changed": False}) == {"changed": False}
+
+    def test_rest_ome_records_requests(self, request_metrics, mocker):
+        mock_response = MagicMock()
+        mock_response.getcode.return_value = 200
+        mock_response.read.return_value = json.dumps({"value": []})
+        mocker.patch(MODULE_UTIL_PATH + 'ome.open_url', return_value=mock_response)
+        module_params = {'hostname': 'xxx.xxx.x.x', 'username': 'username', 'password': 'password', "port": 443}
+        with RestOME(module_params, False) as obj:
+            obj.invoke_request("GET", "DeviceService/Devices(10)")
+        assert request_metrics.records[0]["uri"] == "/api/DeviceService/Devices({id})"
+        assert request_metrics.records[0]["status"] == 200
+        assert request_metrics.records[0]["bytes"] == len(json.dumps({"value": []}))
+        result = add_api_metrics({"changed": False})
+        assert result["api_metrics"]["count"] == 1
+
+    def test_rest_ome_records_http_error(self, request_metrics, mocker):
+        mocker.patch(MODULE_UTIL_PATH + 'ome.open_url',
+                     side_effect=HTTPError('https://host/api/JobService/Jobs(3)', 404, "Not Found",
+                                           {"Content-Length": "12"}, None))
+        module_params = {'hostname': 'xxx.xxx.x.x', 'username': 'username', 'password': 'password', "port": 443}
+        with pytest.raises(HTTPError):
+            with RestOME(module_params, False) as obj:
+                obj.invoke_request("GET", "JobService/Jobs(3)")
+        assert request_metrics.records[0]["status"] == 404
+        assert request_metrics.records[0]["bytes"] == 12
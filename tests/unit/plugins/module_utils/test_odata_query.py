@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import odata_query
+from ansible_collections.dellemc.openmanage.plugins.module_utils.odata_query import ODataQuery, \
+    quote_value, or_filter, and_filter, batch_or_filters, project_item, get_report_with_projection, \
+    iter_items_with_projection, get_items_by_values
+from unittest.mock import MagicMock
+
+TEST_HOST = 'https://testhost.com/'
+DEVICE_API = "DeviceService/Devices"
+DEVICES = [{"Id": 1, "DeviceServiceTag": "ABC1", "Model": "R740", "@odata.id": "/api/Devices(1)"},
+           {"Id": 2, "DeviceServiceTag": "ABC2", "Model": "R640", "@odata.id": "/api/Devices(2)"}]
+
+
+class TestODataQuery(object):
+
+    @pytest.mark.parametrize("value, expected", [(1, "1"), (True, "true"), ("ABC", "'ABC'"), ("O'R", "'O''R'")])
+    def test_quote_value(self, value, expected):
+        assert quote_value(value) == expected
+
+    def test_filters(self):
+        assert or_filter("Id", [1]) == "Id eq 1"
+        assert or_filter("DeviceServiceTag", ["A", "B"]) == "(DeviceServiceTag eq 'A' or DeviceServiceTag eq 'B')"
+        assert and_filter("Type eq 1000", "(Id eq 1 or Id eq 2)") == "(Type eq 1000) and (Id eq 1 or Id eq 2)"
+        assert and_filter("Type eq 1000", None) == "Type eq 1000"
+        assert batch_or_filters("Id", [1, 2, 3], batch_size=2) == ["(Id eq 1 or Id eq 2)", "Id eq 3"]
+
+    def test_query_params(self):
+        query = ODataQuery(select=["Id"], top=10).select("Id", "DeviceServiceTag").where_eq("Type", 1000)
+        query.where_any("Id", [1, 2])
+        assert query.to_params() == {"$select": "Id,DeviceServiceTag", "$top": 10,
+                                     "$filter": "(Type eq 1000) and (Id eq 1 or Id eq 2)"}
+        assert ODataQuery().to_params() == {}
+
+    def test_project_item(self):
+        assert project_item(DEVICES[0], ["Id"]) == {"Id": 1, "@odata.id": "/api/Devices(1)"}
+        assert project_item(DEVICES[0], None) is DEVICES[0]
+
+    def test_get_report_with_projection(self):
+        rest_obj = MagicMock()
+        rest_obj.get_all_report_details.return_value = {"report_list": list(DEVICES)}
+        report = get_report_with_projection(rest_obj, DEVICE_API, select=["Id", "Model"], filter_expr="Type eq 1000")
+        rest_obj.get_all_report_details.assert_called_once_with(
+            DEVICE_API, query_param={"$select": "Id,Model", "$filter": "Type eq 1000"})
+        assert report["report_list"][1] == {"Id": 2, "Model": "R640", "@odata.id": "/api/Devices(2)"}
+
+    def test_get_report_with_projection_select_rejected(self):
+        rest_obj = MagicMock()
+        rest_obj.get_all_report_details.side_effect = [HTTPError(TEST_HOST, 400, "Bad Request", {}, None),
+                                                       {"report_list": list(DEVICES)}]
+        report = get_report_with_projection(rest_obj, DEVICE_API, select=["Id"])
+        assert rest_obj.get_all_report_details.call_args[1] == {"query_param": None}
+        assert report["report_list"][0] == {"Id": 1, "@odata.id": "/api/Devices(1)"}
+
+    def test_get_report_with_projection_error(self):
+        rest_obj = MagicMock()
+        rest_obj.get_all_report_details.side_effect = HTTPError(TEST_HOST, 400, "Bad Request", {}, None)
+        with pytest.raises(HTTPError):
+            get_report_with_projection(rest_obj, DEVICE_API, filter_expr="Id eq 1")
+
+    def test_iter_items_with_projection_select_rejected(self):
+        rest_obj = MagicMock()
+
+        def iter_items(uri, query_param=None, select=None):
+            if select:
+                raise HTTPError(TEST_HOST, 501, "Not Implemented", {}, None)
+            return iter(DEVICES)
+        rest_obj.iter_items.side_effect = iter_items
+        items = list(iter_items_with_projection(rest_obj, DEVICE_API, select=["DeviceServiceTag"]))
+        assert [item["DeviceServiceTag"] for item in items] == ["ABC1", "ABC2"]
+        assert "Model" not in items[0]
+
+    def test_get_items_by_values_batches(self):
+        rest_obj = MagicMock()
+        rest_obj.get_all_report_details.side_effect = [{"report_list": [dict(DEVICES[0])]},
+                                                       {"report_list": [dict(DEVICES[0]), dict(DEVICES[1])]}]
+        items = get_items_by_values(rest_obj, "DeviceServiceTag", ["ABC1", "ABC2"], batch_size=1)
+        assert [item["Id"] for item in items] == [1, 2]
+        assert rest_obj.get_all_report_details.call_args_list[1][1]["query_param"]["$filter"] == \
+            "DeviceServiceTag eq 'ABC2'"
+        assert get_items_by_values(rest_obj, "Id", []) == []
+
+    def test_get_items_by_values_large_list(self, monkeypatch):
+        monkeypatch.setattr(odata_query, "MAX_FILTER_VALUES", 1)
+        rest_obj = MagicMock()
+        rest_obj.get_all_report_details.return_value = {"report_list": list(DEVICES)}
+        items = get_items_by_values(rest_obj, "Id", [1, 2])
+        assert len(items) == 2
+        assert "$filter" not in rest_obj.get_all_report_details.call_args[1]["query_param"]
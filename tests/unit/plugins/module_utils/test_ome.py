@@ -133,6 +133,32 @@ class TestOMERest(object):
         assert reports == {"resp_obj": mock_response,
                            "report_list": list(range(50)) + (list(range(50)))}
 
+    def test_get_all_report_details_concurrent(self, mocker, module_params):
+        def invoke(method, uri, query_param=None):
+            resp = MagicMock()
+            skip = (query_param or {}).get("$skip", 0)
+            resp.json_data = {ODATA_COUNT: 23, "value": list(range(skip, min(skip + 5, 23)))}
+            return resp
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=invoke)
+        with RestOME(module_params, False) as obj:
+            reports = obj.get_all_report_details(DEVICE_API, max_workers=3)
+        assert reports["report_list"] == list(range(23))
+        assert reports["resp_obj"].json_data["value"] == [20, 21, 22]
+        assert invoke_mock.call_count == 5
+
+    def test_get_all_report_details_workers_from_env(self, mocker, module_params, monkeypatch):
+        monkeypatch.setenv("OMAM_PAGINATION_WORKERS", "4")
+        page = MagicMock()
+        page.json_data = {"value": [2, 3]}
+        map_mock = mocker.patch(MODULE_UTIL_PATH + 'ome.map_concurrently', return_value=[page])
+        first = MagicMock()
+        first.json_data = {ODATA_COUNT: 3, "value": [1]}
+        mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, return_value=first)
+        reports = RestOME(module_params, False).get_all_report_details(DEVICE_API)
+        assert reports == {"resp_obj": page, "report_list": [1, 2, 3]}
+        assert map_mock.call_args[0][2] == 4
+        assert map_mock.call_args[0][1] == [{"$top": 1, "$skip": 1}, {"$top": 1, "$skip": 2}]
+
     def test_get_report_list_error_case(self, mock_response, mocker, ome_object):
         mocker.patch(MODULE_UTIL_PATH + OME_OPENURL,
                      return_value=mock_response)
@@ -226,6 +252,49 @@ class TestOMERest(object):
         reports = ome_object.get_all_items_with_pagination(DEVICE_API)
         assert reports == {"total_count": 100, "value": list(range(100))}
 
+    def test_iter_items_follows_next_link_with_query(self, mocker, ome_object):
+        pages = [{ODATA_COUNT: 4, "value": [1, 2], "@odata.nextLink": "/api/DeviceService/Devices?$skip=2&$top=2"},
+                 {ODATA_COUNT: 4, "value": [3, 4]}]
+        calls = []
+
+        def mock_invoke_request(method, uri, query_param=None):
+            calls.append((uri, query_param))
+            resp = MagicMock()
+            resp.json_data = pages[len(calls) - 1]
+            return resp
+        mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=mock_invoke_request)
+        items = list(ome_object.iter_items(DEVICE_API, query_param={"$filter": "Type eq 1000"},
+                                           select=["Id", "DeviceServiceTag"]))
+        assert items == [1, 2, 3, 4]
+        assert calls[0] == (DEVICE_API, {"$filter": "Type eq 1000", "$select": "Id,DeviceServiceTag"})
+        assert calls[1] == ("DeviceService/Devices", {"$skip": "2", "$top": "2", "$filter": "Type eq 1000",
+                                                      "$select": "Id,DeviceServiceTag"})
+
+    def test_iter_items_windows_from_count(self, mocker, ome_object):
+        def mock_invoke_request(method, uri, query_param=None):
+            skip = (query_param or {}).get("$skip", 0)
+            resp = MagicMock()
+            resp.json_data = {ODATA_COUNT: 5, "value": list(range(skip, min(skip + 2, 5)))}
+            return resp
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=mock_invoke_request)
+        assert list(ome_object.iter_items(DEVICE_API)) == [0, 1, 2, 3, 4]
+        assert invoke_mock.call_count == 3
+
+    def test_iter_items_stops_early(self, mocker, ome_object):
+        resp = MagicMock()
+        resp.json_data = {ODATA_COUNT: 100, "value": [1, 2], "@odata.nextLink": "/api/DeviceService/Devices?$skip=2"}
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, return_value=resp)
+        items = ome_object.iter_items(DEVICE_API)
+        assert next(items) == 1
+        assert invoke_mock.call_count == 1
+
+    def test_iter_items_caller_paging_not_windowed(self, mocker, ome_object):
+        resp = MagicMock()
+        resp.json_data = {ODATA_COUNT: 100, "value": [1]}
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, return_value=resp)
+        assert list(ome_object.iter_items(DEVICE_API, query_param={"$top": 1})) == [1]
+        assert invoke_mock.call_count == 1
+
     def test_get_all_items_with_pagination_error_case(self, mock_response, mocker, ome_object):
         mocker.patch(MODULE_UTIL_PATH + OME_OPENURL,
                      return_value=mock_response)
@@ -324,8 +393,8 @@ class TestOMERest(object):
         mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST,
                      return_value=mock_response)
 
-        mocker.patch(MODULE_UTIL_PATH + 'ome.RestOME.get_job_info',
-                     return_value=ret_val)
+        mocker.patch(MODULE_UTIL_PATH + 'ome.RestOME._get_job_info',
+                     return_value=ret_val + ({},))
         job_failed, message = ome_object.job_tracking(12345, 2, 1)
         assert job_failed is ret_val[1]
         assert message == ret_val[2]
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import pytest
+from ansible_collections.dellemc.openmanage.plugins.module_utils import poll_scheduler
+from ansible_collections.dellemc.openmanage.plugins.module_utils.poll_scheduler import PollScheduler, JobHistory, \
+    get_poll_scheduler, get_job_type, get_job_state
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import job_tracking
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(poll_scheduler.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(poll_scheduler.time, "sleep", fake.sleep)
+    return fake
+
+
+class TestPollScheduler(object):
+
+    @pytest.mark.parametrize("job, job_type, state", [
+        ({"JobType": {"Id": 5, "Name": "Update_Task"}, "LastRunStatus": {"Id": 2050}}, "Update_Task", 2050),
+        ({"JobType": "FirmwareUpdate", "JobState": "Running"}, "FirmwareUpdate", "Running"),
+        ({"TaskState": "Running"}, None, "Running"),
+        (None, None, None),
+    ])
+    def test_job_type_and_state(self, job, job_type, state):
+        assert get_job_type(job) == job_type
+        assert get_job_state(job) == state
+
+    def test_fixed_interval_when_disabled(self, monkeypatch):
+        monkeypatch.delenv(poll_scheduler.ADAPTIVE_POLL_ENV, raising=False)
+        scheduler = get_poll_scheduler(10)
+        assert [scheduler.next_interval({"PercentComplete": pct}) for pct in (0, 50, 90)] == [10, 10, 10]
+
+    def test_backoff_and_state_reset(self, clock):
+        scheduler = PollScheduler(10, adaptive=True)
+        intervals = [scheduler.next_interval({"JobState": "Running"}) for dummy in range(6)]
+        assert intervals == [2, 3, 5, 7, 11, 16]
+        assert scheduler.next_interval({"JobState": "Completed"}) == 2
+        assert scheduler.next_interval() == 3
+
+    def test_progress_estimate(self, clock):
+        scheduler = PollScheduler(30, adaptive=True)
+        assert scheduler.next_interval({"PercentComplete": 10}) == 2
+        clock.sleep(10)
+        # 10 percent in 10 seconds, 80 seconds left, polled half way
+        assert scheduler.next_interval({"PercentComplete": 20}) == 40
+        clock.sleep(40)
+        assert scheduler.next_interval({"PercentComplete": 90}) == 3
+
+    def test_history(self, clock, tmp_path):
+        path = str(tmp_path / "history.json")
+        scheduler = PollScheduler(60, adaptive=True, history=JobHistory(path))
+        scheduler.next_interval({"JobType": "FirmwareUpdate"})
+        clock.sleep(300)
+        scheduler.finish()
+        with open(path) as history_file:
+            assert json.load(history_file) == {"FirmwareUpdate": {"count": 1, "mean": 300.0}}
+        scheduler = PollScheduler(60, adaptive=True, history=JobHistory(path))
+        assert scheduler.next_interval({"JobType": "FirmwareUpdate"}) == 120
+        clock.sleep(250)
+        assert scheduler.next_interval({"JobType": "FirmwareUpdate"}) == 25
+        JobHistory(path).record("FirmwareUpdate", 400)
+        assert JobHistory(path).get("FirmwareUpdate") == 330.0
+
+    def test_history_merges_concurrent_records(self, tmp_path):
+        path = str(tmp_path / "history.json")
+        first, second = JobHistory(path), JobHistory(path)
+        first.record("FirmwareUpdate", 300)
+        second.record("Inventory_Task", 10)
+        second.record("FirmwareUpdate", 400)
+        assert JobHistory(path).durations == {"FirmwareUpdate": {"count": 2, "mean": 330.0},
+                                              "Inventory_Task": {"count": 1, "mean": 10}}
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["history.json", "history.json.lock"]
+
+    def test_history_unreadable(self, tmp_path):
+        path = tmp_path / "history.json"
+        path.write_text("not json")
+        assert JobHistory(str(path)).get("FirmwareUpdate") is None
+
+    def test_job_tracking_adaptive(self, clock, monkeypatch, tmp_path, mocker):
+        monkeypatch.setenv(poll_scheduler.ADAPTIVE_POLL_ENV, "true")
+        monkeypatch.setenv(poll_scheduler.JOB_HISTORY_ENV, str(tmp_path / "history.json"))
+        mocker.patch("time.sleep", side_effect=clock.sleep)
+        states = iter([2050, 2050, 2060])
+        rest_obj = mocker.MagicMock()
+
+        def invoke_request(method, uri):
+            resp = mocker.MagicMock()
+            resp.json_data = {"JobType": {"Name": "Inventory_Task"}, "LastRunStatus": {"Id": next(states)}}
+            return resp
+        rest_obj.invoke_request.side_effect = invoke_request
+        job_failed, msg, job_dict, wait_time = job_tracking(rest_obj, "JobService/Jobs(1)", initial_wait=0)
+        assert not job_failed
+        assert wait_time == 5
+        assert JobHistory(str(tmp_path / "history.json")).get("Inventory_Task") == 5.0
+
+    def test_rest_ome_job_tracking_adaptive(self, clock, monkeypatch, tmp_path, mocker):
+        monkeypatch.setenv(poll_scheduler.ADAPTIVE_POLL_ENV, "true")
+        monkeypatch.setenv(poll_scheduler.JOB_HISTORY_ENV, str(tmp_path / "history.json"))
+        mocker.patch("time.sleep", side_effect=clock.sleep)
+        jobs = iter([{"JobType": {"Name": "Inventory_Task"}, "LastRunStatus": {"Id": 2050}, "PercentComplete": 10},
+                     {"JobType": {"Name": "Inventory_Task"}, "LastRunStatus": {"Id": 2050}, "PercentComplete": 50},
+                     {"JobType": {"Name": "Inventory_Task"}, "LastRunStatus": {"Id": 2060}}])
+        mocker.patch.object(RestOME, "invoke_request", side_effect=lambda method, uri: mocker.MagicMock(
+            json_data=next(jobs)))
+        rest_obj = RestOME({"hostname": "192.168.0.1", "username": "admin", "password": "pwd", "port": 443})
+        job_failed, msg = rest_obj.job_tracking(1, job_wait_sec=600, sleep_time=30)
+        assert not job_failed
+        # polled after 2 and 5 seconds, the progress rate places the last poll 2 seconds later
+        assert JobHistory(str(tmp_path / "history.json")).get("Inventory_Task") == 7.0
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import datetime
+import fcntl
+import http.client
+import json
+import os
+import socket
+import threading
+import time
+import pytest
+from ansible_collections.dellemc.openmanage.plugins.module_utils import repo_server
+from ansible_collections.dellemc.openmanage.plugins.module_utils.repo_server import RepositoryServer, \
+    ensure_repository_server, parse_range, repository_url
+
+CATALOG = b"<Manifest><SoftwareComponent path='FOLDER1/BIOS.EXE'/></Manifest>"
+DUP = bytes(bytearray(range(256))) * 64
+
+
+@pytest.fixture
+def repository(tmp_path):
+    (tmp_path / "Catalog.xml").write_bytes(CATALOG)
+    (tmp_path / "FOLDER1").mkdir()
+    (tmp_path / "FOLDER1" / "BIOS.EXE").write_bytes(DUP)
+    (tmp_path.parent / "secret.txt").write_bytes(b"secret")
+    return tmp_path
+
+
+@pytest.fixture
+def server(repository):
+    server = RepositoryServer(str(repository), ("127.0.0.1", 0))
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _serve(servers):
+    def spawn(server, state_path, idle_timeout):
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        servers.append(server)
+        return os.getpid()
+    return spawn
+
+
+def _shutdown(servers):
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _request(server, path, method="GET", headers=None):
+    conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+    try:
+        conn.request(method, path, headers=headers or {})
+        resp = conn.getresponse()
+        return resp.status, dict(resp.getheaders()), resp.read()
+    finally:
+        conn.close()
+
+
+class TestRepositoryServer(object):
+
+    @pytest.mark.parametrize("header, expected", [
+        (None, None), ("bytes=0-9", (0, 9)), ("bytes=10-", (10, 99)), ("bytes=-10", (90, 99)),
+        ("bytes=90-200", (90, 99)), ("bytes=100-", False), ("bytes=9-2", False), ("bytes=-0", False),
+        ("bytes=0-1,5-6", None), ("items=0-1", None), ("bytes=-", None)])
+    def test_parse_range(self, header, expected):
+        assert parse_range(header, 100) == expected
+
+    def test_get_file(self, server):
+        status, headers, body = _request(server, "/Catalog.xml")
+        assert status == 200
+        assert body == CATALOG
+        assert headers["Content-Type"] == "application/xml"
+        assert headers["Accept-Ranges"] == "bytes"
+        status, headers, body = _request(server, "/FOLDER1/BIOS.EXE")
+        assert body == DUP
+        assert headers["Content-Type"] == "application/octet-stream"
+
+    @pytest.mark.parametrize("header, status, content_range, data", [
+        ("bytes=256-511", 206, "bytes 256-511/16384", DUP[256:512]),
+        ("bytes=-100", 206, "bytes 16284-16383/16384", DUP[-100:]),
+        ("bytes=16384-", 416, "bytes */16384", b""),
+    ])
+    def test_get_range(self, server, header, status, content_range, data):
+        resp_status, headers, body = _request(server, "/FOLDER1/BIOS.EXE", headers={"Range": header})
+        assert resp_status == status
+        assert headers["Content-Range"] == content_range
+        assert body == data
+
+    def test_head(self, server):
+        status, headers, body = _request(server, "/FOLDER1/BIOS.EXE", method="HEAD")
+        assert status == 200
+        assert headers["Content-Length"] == str(len(DUP))
+        assert body == b""
+
+    @pytest.mark.parametrize("path", ["/missing.exe", "/../secret.txt", "/%2e%2e/secret.txt", "/FOLDER1"])
+    def test_outside_root_not_found(self, server, path):
+        assert _request(server, path)[0] == 404
+
+    def test_client_connection_limit(self, server):
+        server.max_client_connections = 1
+        assert server.acquire("127.0.0.1")
+        status, headers, body = _request(server, "/Catalog.xml")
+        assert status == 503
+        assert headers["Retry-After"] == "5"
+        server.release("127.0.0.1")
+        assert _request(server, "/Catalog.xml")[0] == 200
+        # The slot is released once the response is flushed, which the client may see first.
+        deadline = time.time() + 5
+        while server.active and time.time() < deadline:
+            time.sleep(0.01)
+        assert server.active == 0
+
+    def test_rate_limit(self, server, mocker):
+        sleep_mock = mocker.patch.object(repo_server.time, "sleep")
+        server.rate_limit = 4096
+        status, headers, body = _request(server, "/FOLDER1/BIOS.EXE")
+        assert body == DUP
+        assert sleep_mock.call_count == 3
+
+    def test_serve_until_idle(self, repository):
+        server = RepositoryServer(str(repository), ("127.0.0.1", 0))
+        server.last_activity = 0
+        server.serve_until_idle(idle_timeout=1, poll_interval=0.01)
+        server.server_close()
+
+    def test_serve_until_idle_before_exit(self, repository):
+        server = RepositoryServer(str(repository), ("127.0.0.1", 0))
+        server.last_activity = 0
+        answers = [False, True]
+        server.serve_until_idle(idle_timeout=1, poll_interval=0.01, before_exit=lambda: answers.pop(0))
+        assert not answers
+        server.server_close()
+
+    def test_release_state(self, repository, tmp_path):
+        server = RepositoryServer(str(repository), ("127.0.0.1", 0))
+        server.last_activity = 0
+        state_path = str(tmp_path / "state.json")
+        with open(state_path, "w") as state:
+            json.dump({"pid": os.getpid() + 1}, state)
+        assert repo_server._release_state(server, 1, state_path)
+        assert os.path.exists(state_path)
+        with open(state_path, "w") as state:
+            json.dump({"pid": os.getpid()}, state)
+        with open(str(tmp_path / "state.lock"), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            assert not repo_server._release_state(server, 1, state_path)
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+        assert os.path.exists(state_path)
+        server.acquire("127.0.0.1")
+        assert not repo_server._release_state(server, 1, state_path)
+        server.release("127.0.0.1")
+        server.last_activity = 0
+        assert repo_server._release_state(server, 1, state_path)
+        assert not os.path.exists(state_path)
+        server.server_close()
+
+    def test_stalled_handshake_does_not_block(self, repository, tmp_path, mocker):
+        x509 = pytest.importorskip("cryptography.x509")
+        hashes = pytest.importorskip("cryptography.hazmat.primitives.hashes")
+        serialization = pytest.importorskip("cryptography.hazmat.primitives.serialization")
+        ec = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.ec")
+        key = ec.generate_private_key(ec.SECP256R1())
+        name = x509.Name([x509.NameAttribute(x509.oid.NameOID.COMMON_NAME, u"localhost")])
+        now = datetime.datetime.utcnow()
+        cert = x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key()) \
+            .serial_number(1).not_valid_before(now).not_valid_after(now + datetime.timedelta(days=1)) \
+            .sign(key, hashes.SHA256())
+        (tmp_path / "cert.pem").write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+        key_pem = key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                    serialization.NoEncryption())
+        (tmp_path / "key.pem").write_bytes(key_pem)
+        mocker.patch.object(repo_server, "HANDSHAKE_TIMEOUT", 1)
+        ssl_context = repo_server.make_ssl_context(str(tmp_path / "cert.pem"), str(tmp_path / "key.pem"))
+        server = RepositoryServer(str(repository), ("127.0.0.1", 0), ssl_context=ssl_context)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        stalled = socket.create_connection(("127.0.0.1", server.port))
+        try:
+            assert repo_server._probe("https", "127.0.0.1", server.port)
+        finally:
+            stalled.close()
+            server.shutdown()
+            server.server_close()
+
+    def test_repository_url(self):
+        assert repository_url("http", "192.168.0.2", 8080) == "http://192.168.0.2:8080"
+        assert repository_url("https", "fe80::1", 443) == "https://[fe80::1]:443"
+
+    def test_ensure_repository_server(self, repository, tmp_path_factory):
+        state_dir = str(tmp_path_factory.mktemp("state"))
+        servers = []
+        spawn = _serve(servers)
+        url = ensure_repository_server(str(repository), "127.0.0.1", state_dir=state_dir, spawn=spawn)
+        assert url == "http://127.0.0.1:{0}".format(servers[0].port)
+        assert servers[0].server_address[0] == "127.0.0.1"
+        servers[0].last_activity = 0
+        again = ensure_repository_server(str(repository), "127.0.0.1", state_dir=state_dir, spawn=spawn)
+        assert again == url
+        assert len(servers) == 1
+        assert servers[0].last_activity > 0
+        state_file = [name for name in os.listdir(state_dir) if name.endswith(".json")][0]
+        with open(os.path.join(state_dir, state_file)) as state:
+            assert json.load(state)["root"] == os.path.realpath(str(repository))
+        _shutdown(servers)
+
+    def test_ensure_repository_server_settings_ignored(self, repository, tmp_path_factory):
+        state_dir = str(tmp_path_factory.mktemp("state"))
+        servers = []
+        warnings = []
+        spawn = _serve(servers)
+        ensure_repository_server(str(repository), "127.0.0.1", max_client_connections=2, state_dir=state_dir,
+                                 spawn=spawn, warn=warnings.append)
+        ensure_repository_server(str(repository), "127.0.0.1", max_client_connections=2, state_dir=state_dir,
+                                 spawn=spawn, warn=warnings.append)
+        assert warnings == []
+        ensure_repository_server(str(repository), "127.0.0.1", rate_limit=1024, state_dir=state_dir, spawn=spawn,
+                                 warn=warnings.append)
+        assert len(servers) == 1
+        assert warnings == [repo_server.SETTINGS_IGNORED_MSG.format(
+            os.path.realpath(str(repository)), "max_client_connections=2, rate_limit=None",
+            "max_client_connections, rate_limit")]
+        _shutdown(servers)
+
+    def test_ensure_repository_server_not_answering(self, repository, tmp_path_factory):
+        state_dir = str(tmp_path_factory.mktemp("state"))
+        servers = []
+        spawn = _serve(servers)
+        ensure_repository_server(str(repository), "127.0.0.1", state_dir=state_dir, spawn=spawn)
+        _shutdown(servers)
+        url = ensure_repository_server(str(repository), "127.0.0.1", state_dir=state_dir, spawn=spawn)
+        assert len(servers) == 2
+        assert url == "http://127.0.0.1:{0}".format(servers[1].port)
+        _shutdown(servers[1:])
+
+    def test_ensure_repository_server_stale_state(self, repository, tmp_path_factory, mocker):
+        state_dir = str(tmp_path_factory.mktemp("state"))
+        mocker.patch.object(repo_server, "_pid_alive", return_value=False)
+        servers = []
+
+        def spawn(server, state_path, idle_timeout):
+            servers.append(server)
+            return 1
+        ensure_repository_server(str(repository), "127.0.0.1", state_dir=state_dir, spawn=spawn)
+        ensure_repository_server(str(repository), "127.0.0.1", state_dir=state_dir, spawn=spawn)
+        assert len(servers) == 2
+        for server in servers:
+            server.server_close()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import pytest
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import request_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.request_cache import GetCache, get_get_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+OME_PARAMS = {'hostname': 'xxx.xxx.x.x', 'username': 'username', 'password': 'password', "port": 443}
+
+
+class FakeResponse(object):
+
+    def __init__(self, body, status=200, headers=None):
+        self.body = json.dumps(body)
+        self.status = status
+        self.headers = headers or {}
+        self.reason = "OK"
+
+    def read(self):
+        return self.body
+
+    def getcode(self):
+        return self.status
+
+
+class FakeResource(object):
+    """open_url stand-in serving resources with versioned ETags."""
+
+    def __init__(self, etag=True):
+        self.etag = etag
+        self.version = 1
+        self.calls = []
+
+    def __call__(self, url, data=None, **kwargs):
+        headers = kwargs.get("headers") or {}
+        self.calls.append((kwargs.get("method"), url, headers.get("If-None-Match")))
+        if kwargs.get("method") != "GET":
+            self.version += 1
+            return FakeResponse({}, status=204)
+        etag = 'W/"{0}"'.format(self.version) if self.etag else None
+        if etag and headers.get("If-None-Match") == etag:
+            raise HTTPError(url, 304, "Not Modified", {}, None)
+        return FakeResponse({"version": self.version, "url": url}, headers={"ETag": etag} if etag else {})
+
+
+class TestGetCache(object):
+
+    @pytest.mark.parametrize("env, expected", [("yes", True), (None, False), ("false", False)])
+    def test_get_get_cache(self, env, expected, monkeypatch):
+        if env:
+            monkeypatch.setenv(request_cache.GET_CACHE_ENV, env)
+        else:
+            monkeypatch.delenv(request_cache.GET_CACHE_ENV, raising=False)
+        assert (get_get_cache() is not None) is expected
+
+    @pytest.mark.parametrize("url, expected", [
+        ("https://host/redfish/v1/Managers", True),
+        ("https://host/redfish/v1/", True),
+        ("https://host:443/api/JobService/JobTypes", True),
+        ("https://host/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_1", False),
+        ("https://host/api/JobService/Jobs(10)", False),
+    ])
+    def test_is_static(self, url, expected):
+        assert GetCache.is_static(url) is expected
+
+    def test_etag_revalidation(self, mocker, monkeypatch):
+        monkeypatch.setenv(request_cache.GET_CACHE_ENV, "yes")
+        fake = FakeResource()
+        mocker.patch(MODULE_UTIL_PATH + 'ome.open_url', side_effect=fake)
+        with RestOME(OME_PARAMS, False) as obj:
+            first = obj.invoke_request("GET", "JobService/Jobs(10)")
+            second = obj.invoke_request("GET", "JobService/Jobs(10)")
+            assert second.json_data == first.json_data
+            assert second.status_code == 200
+            assert fake.calls[1][2] == 'W/"1"'
+            assert obj.get_cache.revalidated == 1
+            obj.invoke_request("POST", "JobService/Actions/JobService.RunJobs", data={"JobIds": [10]})
+            third = obj.invoke_request("GET", "JobService/Jobs(10)")
+        assert third.json_data["version"] == 2
+        assert fake.calls[-1][2] is None
+
+    def test_static_resource_without_etag(self, mocker, monkeypatch):
+        monkeypatch.setenv(request_cache.GET_CACHE_ENV, "yes")
+        fake = FakeResource(etag=False)
+        mocker.patch(MODULE_UTIL_PATH + 'ome.open_url', side_effect=fake)
+        with RestOME(OME_PARAMS, False) as obj:
+            obj.invoke_request("GET", "JobService/JobTypes")
+            obj.invoke_request("GET", "JobService/JobTypes")
+            obj.invoke_request("GET", "JobService/Jobs(10)")
+            obj.invoke_request("GET", "JobService/Jobs(10)")
+        assert len(fake.calls) == 3
+        assert obj.get_cache.hits == 1
+
+    def test_idrac_managers_walk(self, mocker, monkeypatch):
+        monkeypatch.setenv(request_cache.GET_CACHE_ENV, "yes")
+        fake = FakeResource(etag=False)
+        mocker.patch(MODULE_UTIL_PATH + 'idrac_redfish.open_url', side_effect=fake)
+        params = {'idrac_ip': 'xxx.xxx.x.x', 'idrac_user': 'username', 'idrac_password': 'password',
+                  'idrac_port': 443}
+        with iDRACRedfishAPI(params) as obj:
+            for dummy in range(3):
+                assert obj.invoke_request("/redfish/v1/Managers", "GET").json_data["version"] == 1
+        assert len(fake.calls) == 1
+
+    def test_cache_disabled(self, mocker, monkeypatch):
+        monkeypatch.delenv(request_cache.GET_CACHE_ENV, raising=False)
+        fake = FakeResource()
+        mocker.patch(MODULE_UTIL_PATH + 'ome.open_url', side_effect=fake)
+        params = dict(OME_PARAMS)
+        with RestOME(params, False) as obj:
+            obj.invoke_request("GET", "JobService/JobTypes")
+            obj.invoke_request("GET", "JobService/JobTypes")
+        assert [call[2] for call in fake.calls] == [None, None]
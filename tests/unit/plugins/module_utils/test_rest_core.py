@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import asyncio
+import json
+import threading
+import time
+import pytest
+from ansible.module_utils.urls import ConnectionError
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import rest_core
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_core import OpenURLResponse, build_url, \
+    make_requests, gather_requests, async_gather_requests, run_coroutine
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import OpenURLResponse as OMEResponse
+from unittest.mock import MagicMock
+
+TEST_HOST = "https://192.168.0.1:443"
+MODULE_UTIL_PATH = "ansible_collections.dellemc.openmanage.plugins.module_utils."
+
+
+class FakeClient(object):
+    """Records the requests and answers with the path, paths starting with /slow sleep first."""
+
+    def __init__(self, fail=None):
+        self.calls = []
+        self.fail = fail
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def invoke_request(self, method, path, data=None, query_param=None, headers=None, api_timeout=None, dump=True):
+        with self.lock:
+            self.calls.append(path)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if path.startswith("/slow"):
+                time.sleep(0.3)
+            else:
+                time.sleep(0.01)
+            if path == self.fail:
+                raise HTTPError(path, 404, "Not Found", {}, None)
+            return path
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class FakeIdracClient(object):
+
+    def invoke_request(self, uri, method, data=None, query_param=None, headers=None, api_timeout=None, dump=True):
+        return uri
+
+
+class TestRestCore(object):
+
+    @pytest.mark.parametrize("status, success", [(200, True), (204, True), (299, True), (302, False), (400, False)])
+    def test_response_success(self, status, success):
+        resp = MagicMock()
+        resp.getcode.return_value = status
+        resp.read.return_value = json.dumps({"Id": 1})
+        resp.headers = {"X-Auth-Token": "token"}
+        response = OpenURLResponse(resp)
+        assert response.success is success
+        assert response.json_data == {"Id": 1}
+        assert response.token_header == "token"
+
+    def test_ome_response_success_codes(self):
+        resp = MagicMock()
+        resp.getcode.return_value = 203
+        assert OMEResponse(resp).success is False
+        resp.getcode.return_value = 202
+        assert OMEResponse(resp).success is True
+
+    def test_response_invalid_json(self):
+        resp = MagicMock()
+        resp.read.return_value = "<html>"
+        with pytest.raises(ValueError):
+            OpenURLResponse(resp).json_data
+
+    @pytest.mark.parametrize("base, path, query, encode_space, expected", [
+        (TEST_HOST + "/api/", "DeviceService/Devices", {"$filter": "Id eq 1"}, True,
+         TEST_HOST + "/api/DeviceService/Devices?%24filter=Id%20eq%201"),
+        (TEST_HOST, "/redfish/v1", {"$filter": "Id eq 1"}, False, TEST_HOST + "/redfish/v1?%24filter=Id+eq+1"),
+        (TEST_HOST, "", None, False, ""),
+    ])
+    def test_build_url(self, base, path, query, encode_space, expected):
+        assert build_url(base, path, query, encode_space) == expected
+
+    def test_make_requests(self):
+        assert make_requests(FakeClient(), ["/a", {"method": "POST", "path": "/b"}]) == \
+            [{"path": "/a", "method": "GET"}, {"path": "/b", "method": "POST"}]
+        assert make_requests(FakeIdracClient(), ["/a", {"path": "/b"}]) == \
+            [{"uri": "/a", "method": "GET"}, {"uri": "/b", "method": "GET"}]
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_gather_requests_order(self, workers):
+        client = FakeClient()
+        paths = ["/p{0}".format(idx) for idx in range(8)]
+        assert gather_requests(client, paths, max_concurrency=workers) == paths
+        assert client.max_in_flight <= workers
+
+    def test_gather_requests_concurrent(self):
+        client = FakeClient()
+        gather_requests(client, ["/slow{0}".format(idx) for idx in range(4)], max_concurrency=4)
+        assert client.max_in_flight > 1
+
+    @pytest.mark.parametrize("env, expected", [(None, 1), ("1", 1), ("3", 3)])
+    def test_gather_requests_workers_from_env(self, monkeypatch, env, expected):
+        if env:
+            monkeypatch.setenv(rest_core.FANOUT_WORKERS_ENV, env)
+        else:
+            monkeypatch.delenv(rest_core.FANOUT_WORKERS_ENV, raising=False)
+        client = FakeClient()
+        gather_requests(client, ["/slow{0}".format(idx) for idx in range(3)])
+        assert client.max_in_flight == expected
+
+    def test_gather_requests_return_exceptions(self):
+        client = FakeClient(fail="/b")
+        result = gather_requests(client, ["/a", "/b", "/c"], max_concurrency=2, return_exceptions=True)
+        assert result[0] == "/a" and result[2] == "/c"
+        assert isinstance(result[1], HTTPError)
+        result = gather_requests(client, ["/a", "/b"], max_concurrency=1, return_exceptions=True)
+        assert isinstance(result[1], HTTPError)
+
+    def test_gather_requests_cancels_pending(self):
+        client = FakeClient(fail="/a")
+        with pytest.raises(HTTPError):
+            gather_requests(client, ["/a"] + ["/slow{0}".format(idx) for idx in range(6)], max_concurrency=2)
+        time.sleep(0.4)
+        assert len(client.calls) < 7
+
+    def test_gather_requests_timeout(self):
+        client = FakeClient()
+        with pytest.raises(ConnectionError) as err:
+            gather_requests(client, ["/a", "/slow"], max_concurrency=2, timeout=0.05)
+        assert "/slow" in str(err.value)
+
+    def test_run_coroutine_inside_event_loop(self):
+        client = FakeClient()
+
+        async def caller():
+            return gather_requests(client, ["/a", "/b"], max_concurrency=2)
+        assert asyncio.run(caller()) == ["/a", "/b"]
+
+    def test_async_gather_requests(self):
+        client = FakeIdracClient()
+        assert run_coroutine(async_gather_requests(client, ["/a", "/b"], max_concurrency=2)) == ["/a", "/b"]
+
+    def _response(self, body):
+        resp = MagicMock()
+        resp.read.return_value = body
+        return OpenURLResponse(resp)
+
+    def test_json_data_decoded_once(self, mocker, monkeypatch):
+        monkeypatch.setattr(rest_core, "HAS_ORJSON", False)
+        loads = mocker.patch(MODULE_UTIL_PATH + "rest_core.json.loads", side_effect=json.loads)
+        rest_core.DECODE_STATS.reset()
+        response = self._response(json.dumps({"value": [1, 2]}))
+        assert response.json_data is response.json_data
+        assert loads.call_count == 1
+        assert response.decoded_bytes == len(response.body)
+        assert rest_core.DECODE_STATS.to_dict()["count"] == 1
+        response.body = json.dumps({"value": [3]})
+        assert response.json_data == {"value": [3]}
+
+    def test_json_data_none_body(self):
+        with pytest.raises(TypeError):
+            OpenURLResponse(None).json_data
+
+    def test_orjson_backend(self, monkeypatch):
+        backend = MagicMock()
+        backend.loads.return_value = {"fast": True}
+        monkeypatch.setattr(rest_core, "HAS_ORJSON", True)
+        monkeypatch.setattr(rest_core, "orjson", backend, raising=False)
+        assert self._response('{"fast": false}').json_data == {"fast": True}
+        monkeypatch.setenv(rest_core.JSON_BACKEND_ENV, "json")
+        assert self._response('{"fast": false}').json_data == {"fast": False}
+
+    @pytest.mark.parametrize("body, key, expected", [
+        ({"@odata.count": 2, "value": [{"Id": 1}, {"Id": [2, {"a": "]"}]}], "next": "x"}, "value",
+         [{"Id": 1}, {"Id": [2, {"a": "]"}]}]),
+        ({"Members": [], "value": [1]}, "Members", []),
+        ({"Members": {"a": 1}}, "Members", []),
+        ({}, "value", []),
+        ({"Name": "a"}, "value", []),
+    ])
+    def test_iter_json_items(self, body, key, expected):
+        text = json.dumps(body, indent=2).encode()
+        assert list(self._response(text).iter_json_items(key)) == expected
+
+    def test_iter_json_items_from_cache(self):
+        response = self._response(json.dumps({"value": [1, 2]}))
+        response.json_data["value"].append(3)
+        assert list(response.iter_json_items()) == [1, 2, 3]
+
+    @pytest.mark.parametrize("body", ['[1, 2]', '{"value": [1, 2', '{"value" [1]}'])
+    def test_iter_json_items_invalid(self, body):
+        with pytest.raises(ValueError):
+            list(self._response(body).iter_json_items())
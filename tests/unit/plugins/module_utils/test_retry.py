@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import io
+import json
+import socket
+import pytest
+from email.utils import formatdate
+from ansible.module_utils.urls import SSLValidationError
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import retry
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry import RetryPolicy, get_retry_after, \
+    get_retry_policy
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_core import send_request
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from unittest.mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+TEST_HOST = "https://192.168.0.1:443/api"
+
+
+def http_error(code, headers=None):
+    return HTTPError(TEST_HOST, code, "error", headers or {}, None)
+
+
+class TestRetry(object):
+
+    def test_get_retry_after(self, mocker):
+        assert get_retry_after(http_error(503, {"Retry-After": "7"})) == 7
+        assert get_retry_after(http_error(503)) is None
+        assert get_retry_after(http_error(503, {"Retry-After": "soon"})) is None
+        assert get_retry_after(ValueError()) is None
+        mocker.patch(MODULE_UTIL_PATH + "retry.time.time", return_value=1000.0)
+        assert get_retry_after(http_error(503, {"Retry-After": formatdate(1030.0, usegmt=True)})) == 30
+        assert get_retry_after(http_error(503, {"Retry-After": formatdate(900.0, usegmt=True)})) == 0
+
+    @pytest.mark.parametrize("err, method, expected", [
+        (http_error(503), "GET", True),
+        (http_error(503), "POST", True),
+        (http_error(429), "PATCH", True),
+        (http_error(502), "GET", True),
+        (http_error(502), "POST", False),
+        (http_error(404), "GET", False),
+        (http_error(500), "DELETE", False),
+        (URLError(socket.timeout()), "GET", True),
+        (URLError(socket.timeout()), "POST", False),
+        (URLError(ConnectionRefusedError()), "POST", True),
+        (URLError(socket.gaierror()), "GET", False),
+        (ConnectionResetError(), "PUT", True),
+        (ConnectionResetError(), "POST", False),
+        (SSLValidationError("bad cert"), "GET", False),
+        (ValueError("bad json"), "GET", False),
+    ])
+    def test_is_retryable(self, err, method, expected):
+        assert RetryPolicy(retries=3).is_retryable(err, method) is expected
+
+    def test_get_backoff(self, mocker):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+        assert [policy.get_backoff(attempt) for attempt in range(5)] == [1, 2, 4, 5, 5]
+        assert policy.get_backoff(0, http_error(503, {"Retry-After": "3"})) == 3
+        assert policy.get_backoff(0, http_error(503, {"Retry-After": "3600"})) == retry.MAX_RETRY_AFTER
+        uniform = mocker.patch(MODULE_UTIL_PATH + "retry.random.uniform", return_value=0.5)
+        assert RetryPolicy(backoff_factor=1, max_backoff=5).get_backoff(2) == 0.5
+        uniform.assert_called_once_with(0, 4)
+
+    def test_call_retries_until_success(self):
+        policy = RetryPolicy(retries=3, jitter=False)
+        func = MagicMock(side_effect=[http_error(503), URLError(socket.timeout()), "ok"])
+        sleep = MagicMock()
+        assert policy.call(func, "GET", sleep=sleep) == "ok"
+        assert [call[0][0] for call in sleep.call_args_list] == [1, 2]
+
+    def test_call_exhausted(self):
+        policy = RetryPolicy(retries=2, jitter=False)
+        func = MagicMock(side_effect=http_error(503))
+        with pytest.raises(HTTPError):
+            policy.call(func, "GET", sleep=MagicMock())
+        assert func.call_count == 3
+
+    def test_fixed_policy(self):
+        state = RetryPolicy.fixed(2, 10).new_state()
+        assert [state.next_delay(ValueError()) for idx in range(3)] == [10, 10, None]
+
+    def test_get_retry_policy(self, monkeypatch):
+        assert get_retry_policy().retries == 0
+        monkeypatch.setenv(retry.RETRIES_ENV, "4")
+        monkeypatch.setenv(retry.RETRY_BACKOFF_ENV, "0.5")
+        policy = get_retry_policy()
+        assert (policy.retries, policy.backoff_factor) == (4, 0.5)
+
+    def test_send_request_stream_not_retried(self):
+        opener = MagicMock(side_effect=http_error(503))
+        with pytest.raises(HTTPError):
+            send_request(opener, None, TEST_HOST, data=io.BytesIO(b"dup"), retry_policy=RetryPolicy(retries=3),
+                         method="POST")
+        assert opener.call_count == 1
+
+    def test_rest_ome_retries_503(self, monkeypatch, mocker):
+        monkeypatch.setenv(retry.RETRIES_ENV, "2")
+        sleep = mocker.patch(MODULE_UTIL_PATH + "retry.time.sleep")
+        response = MagicMock()
+        response.getcode.return_value = 200
+        response.read.return_value = json.dumps({"value": []})
+        open_url = mocker.patch(MODULE_UTIL_PATH + "ome.open_url",
+                                side_effect=[http_error(503, {"Retry-After": "2"}), response])
+        module_params = {"hostname": "192.168.0.1", "username": "admin", "password": "pwd", "port": 443}
+        with RestOME(module_params, False) as obj:
+            assert obj.invoke_request("GET", "DeviceService/Devices").json_data == {"value": []}
+        assert open_url.call_count == 2
+        sleep.assert_called_once_with(2)
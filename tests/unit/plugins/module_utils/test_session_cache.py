@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import io
+import json
+import threading
+import time
+import pytest
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import session_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import SessionCache, \
+    normalize_target, get_session_cache, cache_created_session, forget_deleted_session
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish
+from ansible_collections.dellemc.openmanage.plugins.module_utils.upload import StreamingBody
+from unittest.mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+TEST_HOST = "https://192.168.0.1:443/api"
+OME_PARAMS = {"hostname": "192.168.0.1", "username": "admin", "password": "pwd", "port": 443}
+
+
+def _drain(body):
+    chunks = []
+    chunk = body.read()
+    while chunk:
+        chunks.append(chunk)
+        chunk = body.read()
+    return b"".join(chunks)
+
+
+class FakeAppliance(object):
+    """Stands in for open_url, hands out tokens and rejects tokens which were expired."""
+
+    def __init__(self):
+        self.calls = []
+        self.headers = []
+        self.bodies = []
+        self.valid_tokens = set()
+        self.count = 0
+
+    def _response(self, status, body, headers=None):
+        resp = MagicMock()
+        resp.getcode.return_value = status
+        resp.read.return_value = json.dumps(body)
+        resp.headers = headers or {}
+        return resp
+
+    def __call__(self, url, data=None, method="GET", headers=None, **kwargs):
+        self.calls.append((method, url))
+        self.headers.append(dict(headers or {}))
+        self.bodies.append(_drain(data) if hasattr(data, "read") else data)
+        if method == "POST" and "Sessions" in url:
+            self.count += 1
+            token = "token{0}".format(self.count)
+            self.valid_tokens.add(token)
+            return self._response(201, {"Id": str(self.count)}, {"X-Auth-Token": token})
+        if headers.get("X-Auth-Token") not in self.valid_tokens:
+            raise HTTPError(url, 401, "Unauthorized", {}, None)
+        return self._response(200, {"value": []})
+
+    def methods(self):
+        return [method for method, url in self.calls]
+
+
+class TestSessionCache(object):
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return SessionCache(str(tmp_path), ttl=60)
+
+    @pytest.fixture
+    def cache_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(session_cache.SESSION_CACHE_ENV, "true")
+        monkeypatch.setenv(session_cache.SESSION_CACHE_DIR_ENV, str(tmp_path))
+
+    @pytest.mark.parametrize("host, port, expected", [
+        ("192.168.0.1", 443, ("192.168.0.1", 443)),
+        ("192.168.0.1:8443", None, ("192.168.0.1", 8443)),
+        ("[FE80::1]", 443, ("fe80::1", 443)),
+        ("fe80::1", None, ("fe80::1", 443)),
+        ("Host.Example.com", "443", ("host.example.com", 443)),
+    ])
+    def test_normalize_target(self, host, port, expected):
+        assert normalize_target(host, port) == expected
+
+    def test_put_get_invalidate(self, cache):
+        cache.put("192.168.0.1", 443, "admin", "pwd", "token", "10")
+        entry = cache.get("192.168.0.1", 443, "admin", "pwd")
+        assert (entry["token"], entry["session_id"]) == ("token", "10")
+        assert "pwd" not in json.dumps(entry)
+        assert cache.get("192.168.0.1", 443, "admin", "other") is None
+        assert cache.get("192.168.0.1", 443, "root", "pwd") is None
+        cache.invalidate("192.168.0.1", 443, "admin")
+        assert cache.get("192.168.0.1", 443, "admin", "pwd") is None
+
+    def test_expired_entry(self, cache, monkeypatch):
+        cache.put("192.168.0.1", 443, "admin", "pwd", "token", "10")
+        now = time.time()
+        monkeypatch.setattr(session_cache.time, "time", lambda: now + 120)
+        assert cache.get("192.168.0.1", 443, "admin", "pwd") is None
+
+    def test_invalidate_session(self, cache):
+        cache.put("192.168.0.1", 443, "admin", "pwd", "token", "10")
+        cache.put("192.168.0.1", 443, "root", "pwd", "token2", "11")
+        cache.invalidate_session("192.168.0.1", 443, "10")
+        assert cache.get("192.168.0.1", 443, "admin", "pwd") is None
+        assert cache.get("192.168.0.1", 443, "root", "pwd") is not None
+
+    def test_get_session_cache(self, cache_env, monkeypatch):
+        assert get_session_cache().ttl == session_cache.DEFAULT_TTL
+        monkeypatch.delenv(session_cache.SESSION_CACHE_ENV)
+        assert get_session_cache() is None
+
+    def test_session_modules_helpers(self, cache_env):
+        cache_created_session(OME_PARAMS, "token", "10")
+        assert get_session_cache().get("192.168.0.1", 443, "admin", "pwd")["token"] == "token"
+        forget_deleted_session({"hostname": "192.168.0.1", "port": 443}, "10")
+        assert get_session_cache().get("192.168.0.1", 443, "admin", "pwd") is None
+
+    def test_rest_ome_reuses_cached_session(self, cache_env, mocker):
+        appliance = FakeAppliance()
+        mocker.patch(MODULE_UTIL_PATH + 'ome.open_url', side_effect=appliance)
+        with RestOME(dict(OME_PARAMS), True) as obj:
+            obj.invoke_request("GET", "DeviceService/Devices")
+        with RestOME(dict(OME_PARAMS), True) as obj:
+            obj.invoke_request("GET", "DeviceService/Devices")
+        assert appliance.methods() == ["POST", "GET", "GET", "GET"]
+        assert appliance.calls[2][1].endswith("SessionService/Sessions('1')")
+
+    def test_concurrent_forks_share_one_session(self, cache_env, mocker):
+        appliance = FakeAppliance()
+        login = appliance.__call__
+
+        def slow_appliance(url, data=None, method="GET", headers=None, **kwargs):
+            if method == "POST":
+                time.sleep(0.2)
+            return login(url, data=data, method=method, headers=headers, **kwargs)
+
+        mocker.patch(MODULE_UTIL_PATH + 'ome.open_url', side_effect=slow_appliance)
+
+        def run():
+            with RestOME(dict(OME_PARAMS), True) as obj:
+                obj.invoke_request("GET", "DeviceService/Devices")
+
+        workers = [threading.Thread(target=run) for i in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert appliance.methods().count("POST") == 1
+        assert "DELETE" not in appliance.methods()
+
+    def test_unlockable_cache_deletes_session(self, tmp_path, monkeypatch, mocker):
+        cache_file = tmp_path / "not_a_dir"
+        cache_file.write_text("")
+        monkeypatch.setenv(session_cache.SESSION_CACHE_ENV, "true")
+        monkeypatch.setenv(session_cache.SESSION_CACHE_DIR_ENV, str(cache_file))
+        appliance = FakeAppliance()
+        mocker.patch(MODULE_UTIL_PATH + 'ome.open_url', side_effect=appliance)
+        with RestOME(dict(OME_PARAMS), True) as obj:
+            obj.invoke_request("GET", "DeviceService/Devices")
+        assert appliance.methods() == ["POST", "GET", "DELETE"]
+
+    def test_rest_ome_without_cache_deletes_session(self, monkeypatch, mocker):
+        monkeypatch.delenv(session_cache.SESSION_CACHE_ENV, raising=False)
+        appliance = FakeAppliance()
+        mocker.patch(MODULE_UTIL_PATH + 'ome.open_url', side_effect=appliance)
+        with RestOME(dict(OME_PARAMS), True) as obj:
+            obj.invoke_request("GET", "DeviceService/Devices")
+        assert appliance.methods() == ["POST", "GET", "DELETE"]
+
+    def test_rest_ome_stale_cached_session(self, cache_env, mocker):
+        appliance = FakeAppliance()
+        mocker.patch(MODULE_UTIL_PATH + 'ome.open_url', side_effect=appliance)
+        get_session_cache().put("192.168.0.1", 443, "admin", "pwd", "expired", "5")
+        with RestOME(dict(OME_PARAMS), True) as obj:
+            obj.invoke_request("GET", "DeviceService/Devices")
+        assert appliance.methods() == ["GET", "POST", "GET"]
+        assert get_session_cache().get("192.168.0.1", 443, "admin", "pwd")["token"] == "token1"
+
+    def test_redfish_relogin_on_401(self, cache_env, mocker):
+        appliance = FakeAppliance()
+        mocker.patch(MODULE_UTIL_PATH + 'redfish.open_url', side_effect=appliance)
+        params = {"baseuri": "192.168.0.1:443", "username": "admin", "password": "pwd"}
+        with Redfish(dict(params), True) as obj:
+            appliance.valid_tokens.clear()
+            resp = obj.invoke_request("GET", "/redfish/v1/Systems")
+        assert resp.status_code == 200
+        assert appliance.methods() == ["POST", "GET", "POST", "GET"]
+        assert obj.session_id == "2"
+
+    def test_relogin_only_once(self, cache_env, mocker):
+        appliance = FakeAppliance()
+        appliance.valid_tokens = MagicMock(__contains__=MagicMock(return_value=False))
+        mocker.patch(MODULE_UTIL_PATH + 'ome.open_url', side_effect=appliance)
+        with pytest.raises(HTTPError):
+            with RestOME(dict(OME_PARAMS), True) as obj:
+                obj.invoke_request("GET", "DeviceService/Devices")
+        assert appliance.methods() == ["POST", "GET", "POST", "GET"]
+
+    def test_relogin_rewinds_upload(self, cache_env, mocker):
+        appliance = FakeAppliance()
+        mocker.patch(MODULE_UTIL_PATH + 'redfish.open_url', side_effect=appliance)
+        params = {"baseuri": "192.168.0.1:443", "username": "admin", "password": "pwd"}
+        body = StreamingBody([b"firmware", b"-image"], chunk_size=4)
+        with Redfish(dict(params), True) as obj:
+            appliance.valid_tokens.clear()
+            resp = obj.invoke_request("POST", "/redfish/v1/UpdateService/upload", data=body,
+                                      headers=body.headers("application/octet-stream"), dump=False)
+        assert resp.status_code == 200
+        assert appliance.methods() == ["POST", "POST", "POST", "POST"]
+        assert appliance.bodies[1] == appliance.bodies[3] == b"firmware-image"
+
+    def test_no_relogin_with_unreadable_body(self, cache_env, mocker):
+        appliance = FakeAppliance()
+        mocker.patch(MODULE_UTIL_PATH + 'ome.open_url', side_effect=appliance)
+        with pytest.raises(HTTPError):
+            with RestOME(dict(OME_PARAMS), True) as obj:
+                appliance.valid_tokens.clear()
+                obj.invoke_request("POST", "UpdateService/Actions/UpdateService.UploadFile",
+                                   data=io.BytesIO(b"firmware"), dump=False)
+        assert appliance.methods() == ["POST", "POST"]
+
+    def test_request_headers_not_kept(self, cache_env, mocker):
+        appliance = FakeAppliance()
+        mocker.patch(MODULE_UTIL_PATH + 'ome.open_url', side_effect=appliance)
+        body = StreamingBody([b"firmware"])
+        with RestOME(dict(OME_PARAMS), True) as obj:
+            obj.invoke_request("POST", "UpdateService/Actions/UpdateService.UploadFile", data=body,
+                               headers=body.headers("application/octet-stream"), dump=False)
+            obj.invoke_request("POST", "UpdateService/Actions/UpdateService.GetSingleDupReport", data={"a": 1})
+        upload, report = appliance.headers[1:]
+        assert upload["Content-Length"] == "8"
+        assert "Content-Length" not in report
+        assert report["Content-Type"] == "application/json"
+        assert report["X-Auth-Token"] == "token1"
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import io
+import json
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
+from ansible.module_utils.six.moves.urllib.parse import quote, unquote
+from ansible_collections.dellemc.openmanage.plugins.module_utils import transport
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import PoolManager, \
+    get_transport, get_transport_setting, map_concurrently, TransportStats
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.upload import StreamingBody
+from unittest.mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+
+
+class _ThreadingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body, headers=None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, val in (headers or {}).items():
+            self.send_header(key, val)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path.startswith("/missing"):
+            self._reply(404, {"error": "not found"})
+        elif self.path.startswith("/redirect?to="):
+            self._reply(302, {}, {"Location": unquote(self.path.split("=", 1)[1])})
+        elif self.path.startswith("/redirect"):
+            self._reply(302, {}, {"Location": "/api/target"})
+        elif self.path.startswith("/challenge") and not self.headers.get("Authorization"):
+            self._reply(401, {}, {"WWW-Authenticate": 'Basic realm="test"'})
+        elif self.path.startswith("/drop"):
+            # keeps the connection open for the client but closes it once the response is sent
+            self._reply(200, {"path": self.path})
+            self.close_connection = True
+        else:
+            self._reply(200, {"path": self.path, "auth": self.headers.get("Authorization")})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        data = json.loads(self.rfile.read(length))
+        if self.path.startswith("/redirect"):
+            self._reply(int(self.path.rsplit("/", 1)[1]), {}, {"Location": "/api/target"})
+            return
+        self._reply(201, {"echo": data, "path": self.path})
+
+
+@pytest.fixture
+def http_server():
+    server = _ThreadingServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield "http://127.0.0.1:{0}".format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+class TestTransport(object):
+
+    def test_connection_reused_across_requests(self, http_server):
+        manager = PoolManager(max_size=2, idle_timeout=30)
+        for idx in range(5):
+            resp = manager.open_url("{0}/api/items?page={1}".format(http_server, idx), method="GET")
+            assert resp.getcode() == 200
+            assert json.loads(resp.read())["path"] == "/api/items?page={0}".format(idx)
+        assert manager.stats.handshakes == 1
+        assert manager.stats.reused == 4
+        assert manager.stats.to_dict()["requests"] == 5
+        manager.close()
+
+    def test_idle_timeout_expires_connection(self, http_server):
+        manager = PoolManager(max_size=2, idle_timeout=0)
+        manager.open_url(http_server + "/api/a")
+        manager.open_url(http_server + "/api/b")
+        assert manager.stats.handshakes == 2
+        assert manager.stats.reused == 0
+        manager.close()
+
+    def test_basic_auth_and_post(self, http_server):
+        manager = PoolManager()
+        resp = manager.open_url(http_server + "/api/items", url_username="user", url_password="pwd",
+                                force_basic_auth=True)
+        assert json.loads(resp.read())["auth"] == "Basic dXNlcjpwd2Q="
+        resp = manager.open_url(http_server + "/api/items", method="POST", data=json.dumps({"Id": 1}),
+                                headers={"Content-Type": "application/json"})
+        assert resp.getcode() == 201
+        assert json.loads(resp.read()) == {"echo": {"Id": 1}, "path": "/api/items"}
+        manager.close()
+
+    def test_http_error_raised(self, http_server):
+        manager = PoolManager()
+        with pytest.raises(HTTPError) as err:
+            manager.open_url(http_server + "/missing")
+        assert err.value.code == 404
+        assert json.load(err.value) == {"error": "not found"}
+        manager.close()
+
+    def test_redirect_followed(self, http_server):
+        manager = PoolManager()
+        resp = manager.open_url(http_server + "/redirect", follow_redirects="all")
+        assert json.loads(resp.read())["path"] == "/api/target"
+        manager.close()
+
+    def test_basic_auth_sent_on_challenge(self, http_server):
+        manager = PoolManager()
+        resp = manager.open_url(http_server + "/api/items", url_username="user", url_password="pwd")
+        assert json.loads(resp.read())["auth"] is None
+        resp = manager.open_url(http_server + "/challenge", url_username="user", url_password="pwd")
+        assert json.loads(resp.read())["auth"] == "Basic dXNlcjpwd2Q="
+        with pytest.raises(HTTPError) as err:
+            manager.open_url(http_server + "/challenge")
+        assert err.value.code == 401
+        manager.close()
+
+    def test_redirect_to_other_host_drops_credentials(self, http_server):
+        manager = PoolManager()
+        other_host = http_server.replace("127.0.0.1", "localhost") + "/api/target"
+        resp = manager.open_url(http_server + "/redirect?to=" + quote(other_host, safe=""), url_username="user",
+                                url_password="pwd", force_basic_auth=True, headers={"X-Auth-Token": "token"},
+                                follow_redirects="all")
+        assert resp.geturl() == other_host
+        assert json.loads(resp.read())["auth"] is None
+        resp = manager.open_url(http_server + "/redirect", url_username="user", url_password="pwd",
+                                force_basic_auth=True, follow_redirects="all")
+        assert json.loads(resp.read())["auth"] == "Basic dXNlcjpwd2Q="
+        manager.close()
+
+    @pytest.mark.parametrize("follow_redirects, status, expected", [
+        ("safe", 302, 302), ("none", 302, 302), ("urllib2", 307, 307),
+        ("all", 307, 201), ("all", 302, 200), ("urllib2", 302, 200),
+    ])
+    def test_redirect_modes_post(self, http_server, follow_redirects, status, expected):
+        manager = PoolManager()
+        url = "{0}/redirect/{1}".format(http_server, status)
+        if expected == status:
+            with pytest.raises(HTTPError) as err:
+                manager.open_url(url, method="POST", data=json.dumps({"Id": 1}), follow_redirects=follow_redirects)
+            assert err.value.code == status
+        else:
+            resp = manager.open_url(url, method="POST", data=json.dumps({"Id": 1}),
+                                    follow_redirects=follow_redirects)
+            assert resp.getcode() == expected
+            assert json.loads(resp.read())["path"] == "/api/target"
+        manager.close()
+
+    def test_stale_connection_rewinds_streaming_body(self, http_server):
+        manager = PoolManager()
+        manager.open_url(http_server + "/drop")
+        body = StreamingBody([json.dumps({"Id": 1}).encode()])
+        resp = manager.open_url(http_server + "/api/items", method="POST", data=body,
+                                headers=body.headers("application/json"))
+        assert json.loads(resp.read()) == {"echo": {"Id": 1}, "path": "/api/items"}
+        assert manager.stats.handshakes == 2
+        assert body.progress.sent == len(body)
+        manager.close()
+
+    def test_stale_connection_not_replayed_with_read_body(self, http_server):
+        manager = PoolManager()
+        manager.open_url(http_server + "/drop")
+        payload = json.dumps({"Id": 1}).encode()
+        with pytest.raises(URLError):
+            manager.open_url(http_server + "/api/items", method="POST", data=io.BytesIO(payload),
+                             headers={"Content-Length": str(len(payload))})
+        assert manager.stats.handshakes == 1
+        manager.close()
+
+    def test_redirect_resends_only_rewindable_body(self, http_server):
+        manager = PoolManager()
+        payload = json.dumps({"Id": 1}).encode()
+        with pytest.raises(HTTPError) as err:
+            manager.open_url(http_server + "/redirect/307", method="POST", data=io.BytesIO(payload),
+                             headers={"Content-Length": str(len(payload))}, follow_redirects="all")
+        assert err.value.code == 307
+        body = StreamingBody([payload])
+        resp = manager.open_url(http_server + "/redirect/307", method="POST", data=body,
+                                headers=body.headers("application/json"), follow_redirects="all")
+        assert json.loads(resp.read()) == {"echo": {"Id": 1}, "path": "/api/target"}
+        manager.close()
+
+    def test_stats_time_saved(self):
+        stats = TransportStats()
+        assert stats.time_saved == 0.0
+        stats.record_handshake(0.5)
+        stats.record_request(False)
+        stats.record_request(True)
+        stats.record_request(True)
+        assert stats.time_saved == 1.0
+
+    @pytest.mark.parametrize("env, expected", [("yes", True), (None, False), ("false", False)])
+    def test_get_transport(self, env, expected, monkeypatch):
+        monkeypatch.setattr(transport, "_POOL_MANAGER", None)
+        if env:
+            monkeypatch.setenv(transport.KEEPALIVE_ENV, env)
+        else:
+            monkeypatch.delenv(transport.KEEPALIVE_ENV, raising=False)
+        assert (get_transport() is not None) is expected
+
+    def test_get_transport_setting_invalid(self, monkeypatch):
+        monkeypatch.setenv(transport.POOL_SIZE_ENV, "abc")
+        assert get_transport_setting(transport.POOL_SIZE_ENV, 4, int) == 4
+        monkeypatch.setenv(transport.POOL_SIZE_ENV, "8")
+        assert get_transport_setting(transport.POOL_SIZE_ENV, 4, int) == 8
+
+    def test_rest_ome_uses_transport(self, mocker):
+        mock_response = MagicMock()
+        mock_response.getcode.return_value = 200
+        mock_response.read.return_value = json.dumps({"value": "data"})
+        manager = MagicMock()
+        manager.open_url.return_value = mock_response
+        mocker.patch(MODULE_UTIL_PATH + 'ome.get_transport', return_value=manager)
+        open_url_mock = mocker.patch(MODULE_UTIL_PATH + 'ome.open_url')
+        module_params = {'hostname': 'xxx.xxx.x.x', 'username': 'username', 'password': 'password', "port": 443}
+        with RestOME(module_params, False) as obj:
+            resp = obj.invoke_request("GET", "/testpath")
+        assert resp.json_data == {"value": "data"}
+        assert manager.open_url.called
+        assert not open_url_mock.called
+
+    @pytest.mark.parametrize("workers", [None, 1, 3])
+    def test_map_concurrently_keeps_order(self, workers):
+        assert map_concurrently(lambda x: x * 2, range(10), workers) == [x * 2 for x in range(10)]
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from ansible.module_utils.urls import open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import PoolManager
+from ansible_collections.dellemc.openmanage.plugins.module_utils.upload import StreamingBody, MultipartFileBody, \
+    UploadProgress, log_progress
+from unittest.mock import MagicMock
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    received = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.received.append((self.headers.get("Transfer-Encoding"), self.headers["Content-Type"], body))
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+@pytest.fixture
+def http_server():
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    del _Handler.received[:]
+    yield "http://127.0.0.1:{0}".format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "firmware.exe"
+    path.write_bytes(bytes(bytearray(range(256))) * 40)
+    return str(path)
+
+
+class TestUpload(object):
+
+    def test_streaming_body_chunks(self, image):
+        body = StreamingBody([b"head", image, b"tail"], chunk_size=4096)
+        assert len(body) == 10248
+        chunks = list(iter(body.read, b""))
+        assert [len(chunk) for chunk in chunks] == [4, 4096, 4096, 2048, 4]
+        assert b"".join(chunks) == b"head" + open(image, "rb").read() + b"tail"
+        assert body.read() == b""
+        assert body.progress.sent == 10248
+        assert body.progress.percent == 100
+        assert body.headers("application/octet-stream") == {"Content-Type": "application/octet-stream",
+                                                            "Content-Length": "10248"}
+
+    def test_multipart_body(self, image):
+        body = MultipartFileBody(image, filename='fw"1.exe', file_content_type="multipart/form-data",
+                                 boundary="xyz")
+        data = b"".join(iter(lambda: body.read(1000), b""))
+        assert body.content_type == "multipart/form-data; boundary=xyz"
+        assert len(data) == len(body)
+        assert data.startswith(b'--xyz\r\nContent-Disposition: form-data; name="file"; filename="fw%221.exe"\r\n'
+                               b'Content-Type: multipart/form-data\r\n\r\n\x00\x01')
+        assert data.endswith(b"\xfe\xff\r\n--xyz--\r\n")
+
+    def test_progress_callback(self):
+        reports = []
+        progress = UploadProgress(1000, callback=lambda prog: reports.append(prog.percent), step=25)
+        for dummy in range(20):
+            progress.update(50)
+        assert reports == [5, 25, 50, 75, 100]
+        assert progress.to_dict()["bytes_sent"] == 1000
+        module = MagicMock()
+        log_progress(module)(progress)
+        assert module.log.call_args[0][0].startswith("Uploaded 1000 of 1000 bytes (100%) at ")
+
+    @pytest.mark.parametrize("pooled", [False, True])
+    def test_upload_with_content_length(self, http_server, image, pooled):
+        body = MultipartFileBody(image, boundary="xyz", chunk_size=1024)
+        headers = body.headers(body.content_type)
+        if pooled:
+            manager = PoolManager()
+            resp = manager.open_url(http_server + "/upload", data=body, method="POST", headers=headers)
+            manager.close()
+        else:
+            resp = open_url(http_server + "/upload", data=body, method="POST", headers=headers)
+        assert resp.getcode() == 201
+        transfer_encoding, content_type, received = _Handler.received[0]
+        assert transfer_encoding is None
+        assert content_type == "multipart/form-data; boundary=xyz"
+        assert len(received) == len(body)
+        assert open(image, "rb").read() in received
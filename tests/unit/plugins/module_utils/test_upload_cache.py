@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import hashlib
+import os
+from ansible_collections.dellemc.openmanage.plugins.module_utils import upload_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.upload_cache import UploadCache, file_sha256, \
+    get_upload_cache
+
+
+class TestUploadCache(object):
+
+    def test_file_sha256(self, tmp_path):
+        image = tmp_path / "image.exe"
+        image.write_bytes(b"firmware" * 1000)
+        assert file_sha256(str(image)) == hashlib.sha256(b"firmware" * 1000).hexdigest()
+        empty = tmp_path / "empty.exe"
+        empty.write_bytes(b"")
+        assert file_sha256(str(empty)) == hashlib.sha256(b"").hexdigest()
+
+    def test_image_digest_cached(self, tmp_path, mocker):
+        image = tmp_path / "image.exe"
+        image.write_bytes(b"v1")
+        cache = UploadCache(str(tmp_path / "cache"))
+        digest_mock = mocker.patch.object(upload_cache, "file_sha256", side_effect=file_sha256)
+        first = cache.image_digest(str(image))
+        assert cache.image_digest(str(image)) == first
+        assert digest_mock.call_count == 1
+        image.write_bytes(b"v2 longer")
+        assert cache.image_digest(str(image)) == hashlib.sha256(b"v2 longer").hexdigest()
+        assert digest_mock.call_count == 2
+
+    def test_staged_locations(self, tmp_path):
+        cache = UploadCache(str(tmp_path / "cache"))
+        cache.set_staged("abc", "192.168.0.1", "/redfish/v1/UpdateService/FirmwareInventory/Available-1", "1.2.3")
+        cache.set_staged("abc", "[2001:db8::1]:443", "/redfish/v1/UpdateService/FirmwareInventory/Available-2")
+        assert cache.get_staged("abc", "192.168.0.1:443") == {
+            "location": "/redfish/v1/UpdateService/FirmwareInventory/Available-1", "version": "1.2.3"}
+        assert cache.get_staged("abc", "2001:db8::1") == {
+            "location": "/redfish/v1/UpdateService/FirmwareInventory/Available-2", "version": None}
+        cache.set_staged("abc", "192.168.0.1", None)
+        assert cache.get_staged("abc", "192.168.0.1") is None
+        assert cache.get_staged("def", "192.168.0.1") is None
+        assert oct(os.stat(cache._path("image-abc")).st_mode & 0o777) == "0o600"
+
+    def test_get_upload_cache(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(upload_cache.UPLOAD_CACHE_ENV, raising=False)
+        assert get_upload_cache() is None
+        monkeypatch.setenv(upload_cache.UPLOAD_CACHE_ENV, "yes")
+        monkeypatch.setenv(upload_cache.UPLOAD_CACHE_DIR_ENV, str(tmp_path))
+        assert get_upload_cache().cache_dir == str(tmp_path)
@@ -40,6 +40,14 @@ VALIDATE_CATALOG = "idrac_firmware._validate_catalog_file"
 SHARE_PWD = "share_pwd"
 USER_PWD = "user_pwd"
 TEST_HOST = "'https://testhost.com'"
+PRECHECK_CATALOG = u"""<Manifest version="24.03.00">
+  <SoftwareComponent packageID="BIOS1" path="FOLDER1/BIOS.EXE" vendorVersion="2.10.2" rebootRequired="true">
+    <SupportedDevices><Device componentID="159"/></SupportedDevices>
+    <SupportedSystems><Brand prefix="PE"><Model systemID="0716"><Display>R740</Display></Model></Brand>
+    </SupportedSystems>
+  </SoftwareComponent>
+</Manifest>"""
+SYSTEM_DATA = {"Model": "PowerEdge R740", "Oem": {"Dell": {"DellSystem": {"SystemID": 1814}}}}
 
 
 class TestidracFirmware(FakeAnsibleModule):
@@ -360,6 +368,152 @@ class TestidracFirmware(FakeAnsibleModule):
         assert result == {'msg': 'Successfully updated the firmware.', 'update_status': 'Success',
                           'changed': False, 'failed': False}
 
+    def test_main_local_repository(self, idrac_connection_firmware_redfish_mock, idrac_default_args, mocker,
+                                   tmp_path, monkeypatch):
+        monkeypatch.setenv("OMAM_CATALOG_CACHE", "false")
+        (tmp_path / CATALOG).write_text(u"<Manifest/>")
+        idrac_default_args.update({"local_repository": {"path": str(tmp_path), "address": "192.168.0.2",
+                                                        "rate_limit": 1024}})
+        idrac_connection_firmware_redfish_mock.json_data = {}
+        server_mock = mocker.patch(MODULE_PATH + 'idrac_firmware.ensure_repository_server',
+                                   return_value="http://192.168.0.2:8080")
+        share_names = []
+
+        def update_firmware(idrac, module, repo_urls):
+            share_names.append(module.params['share_name'])
+            return {"update_msg": SUCCESS_MSG, "update_status": "Success", 'changed': True, 'failed': False}
+        mocker.patch(MODULE_PATH + 'idrac_firmware.update_firmware_redfish', side_effect=update_firmware)
+        result = self._run_module(idrac_default_args)
+        assert result['changed'] is True
+        assert share_names == ["http://192.168.0.2:8080"]
+        assert server_mock.call_args[0] == (str(tmp_path), "192.168.0.2")
+        assert server_mock.call_args[1]['rate_limit'] == 1024
+        assert server_mock.call_args[1]['max_client_connections'] == 4
+
+    def test_main_local_repository_catalog_missing(self, idrac_connection_firmware_redfish_mock, idrac_default_args,
+                                                   mocker, tmp_path):
+        idrac_default_args.update({"local_repository": {"path": str(tmp_path), "address": "192.168.0.2"}})
+        idrac_connection_firmware_redfish_mock.json_data = {}
+        server_mock = mocker.patch(MODULE_PATH + 'idrac_firmware.ensure_repository_server')
+        result = self._run_module_with_fail_json(idrac_default_args)
+        assert result['msg'] == idrac_firmware.CATALOG_NOT_FOUND.format(CATALOG, str(tmp_path))
+        assert not server_mock.called
+
+    def test_main_local_repository_invalid_catalog(self, idrac_connection_firmware_redfish_mock,
+                                                   idrac_default_args, mocker, tmp_path, monkeypatch):
+        monkeypatch.setenv("OMAM_CATALOG_CACHE", "false")
+        (tmp_path / CATALOG).write_text(u"<Catalog>")
+        idrac_default_args.update({"local_repository": {"path": str(tmp_path), "address": "192.168.0.2"}})
+        idrac_connection_firmware_redfish_mock.json_data = {}
+        server_mock = mocker.patch(MODULE_PATH + 'idrac_firmware.ensure_repository_server')
+        result = self._run_module_with_fail_json(idrac_default_args)
+        assert result['msg'].startswith("Unable to parse the catalog file")
+        assert not server_mock.called
+
+    def test_main_local_repository_server_error(self, idrac_connection_firmware_redfish_mock, idrac_default_args,
+                                                mocker, tmp_path, monkeypatch):
+        monkeypatch.setenv("OMAM_CATALOG_CACHE", "false")
+        (tmp_path / CATALOG).write_text(u"<Manifest/>")
+        idrac_default_args.update({"local_repository": {"path": str(tmp_path), "address": "192.168.0.2",
+                                                        "port": 80}})
+        idrac_connection_firmware_redfish_mock.json_data = {}
+        mocker.patch(MODULE_PATH + 'idrac_firmware.ensure_repository_server',
+                     side_effect=OSError(13, "Permission denied"))
+        result = self._run_module_with_fail_json(idrac_default_args)
+        assert result['msg'] == idrac_firmware.REPO_SERVER_ERROR.format(OSError(13, "Permission denied"))
+
+    @pytest.mark.parametrize("bios_version, check_mode, expected", [
+        ("2.10.2", False, idrac_firmware.EXIT_MESSAGE),
+        ("2.10.2", True, idrac_firmware.NO_CHANGES_MSG),
+        ("2.9.0", False, None),
+    ])
+    def test_firmware_precheck(self, idrac_default_args, tmp_path, monkeypatch, bios_version, check_mode, expected):
+        monkeypatch.setenv("OMAM_CATALOG_CACHE", "false")
+        (tmp_path / CATALOG).write_text(PRECHECK_CATALOG)
+        idrac_default_args.update({"precheck_catalog": None, "local_repository": None, "share_mnt": str(tmp_path),
+                                   "catalog_file_name": CATALOG})
+        f_module = self.get_module_mock(params=idrac_default_args, check_mode=check_mode)
+        inventory = [{"Id": "Installed-159-" + bios_version, "Version": bios_version, "Updateable": True},
+                     {"Id": "Previous-159-2.8.0", "Version": "2.8.0", "Updateable": True}]
+        idrac = MagicMock()
+        idrac.invoke_request.side_effect = [MagicMock(json_data={"Members": inventory}),
+                                            MagicMock(json_data=SYSTEM_DATA)]
+        if expected:
+            with pytest.raises(Exception) as ex:
+                self.module.firmware_precheck(idrac, f_module)
+            assert ex.value.args[0] == expected
+        else:
+            assert self.module.firmware_precheck(idrac, f_module) is None
+            assert not f_module.exit_json.called
+        assert idrac.invoke_request.call_args_list[0][0] == (idrac_firmware.FIRMWARE_INVENTORY_URI, "GET")
+
+    @pytest.mark.parametrize("members, side_effect", [
+        ([{"@odata.id": "/redfish/v1/UpdateService/FirmwareInventory/Installed-159-2.10.2"}], None),
+        ([], None),
+        (None, HTTPError(TEST_HOST, 400, "Bad Request", {}, None)),
+        (None, [MagicMock(json_data=None)]),
+    ])
+    def test_firmware_precheck_skipped(self, idrac_default_args, tmp_path, monkeypatch, members, side_effect):
+        monkeypatch.setenv("OMAM_CATALOG_CACHE", "false")
+        catalog_path = tmp_path / CATALOG
+        catalog_path.write_text(PRECHECK_CATALOG)
+        idrac_default_args.update({"precheck_catalog": str(catalog_path), "local_repository": None,
+                                   "share_mnt": None, "catalog_file_name": CATALOG})
+        f_module = self.get_module_mock(params=idrac_default_args)
+        idrac = MagicMock()
+        idrac.invoke_request.side_effect = side_effect or [MagicMock(json_data={"Members": members})]
+        assert self.module.firmware_precheck(idrac, f_module) is None
+        assert f_module.warn.call_args[0][0].startswith("Skipped the firmware pre-check")
+        assert not f_module.exit_json.called
+
+    @pytest.mark.parametrize("system_data, reason", [
+        ({"Model": "PowerEdge R660", "Oem": {"Dell": {"DellSystem": {"SystemID": 2770}}}},
+         "no installed component is listed in the catalog for the system"),
+        (None, "'NoneType' object has no attribute 'get'"),
+    ])
+    def test_firmware_precheck_unknown(self, idrac_default_args, tmp_path, monkeypatch, system_data, reason):
+        monkeypatch.setenv("OMAM_CATALOG_CACHE", "false")
+        catalog_path = tmp_path / CATALOG
+        catalog_path.write_text(PRECHECK_CATALOG)
+        idrac_default_args.update({"precheck_catalog": str(catalog_path), "local_repository": None,
+                                   "share_mnt": None, "catalog_file_name": CATALOG})
+        f_module = self.get_module_mock(params=idrac_default_args)
+        inventory = [{"Id": "Installed-159-2.10.2", "Version": "2.10.2", "Updateable": True}]
+        idrac = MagicMock()
+        idrac.invoke_request.side_effect = [MagicMock(json_data={"Members": inventory}),
+                                            MagicMock(json_data=system_data)]
+        assert self.module.firmware_precheck(idrac, f_module) is None
+        assert f_module.warn.call_args[0][0] == idrac_firmware.PRECHECK_SKIPPED.format(reason)
+        assert not f_module.exit_json.called
+
+    def test_firmware_precheck_no_catalog(self, idrac_default_args, tmp_path):
+        idrac_default_args.update({"precheck_catalog": None, "local_repository": {"path": str(tmp_path)},
+                                   "share_mnt": None, "catalog_file_name": CATALOG})
+        f_module = self.get_module_mock(params=idrac_default_args)
+        idrac = MagicMock()
+        self.module.firmware_precheck(idrac, f_module)
+        assert f_module.warn.call_args[0][0] == idrac_firmware.PRECHECK_SKIPPED.format(
+            "a local copy of the catalog is not available")
+        assert not idrac.invoke_request.called
+
+    def test_main_precheck_before_local_repository(self, idrac_connection_firmware_redfish_mock, idrac_default_args,
+                                                   mocker, tmp_path, monkeypatch):
+        monkeypatch.setenv("OMAM_CATALOG_CACHE", "false")
+        (tmp_path / CATALOG).write_text(PRECHECK_CATALOG)
+        idrac_default_args.update({"local_repository": {"path": str(tmp_path), "address": "192.168.0.2"},
+                                   "precheck": True})
+        idrac_connection_firmware_redfish_mock.json_data = {}
+        calls = []
+        mocker.patch(MODULE_PATH + 'idrac_firmware.firmware_precheck',
+                     side_effect=lambda idrac, module: calls.append("precheck"))
+        mocker.patch(MODULE_PATH + 'idrac_firmware.ensure_repository_server',
+                     side_effect=lambda *args, **kwargs: calls.append("server") or "http://192.168.0.2:8080")
+        mocker.patch(MODULE_PATH + 'idrac_firmware.update_firmware_redfish',
+                     return_value={"update_msg": SUCCESS_MSG, "update_status": "Success", 'changed': True,
+                                   'failed': False})
+        self._run_module(idrac_default_args)
+        assert calls == ["precheck", "server"]
+
     def test_main_HTTPError_case(self, idrac_default_args, idrac_connection_firmware_redfish_mock, mocker):
         idrac_default_args.update({"share_name": "sharename", "catalog_file_name": CATALOG,
                                    "share_user": "sharename", "share_password": SHARE_PWD,
@@ -423,6 +577,36 @@ class TestidracFirmware(FakeAnsibleModule):
         assert comp == {'JobID': 'JID_123456789', 'Message': 'Success', 'JobStatus': 'Critical'}
         assert failed
 
+    def test_track_component_jobs(self, idrac_default_args, idrac_connection_firm_mock, redfish_response_mock,
+                                  mocker):
+        idrac_default_args.update({"reboot": True, "job_wait": True, "apply_update": True})
+        f_module = self.get_module_mock(params=idrac_default_args)
+        mocker.patch('time.sleep', return_value=None)
+        redfish_response_mock.json_data = {"Members": [
+            {"Id": "JID_1", "JobState": "Completed", "PercentComplete": 100, "JobStatus": "OK",
+             "Messages": [{"Message": "Job completed successfully."}]},
+            {"Id": "JID_2", "JobState": "Completed", "PercentComplete": 100, "JobStatus": "Critical",
+             "Messages": [{"Message": "Unable to update."}]}]}
+        job_details = {"PackageList": "<root><INSTANCENAME><PROPERTY NAME='JobID'><VALUE>JID_1</VALUE></PROPERTY>"
+                                      "</INSTANCENAME><INSTANCENAME><PROPERTY NAME='JobID'><VALUE>JID_2</VALUE>"
+                                      "</PROPERTY></INSTANCENAME></root>"}
+        data, repo_status, failed = self.module._convert_xmltojson(f_module, job_details, None)
+        assert [comp["JobStatus"] for comp in data] == ["OK", "Critical"]
+        assert data[1]["Message"] == "Unable to update."
+        assert repo_status and failed
+        assert idrac_connection_firm_mock.invoke_request.call_count == 1
+        timeout_msg = self.module.JOB_WAIT_MSG.format((self.module.WAIT_COUNT * self.module.INTERVAL) / 60)
+        running = {"Id": "JID_2", "JobState": "Running", "PercentComplete": 50}
+        redfish_response_mock.json_data = {"Members": [redfish_response_mock.json_data["Members"][0], running]}
+        idrac_connection_firm_mock.invoke_request.side_effect = [redfish_response_mock] + [
+            HTTPError(TEST_HOST, 400, "Bad Request", {}, None)] * 5
+        tracked = self.module.track_component_jobs(f_module, [{"JobID": "JID_1"}, {"JobID": "JID_2"}])
+        assert tracked["JID_1"][0]["JobStatus"] == "OK" and tracked["JID_1"][1] is None
+        assert tracked["JID_2"] == (running, timeout_msg)
+        idrac_connection_firm_mock.invoke_request.side_effect = HTTPError(TEST_HOST, 400, "Bad Request", {}, None)
+        assert self.module.track_component_jobs(f_module, [{"JobID": "JID_1"}, {"JobID": "JID_2"}]) == {
+            "JID_1": (None, timeout_msg), "JID_2": (None, timeout_msg)}
+
     def test_wait_for_job_completion(self, idrac_default_args, idrac_connection_firm_mock, redfish_response_mock):
         idrac_default_args.update({"share_name": "sharename", "catalog_file_name": CATALOG,
                                    "share_user": "sharename", "share_password": SHARE_PWD,
@@ -111,7 +111,13 @@ class TestOmeChassisSlots(FakeAnsibleModule):
     @pytest.mark.parametrize("params", [
         {"json_data": {"value": [{'Name': 'j1', 'Id': 12, "LastRunStatus": {"Id": 2060, "Name": "Completed"}}]},
          "slot_data": {"ABC1234": {"new_name": "s1", "SlotNumber": "1", "SlotType": "2000", "JobId": 12}},
-         "failed_jobs": {}}])
+         "failed_jobs": {}},
+        {"json_data": {"value": [{'Name': 'j1', 'Id': 12, "LastRunStatus": {"Id": 2060, "Name": "Completed"}},
+                                 {'Name': 'j2', 'Id': 13, "LastRunStatus": {"Id": 2070, "Name": "Failed"}}]},
+         "slot_data": {"ABC1234": {"new_name": "s1", "SlotNumber": "1", "SlotType": "2000", "JobId": 12},
+                       "ABC1234_2": {"new_name": "s2", "SlotNumber": "2", "SlotType": "2000", "JobId": 13}},
+         "failed_jobs": {"ABC1234_2": {"new_name": "s2", "SlotNumber": "2", "SlotType": "2000", "JobId": 13,
+                                       "JobStatus": "Failed"}}}])
     def test_get_job_states(
             self, params, ome_connection_mock_for_chassis_slots, ome_response_mock):
         ome_response_mock.success = params.get("success", True)
@@ -430,6 +430,17 @@ class TestOMEDeviceGroup(FakeAnsibleModule):
                                                                      'fe80::ffff:ffff:ffff:ffff/24']})
             self.module.get_device_id_from_ip(ip_addresses, device_list, f_module)
 
+    def test_get_device_id_from_ip_refreshes_catalog(self, mocker):
+        resolver = mocker.MagicMock()
+        resolver.refresh.return_value = True
+        resolver.load_all.return_value = [{"Id": 3333, "DeviceManagement": [{"NetworkAddress": "192.168.2.10"}]}]
+        f_module = self.get_module_mock(params={"name": "group1", "ip_addresses": ["192.168.2.10"]})
+        res = self.module.get_device_id_from_ip([IPAddress("192.168.2.10")], [], f_module, resolver)
+        assert res == {3333: "192.168.2.10"}
+        resolver.refresh.return_value = False
+        with pytest.raises(Exception, match=IP_NOT_EXISTS):
+            self.module.get_device_id_from_ip([IPAddress("192.168.2.11")], [], f_module, resolver)
+
     # def test_add_member_to_group_case01(self, ome_connection_mock_for_device_group, ome_response_mock):
     #     report_list = [{"Id": 3333, "DeviceServiceTag": "device1",
     #                     "DeviceManagement": [{"NetworkAddress": "192.168.2.10"},
@@ -77,6 +77,11 @@ class TestOMEMDevicePower(FakeAnsibleModule):
         result = self.module.get_chassis_device(f_module, ome_conn_mock_qd)
         assert result[0] == "Id"
         assert result[1] == 25012
+        mocker.patch(MODULE_PATH + "get_ip_from_host", return_value="2001:DB8:0::1")
+        ome_response_mock.json_data = {"value": [{"DeviceId": 25013, "DomainRoleTypeValue": "LEAD",
+                                                  "PublicAddress": ["X.X.X.X", "[2001:db8::1]"]}]}
+        result = self.module.get_chassis_device(f_module, ome_conn_mock_qd)
+        assert result[1] == 25013
 
     def test_get_ip_from_host(self, ome_conn_mock_qd, ome_default_args, ome_response_mock):
         result = self.module.get_ip_from_host("XX.XX.XX.XX")
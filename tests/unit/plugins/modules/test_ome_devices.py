@@ -70,7 +70,8 @@ class TestOmeDevices(FakeAnsibleModule):
                                 module_mock):
         ome_response_mock.success = params.get("success", True)
         ome_response_mock.json_data = params['json_data']
-        ome_connection_mock_for_devices.get_all_items_with_pagination.return_value = params['json_data']
+        ome_connection_mock_for_devices.get_all_report_details.return_value = {
+            "report_list": params['json_data']['value']}
         ome_default_args.update(params['mparams'])
         result = self._run_module(ome_default_args, check_mode=params.get('check_mode', False))
         assert result['msg'] == params['message']
@@ -433,6 +434,8 @@ class TestOmeDevices(FakeAnsibleModule):
                                             ome_default_args, module_mock, mocker):
         ome_response_mock.success = params.get("success", True)
         ome_response_mock.json_data = params['json_data']
+        ome_connection_mock_for_devices.get_all_report_details.return_value = {
+            "report_list": params['json_data'].get('value', [])}
         mocks = ["check_similar_job", "get_dev_ids"]
         for m in mocks:
             if m in params:
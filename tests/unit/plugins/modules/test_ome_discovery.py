@@ -211,7 +211,25 @@ class TestOmeDiscovery(FakeAnsibleModule):
                                            'type': 'SNMP'}]}, "DeviceType": [1000],
         "DiscoveryConfigTargets": [{"NetworkAddressDetail": "196.168.24.17"}], 'mparams': {'discovery_config_targets': [
             {"device_types": ["SERVER"], "network_address_detail": ["196.168.24.17"],
-             "snmp": {"community": "public", "port": 161, "retries": 3, "timeout": 3}}]}}])
+             "snmp": {"community": "public", "port": 161, "retries": 3, "timeout": 3}}]}},
+        {"get_conn_json": {"profileId": 0, "profileName": "", "profileDescription": "", "type": "DISCOVERY",
+                           'credentials': [{'authType': 'Basic', 'credentials': {'community': 'public'},
+                                            'modified': False, 'type': 'SNMP'}]}, "DeviceType": [1000],
+         "DiscoveryConfigTargets": [{"NetworkAddressDetail": "196.168.24.0/24"}, {"NetworkAddressDetail": "host1"}],
+         "warning": "Skipped the network addresses 196.168.24.17, 196.168.24.10-196.168.24.20 which are covered by "
+                    "other entries of the same target.",
+         'mparams': {'skip_covered_addresses': True, 'discovery_config_targets': [
+             {"device_types": ["SERVER"], "snmp": {"community": "public"},
+              "network_address_detail": ["196.168.24.0/24", "196.168.24.17", "host1",
+                                         "196.168.24.10-196.168.24.20"]}]}},
+        {"get_conn_json": {"profileId": 0, "profileName": "", "profileDescription": "", "type": "DISCOVERY",
+                           'credentials': [{'authType': 'Basic', 'credentials': {'community': 'public'},
+                                            'modified': False, 'type': 'SNMP'}]}, "DeviceType": [1000],
+         "DiscoveryConfigTargets": [{"NetworkAddressDetail": "196.168.24.0/24"},
+                                    {"NetworkAddressDetail": "196.168.24.17"}],
+         'mparams': {'discovery_config_targets': [
+             {"device_types": ["SERVER"], "snmp": {"community": "public"},
+              "network_address_detail": ["196.168.24.0/24", "196.168.24.17"]}]}}])
     def test_get_discovery_config(self, params, mocker, ome_connection_mock_for_discovery, ):
         dev_id_map = {"CHASSIS": 2000, "DELL STORAGE": 5000, "NETWORK SWITCH": 7000, "SERVER": 1000, "STORAGE": 5000}
         proto_dev_map = {"CHASSIS": ["WSMAN", "REDFISH"], "DELL STORAGE": ["SNMP", "STORAGE"],
@@ -222,6 +240,10 @@ class TestOmeDiscovery(FakeAnsibleModule):
         disc_cfg_list = self.module.get_discovery_config(f_module, ome_connection_mock_for_discovery)
         assert disc_cfg_list[0]['DeviceType'] == params['DeviceType']
         assert disc_cfg_list[0]['DiscoveryConfigTargets'] == params['DiscoveryConfigTargets']
+        if params.get('warning'):
+            f_module.warn.assert_called_once_with(params['warning'])
+        else:
+            f_module.warn.assert_not_called()
 
     @pytest.mark.parametrize("params", [{"json_data": {"@odata.type": "#DiscoveryConfigService.DiscoveryJob",
                                                        "@odata.id": "/api/DiscoveryConfigService/Jobs(12617)",
@@ -12,11 +12,10 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
-from unittest.mock import patch, mock_open
+from unittest.mock import mock_open
 
 import pytest
 import json
-import sys
 from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from io import StringIO
@@ -291,51 +290,60 @@ class TestOmeFirmware(FakeAnsibleModule):
             duppayload.get('device_ids'), duppayload.get('group_ids'), duppayload.get('baseline_ids'))
         assert data == duppayload["out"]
 
-    def test_upload_dup_file_success_case01(self, ome_connection_firmware_mock, ome_response_mock):
+    def test_upload_dup_file_success_case01(self, ome_connection_firmware_mock, ome_response_mock, tmp_path):
         ome_response_mock.json_data = "1577786112600"
         ome_response_mock.success = True
         ome_response_mock.status_code = 200
-        f_module = self.get_module_mock(params={'dup_file': "/root1/Ansible_EXE/BIOS_87V69_WN64_2.4.7.EXE"})
-        if sys.version_info.major == 3:
-            builtin_module_name = 'builtins'
-        else:
-            builtin_module_name = '__builtin__'
-        with patch("{0}.open".format(builtin_module_name), mock_open(read_data="data")) as mock_file:
-            result = self.module.upload_dup_file(ome_connection_firmware_mock, f_module)
+        dup_file = tmp_path / "BIOS_87V69_WN64_2.4.7.EXE"
+        dup_file.write_bytes(b"data")
+        f_module = self.get_module_mock(params={'dup_file': str(dup_file)})
+        result = self.module.upload_dup_file(ome_connection_firmware_mock, f_module)
         assert result == (True, "1577786112600")
+        kwargs = ome_connection_firmware_mock.invoke_request.call_args[1]
+        assert kwargs["headers"] == {"Content-Type": "application/octet-stream", "Content-Length": "4",
+                                     "Accept": "application/octet-stream"}
+        assert len(kwargs["data"]) == 4
 
     def test_upload_dup_file_failure_case02(self, ome_default_args,
-                                            ome_connection_firmware_mock, ome_response_mock):
+                                            ome_connection_firmware_mock, ome_response_mock, tmp_path):
         ome_response_mock.json_data = {"value": [{"Id": [1111, 2222, 3333], "DeviceServiceTag": "KLBR222",
                                                   "dup_file": "/root/Ansible_EXE/BIOS_87V69_WN64_2.4.7.EXE"}]}
         ome_response_mock.status_code = 500
-
-        if sys.version_info.major == 3:
-            builtin_module_name = 'builtins'
-        else:
-            builtin_module_name = '__builtin__'
+        dup_file = tmp_path / "BIOS_87V69_WN64_2.4.7.EXE"
+        dup_file.write_bytes(b"data")
         f_module = self.get_module_mock(
-            params={'dup_file': "/root1/Ansible_EXE/BIOS_87V69_WN64_2.4.7.EXE", 'hostname': 'XX.XX.XX.XX'})
-        with patch("{0}.open".format(builtin_module_name), mock_open(read_data="data")) as mock_file:
-            with pytest.raises(Exception) as exc:
-                self.module.upload_dup_file(ome_connection_firmware_mock, f_module)
-        assert exc.value.args[0] == "Unable to upload {0} to {1}".format('/root1/Ansible_EXE/BIOS_87V69_WN64_2.4.7.EXE',
-                                                                         'XX.XX.XX.XX')
+            params={'dup_file': str(dup_file), 'hostname': 'XX.XX.XX.XX'})
+        with pytest.raises(Exception) as exc:
+            self.module.upload_dup_file(ome_connection_firmware_mock, f_module)
+        assert exc.value.args[0] == "Unable to upload {0} to {1}".format(str(dup_file), 'XX.XX.XX.XX')
 
     def test_get_device_ids_success_case(self, ome_connection_firmware_mock, ome_response_mock, ome_default_args):
         ome_default_args.update()
         f_module = self.get_module_mock()
-        ome_connection_firmware_mock.get_all_report_details.return_value = {
-            "report_list": [{'Id': 1111, 'DeviceServiceTag': "ABC1111"},
-                            {'Id': 2222, 'DeviceServiceTag': "ABC2222"},
-                            {'Id': 3333, 'DeviceServiceTag': "ABC3333"},
-                            {'Id': 4444, 'DeviceServiceTag': "ABC4444"}]}
+        ome_connection_firmware_mock.get_all_report_details.side_effect = [
+            {"report_list": [{'Id': 1111, 'DeviceServiceTag': "ABC1111"},
+                             {'Id': 2222, 'DeviceServiceTag': "ABC2222"},
+                             {'Id': 3333, 'DeviceServiceTag': "ABC3333"}]},
+            {"report_list": [{'Id': 4444, 'DeviceServiceTag': "ABC4444"}]}]
         data, id_tag_map = self.module.get_device_ids(ome_connection_firmware_mock, f_module, [1111, 2222, 3333, "ABC4444"])
         assert data == ['1111', '2222', '3333', '4444']
+        assert "5555" not in id_tag_map
+        query_param = ome_connection_firmware_mock.get_all_report_details.call_args_list[0][1]["query_param"]
+        assert query_param["$filter"] == "(Id eq 1111 or Id eq 2222 or Id eq 3333)"
+        query_param = ome_connection_firmware_mock.get_all_report_details.call_args_list[1][1]["query_param"]
+        assert query_param["$filter"] == "DeviceServiceTag eq 'ABC4444'"
+
+    def test_get_device_ids_empty_inventory(self, ome_connection_firmware_mock, ome_response_mock):
+        ome_connection_firmware_mock.get_all_report_details.return_value = {"report_list": []}
+        f_module = self.get_module_mock()
+        with pytest.raises(Exception) as exc:
+            self.module.get_device_ids(ome_connection_firmware_mock, f_module, [2222])
+        assert exc.value.args[0] == "Unable to complete the operation because the entered target device service" \
+                                    " tag(s) or device id(s) '{0}' are invalid.".format("2222")
 
     def test_get_device_ids_failure_case01(self, ome_connection_firmware_mock, ome_response_mock):
-        ome_response_mock.json_data = {'value': [{'Id': 'DeviceServiceTag'}]}
-        ome_response_mock.success = False
+        ome_connection_firmware_mock.get_all_report_details.return_value = {"report_list": [
+            {'Id': 1111, 'DeviceServiceTag': "ABC1111"}]}
         f_module = self.get_module_mock()
         with pytest.raises(Exception) as exc:
             self.module.get_device_ids(ome_connection_firmware_mock, f_module, [2222])
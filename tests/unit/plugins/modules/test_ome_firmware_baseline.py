@@ -289,8 +289,8 @@ class TestOmeFirmwareBaseline(FakeAnsibleModule):
     def test_get_dev_ids(self, ome_connection_mock_for_firmware_baseline,
                          ome_response_mock, params):
         f_module = self.get_module_mock(params=params["inp"])
-        ome_connection_mock_for_firmware_baseline.get_all_items_with_pagination.return_value = {
-            "value":
+        ome_connection_mock_for_firmware_baseline.get_all_report_details.return_value = {
+            "report_list":
                 [
                     {
                         "Id": 12,
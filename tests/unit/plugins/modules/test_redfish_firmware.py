@@ -255,6 +255,68 @@ class TestRedfishFirmware(FakeAnsibleModule):
             result = self.module.firmware_update(redfish_firmware_connection_mock, f_module)
         assert result == redfish_response_mock
 
+    def test_firmware_update_local_file(self, redfish_default_args, redfish_firmware_connection_mock,
+                                        redfish_response_mock, mocker, tmp_path):
+        mocker.patch(MODULE_PATH + "redfish_firmware._get_update_service_target",
+                     return_value=('2134', HTTPS_ADDRESS_DELL, 'redfish'))
+        image = tmp_path / "component.exe"
+        image.write_bytes(b"x" * 1000)
+        redfish_default_args.update({"image_uri": str(image), "transfer_protocol": "HTTP", "timeout": 0,
+                                     "job_wait_timeout": 0})
+        f_module = self.get_module_mock(params=redfish_default_args)
+        redfish_response_mock.status_code = 201
+        redfish_response_mock.headers = {"location": "/redfish/v1/UpdateService/FirmwareInventory/Available-1",
+                                         "etag": "W/123"}
+        bodies = []
+
+        def invoke_request(method, uri, data=None, **kwargs):
+            if uri == HTTPS_ADDRESS_DELL:
+                bodies.append((kwargs["headers"], b"".join(iter(lambda: data.read(256), b""))))
+            return redfish_response_mock
+        redfish_firmware_connection_mock.invoke_request.side_effect = invoke_request
+        self.module.firmware_update(redfish_firmware_connection_mock, f_module)
+        headers, body = bodies[0]
+        assert headers["If-Match"] == "W/123"
+        assert headers["Content-Length"] == str(len(body))
+        assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        assert b'name="file"; filename="component.exe"\r\nContent-Type: multipart/form-data\r\n\r\n' + \
+            b"x" * 1000 + b"\r\n--" in body
+        assert redfish_firmware_connection_mock.invoke_request.call_args[1]["data"] == {
+            "ImageURI": "/redfish/v1/UpdateService/FirmwareInventory/Available-1"}
+
+    def test_firmware_update_staged_image(self, redfish_default_args, redfish_firmware_connection_mock,
+                                          redfish_response_mock, mocker, tmp_path, monkeypatch):
+        monkeypatch.setenv("OMAM_UPLOAD_CACHE", "true")
+        monkeypatch.setenv("OMAM_UPLOAD_CACHE_DIR", str(tmp_path / "cache"))
+        mocker.patch(MODULE_PATH + "redfish_firmware._get_update_service_target",
+                     return_value=('2134', HTTPS_ADDRESS_DELL, 'redfish'))
+        image = tmp_path / "component.exe"
+        image.write_bytes(b"x" * 1000)
+        location = "/redfish/v1/UpdateService/FirmwareInventory/Available-159-2.4.7"
+        redfish_default_args.update({"image_uri": str(image), "transfer_protocol": "HTTP", "timeout": 0,
+                                     "job_wait_timeout": 0})
+        f_module = self.get_module_mock(params=redfish_default_args)
+        redfish_response_mock.status_code = 201
+        redfish_response_mock.headers = {"location": location, "etag": "W/123"}
+        redfish_response_mock.json_data = {"Members": [{"@odata.id": location}], "Version": "2.4.7"}
+        pushed = []
+
+        def invoke_request(method, uri, data=None, **kwargs):
+            if uri == HTTPS_ADDRESS_DELL:
+                pushed.append(data.read())
+            return redfish_response_mock
+        redfish_firmware_connection_mock.invoke_request.side_effect = invoke_request
+        self.module.firmware_update(redfish_firmware_connection_mock, f_module)
+        self.module.firmware_update(redfish_firmware_connection_mock, f_module)
+        assert len(pushed) == 1
+        assert redfish_firmware_connection_mock.invoke_request.call_args[1]["data"] == {"ImageURI": location}
+        redfish_response_mock.json_data = {"Members": [{"@odata.id": location}], "Version": "2.4.8"}
+        self.module.firmware_update(redfish_firmware_connection_mock, f_module)
+        assert len(pushed) == 2
+        redfish_response_mock.json_data = {"Members": []}
+        self.module.firmware_update(redfish_firmware_connection_mock, f_module)
+        assert len(pushed) == 3
+
     @pytest.mark.parametrize("params", [{"ip": "192.161.1.1:443"}, {"ip": "192.161.1.1"},
                                         {"ip": "82f5:d985:a2d5:f0c3:5392:cc52:27d1:4da6"},
                                         {"ip": "[82f5:d985:a2d5:f0c3:5392:cc52:27d1:4da6]"},
@@ -223,36 +223,49 @@ class TestRedfishFirmware(FakeAnsibleModule):
         redfish_default_args.update({"username": "user", "password": "pwd", "baseuri": "XX.XX.XX.XX", "Name": "BIOS",
                                      "reboot_timeout": 900})
         f_module = self.get_module_mock(params=redfish_default_args)
-        redfish_response_mock.json_data = {"JobState": "Completed", "JobType": "FirmwareUpdate",
-                                           "Name": "Firmware Rollback: Network", "PercentComplete": 100}
-        mocker.patch(MODULE_PATH + 'redfish_firmware_rollback.wait_for_redfish_job_complete',
-                     return_value=(redfish_response_mock, ""))
-        mocker.patch(MODULE_PATH + 'redfish_firmware_rollback.strip_substr_dict',
-                     return_value={"JobState": "Completed", "JobType": "FirmwareUpdate",
-                                   "Name": "Firmware Rollback: Network", "PercentComplete": 100})
+        mocker.patch(MODULE_PATH + 'redfish_firmware_rollback.time.sleep', return_value=None)
+        job = {"Id": "JID_123456789", "JobState": "Completed", "JobType": "FirmwareUpdate",
+               "Name": "Firmware Rollback: Network", "PercentComplete": 100}
+        redfish_response_mock.json_data = {"Members": [job]}
         result = self.module.get_job_status(redfish_connection_mock, f_module, ["JID_123456789"], job_wait=True)
-        assert result[0] == [{'JobState': 'Completed', 'JobType': 'FirmwareUpdate',
+        assert result[0] == [{'Id': 'JID_123456789', 'JobState': 'Completed', 'JobType': 'FirmwareUpdate',
                               'Name': 'Firmware Rollback: Network', 'PercentComplete': 100}]
         assert result[1] == 0
-        redfish_response_mock.json_data = {"JobState": "Failed", "JobType": "FirmwareUpdate",
-                                           "Name": "Firmware Rollback: Network", "PercentComplete": 100}
-        mocker.patch(MODULE_PATH + 'redfish_firmware_rollback.wait_for_redfish_job_complete',
-                     return_value=(redfish_response_mock, ""))
-        mocker.patch(MODULE_PATH + 'redfish_firmware_rollback.strip_substr_dict',
-                     return_value={"JobState": "Failed", "JobType": "FirmwareUpdate",
-                                   "Name": "Firmware Rollback: Network", "PercentComplete": 100})
-        result = self.module.get_job_status(redfish_connection_mock, f_module, ["JID_123456789"], job_wait=True)
-        assert result[0] == [{'JobState': 'Failed', 'JobType': 'FirmwareUpdate',
-                              'Name': 'Firmware Rollback: Network', 'PercentComplete': 100}]
+        job["JobState"] = "Failed"
+        redfish_response_mock.json_data = {"Members": [job]}
+        result = self.module.get_job_status(redfish_connection_mock, f_module, ["JID_123456789"], job_wait=False)
+        assert result[0][0]['JobState'] == 'Failed'
         assert result[1] == 1
-
-        mocker.patch(MODULE_PATH + 'redfish_firmware_rollback.wait_for_redfish_job_complete',
-                     return_value=(redfish_response_mock, "some error message"))
+        job.update({"JobState": "RebootFailed", "PercentComplete": 50})
+        redfish_response_mock.json_data = {"Members": [job]}
         with pytest.raises(Exception) as ex:
             self.module.get_job_status(redfish_connection_mock, f_module, ["JID_123456789"], job_wait=True)
         assert ex.value.args[0] == "Task excited after waiting for 900 seconds. Check console for " \
                                    "firmware rollback status."
 
+    def test_get_job_status_batched(self, redfish_connection_mock, redfish_response_mock, redfish_default_args,
+                                    mocker):
+        redfish_default_args.update({"reboot_timeout": 900})
+        f_module = self.get_module_mock(params=redfish_default_args)
+        mocker.patch(MODULE_PATH + 'redfish_firmware_rollback.time.sleep', return_value=None)
+        mocker.patch('time.sleep', return_value=None)
+        polls = iter([{"Members": [{"Id": "JID_1", "JobState": "Running", "PercentComplete": 10},
+                                   {"Id": "JID_2", "JobState": "Completed", "PercentComplete": 100}]},
+                      {"Members": [{"Id": "JID_1", "JobState": "Failed", "PercentComplete": 100},
+                                   {"Id": "JID_2", "JobState": "Completed", "PercentComplete": 100}]}])
+        responses = []
+
+        def invoke_request(*args, **kwargs):
+            resp = MagicMock()
+            resp.json_data = next(polls)
+            responses.append(kwargs)
+            return resp
+        redfish_connection_mock.invoke_request.side_effect = invoke_request
+        result = self.module.get_job_status(redfish_connection_mock, f_module, ["JID_1", "JID_2"], job_wait=True)
+        assert [job["JobState"] for job in result[0]] == ["Failed", "Completed"]
+        assert result[1] == 1
+        assert len(responses) == 2
+
     def test_simple_update(self, redfish_connection_mock, redfish_response_mock, redfish_default_args, mocker):
         mocker.patch(MODULE_PATH + 'redfish_firmware_rollback.time.sleep', return_value=None)
         preview_uri, update_uri = ["/uri/1"], ["/uri/SimpleUpdate"]